@@ -8,6 +8,8 @@ Generates dossiers for multiple entities in parallel with:
 - Incremental updates (re-generate only stale dossiers)
 - Cost tracking and estimation
 - Error handling and retry logic
+- Sliding-window worker pool (a new entity starts as soon as a slot frees)
+- Durable completion ledger so interrupted runs can be resumed
 
 USAGE:
     # Generate for all entities
@@ -19,6 +21,9 @@ USAGE:
     # Generate from CSV list
     python batch_dossier_generator.py --input entities.csv
 
+    # Resume an interrupted overnight run (skips entities in the ledger)
+    python batch_dossier_generator.py --from-supabase --resume
+
 AUTHOR: Phase 0 Scalable Dossier System
 DATE: 2026-02-22
 """
@@ -44,6 +49,7 @@ from backend.schemas import EntityDossier
 from backend.claude_client import ClaudeClient
 from backend.dossier_generator import UniversalDossierGenerator
 from backend.dossier_data_collector import DossierDataCollector
+from backend.llm_scheduler import PRIORITY_BULK, llm_priority
 from backend.supabase_dossier_collector import SupabaseDataCollector, SupabaseEntity
 from backend.universal_club_prompts import (
     BATCH_CONFIG,
@@ -73,6 +79,15 @@ class EntityRecord:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+def _percentile(samples: List[float], percentile: float) -> float:
+    """Nearest-rank percentile of a list of samples (0.0 when empty)"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = int(round((percentile / 100.0) * (len(ordered) - 1)))
+    return ordered[max(0, min(rank, len(ordered) - 1))]
+
+
 @dataclass
 class BatchProgress:
     """Batch generation progress tracking"""
@@ -80,6 +95,8 @@ class BatchProgress:
     completed: int = 0
     failed: int = 0
     skipped: int = 0
+    resumed: int = 0
+    concurrency: int = 1
     start_time: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     errors: List[Dict[str, str]] = field(default_factory=list)
     costs: Dict[str, float] = field(default_factory=lambda: {
@@ -87,6 +104,14 @@ class BatchProgress:
         "STANDARD": 0.0,
         "PREMIUM": 0.0
     })
+    # Measured per-entity generation latency, keyed by tier
+    latencies_by_tier: Dict[str, List[float]] = field(default_factory=lambda: {
+        "BASIC": [],
+        "STANDARD": [],
+        "PREMIUM": []
+    })
+    # Entities not yet finished, keyed by tier (drives the ETA)
+    pending_by_tier: Dict[str, int] = field(default_factory=dict)
 
     def get_elapsed_seconds(self) -> float:
         return (datetime.now(timezone.utc) - self.start_time).total_seconds()
@@ -99,22 +124,74 @@ class BatchProgress:
     def get_total_cost(self) -> float:
         return sum(self.costs.values())
 
+    def record_result(self, tier: str, generation_time: float) -> None:
+        """Record a finished entity (success or failure) for throughput/ETA"""
+        self.latencies_by_tier.setdefault(tier, []).append(max(0.0, generation_time))
+        if self.pending_by_tier.get(tier, 0) > 0:
+            self.pending_by_tier[tier] -= 1
+
+    def get_throughput_per_minute(self) -> float:
+        """Finished entities per minute of wall-clock time in this run"""
+        elapsed = self.get_elapsed_seconds()
+        finished = self.completed + self.failed
+        if elapsed <= 0 or finished <= 0:
+            return 0.0
+        return finished / elapsed * 60.0
+
+    def get_latency_percentiles(self) -> Dict[str, Dict[str, float]]:
+        """p50/p90 generation latency for every tier with samples"""
+        return {
+            tier: {
+                "p50": round(_percentile(samples, 50), 2),
+                "p90": round(_percentile(samples, 90), 2),
+                "samples": len(samples),
+            }
+            for tier, samples in self.latencies_by_tier.items()
+            if samples
+        }
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "total_entities": self.total_entities,
             "completed": self.completed,
             "failed": self.failed,
             "skipped": self.skipped,
+            "resumed": self.resumed,
             "progress_percent": round(self.get_progress_percent(), 1),
             "elapsed_seconds": round(self.get_elapsed_seconds(), 1),
             "estimated_remaining_seconds": round(self.estimate_remaining_seconds(), 1),
+            "throughput_per_minute": round(self.get_throughput_per_minute(), 2),
+            "latency_by_tier": self.get_latency_percentiles(),
             "total_cost_usd": round(self.get_total_cost(), 4),
             "costs_by_tier": self.costs,
             "error_count": len(self.errors)
         }
 
     def estimate_remaining_seconds(self) -> float:
-        """Estimate seconds remaining based on current progress"""
+        """
+        Estimate seconds remaining.
+
+        Uses the measured median latency of each tier times the number of
+        entities still pending in that tier, spread over the worker pool.
+        Tiers without samples yet borrow the median across all tiers. Falls
+        back to the simple completion rate when no tier breakdown is known.
+        """
+        all_samples = [
+            latency
+            for samples in self.latencies_by_tier.values()
+            for latency in samples
+        ]
+        if self.pending_by_tier and all_samples:
+            overall_median = _percentile(all_samples, 50)
+            work_seconds = 0.0
+            for tier, pending in self.pending_by_tier.items():
+                if pending <= 0:
+                    continue
+                tier_samples = self.latencies_by_tier.get(tier) or []
+                median = _percentile(tier_samples, 50) if tier_samples else overall_median
+                work_seconds += pending * median
+            return work_seconds / max(1, self.concurrency)
+
         if self.completed == 0:
             return 0.0
 
@@ -139,6 +216,90 @@ class DossierOutput:
     timestamp: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
 
 
+class CompletionLedger:
+    """
+    Durable per-entity completion ledger (append-only JSONL).
+
+    Every finished entity is appended and fsynced immediately, so an
+    interrupted run loses at most the entities that were in flight.
+    `--resume` reads the ledger back and skips entities that already
+    succeeded at the same tier.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._completed: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    def _load(self):
+        if not self.path.exists():
+            return
+
+        self._truncate_torn_tail()
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Ignoring unreadable ledger line in {self.path}")
+                    continue
+                if record.get("success") and record.get("entity_id"):
+                    self._completed[record["entity_id"]] = record
+
+    def _truncate_torn_tail(self):
+        """
+        Drop a partial final line left by a crash mid-write.
+
+        Otherwise the next append would be concatenated onto it and both
+        records would be unreadable.
+        """
+        with open(self.path, 'r+b') as f:
+            data = f.read()
+            if not data or data.endswith(b"\n"):
+                return
+            keep = data.rfind(b"\n") + 1
+            logger.warning(f"Truncating torn trailing line in {self.path}")
+            f.truncate(keep)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def is_completed(self, entity_id: str, tier: Optional[str] = None) -> bool:
+        record = self._completed.get(entity_id)
+        if record is None:
+            return False
+        return tier is None or record.get("tier") == tier
+
+    def get_record(self, entity_id: str) -> Optional[Dict[str, Any]]:
+        return self._completed.get(entity_id)
+
+    def record(self, output: "DossierOutput"):
+        entry = {
+            "entity_id": output.entity_id,
+            "entity_name": output.entity_name,
+            "tier": output.tier,
+            "success": output.success,
+            "error": output.error,
+            "generation_time": round(output.generation_time, 3),
+            "cost_usd": output.cost_usd,
+            "timestamp": output.timestamp,
+        }
+
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+        if output.success:
+            self._completed[output.entity_id] = entry
+
+    def __len__(self) -> int:
+        return len(self._completed)
+
+
 # =============================================================================
 # BATCH DOSSIER GENERATOR
 # =============================================================================
@@ -148,7 +309,8 @@ class BatchDossierGenerator:
     Generate dossiers for multiple entities in parallel.
 
     Features:
-    - Parallel processing with configurable concurrency
+    - Sliding-window worker pool with configurable concurrency
+    - Durable completion ledger with resume support
     - Tier assignment based on priority scores
     - Progress tracking and cost estimation
     - Incremental updates (skip fresh dossiers)
@@ -161,7 +323,8 @@ class BatchDossierGenerator:
         claude_client: Optional[ClaudeClient] = None,
         max_concurrent: int = 5,
         stale_days: int = 7,
-        output_dir: str = "data/dossiers"
+        output_dir: str = "data/dossiers",
+        checkpoint_interval: int = 20
     ):
         """
         Initialize batch generator.
@@ -171,98 +334,194 @@ class BatchDossierGenerator:
             max_concurrent: Maximum parallel dossier generation
             stale_days: Days before dossier considered stale
             output_dir: Directory for dossier output files
+            checkpoint_interval: Finished entities between intermediate saves
         """
         self.claude_client = claude_client or ClaudeClient()
-        self.max_concurrent = max_concurrent
+        self.max_concurrent = max(1, max_concurrent)
         self.stale_days = stale_days
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.checkpoint_interval = max(1, checkpoint_interval)
+        self.ledger_path = self.output_dir / "_completion_ledger.jsonl"
 
         # Create generator instance
         self.generator = UniversalDossierGenerator(
             claude_client=self.claude_client
         )
 
+    @llm_priority(PRIORITY_BULK, tenant="batch_dossier")
     async def generate_batch(
         self,
         entities: List[EntityRecord],
         tier: str = "AUTO",
-        force_refresh: bool = False
+        force_refresh: bool = False,
+        resume: bool = False
     ) -> Tuple[List[DossierOutput], BatchProgress]:
         """
         Generate dossiers for multiple entities.
 
+        Entities are pulled from a shared queue by `max_concurrent` workers,
+        so a slow entity only occupies its own slot. Every finished entity is
+        written to the completion ledger before the next one is picked up.
+        On resume, entities completed by earlier runs are carried into the
+        returned outputs and the saved results from the ledger and their
+        dossier files.
+
         Args:
             entities: List of entity records
             tier: Dossier tier (BASIC/STANDARD/PREMIUM/AUTO)
             force_refresh: Force regeneration even if recent dossier exists
+            resume: Skip entities the completion ledger already marks as done
 
         Returns:
-            Tuple of (output list, progress tracking)
+            Tuple of (output list in input order, progress tracking)
         """
-        progress = BatchProgress(total_entities=len(entities))
-        outputs: List[DossierOutput] = []
+        progress = BatchProgress(
+            total_entities=len(entities),
+            concurrency=self.max_concurrent
+        )
 
         logger.info(f"Starting batch generation: {len(entities)} entities, tier={tier}")
 
-        # Filter entities that need generation
-        entities_to_process = self._filter_entities(
-            entities, tier, force_refresh
-        )
+        if not resume and self.ledger_path.exists():
+            self.ledger_path.unlink()
+        ledger = CompletionLedger(self.ledger_path)
+
+        # Outputs keyed by input position, so they are saved in input order
+        results: Dict[int, DossierOutput] = {}
+
+        if resume:
+            remaining = []
+            for position, entity in enumerate(entities):
+                if ledger.is_completed(entity.entity_id, self._resolve_tier(entity, tier)):
+                    results[position] = self._resumed_output(entity, ledger.get_record(entity.entity_id))
+                else:
+                    remaining.append((position, entity))
+            progress.resumed = len(results)
+            logger.info(f"Resuming: {progress.resumed} entities already completed in ledger")
+        else:
+            remaining = list(enumerate(entities))
 
-        progress.skipped = len(entities) - len(entities_to_process)
+        # Filter entities that need generation
+        entities_to_process = [
+            (position, entity) for position, entity in remaining
+            if self._needs_generation(entity, tier, force_refresh)
+        ]
+
+        progress.skipped = len(remaining) - len(entities_to_process)
+        for _, entity in entities_to_process:
+            entity_tier = self._resolve_tier(entity, tier)
+            progress.pending_by_tier[entity_tier] = progress.pending_by_tier.get(entity_tier, 0) + 1
         logger.info(f"Processing {len(entities_to_process)} entities (skipped {progress.skipped})")
 
-        # Process in batches
-        for i in range(0, len(entities_to_process), self.max_concurrent):
-            batch = entities_to_process[i:i + self.max_concurrent]
-
-            # Generate batch in parallel
-            batch_results = await asyncio.gather(
-                *[self._generate_single_entity(entity, tier) for entity in batch],
-                return_exceptions=True
-            )
-
-            # Process results
-            for result in batch_results:
-                if isinstance(result, Exception):
-                    logger.error(f"Generation error: {result}")
-                    progress.failed += 1
-                    progress.errors.append({
-                        "error": str(result),
-                        "timestamp": datetime.now(timezone.utc).isoformat()
-                    })
-                elif isinstance(result, DossierOutput):
-                    outputs.append(result)
-
-                    if result.success:
-                        progress.completed += 1
-                        progress.costs[result.tier] += result.cost_usd
-                    else:
-                        progress.failed += 1
-                        progress.errors.append({
-                            "entity_id": result.entity_id,
-                            "error": result.error or "Unknown error",
-                            "timestamp": result.timestamp
-                        })
-
-            # Log progress
-            logger.info(
-                f"Progress: {progress.completed}/{progress.total_entities} "
-                f"({progress.get_progress_percent():.1f}%), "
-                f"cost: ${progress.get_total_cost():.4f}, "
-                f"errors: {progress.failed}"
-            )
-
-            # Save intermediate results
-            if i % 20 == 0:  # Every 20 entities
-                self._save_intermediate_results(outputs)
+        queue: asyncio.Queue = asyncio.Queue()
+        for item in entities_to_process:
+            queue.put_nowait(item)
+
+        finished = 0
+
+        async def worker():
+            nonlocal finished
+            while True:
+                try:
+                    index, entity = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                try:
+                    result = await self._generate_single_entity(entity, tier)
+                except Exception as e:
+                    logger.error(f"Generation error: {e}")
+                    result = DossierOutput(
+                        entity_id=entity.entity_id,
+                        entity_name=entity.entity_name,
+                        tier=self._resolve_tier(entity, tier),
+                        success=False,
+                        error=str(e)
+                    )
+
+                results[index] = result
+                finished += 1
+                self._record_output(result, progress, ledger)
+
+                if finished % self.checkpoint_interval == 0:
+                    self._save_intermediate_results(
+                        [results[i] for i in sorted(results)]
+                    )
+
+        workers = min(self.max_concurrent, len(entities_to_process))
+        await asyncio.gather(*[worker() for _ in range(workers)])
+
+        outputs = [results[i] for i in sorted(results)]
 
         # Save final results
         self._save_results(outputs, progress)
 
         return outputs, progress
 
+    def _record_output(
+        self,
+        result: DossierOutput,
+        progress: BatchProgress,
+        ledger: CompletionLedger
+    ):
+        """Fold one finished entity into progress, the ledger and the log"""
+        if result.success:
+            progress.completed += 1
+            progress.costs[result.tier] = progress.costs.get(result.tier, 0.0) + result.cost_usd
+        else:
+            progress.failed += 1
+            progress.errors.append({
+                "entity_id": result.entity_id,
+                "error": result.error or "Unknown error",
+                "timestamp": result.timestamp
+            })
+
+        progress.record_result(result.tier, result.generation_time)
+
+        try:
+            ledger.record(result)
+        except OSError as e:
+            logger.error(f"Failed to write completion ledger for {result.entity_id}: {e}")
+
+        logger.info(
+            f"Progress: {progress.completed}/{progress.total_entities} "
+            f"({progress.get_progress_percent():.1f}%), "
+            f"throughput: {progress.get_throughput_per_minute():.2f}/min, "
+            f"ETA: {progress.estimate_remaining_seconds():.0f}s, "
+            f"cost: ${progress.get_total_cost():.4f}, "
+            f"errors: {progress.failed}"
+        )
+
+    def _resumed_output(self, entity: EntityRecord, record: Dict[str, Any]) -> DossierOutput:
+        """Rebuild the output of an entity completed by an earlier run"""
+        entity_tier = record.get("tier") or "STANDARD"
+        dossier_path = self._get_dossier_path(entity.entity_id, entity_tier)
+        dossier_data = None
+        try:
+            with open(dossier_path, 'r', encoding='utf-8') as f:
+                dossier_data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not load resumed dossier for {entity.entity_id} from {dossier_path}: {e}")
+
+        return DossierOutput(
+            entity_id=entity.entity_id,
+            entity_name=record.get("entity_name") or entity.entity_name,
+            tier=entity_tier,
+            success=True,
+            dossier_data=dossier_data,
+            generation_time=float(record.get("generation_time") or 0.0),
+            cost_usd=float(record.get("cost_usd") or 0.0),
+            timestamp=record.get("timestamp") or datetime.now(timezone.utc).isoformat()
+        )
+
+    @staticmethod
+    def _resolve_tier(entity: EntityRecord, tier: str) -> str:
+        """Resolve AUTO to the entity's priority-based tier"""
+        if tier == "AUTO":
+            return calculate_dossier_tier(entity.priority_score)
+        return tier
+
     async def _generate_single_entity(
         self,
         entity: EntityRecord,
@@ -279,10 +538,7 @@ class BatchDossierGenerator:
             DossierOutput with result
         """
         start_time = time.time()
-        entity_tier = tier
-
-        if tier == "AUTO":
-            entity_tier = calculate_dossier_tier(entity.priority_score)
+        entity_tier = self._resolve_tier(entity, tier)
 
         try:
             logger.info(f"Generating {entity_tier} dossier for {entity.entity_name}")
@@ -323,47 +579,32 @@ class BatchDossierGenerator:
                 generation_time=generation_time
             )
 
-    def _filter_entities(
+    def _needs_generation(
         self,
-        entities: List[EntityRecord],
+        entity: EntityRecord,
         tier: str,
         force_refresh: bool
-    ) -> List[EntityRecord]:
-        """
-        Filter entities that need dossier generation.
-
-        Args:
-            entities: All entities
-            tier: Dossier tier
-            force_refresh: Skip freshness check
-
-        Returns:
-            List of entities that need generation
-        """
+    ) -> bool:
+        """Check whether an entity lacks a fresh dossier"""
         if force_refresh:
-            return entities
-
-        filtered = []
-        stale_threshold = datetime.now(timezone.utc) - timedelta(days=self.stale_days)
+            return True
 
-        for entity in entities:
-            # Check if existing dossier exists and is fresh
-            dossier_path = self._get_dossier_path(entity.entity_id, tier)
+        # Check if existing dossier exists and is fresh
+        dossier_path = self._get_dossier_path(entity.entity_id, tier)
 
-            if dossier_path.exists():
-                # Check file modification time
-                mtime = datetime.fromtimestamp(
-                    dossier_path.stat().st_mtime,
-                    tz=timezone.utc
-                )
-
-                if mtime > stale_threshold:
-                    logger.debug(f"Skipping {entity.entity_name} - fresh dossier exists")
-                    continue
+        if dossier_path.exists():
+            # Check file modification time
+            mtime = datetime.fromtimestamp(
+                dossier_path.stat().st_mtime,
+                tz=timezone.utc
+            )
+            stale_threshold = datetime.now(timezone.utc) - timedelta(days=self.stale_days)
 
-            filtered.append(entity)
+            if mtime > stale_threshold:
+                logger.debug(f"Skipping {entity.entity_name} - fresh dossier exists")
+                return False
 
-        return filtered
+        return True
 
     def _get_dossier_path(self, entity_id: str, tier: str) -> Path:
         """Get the file path for a dossier"""
@@ -729,6 +970,17 @@ def main():
         type=int,
         help="Limit number of entities (default: all from data source)"
     )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip entities already completed in the output directory's ledger"
+    )
+    parser.add_argument(
+        "--checkpoint-interval",
+        type=int,
+        default=20,
+        help="Finished entities between intermediate saves (default: 20)"
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -829,14 +1081,16 @@ def main():
     generator = BatchDossierGenerator(
         max_concurrent=args.max_concurrent,
         stale_days=args.stale_days,
-        output_dir=args.output_dir
+        output_dir=args.output_dir,
+        checkpoint_interval=args.checkpoint_interval
     )
 
     async def run(data_src: str):
         outputs, progress = await generator.generate_batch(
             entities=entities,
             tier=args.tier,
-            force_refresh=args.force_refresh
+            force_refresh=args.force_refresh,
+            resume=args.resume
         )
 
         # Print summary
@@ -848,6 +1102,8 @@ def main():
         print(f"Completed: {progress.completed}")
         print(f"Failed: {progress.failed}")
         print(f"Skipped: {progress.skipped}")
+        print(f"Resumed (already done): {progress.resumed}")
+        print(f"Throughput: {progress.get_throughput_per_minute():.2f} entities/min")
         print(f"Total Cost: ${progress.get_total_cost():.4f}")
         print(f"Time Elapsed: {progress.get_elapsed_seconds():.1f}s")
         print(f"Output Directory: {args.output_dir}")
@@ -46,6 +46,19 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _shared_cluster_intelligence() -> Optional[Any]:
+    """Process-wide ClusterIntelligence, or None where it cannot be loaded"""
+    try:
+        try:
+            from cluster_intelligence import get_shared_cluster_intelligence
+        except ImportError:
+            from backend.cluster_intelligence import get_shared_cluster_intelligence
+        return get_shared_cluster_intelligence()
+    except Exception as e:
+        logger.warning(f"⚠️  Cluster intelligence unavailable, feedback will not update clusters: {e}")
+        return None
+
+
 @dataclass
 class PatternFeedback:
     """Single feedback event for a pattern"""
@@ -80,6 +93,7 @@ class BindingFeedbackProcessor:
     - Lifecycle state transitions
     - Feedback history tracking
     - Re-discovery triggering for degraded bindings
+    - Incremental cluster intelligence updates (when a ClusterIntelligence is supplied)
     """
     
     # Confidence adjustment weights
@@ -107,7 +121,8 @@ class BindingFeedbackProcessor:
         self,
         bindings_dir: Optional[Path] = None,
         feedback_log_path: Optional[Path] = None,
-        rediscovery_queue_dir: Optional[Path] = None
+        rediscovery_queue_dir: Optional[Path] = None,
+        cluster_intelligence: Optional[Any] = None
     ):
         """
         Initialize feedback processor
@@ -116,10 +131,13 @@ class BindingFeedbackProcessor:
             bindings_dir: Directory containing runtime bindings
             feedback_log_path: Path to feedback log (JSONL)
             rediscovery_queue_dir: Directory for rediscovery queue
+            cluster_intelligence: ClusterIntelligence to receive binding deltas
+                (defaults to the process-wide shared instance)
         """
         self.bindings_dir = bindings_dir or Path("data/runtime_bindings")
         self.feedback_log_path = feedback_log_path or Path("data/feedback_history.jsonl")
         self.rediscovery_queue_dir = rediscovery_queue_dir or Path("data/rediscovery_queue")
+        self.cluster_intelligence = cluster_intelligence or _shared_cluster_intelligence()
         
         # Create directories if needed
         self.bindings_dir.mkdir(parents=True, exist_ok=True)
@@ -424,6 +442,9 @@ class BindingFeedbackProcessor:
         # Save updated binding
         self._save_binding(binding)
         
+        # Fold the change into the binding's cluster statistics
+        self._update_cluster_intelligence(binding)
+        
         # Log feedback to JSONL
         self._log_feedback({
             "entry_id": str(uuid.uuid4()),
@@ -544,6 +565,16 @@ class BindingFeedbackProcessor:
         except Exception as e:
             logger.error(f"❌ Failed to save binding: {e}")
     
+    def _update_cluster_intelligence(self, binding: Dict[str, Any]) -> None:
+        """Apply the updated binding to cluster intelligence as a delta"""
+        if self.cluster_intelligence is None:
+            return
+        
+        try:
+            self.cluster_intelligence.apply_binding_update(binding)
+        except Exception as e:
+            logger.error(f"❌ Failed to update cluster intelligence: {e}")
+    
     def _log_feedback(self, feedback_entry: Dict[str, Any]) -> None:
         """Append feedback entry to JSONL log"""
         try:
@@ -25,6 +25,11 @@ from urllib.parse import parse_qs, unquote, urlparse, urljoin
 from urllib.parse import urlencode
 import httpx
 
+try:
+    from backend.request_hedging import get_request_hedger
+except ImportError:
+    from request_hedging import get_request_hedger
+
 logger = logging.getLogger(__name__)
 
 
@@ -108,6 +113,8 @@ class BrightDataSDKClient:
         self._rate_limit_cooldown_seconds = 0.0
         self._rate_limit_cooldown_until = 0.0
         self._rate_limit_cooldown_until_epoch = 0.0
+        self.hedging_enabled = os.getenv("BRIGHTDATA_HEDGING_ENABLED", "false").strip().lower() in {"1", "true", "yes", "on"}
+        self._request_hedger = get_request_hedger("brightdata") if self.hedging_enabled else None
 
         if not self.token:
             logger.warning("⚠️ BRIGHTDATA_API_TOKEN not found in environment")
@@ -334,6 +341,13 @@ class BrightDataSDKClient:
         )
         return await asyncio.wait_for(awaitable, timeout=timeout_seconds)
 
+    async def _run_hedged(self, endpoint: str, call, is_success=None):
+        """Await ``call()``, hedging it with a duplicate request when BRIGHTDATA_HEDGING_ENABLED."""
+        hedger = getattr(self, "_request_hedger", None)
+        if hedger is None:
+            return await call()
+        return await hedger.run(endpoint, call, is_success=is_success or (lambda _result: True))
+
     async def _get_client(self):
         """Get or create async client context"""
         if self._client is None:
@@ -443,37 +457,7 @@ class BrightDataSDKClient:
                 try:
                     await self._wait_for_rate_limit_cooldown()
                     # Call search directly (SDK methods are async)
-                    if normalized_engine == "google":
-                        result = await asyncio.wait_for(
-                            client.search.google(
-                                query=query,
-                                location=sdk_location,
-                                language="en",
-                                num_results=num_results,
-                            ),
-                            timeout=search_timeout,
-                        )
-                    elif normalized_engine == "bing":
-                        result = await asyncio.wait_for(
-                            client.search.bing(
-                                query=query,
-                                location=sdk_location,
-                                language="en",
-                                num_results=num_results,
-                            ),
-                            timeout=search_timeout,
-                        )
-                    elif normalized_engine == "yandex":
-                        result = await asyncio.wait_for(
-                            client.search.yandex(
-                                query=query,
-                                location=sdk_location,
-                                language="en",
-                                num_results=num_results,
-                            ),
-                            timeout=search_timeout,
-                        )
-                    else:
+                    if normalized_engine not in {"google", "bing", "yandex"}:
                         return self._build_search_error_response(
                             query=query,
                             engine=normalized_engine,
@@ -481,6 +465,20 @@ class BrightDataSDKClient:
                             error=f"Unsupported search engine: {normalized_engine}",
                             metadata={"source": "brightdata_sdk"},
                         )
+                    search_fn = getattr(client.search, normalized_engine)
+                    result = await self._run_hedged(
+                        f"search:{normalized_engine}",
+                        lambda: asyncio.wait_for(
+                            search_fn(
+                                query=query,
+                                location=sdk_location,
+                                language="en",
+                                num_results=num_results,
+                            ),
+                            timeout=search_timeout,
+                        ),
+                        is_success=lambda value: bool(value) and getattr(value, "data", None) is not None,
+                    )
 
                     # Check if result has data and data is not None
                     if result and hasattr(result, 'data') and result.data is not None:
@@ -636,9 +634,12 @@ class BrightDataSDKClient:
                         lane_1_attempt = attempt
                         try:
                             await self._wait_for_rate_limit_cooldown()
-                            sdk_result = await asyncio.wait_for(
-                                client.scrape_url(url, response_format="raw"),
-                                timeout=scrape_timeout,
+                            sdk_result = await self._run_hedged(
+                                "scrape:raw",
+                                lambda: asyncio.wait_for(
+                                    client.scrape_url(url, response_format="raw"),
+                                    timeout=scrape_timeout,
+                                ),
                             )
                             self._recover_rate_limit_cooldown()
                             break
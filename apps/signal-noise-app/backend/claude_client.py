@@ -9,6 +9,7 @@ import urllib.parse
 from datetime import datetime
 from dataclasses import dataclass
 from collections import deque
+from contextlib import asynccontextmanager, nullcontext
 from pathlib import Path
 import httpx
 
@@ -17,6 +18,26 @@ try:
 except ImportError:
     from backend.http_client_pool import HttpClientPool
 
+try:
+    from llm_response_cache import LLMResponseCache
+except ImportError:
+    from backend.llm_response_cache import LLMResponseCache
+
+try:
+    from llm_scheduler import LLMAdmissionRejected, get_llm_scheduler
+except ImportError:
+    from backend.llm_scheduler import LLMAdmissionRejected, get_llm_scheduler
+
+try:
+    from json_scanner import JsonScanner
+except ImportError:
+    from backend.json_scanner import JsonScanner
+
+try:
+    from request_hedging import get_request_hedger
+except ImportError:
+    from backend.request_hedging import get_request_hedger
+
 try:
     from anthropic import Anthropic
     ANTHROPIC_SDK_AVAILABLE = True
@@ -522,6 +543,12 @@ class ClaudeClient:
             os.getenv("CHUTES_JSON_INCLUDE_REASONING"),
             default=False,
         )
+        # Close JSON-mode streams once the first top-level object is complete instead
+        # of waiting for trailing tokens; usage totals may then be missing.
+        self.chutes_stream_json_early_stop = self._parse_bool_env(
+            os.getenv("CHUTES_STREAM_JSON_EARLY_STOP"),
+            default=False,
+        )
         env_fallback_model = (os.getenv("CHUTES_FALLBACK_MODEL") or "").strip()
         if env_fallback_model and env_fallback_model != self.chutes_model:
             self.chutes_fallback_model = env_fallback_model
@@ -579,6 +606,23 @@ class ClaudeClient:
             os.getenv("LLM_PROVIDER_VALIDATION_STRICT"),
             default=True,
         )
+        self.llm_response_cache_enabled = self._parse_bool_env(
+            os.getenv("LLM_RESPONSE_CACHE_ENABLED"),
+            default=False,
+        )
+        # Free-form prompts run at non-zero temperature; only JSON-mode calls
+        # (temperature 0) replay deterministically unless a call site opts in.
+        self.llm_response_cache_json_only = self._parse_bool_env(
+            os.getenv("LLM_RESPONSE_CACHE_JSON_ONLY"),
+            default=True,
+        )
+        self._response_cache: Optional[LLMResponseCache] = None
+        if self.llm_response_cache_enabled:
+            self._response_cache = LLMResponseCache(
+                path=os.getenv("LLM_RESPONSE_CACHE_PATH", "backend/data/dossiers/llm_response_cache.sqlite3"),
+                ttl_seconds=float(os.getenv("LLM_RESPONSE_CACHE_TTL_SECONDS", "604800")),
+                max_entries=max(1, int(os.getenv("LLM_RESPONSE_CACHE_MAX_ENTRIES", "20000"))),
+            )
 
         disable_flag = (os.getenv("DISABLE_CLAUDE_API") or "").strip().lower()
         if disable_flag in {"1", "true", "yes", "on"}:
@@ -601,6 +645,15 @@ class ClaudeClient:
         self._chutes_rate_limit_cooldown_until_monotonic = 0.0
         self._chutes_rate_limit_cooldown_until_epoch = 0.0
         self._http_client_pool = HttpClientPool()
+        # Shared by every client in the process; None unless LLM_SCHEDULER_ENABLED.
+        self._llm_scheduler = get_llm_scheduler()
+        self.chutes_hedging_enabled = self._parse_bool_env(
+            os.getenv("CHUTES_HEDGING_ENABLED"),
+            default=False,
+        )
+        # Empty hedges to the same model; set to e.g. the fallback model to race an alternate.
+        self.chutes_hedge_model = (os.getenv("CHUTES_HEDGE_MODEL") or "").strip()
+        self._request_hedger = get_request_hedger("chutes") if self.chutes_hedging_enabled else None
         self._last_request_diagnostics: Dict[str, Any] = {
             "llm_provider": self.provider,
             "llm_retry_attempts": 0,
@@ -1066,6 +1119,8 @@ class ClaudeClient:
         self._chutes_rate_limit_cooldown_seconds = max(0.0, candidate)
         self._chutes_rate_limit_cooldown_until_monotonic = time.monotonic() + self._chutes_rate_limit_cooldown_seconds
         self._chutes_rate_limit_cooldown_until_epoch = time.time() + self._chutes_rate_limit_cooldown_seconds
+        if self._llm_scheduler is not None:
+            self._llm_scheduler.note_cooldown(self._chutes_rate_limit_cooldown_seconds)
         return self._chutes_rate_limit_cooldown_seconds
 
     def _recover_chutes_rate_limit_cooldown(self) -> None:
@@ -1125,6 +1180,59 @@ class ClaudeClient:
         factor = min(1.0, max(0.0, float(self.chutes_adaptive_recovery_factor or 0.9)))
         self._set_chutes_effective_min_interval(current * factor)
 
+    @asynccontextmanager
+    async def _chutes_request_slot(self):
+        """Hold this client's concurrency slot, its pacing, and the shared scheduler slot."""
+        async with self._chutes_request_semaphore:
+            await self._apply_chutes_request_throttle()
+            async with self._provider_slot():
+                yield
+
+    async def _send_chutes_request(
+        self,
+        *,
+        payload: Dict[str, Any],
+        headers: Dict[str, str],
+        timeout: httpx.Timeout,
+        stream: bool,
+    ) -> Dict[str, Any]:
+        """Send one Chutes completion, hedged when CHUTES_HEDGING_ENABLED.
+
+        The hedge runs inside the caller's request slot, so it never adds to
+        the provider concurrency the scheduler hands out; the hedger's budget
+        bounds the extra request volume.
+        """
+        send = self._query_chutes_streaming if stream else self._query_chutes_non_stream
+        hedger = getattr(self, "_request_hedger", None)
+        if hedger is None:
+            return await send(payload=payload, headers=headers, timeout=timeout)
+
+        primary_payload = dict(payload)
+        hedge_model = getattr(self, "chutes_hedge_model", "")
+        hedge_payload = dict(payload)
+        if hedge_model and hedge_model != payload.get("model"):
+            hedge_payload["model"] = hedge_model
+
+        async def _hedge() -> Dict[str, Any]:
+            data = await send(payload=hedge_payload, headers=headers, timeout=timeout)
+            if hedge_payload["model"] != primary_payload.get("model"):
+                data["served_model"] = hedge_payload["model"]
+            return data
+
+        mode = "stream" if stream else "non_stream"
+        return await hedger.run(
+            f"chutes:{primary_payload.get('model')}:{mode}",
+            lambda: send(payload=primary_payload, headers=headers, timeout=timeout),
+            _hedge,
+            is_success=lambda data: bool(data.get("answer_text") or data.get("structured_output")),
+            hedge_endpoint=f"chutes:{hedge_payload.get('model')}:{mode}",
+        )
+
+    def _provider_slot(self):
+        if self._llm_scheduler is None:
+            return nullcontext()
+        return self._llm_scheduler.slot()
+
     async def _apply_chutes_request_throttle(self) -> None:
         min_interval_seconds = self._effective_chutes_min_interval_seconds()
         if min_interval_seconds <= 0.0:
@@ -1162,10 +1270,24 @@ class ClaudeClient:
             self._reset_quota_circuit()
 
     def get_runtime_diagnostics(self) -> Dict[str, Any]:
-        return dict(self._last_request_diagnostics)
+        diagnostics = dict(self._last_request_diagnostics)
+        if self._response_cache is not None:
+            diagnostics["llm_response_cache"] = self._response_cache.snapshot()
+        if self._llm_scheduler is not None:
+            diagnostics["llm_scheduler"] = self._llm_scheduler.snapshot()
+        if getattr(self, "_request_hedger", None) is not None:
+            diagnostics["request_hedging"] = self._request_hedger.snapshot()
+        return diagnostics
+
+    def get_response_cache_stats(self) -> Dict[str, Any]:
+        if self._response_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._response_cache.snapshot()}
 
     async def close(self) -> None:
         await self._http_client_pool.close()
+        if self._response_cache is not None:
+            self._response_cache.close()
 
     @staticmethod
     def _format_chutes_error(error: Exception) -> str:
@@ -1323,6 +1445,65 @@ class ClaudeClient:
         # All models failed
         raise Exception("All models in cascade failed")
 
+    def _response_cache_model_identity(self, model: str, json_mode: bool) -> str:
+        if self.provider in {self.PROVIDER_CHUTES_OPENAI, self.PROVIDER_CHUTES_ANTHROPIC}:
+            runtime_model = self._resolve_chutes_runtime_model(model)
+            if json_mode and self.chutes_model_json:
+                runtime_model = f"{runtime_model}|json:{self.chutes_model_json}"
+            return runtime_model
+        model_config = ModelRegistry.get_model(model)
+        return model_config.model_id if model_config else str(model)
+
+    def _response_cache_key(
+        self,
+        *,
+        prompt: str,
+        model: str,
+        max_tokens: int,
+        tools: Optional[List[Dict]],
+        system_prompt: Optional[str],
+        json_mode: bool,
+        json_schema: Optional[Dict[str, Any]],
+    ) -> Optional[str]:
+        if self._response_cache is None:
+            return None
+        return LLMResponseCache.build_key(
+            provider=self.provider,
+            model=str(model or "").strip().lower(),
+            runtime_model=self._response_cache_model_identity(model, json_mode),
+            system_prompt=system_prompt or "",
+            prompt=prompt,
+            tools=tools or None,
+            json_mode=bool(json_mode),
+            json_schema=json_schema or None,
+            max_tokens=int(max_tokens),
+        )
+
+    def _should_use_response_cache(self, cache: Optional[bool], json_mode: bool) -> bool:
+        if self._response_cache is None or cache is False:
+            return False
+        if cache is True:
+            return True
+        return bool(json_mode) or not self.llm_response_cache_json_only
+
+    def _is_cacheable_response(self, result: Any, *, json_mode: bool) -> bool:
+        # Only replay answers a caller could have used: truncated, empty or
+        # unparseable JSON responses are left to the normal retry paths.
+        if not isinstance(result, dict):
+            return False
+        if str(result.get("stop_reason") or "").lower() in {"length", "max_tokens"}:
+            return False
+        diagnostics = result.get("inference_diagnostics")
+        if isinstance(diagnostics, dict) and diagnostics.get("empty_content_fast_fail"):
+            return False
+        content = result.get("content")
+        if json_mode:
+            return (
+                isinstance(result.get("structured_output"), dict)
+                or self._extract_structured_output(content) is not None
+            )
+        return isinstance(content, str) and bool(content.strip())
+
     async def query(
         self,
         prompt: str,
@@ -1336,6 +1517,7 @@ class ClaudeClient:
         max_retries_override: Optional[int] = None,
         empty_retries_before_fallback_override: Optional[int] = None,
         fast_fail_on_length: bool = False,
+        cache: Optional[bool] = None,
     ) -> Dict[str, Any]:
         """
         Query Claude with specific model using Anthropic SDK
@@ -1346,10 +1528,62 @@ class ClaudeClient:
             max_tokens: Maximum tokens to generate
             tools: Optional list of tools
             system_prompt: Optional system prompt
+            cache: Response cache override for this call. None follows
+                LLM_RESPONSE_CACHE_* settings, False always goes to the
+                provider, True also caches free-form (non-JSON) prompts.
 
         Returns:
-            Response dict with content, tokens_used, etc.
+            Response dict with content, tokens_used, etc. Cache hits carry a
+            ``response_cache`` entry with the entry age.
         """
+        cache_key = None
+        if self._should_use_response_cache(cache, json_mode):
+            cache_key = self._response_cache_key(
+                prompt=prompt,
+                model=model,
+                max_tokens=max_tokens,
+                tools=tools,
+                system_prompt=system_prompt,
+                json_mode=json_mode,
+                json_schema=json_schema,
+            )
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                self._set_last_request_diagnostics(retry_attempts=0, last_status="cache_hit")
+                return cached
+
+        started = time.monotonic()
+        result = await self._query_provider(
+            prompt=prompt,
+            model=model,
+            max_tokens=max_tokens,
+            tools=tools,
+            system_prompt=system_prompt,
+            json_mode=json_mode,
+            json_schema=json_schema,
+            stream=stream,
+            max_retries_override=max_retries_override,
+            empty_retries_before_fallback_override=empty_retries_before_fallback_override,
+            fast_fail_on_length=fast_fail_on_length,
+        )
+        if cache_key and self._is_cacheable_response(result, json_mode=json_mode):
+            self._response_cache.put(cache_key, result, latency_seconds=time.monotonic() - started)
+        return result
+
+    async def _query_provider(
+        self,
+        prompt: str,
+        model: str = "haiku",
+        max_tokens: int = 2000,
+        tools: Optional[List[Dict]] = None,
+        system_prompt: Optional[str] = None,
+        json_mode: bool = False,
+        json_schema: Optional[Dict[str, Any]] = None,
+        stream: Optional[bool] = None,
+        max_retries_override: Optional[int] = None,
+        empty_retries_before_fallback_override: Optional[int] = None,
+        fast_fail_on_length: bool = False,
+    ) -> Dict[str, Any]:
         if self.provider == self.PROVIDER_CHUTES_OPENAI:
             return await self._query_chutes(
                 prompt=prompt,
@@ -1400,13 +1634,14 @@ class ClaudeClient:
             messages = [{"role": "user", "content": prompt}]
 
             # Create message
-            response = client.messages.create(
-                model=model_config.model_id,
-                max_tokens=max_tokens,
-                messages=messages,
-                temperature=0.7 if system_prompt is None else 0.4,
-                system=system_prompt
-            )
+            async with self._provider_slot():
+                response = client.messages.create(
+                    model=model_config.model_id,
+                    max_tokens=max_tokens,
+                    messages=messages,
+                    temperature=0.7 if system_prompt is None else 0.4,
+                    system=system_prompt
+                )
 
             # Extract content
             content = response.content[0].text if response.content else ""
@@ -1538,22 +1773,15 @@ class ClaudeClient:
                     connect=min(request_timeout_seconds, 15.0),
                     read=min(request_timeout_seconds, self.chutes_stream_idle_timeout_seconds),
                 )
-                if request_stream:
-                    async with self._chutes_request_semaphore:
-                        await self._apply_chutes_request_throttle()
-                        data = await self._query_chutes_streaming(
-                            payload=payload,
-                            headers=headers,
-                            timeout=timeout,
-                        )
-                else:
-                    async with self._chutes_request_semaphore:
-                        await self._apply_chutes_request_throttle()
-                        data = await self._query_chutes_non_stream(
-                            payload=payload,
-                            headers=headers,
-                            timeout=timeout,
-                        )
+                async with self._chutes_request_slot():
+                    data = await self._send_chutes_request(
+                        payload=payload,
+                        headers=headers,
+                        timeout=timeout,
+                        stream=request_stream,
+                    )
+                if data.get("served_model"):
+                    payload["model"] = data["served_model"]
 
                 content = data.get("answer_text", "")
                 reasoning_content = data.get("reasoning_text", "")
@@ -1735,6 +1963,9 @@ class ClaudeClient:
                         "attempt_history": list(attempt_history),
                     },
                 }
+            except LLMAdmissionRejected:
+                # Shed by the scheduler: retrying here would defeat load shedding
+                raise
             except Exception as e:
                 last_error = e
                 error_detail = self._format_chutes_error(e)
@@ -1942,6 +2173,11 @@ class ClaudeClient:
         stop_reason: Optional[str] = None
         chunk_count = 0
         raw_events: List[Dict[str, Any]] = []
+        json_scanner = (
+            JsonScanner()
+            if getattr(self, "chutes_stream_json_early_stop", False) and payload.get("response_format")
+            else None
+        )
 
         async with httpx.AsyncClient(timeout=timeout) as client:
             async with client.stream(
@@ -1988,6 +2224,10 @@ class ClaudeClient:
                     if isinstance(event, dict) and isinstance(event.get("usage"), dict):
                         usage = event["usage"]
                     chunk_count += 1
+                    if json_scanner is not None and content_text and json_scanner.feed(content_text).complete:
+                        stop_reason = stop_reason or "stop"
+                        self._record_chutes_event("stream_json_early_stop")
+                        break
 
         return {
             "answer_text": "".join(answer_parts),
@@ -2045,8 +2285,7 @@ class ClaudeClient:
                     timeout=self.chutes_timeout_seconds,
                     connect=min(self.chutes_timeout_seconds, 15.0),
                 )
-                async with self._chutes_request_semaphore:
-                    await self._apply_chutes_request_throttle()
+                async with self._chutes_request_slot():
                     async with httpx.AsyncClient(timeout=timeout) as client:
                         response = await client.post(
                             f"{self.base_url.rstrip('/')}/messages",
@@ -2115,6 +2354,9 @@ class ClaudeClient:
                     },
                     "stop_reason": stop_reason,
                 }
+            except LLMAdmissionRejected:
+                # Shed by the scheduler: retrying here would defeat load shedding
+                raise
             except Exception as e:
                 last_error = e
                 error_detail = self._format_chutes_error(e)
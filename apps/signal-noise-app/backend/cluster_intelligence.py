@@ -22,10 +22,18 @@ Example:
 
     priorities = intelligence.get_channel_priorities("tier_1_club_centralized_procurement")
     # Returns: ["official_site/news", "linkedin/jobs", "press_releases"]
+
+    # Promotions, feedback and usage updates apply a delta instead of a rollup
+    intelligence.apply_binding_update(binding)
 """
 
+import atexit
 import json
 import logging
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from typing import Dict, List, Any, Optional
@@ -40,6 +48,23 @@ from template_runtime_binding import RuntimeBinding, RuntimeBindingCache
 
 logger = logging.getLogger(__name__)
 
+# Dirty clusters are persisted together once this many accumulate or the
+# interval elapses, instead of rewriting the cache file on every update
+CLUSTER_INTELLIGENCE_SAVE_BATCH_SIZE = int(os.getenv("CLUSTER_INTELLIGENCE_SAVE_BATCH_SIZE", "50"))
+CLUSTER_INTELLIGENCE_SAVE_INTERVAL_SECONDS = float(os.getenv("CLUSTER_INTELLIGENCE_SAVE_INTERVAL_SECONDS", "5.0"))
+# Deltas only cover updates made in this process; reads re-roll a cluster from
+# all bindings once its last full rollup is older than this
+CLUSTER_INTELLIGENCE_MAX_AGE_SECONDS = float(os.getenv("CLUSTER_INTELLIGENCE_MAX_AGE_SECONDS", "3600"))
+
+
+def _binding_value(binding: Any, name: str, default: Any = None) -> Any:
+    """Read a field from a RuntimeBinding or its dict form (feedback processor)"""
+    if isinstance(binding, dict):
+        value = binding.get(name, default)
+    else:
+        value = getattr(binding, name, default)
+    return default if value is None else value
+
 
 @dataclass
 class ClusterStats:
@@ -65,6 +90,79 @@ class ClusterStats:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class ClusterAggregate:
+    """
+    Mergeable running totals behind a cluster's ClusterStats
+
+    Each promoted binding contributes its usage, success rate, channels and
+    signals. Keeping the last contribution per entity lets an update retract
+    the old values and add the new ones, so stats change in time proportional
+    to the binding's channels and signals rather than the cluster size.
+
+    Attributes:
+        cluster_id: Template/cluster identifier
+        binding_count: Number of contributing (promoted) bindings
+        usage_total: Sum of usage counts
+        success_total: Sum of success rates
+        confidence_adjustment_total: Sum of confidence adjustments
+        channel_totals: Channel → [usage-weighted success, usage weight, bindings]
+        signal_totals: Signal → [success rate sum, bindings]
+        members: Entity → contribution currently counted in the totals
+    """
+    cluster_id: str
+    binding_count: int = 0
+    usage_total: float = 0.0
+    success_total: float = 0.0
+    confidence_adjustment_total: float = 0.0
+    channel_totals: Dict[str, List[float]] = field(default_factory=dict)
+    signal_totals: Dict[str, List[float]] = field(default_factory=dict)
+    members: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def set_member(self, entity_id: str, contribution: Optional[Dict[str, Any]]) -> None:
+        """Replace an entity's contribution (None removes it from the cluster)"""
+        previous = self.members.pop(entity_id, None)
+        if previous is not None:
+            self._add(previous, -1)
+        if contribution is not None:
+            self.members[entity_id] = contribution
+            self._add(contribution, 1)
+
+    def merge(self, other: "ClusterAggregate") -> None:
+        """Fold another aggregate of the same cluster into this one"""
+        for entity_id, contribution in other.members.items():
+            self.set_member(entity_id, contribution)
+
+    def _add(self, contribution: Dict[str, Any], sign: int) -> None:
+        usage = contribution["usage_count"]
+        success = contribution["success_rate"]
+
+        self.binding_count += sign
+        self.usage_total += sign * usage
+        self.success_total += sign * success
+        self.confidence_adjustment_total += sign * contribution["confidence_adjustment"]
+
+        for channel in contribution["channels"]:
+            totals = self.channel_totals.setdefault(channel, [0.0, 0.0, 0])
+            totals[0] += sign * success * usage
+            totals[1] += sign * usage
+            totals[2] += sign
+            if totals[2] <= 0:
+                del self.channel_totals[channel]
+
+        for signal in contribution["signals"]:
+            totals = self.signal_totals.setdefault(signal, [0.0, 0])
+            totals[0] += sign * success
+            totals[1] += sign
+            if totals[1] <= 0:
+                del self.signal_totals[signal]
+
+        if self.binding_count <= 0:
+            # Drop floating point residue once the cluster is empty
+            self.binding_count = 0
+            self.usage_total = self.success_total = self.confidence_adjustment_total = 0.0
+
+
 class ClusterIntelligence:
     """
     Cluster intelligence system
@@ -95,6 +193,12 @@ class ClusterIntelligence:
 
         # Load existing intelligence
         self._intelligence_cache: Dict[str, ClusterStats] = {}
+        self._aggregates: Dict[str, ClusterAggregate] = {}
+        self._rolled_up_at: Dict[str, float] = {}
+        self._lock = threading.RLock()
+        self._dirty_clusters: set = set()
+        self._batch_depth = 0
+        self._last_save = time.monotonic()
         self._load_cache()
 
         logger.info(f"🧠 ClusterIntelligence initialized ({len(self._intelligence_cache)} clusters)")
@@ -109,40 +213,111 @@ class ClusterIntelligence:
                 for cluster_id, stats_data in data.get("clusters", {}).items():
                     self._intelligence_cache[cluster_id] = ClusterStats(**stats_data)
 
+                # Caches written before incremental rollups have no aggregates;
+                # those clusters are rebuilt from bindings on their next update
+                for cluster_id, aggregate_data in data.get("aggregates", {}).items():
+                    self._aggregates[cluster_id] = ClusterAggregate(**aggregate_data)
+
                 logger.info(f"✅ Loaded {len(self._intelligence_cache)} cluster intelligence profiles")
 
             except Exception as e:
                 logger.error(f"❌ Error loading cluster intelligence cache: {e}")
                 self._intelligence_cache = {}
+                self._aggregates = {}
         else:
             logger.info("ℹ️ No existing cluster intelligence cache, starting fresh")
 
     def _save_cache(self):
-        """Save cluster intelligence to disk"""
-        try:
-            data = {
-                "clusters": {
-                    cluster_id: asdict(stats)
-                    for cluster_id, stats in self._intelligence_cache.items()
-                },
-                "metadata": {
-                    "total_clusters": len(self._intelligence_cache),
-                    "last_updated": datetime.now().isoformat()
+        """
+        Save cluster intelligence to disk
+
+        Writes to a temporary file in the same directory and renames it over
+        the cache, so readers never see a partially written file.
+        """
+        with self._lock:
+            try:
+                data = {
+                    "clusters": {
+                        cluster_id: asdict(stats)
+                        for cluster_id, stats in self._intelligence_cache.items()
+                    },
+                    "aggregates": {
+                        cluster_id: asdict(aggregate)
+                        for cluster_id, aggregate in self._aggregates.items()
+                    },
+                    "metadata": {
+                        "total_clusters": len(self._intelligence_cache),
+                        "last_updated": datetime.now().isoformat()
+                    }
                 }
-            }
 
-            with open(self.cache_path, 'w') as f:
-                json.dump(data, f, indent=2)
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=self.cache_path.parent, prefix=f".{self.cache_path.name}.", suffix=".tmp"
+                )
+                try:
+                    with os.fdopen(fd, 'w') as f:
+                        json.dump(data, f, indent=2)
+                    os.replace(tmp_path, self.cache_path)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+
+                self._dirty_clusters.clear()
+                self._last_save = time.monotonic()
+                logger.debug(f"💾 Saved {len(self._intelligence_cache)} cluster intelligence profiles")
 
-            logger.debug(f"💾 Saved {len(self._intelligence_cache)} cluster intelligence profiles")
+            except Exception as e:
+                logger.error(f"❌ Error saving cluster intelligence cache: {e}")
+
+    def flush(self):
+        """
+        Persist any clusters updated since the last save
 
-        except Exception as e:
-            logger.error(f"❌ Error saving cluster intelligence cache: {e}")
+        Shared instances are flushed at interpreter exit; others must call
+        this (or use batch_updates) before they are dropped.
+        """
+        with self._lock:
+            if self._dirty_clusters:
+                self._save_cache()
+
+    @contextmanager
+    def batch_updates(self):
+        """
+        Defer persistence until the block exits
+
+        Example:
+            with intelligence.batch_updates():
+                for binding in promoted:
+                    intelligence.apply_binding_update(binding)
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self.flush()
+
+    def _mark_dirty(self, cluster_id: str):
+        """Record an updated cluster and save once the batch is full or stale"""
+        self._dirty_clusters.add(cluster_id)
+        if self._batch_depth:
+            return
+        if (
+            len(self._dirty_clusters) >= CLUSTER_INTELLIGENCE_SAVE_BATCH_SIZE
+            or time.monotonic() - self._last_save >= CLUSTER_INTELLIGENCE_SAVE_INTERVAL_SECONDS
+        ):
+            self._save_cache()
 
     def rollup_cluster_data(self, cluster_id: str) -> ClusterStats:
         """
         Aggregate data from all promoted bindings in cluster
 
+        Full rebuild of the cluster's aggregates from the binding cache. Day to
+        day, apply_binding_update keeps them current; use this to reconcile.
+
         Only uses PROMOTED bindings (high trust threshold).
         Calculates:
         - Channel effectiveness (success rate by channel)
@@ -157,60 +332,165 @@ class ClusterIntelligence:
         """
         logger.info(f"🧠 Rolling up cluster intelligence for {cluster_id}")
 
-        # Get all bindings for cluster
-        all_bindings = self.binding_cache.list_bindings(template_id=cluster_id)
-
-        # Filter for promoted bindings only
-        promoted_bindings = [
-            b for b in all_bindings
-            if getattr(b, 'state', 'EXPLORING') == 'PROMOTED'
-        ]
+        with self._lock:
+            stats = self._rebuild_cluster(
+                cluster_id, self.binding_cache.list_bindings(template_id=cluster_id)
+            )
+            self._mark_dirty(cluster_id)
+            if not self._batch_depth:
+                self.flush()
 
-        if not promoted_bindings:
+        if not stats.total_bindings:
             logger.warning(f"⚠️ No promoted bindings found for cluster {cluster_id}")
-            return ClusterStats(cluster_id=cluster_id, total_bindings=0)
+            return stats
+
+        logger.info(
+            f"✅ Cluster intelligence rolled up: "
+            f"{stats.total_bindings} promoted bindings, "
+            f"{len(stats.channel_effectiveness)} channels, "
+            f"{len(stats.signal_reliability)} signals, "
+            f"{len(stats.discovery_shortcuts)} shortcuts"
+        )
+
+        return stats
+
+    def apply_binding_update(self, binding: Any) -> Optional[ClusterStats]:
+        """
+        Apply a binding promotion, feedback event or usage update as a delta
+
+        The binding's previous contribution to its cluster is retracted and
+        the current one added (nothing, unless it is PROMOTED). Only the
+        affected cluster's stats are recomputed; persistence is batched.
+
+        Args:
+            binding: RuntimeBinding or its dict form
+
+        Returns:
+            Updated ClusterStats, or None if the binding has no cluster
+        """
+        cluster_id = _binding_value(binding, "template_id")
+        entity_id = _binding_value(binding, "entity_id")
+        if not cluster_id or not entity_id:
+            return None
+
+        with self._lock:
+            if cluster_id not in self._aggregates:
+                # First update for a cluster without aggregates: seed it once
+                self._rebuild_cluster(cluster_id, self.binding_cache.list_bindings(template_id=cluster_id))
+
+            self._aggregates[cluster_id].set_member(entity_id, self._binding_contribution(binding))
+            stats = self._refresh_stats(cluster_id)
+            self._mark_dirty(cluster_id)
+
+        return stats
+
+    def remove_binding(self, cluster_id: str, entity_id: str) -> Optional[ClusterStats]:
+        """
+        Retract a deleted binding from its cluster
+
+        Args:
+            cluster_id: Template/cluster identifier
+            entity_id: Entity whose binding was removed
 
-        logger.info(f"✅ Found {len(promoted_bindings)} promoted bindings for {cluster_id}")
+        Returns:
+            Updated ClusterStats, or None if the cluster has no aggregates
+        """
+        with self._lock:
+            aggregate = self._aggregates.get(cluster_id)
+            if aggregate is None or entity_id not in aggregate.members:
+                return self._intelligence_cache.get(cluster_id)
+
+            aggregate.set_member(entity_id, None)
+            stats = self._refresh_stats(cluster_id)
+            self._mark_dirty(cluster_id)
+
+        return stats
+
+    def _rebuild_cluster(self, cluster_id: str, bindings: List[Any]) -> ClusterStats:
+        """Replace a cluster's aggregates with totals over the given bindings"""
+        aggregate = ClusterAggregate(cluster_id=cluster_id)
+
+        for binding in bindings:
+            contribution = self._binding_contribution(binding)
+            if contribution is not None:
+                aggregate.set_member(_binding_value(binding, "entity_id"), contribution)
+
+        self._aggregates[cluster_id] = aggregate
+        self._rolled_up_at[cluster_id] = time.monotonic()
+        return self._refresh_stats(cluster_id)
+
+    def _current_stats(self, cluster_id: str) -> ClusterStats:
+        """
+        Cached stats, rolled up first if never seen or stale
+
+        Stats loaded from disk count as stale, so each cluster is reconciled
+        with the binding cache on first read; after that reads are dictionary
+        lookups until CLUSTER_INTELLIGENCE_MAX_AGE_SECONDS pass.
+        """
+        stats = self._intelligence_cache.get(cluster_id)
+        rolled_up_at = self._rolled_up_at.get(cluster_id)
+
+        if stats is None:
+            logger.info(f"⚠️ No cached intelligence for {cluster_id}, rolling up fresh data")
+        elif rolled_up_at is None or time.monotonic() - rolled_up_at > CLUSTER_INTELLIGENCE_MAX_AGE_SECONDS:
+            logger.info(f"🔄 Cached intelligence for {cluster_id} is stale, rolling up fresh data")
+        else:
+            return stats
+
+        return self.rollup_cluster_data(cluster_id)
+
+    def _binding_contribution(self, binding: Any) -> Optional[Dict[str, Any]]:
+        """
+        Extract what a binding adds to its cluster's totals
+
+        Only PROMOTED bindings contribute. A signal counts when the binding
+        has at least one example for it.
+        """
+        if _binding_value(binding, "state", "EXPLORING") != "PROMOTED":
+            return None
 
-        # Calculate channel effectiveness
-        channel_effectiveness = self._calculate_channel_effectiveness(promoted_bindings)
+        enriched_patterns = _binding_value(binding, "enriched_patterns", {})
 
-        # Calculate signal reliability
-        signal_reliability = self._calculate_signal_reliability(promoted_bindings)
+        return {
+            "usage_count": _binding_value(binding, "usage_count", 0),
+            "success_rate": _binding_value(binding, "success_rate", 0.0),
+            "confidence_adjustment": _binding_value(binding, "confidence_adjustment", 0.0),
+            "channels": list(_binding_value(binding, "discovered_channels", {}).keys()),
+            "signals": [name for name, examples in enriched_patterns.items() if examples],
+        }
+
+    def _refresh_stats(self, cluster_id: str) -> ClusterStats:
+        """Derive and cache ClusterStats from the cluster's aggregates"""
+        aggregate = self._aggregates[cluster_id]
+
+        if not aggregate.binding_count:
+            stats = ClusterStats(cluster_id=cluster_id, total_bindings=0)
+            self._intelligence_cache[cluster_id] = stats
+            return stats
 
-        # Generate discovery shortcuts (sorted channels)
-        discovery_shortcuts = self._generate_discovery_shortcuts(channel_effectiveness)
+        channel_effectiveness = self._calculate_channel_effectiveness(aggregate)
+        signal_reliability = self._calculate_signal_reliability(aggregate)
+        count = aggregate.binding_count
 
-        # Create cluster stats
         stats = ClusterStats(
             cluster_id=cluster_id,
             channel_effectiveness=channel_effectiveness,
             signal_reliability=signal_reliability,
-            discovery_shortcuts=discovery_shortcuts,
-            total_bindings=len(promoted_bindings),
+            discovery_shortcuts=self._generate_discovery_shortcuts(channel_effectiveness),
+            total_bindings=count,
             metadata={
-                "avg_usage_count": sum(b.usage_count for b in promoted_bindings) / len(promoted_bindings),
-                "avg_success_rate": sum(b.success_rate for b in promoted_bindings) / len(promoted_bindings),
-                "avg_confidence_adjustment": sum(b.confidence_adjustment for b in promoted_bindings) / len(promoted_bindings)
+                "avg_usage_count": aggregate.usage_total / count,
+                "avg_success_rate": aggregate.success_total / count,
+                "avg_confidence_adjustment": aggregate.confidence_adjustment_total / count
             }
         )
 
-        # Cache intelligence
         self._intelligence_cache[cluster_id] = stats
-        self._save_cache()
-
-        logger.info(
-            f"✅ Cluster intelligence rolled up: "
-            f"{len(channel_effectiveness)} channels, "
-            f"{len(signal_reliability)} signals, "
-            f"{len(discovery_shortcuts)} shortcuts"
-        )
-
         return stats
 
     def _calculate_channel_effectiveness(
         self,
-        promoted_bindings: List[RuntimeBinding]
+        aggregate: ClusterAggregate
     ) -> Dict[str, float]:
         """
         Calculate channel effectiveness scores
@@ -219,34 +499,15 @@ class ClusterIntelligence:
         weighted by usage count (more usage = more confidence)
 
         Args:
-            promoted_bindings: List of promoted bindings
+            aggregate: Cluster aggregates
 
         Returns:
             Dictionary of channel → effectiveness score (0.0 to 1.0)
         """
-        channel_scores = defaultdict(list)
-        channel_weights = defaultdict(float)
-
-        for binding in promoted_bindings:
-            # Get channels used by this binding
-            for channel_type in binding.discovered_channels.keys():
-                # Weight by usage count (more executions = more reliable)
-                weight = binding.usage_count
-
-                # Weighted score
-                weighted_score = binding.success_rate * weight
-
-                channel_scores[channel_type].append(weighted_score)
-                channel_weights[channel_type] += weight
-
-        # Calculate weighted average
         channel_effectiveness = {}
 
-        for channel, scores in channel_scores.items():
-            total_weight = channel_weights[channel]
-            avg_score = sum(scores) / total_weight if total_weight > 0 else 0.0
-
-            channel_effectiveness[channel] = avg_score
+        for channel, (weighted_score, total_weight, _) in aggregate.channel_totals.items():
+            channel_effectiveness[channel] = weighted_score / total_weight if total_weight > 0 else 0.0
 
         logger.debug(f"📊 Channel effectiveness: {channel_effectiveness}")
 
@@ -254,7 +515,7 @@ class ClusterIntelligence:
 
     def _calculate_signal_reliability(
         self,
-        promoted_bindings: List[RuntimeBinding]
+        aggregate: ClusterAggregate
     ) -> Dict[str, float]:
         """
         Calculate signal reliability scores
@@ -262,30 +523,18 @@ class ClusterIntelligence:
         Reliability = correlation between signal presence and binding success
 
         Args:
-            promoted_bindings: List of promoted bindings
+            aggregate: Cluster aggregates
 
         Returns:
             Dictionary of signal → reliability score (0.0 to 1.0)
         """
-        signal_scores = defaultdict(list)
-        signal_counts = defaultdict(int)
-
-        for binding in promoted_bindings:
-            # Get enriched patterns from this binding
-            for pattern_name, examples in binding.enriched_patterns.items():
-                if examples:  # Signal present
-                    # Signal contributes to success rate
-                    signal_scores[pattern_name].append(binding.success_rate)
-                    signal_counts[pattern_name] += 1
-
-        # Calculate average reliability
         signal_reliability = {}
 
-        for signal, scores in signal_scores.items():
-            avg_score = sum(scores) / len(scores) if scores else 0.0
+        for signal, (score_total, count) in aggregate.signal_totals.items():
+            avg_score = score_total / count if count else 0.0
 
             # Boost score if signal appears frequently (reliable indicator)
-            frequency_boost = min(signal_counts[signal] * 0.01, 0.1)
+            frequency_boost = min(count * 0.01, 0.1)
 
             signal_reliability[signal] = min(avg_score + frequency_boost, 1.0)
 
@@ -323,7 +572,10 @@ class ClusterIntelligence:
         """
         Return channels sorted by effectiveness for new entities
 
-        Uses cached intelligence if available, rolls up fresh data if not.
+        A dictionary lookup: shortcuts are kept current by
+        apply_binding_update. A cluster is only rolled up when it has never
+        been seen (the result, even an empty one, is cached), was loaded from
+        disk, or its last rollup is older than CLUSTER_INTELLIGENCE_MAX_AGE_SECONDS.
 
         Args:
             cluster_id: Template/cluster identifier
@@ -331,18 +583,7 @@ class ClusterIntelligence:
         Returns:
             List of channels sorted by effectiveness (descending)
         """
-        # Check cache
-        if cluster_id not in self._intelligence_cache:
-            logger.info(f"⚠️ No cached intelligence for {cluster_id}, rolling up fresh data")
-            self.rollup_cluster_data(cluster_id)
-
-        stats = self._intelligence_cache.get(cluster_id)
-
-        if not stats:
-            logger.warning(f"⚠️ No intelligence available for {cluster_id}")
-            return []
-
-        return stats.discovery_shortcuts
+        return self._current_stats(cluster_id).discovery_shortcuts
 
     def get_cluster_stats(self, cluster_id: str) -> Optional[ClusterStats]:
         """
@@ -354,12 +595,7 @@ class ClusterIntelligence:
         Returns:
             ClusterStats if available, None otherwise
         """
-        # Check cache
-        if cluster_id not in self._intelligence_cache:
-            logger.info(f"⚠️ No cached intelligence for {cluster_id}, rolling up fresh data")
-            self.rollup_cluster_data(cluster_id)
-
-        return self._intelligence_cache.get(cluster_id)
+        return self._current_stats(cluster_id)
 
     def get_all_cluster_stats(self) -> Dict[str, ClusterStats]:
         """
@@ -384,16 +620,19 @@ class ClusterIntelligence:
         """Refresh cluster intelligence for all clusters"""
         logger.info("🔄 Refreshing all cluster intelligence")
 
-        # Get all unique template IDs
-        all_bindings = self.binding_cache.list_bindings()
-        unique_clusters = set(b.template_id for b in all_bindings)
+        # Group all bindings by template in one pass
+        bindings_by_cluster = defaultdict(list)
+        for binding in self.binding_cache.list_bindings():
+            bindings_by_cluster[_binding_value(binding, "template_id")].append(binding)
 
-        logger.info(f"Found {len(unique_clusters)} unique clusters")
+        logger.info(f"Found {len(bindings_by_cluster)} unique clusters")
 
-        for cluster_id in unique_clusters:
-            self.rollup_cluster_data(cluster_id)
+        with self._lock, self.batch_updates():
+            for cluster_id, bindings in bindings_by_cluster.items():
+                self._rebuild_cluster(cluster_id, bindings)
+                self._mark_dirty(cluster_id)
 
-        logger.info(f"✅ Refreshed {len(unique_clusters)} clusters")
+        logger.info(f"✅ Refreshed {len(bindings_by_cluster)} clusters")
 
     def get_global_summary(self) -> Dict[str, Any]:
         """
@@ -472,6 +711,53 @@ def get_cluster_intelligence(
     return ClusterIntelligence(binding_cache, cache_path)
 
 
+# Shared instance over the default binding cache, plus one per explicit cache
+# (keyed by id; each instance holds its cache, so ids are not reused)
+_shared_intelligence: Optional[ClusterIntelligence] = None
+_shared_intelligence_by_cache: Dict[int, ClusterIntelligence] = {}
+_shared_intelligence_lock = threading.Lock()
+
+
+def get_shared_cluster_intelligence(
+    binding_cache: Optional[RuntimeBindingCache] = None
+) -> ClusterIntelligence:
+    """
+    Process-wide cluster intelligence that feedback, promotion and usage
+    updates are applied to
+
+    Args:
+        binding_cache: Binding cache to roll up from; callers passing the
+            same cache share one instance, and None shares the default one
+
+    Returns:
+        Shared ClusterIntelligence instance for that binding cache
+    """
+    global _shared_intelligence
+    with _shared_intelligence_lock:
+        if binding_cache is None:
+            if _shared_intelligence is None:
+                _shared_intelligence = ClusterIntelligence()
+            return _shared_intelligence
+        intelligence = _shared_intelligence_by_cache.get(id(binding_cache))
+        if intelligence is None:
+            intelligence = ClusterIntelligence(binding_cache=binding_cache)
+            _shared_intelligence_by_cache[id(binding_cache)] = intelligence
+        return intelligence
+
+
+def _flush_shared_cluster_intelligence() -> None:
+    """Save updates the shared instances still hold for their next batched save"""
+    with _shared_intelligence_lock:
+        instances = list(_shared_intelligence_by_cache.values())
+        if _shared_intelligence is not None:
+            instances.append(_shared_intelligence)
+    for intelligence in instances:
+        intelligence.flush()
+
+
+atexit.register(_flush_shared_cluster_intelligence)
+
+
 # =============================================================================
 # Test / Main
 # =============================================================================
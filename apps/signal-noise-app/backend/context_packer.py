@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Token-budgeted context packing for dossier and discovery prompts.
+
+Prompt assembly used to cut each source at a character limit, which either
+overshoots the model's input budget or keeps the first N characters and drops
+the passages that actually answer the question. ``pack_context`` instead:
+
+1. splits every source into sentence-sized passages,
+2. ranks passages by BM25-style lexical relevance to the question,
+3. skips near-duplicates (word-shingle Jaccard) already chosen from any source,
+4. greedily packs the best passages under an exact token budget, per source
+   caps included, and re-emits each source's passages in document order.
+
+``estimate_tokens`` is a cheap, deterministic approximation (word pieces plus
+punctuation); budgets are enforced against that estimate, never exceeded.
+Packing is opt-in via ``CONTEXT_PACKING_ENABLED`` at the call sites.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import re
+import threading
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from typing import Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple, Union
+
+_WORD_RE = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+_TERM_RE = re.compile(r"[a-z0-9]+")
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+|\n{1,}")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the this to was were will with".split()
+)
+
+# Per-model caps on packed prompt context; override with CONTEXT_PACK_MODEL_BUDGETS.
+DEFAULT_MODEL_TOKEN_BUDGETS: Dict[str, int] = {"haiku": 2400, "sonnet": 3200, "opus": 4000}
+
+
+def context_packing_enabled() -> bool:
+    return str(os.getenv("CONTEXT_PACKING_ENABLED", "false")).strip().lower() in {"1", "true", "yes", "on"}
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate BPE token count: one per word piece of ~6 chars plus one per punctuation mark."""
+    total = 0
+    for piece in _WORD_RE.findall(str(text or "")):
+        total += 1 + (len(piece) - 1) // 6
+    return total
+
+
+def model_token_budget(model: str, default: Optional[int] = None) -> int:
+    """Token budget for ``model`` from CONTEXT_PACK_MODEL_BUDGETS ("haiku=2400,sonnet=3200")."""
+    budgets = dict(DEFAULT_MODEL_TOKEN_BUDGETS)
+    for part in str(os.getenv("CONTEXT_PACK_MODEL_BUDGETS", "")).split(","):
+        name, _, value = part.partition("=")
+        try:
+            budgets[name.strip().lower()] = max(1, int(value))
+        except ValueError:
+            continue
+    fallback = default if default is not None else DEFAULT_MODEL_TOKEN_BUDGETS["haiku"]
+    return budgets.get(str(model or "").strip().lower(), fallback)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut ``text`` at a word boundary so its estimate is at most ``max_tokens``."""
+    if max_tokens <= 0:
+        return ""
+    used = 0
+    end = 0
+    for match in _WORD_RE.finditer(text):
+        cost = 1 + (len(match.group(0)) - 1) // 6
+        if used + cost > max_tokens:
+            break
+        used += cost
+        end = match.end()
+    return text[:end].rstrip()
+
+
+def _terms(text: str) -> List[str]:
+    return [term for term in _TERM_RE.findall(text.lower()) if term not in _STOPWORDS]
+
+
+def _shingles(terms: Sequence[str], size: int = 3) -> FrozenSet[Tuple[str, ...]]:
+    if len(terms) < size:
+        return frozenset({tuple(terms)}) if terms else frozenset()
+    return frozenset(tuple(terms[idx : idx + size]) for idx in range(len(terms) - size + 1))
+
+
+@dataclass
+class Passage:
+    source: str
+    index: int
+    text: str
+    tokens: int
+    terms: List[str] = field(repr=False)
+    score: float = 0.0
+
+
+@dataclass
+class PackResult:
+    sections: Dict[str, str]
+    selected: List[Passage]
+    input_tokens: int
+    packed_tokens: int
+    budget_tokens: int
+    dropped_duplicates: int = 0
+
+    @property
+    def saved_tokens(self) -> int:
+        return max(0, self.input_tokens - self.packed_tokens)
+
+    @property
+    def text(self) -> str:
+        return "\n\n".join(section for section in self.sections.values() if section)
+
+
+@dataclass
+class ContextPackStats:
+    calls: int = 0
+    input_tokens: int = 0
+    packed_tokens: int = 0
+    saved_tokens: int = 0
+    dropped_duplicates: int = 0
+
+
+_stats = ContextPackStats()
+_stats_lock = threading.Lock()
+
+
+def get_context_pack_stats() -> Dict[str, int]:
+    with _stats_lock:
+        return asdict(_stats)
+
+
+def split_passages(text: str, max_passage_tokens: int = 80) -> List[str]:
+    """Sentence/line passages, merging short fragments and hard-cutting very long ones."""
+    passages: List[str] = []
+    min_passage_tokens = max(8, max_passage_tokens // 4)
+    current = ""
+    for raw in _SENTENCE_RE.split(str(text or "")):
+        sentence = raw.strip()
+        if not sentence:
+            continue
+        while estimate_tokens(sentence) > max_passage_tokens:
+            head = truncate_to_tokens(sentence, max_passage_tokens)
+            if not head:
+                break
+            if current:
+                passages.append(current)
+                current = ""
+            passages.append(head)
+            sentence = sentence[len(head) :].strip()
+        if not sentence:
+            continue
+        # Sentences stay separate passages unless the pending one is a short fragment.
+        if current and estimate_tokens(current) >= min_passage_tokens:
+            passages.append(current)
+            current = ""
+        candidate = f"{current} {sentence}".strip() if current else sentence
+        if current and estimate_tokens(candidate) > max_passage_tokens:
+            passages.append(current)
+            current = sentence
+        else:
+            current = candidate
+    if current:
+        passages.append(current)
+    return passages
+
+
+def _score_passages(passages: List[Passage], question_terms: Sequence[str]) -> None:
+    query = set(question_terms)
+    total = len(passages)
+    average_length = sum(len(passage.terms) for passage in passages) / max(1, total)
+    document_frequency: Counter = Counter()
+    for passage in passages:
+        document_frequency.update(set(passage.terms) & query)
+    k1, b = 1.2, 0.75
+    for passage in passages:
+        counts = Counter(passage.terms)
+        length_norm = k1 * (1 - b + b * len(passage.terms) / max(1.0, average_length))
+        score = 0.0
+        for term in query:
+            tf = counts.get(term, 0)
+            if not tf:
+                continue
+            idf = math.log(1 + (total - document_frequency[term] + 0.5) / (document_frequency[term] + 0.5))
+            score += idf * tf * (k1 + 1) / (tf + length_norm)
+        # Gentle lead bias so equally relevant passages keep document order.
+        passage.score = score + 0.01 / (1 + passage.index)
+
+
+def pack_context(
+    question: str,
+    sources: Union[Mapping[str, str], Sequence[Tuple[str, str]]],
+    budget_tokens: int,
+    *,
+    source_caps: Optional[Mapping[str, int]] = None,
+    dedupe_threshold: float = 0.8,
+    max_passage_tokens: int = 80,
+) -> PackResult:
+    """
+    Pack the passages most relevant to ``question`` from ``sources`` into ``budget_tokens``.
+
+    Args:
+        question: Text the prompt must answer; its terms drive ranking.
+        sources: ``{name: text}`` (or pairs); names are kept in the result.
+        budget_tokens: Hard cap on the summed token estimate of selected passages.
+        source_caps: Optional per-source token caps inside the overall budget.
+        dedupe_threshold: Shingle Jaccard at or above which a passage is a duplicate.
+        max_passage_tokens: Target passage size when splitting sources.
+
+    Returns:
+        PackResult with per-source packed text (document order) and token accounting.
+    """
+    items = list(sources.items()) if isinstance(sources, Mapping) else list(sources)
+    caps = dict(source_caps or {})
+    passages: List[Passage] = []
+    input_tokens = 0
+    for name, text in items:
+        for index, chunk in enumerate(split_passages(str(text or ""), max_passage_tokens)):
+            passage = Passage(source=name, index=index, text=chunk, tokens=estimate_tokens(chunk), terms=_terms(chunk))
+            input_tokens += passage.tokens
+            passages.append(passage)
+
+    _score_passages(passages, _terms(question))
+    ranked = sorted(passages, key=lambda passage: -passage.score)
+
+    remaining = max(0, int(budget_tokens))
+    used_by_source: Dict[str, int] = {}
+    selected: List[Passage] = []
+    selected_shingles: List[FrozenSet[Tuple[str, ...]]] = []
+    duplicates = 0
+    for passage in ranked:
+        if remaining <= 0:
+            break
+        shingles = _shingles(passage.terms)
+        if shingles and any(
+            len(shingles & other) / len(shingles | other) >= dedupe_threshold for other in selected_shingles
+        ):
+            duplicates += 1
+            continue
+        room = remaining
+        if passage.source in caps:
+            room = min(room, caps[passage.source] - used_by_source.get(passage.source, 0))
+        if passage.tokens > room:
+            # Only cut a passage when nothing from its source fits yet; otherwise try smaller ones.
+            if used_by_source.get(passage.source) or room < min(16, max_passage_tokens):
+                continue
+            text = truncate_to_tokens(passage.text, room)
+            if not text:
+                continue
+            passage = Passage(
+                source=passage.source,
+                index=passage.index,
+                text=text,
+                tokens=estimate_tokens(text),
+                terms=passage.terms,
+                score=passage.score,
+            )
+        selected.append(passage)
+        selected_shingles.append(shingles)
+        remaining -= passage.tokens
+        used_by_source[passage.source] = used_by_source.get(passage.source, 0) + passage.tokens
+
+    sections: Dict[str, str] = {}
+    for name, _ in items:
+        chosen = sorted((passage for passage in selected if passage.source == name), key=lambda passage: passage.index)
+        sections[name] = " ".join(passage.text for passage in chosen)
+
+    result = PackResult(
+        sections=sections,
+        selected=selected,
+        input_tokens=input_tokens,
+        packed_tokens=sum(passage.tokens for passage in selected),
+        budget_tokens=int(budget_tokens),
+        dropped_duplicates=duplicates,
+    )
+    with _stats_lock:
+        _stats.calls += 1
+        _stats.input_tokens += result.input_tokens
+        _stats.packed_tokens += result.packed_tokens
+        _stats.saved_tokens += result.saved_tokens
+        _stats.dropped_duplicates += duplicates
+    return result
@@ -24,6 +24,7 @@ Usage:
     print(f"Sales Readiness: {scores['sales_readiness']}")
 """
 
+import asyncio
 import logging
 import math
 from datetime import datetime, timezone, timedelta
@@ -91,6 +92,86 @@ class ScoringConfig:
     density_window_days: int = 180
 
 
+# =============================================================================
+# Score Components
+# =============================================================================
+#
+# Shared by DashboardScorer and the columnar batch path so both apply the same
+# caps, decay and clamps.
+
+_BASELINE_MATURITY = 25.0  # Maturity for entities without active hypotheses
+_MIN_ACTIVE_PROBABILITY = 0.05  # Conservative baseline for unknown/low-signal entities
+_MAX_ACTIVE_PROBABILITY = 0.95
+
+
+def _capability_points(count: int) -> float:
+    """Capability signals (0-40 points); 10 signals earn full points"""
+    return min(40.0, count * 4.0)
+
+
+def _initiative_points(count: int) -> float:
+    """Digital initiatives (0-30 points)"""
+    return min(30.0, count * 10.0)
+
+
+def _partnership_points(count: int) -> float:
+    """Partnership activity (0-20 points)"""
+    return min(20.0, count * 5.0)
+
+
+def _executive_points(count: int) -> float:
+    """Executive changes (0-10 points)"""
+    return min(10.0, count * 3.0)
+
+
+def _weighted_maturity(
+    capability: float,
+    initiative: float,
+    partnership: float,
+    executive: float,
+    config: ScoringConfig,
+) -> float:
+    """Weighted maturity (0-100) from the four component scores"""
+    maturity = (
+        capability * config.capability_weight +
+        initiative * config.initiative_weight +
+        partnership * config.partnership_weight +
+        executive * config.executive_weight
+    )
+    return min(100.0, max(0.0, maturity))
+
+
+def _maturity_from_confidence(average_confidence: Optional[float]) -> float:
+    """Scale an average hypothesis confidence to 0-100 (0.5 baseline = 50 points)"""
+    if average_confidence is None:
+        return _BASELINE_MATURITY
+    return min(100.0, max(0.0, average_confidence * 100))
+
+
+def _procurement_density(count: int) -> float:
+    """Normalize: 3+ procurement signals in the window = max density"""
+    return min(1.0, count / 3.0)
+
+
+def _recency_decay(most_recent_days: float) -> float:
+    """Exponential decay: recent = 1.0, 90 days = ~0.26, nothing relevant = 0.0"""
+    if most_recent_days == float('inf'):
+        return 0.0
+    return math.exp(-0.015 * most_recent_days)
+
+
+def _eig_confidence(average_confidence: Optional[float]) -> float:
+    """Average confidence above the 0.5 baseline contributes (0.5 = 0, 1.0 = 1)"""
+    if average_confidence is None:
+        return 0.0
+    return max(0.0, (average_confidence - 0.5) * 2.0)
+
+
+def _clamp_active_probability(probability: float) -> float:
+    """Keep the 6-month probability inside its conservative bounds"""
+    return min(_MAX_ACTIVE_PROBABILITY, max(_MIN_ACTIVE_PROBABILITY, probability))
+
+
 # =============================================================================
 # Dashboard Scorer
 # =============================================================================
@@ -316,39 +397,17 @@ class DashboardScorer:
         partnership_score = await self._score_partnership_activity(signals, episodes)
         executive_score = await self._score_executive_changes(signals, episodes)
 
-        # Weighted sum
-        maturity = (
-            capability_score * self.config.capability_weight +
-            initiative_score * self.config.initiative_weight +
-            partnership_score * self.config.partnership_weight +
-            executive_score * self.config.executive_weight
+        return _weighted_maturity(
+            capability_score, initiative_score, partnership_score, executive_score, self.config
         )
 
-        return min(100.0, max(0.0, maturity))
-
     async def _maturity_from_hypotheses(self, hypotheses: List[Any]) -> float:
         """
         Calculate maturity from hypothesis confidence scores
 
         Higher average confidence = higher maturity
         """
-        if not hypotheses:
-            return 25.0  # Baseline for unknown
-
-        # Get active hypotheses with confidence scores
-        active_hyps = [h for h in hypotheses if self._hypothesis_status(h) == "ACTIVE"]
-
-        if not active_hyps:
-            return 25.0
-
-        # Calculate weighted average confidence
-        total_confidence = sum(self._hypothesis_confidence(h) for h in active_hyps)
-        avg_confidence = total_confidence / len(active_hyps)
-
-        # Scale to 0-100 (0.5 baseline = 50 points)
-        maturity = avg_confidence * 100
-
-        return min(100.0, max(0.0, maturity))
+        return _maturity_from_confidence(_hypothesis_average_confidence(hypotheses))
 
     async def _score_capability_signals(
         self,
@@ -374,10 +433,7 @@ class DashboardScorer:
                 if self._contains_any(episode, self._CAPABILITY_KEYWORDS):
                     capability_count += 1
 
-        # Cap at 10 capability signals for full points
-        score = min(40.0, capability_count * 4.0)
-
-        return score
+        return _capability_points(capability_count)
 
     async def _score_digital_initiatives(
         self,
@@ -402,9 +458,7 @@ class DashboardScorer:
                 if self._contains_any(episode, self._INITIATIVE_KEYWORDS):
                     initiative_count += 1
 
-        score = min(30.0, initiative_count * 10.0)
-
-        return score
+        return _initiative_points(initiative_count)
 
     async def _score_partnership_activity(
         self,
@@ -429,9 +483,7 @@ class DashboardScorer:
                 if self._contains_any(signal, self._PARTNERSHIP_KEYWORDS):
                     partnership_count += 1
 
-        score = min(20.0, partnership_count * 5.0)
-
-        return score
+        return _partnership_points(partnership_count)
 
     async def _score_executive_changes(
         self,
@@ -456,9 +508,7 @@ class DashboardScorer:
                 if self._contains_any(signal, self._EXECUTIVE_KEYWORDS):
                     executive_count += 1
 
-        score = min(10.0, executive_count * 3.0)
-
-        return score
+        return _executive_points(executive_count)
 
     async def _calculate_active_probability(
         self,
@@ -476,7 +526,7 @@ class DashboardScorer:
         - Temporal recency (0-20%)
         - EIG confidence (0-10%)
         """
-        probability = 0.05  # Conservative baseline for unknown/low-signal entities
+        probability = _MIN_ACTIVE_PROBABILITY
 
         # 1. Validated RFP bonus
         if validated_rfps and len(validated_rfps) > 0:
@@ -495,7 +545,7 @@ class DashboardScorer:
             eig_conf = await self._calculate_eig_confidence(hypotheses)
             probability += eig_conf * self.config.confidence_weight
 
-        return min(0.95, max(0.05, probability))
+        return _clamp_active_probability(probability)
 
     async def _calculate_procurement_density(
         self,
@@ -532,8 +582,7 @@ class DashboardScorer:
                 if self._contains_any(signal, self._PROCUREMENT_KEYWORDS):
                     count += 1
 
-        # Normalize: 3+ signals in 6 months = max density
-        return min(1.0, count / 3.0)
+        return _procurement_density(count)
 
     async def _calculate_recency_bonus(
         self,
@@ -597,30 +646,11 @@ class DashboardScorer:
                 except:
                     most_recent_days = min(most_recent_days, 0.0)
 
-        if most_recent_days == float('inf'):
-            return 0.0
-
-        # Exponential decay: recent = 1.0, 90 days = ~0.26
-        recency = math.exp(-0.015 * most_recent_days)
-
-        return recency
+        return _recency_decay(most_recent_days)
 
     async def _calculate_eig_confidence(self, hypotheses: List[Any]) -> float:
         """Calculate EIG-based confidence score (0-1)"""
-        if not hypotheses:
-            return 0.0
-
-        # Get average confidence from active hypotheses
-        active_hyps = [h for h in hypotheses if self._hypothesis_status(h) == "ACTIVE"]
-
-        if not active_hyps:
-            return 0.0
-
-        # Average confidence above 0.5 baseline contributes
-        avg_confidence = sum(self._hypothesis_confidence(h) for h in active_hyps) / len(active_hyps)
-
-        # Scale: 0.5 = 0, 1.0 = 1
-        return max(0.0, (avg_confidence - 0.5) * 2.0)
+        return _eig_confidence(_hypothesis_average_confidence(hypotheses))
 
     @staticmethod
     def _hypothesis_status(hypothesis: Any) -> str:
@@ -780,44 +810,276 @@ class DashboardScorer:
 # Batch Scoring
 # =============================================================================
 
+_FEATURE_CAPABILITY = 1
+_FEATURE_INITIATIVE = 2
+_FEATURE_PARTNERSHIP = 4
+_FEATURE_EXECUTIVE = 8
+_FEATURE_PROCUREMENT = 16
+_FEATURE_RECENCY_RELEVANT = _FEATURE_PROCUREMENT | _FEATURE_CAPABILITY | _FEATURE_INITIATIVE | _FEATURE_PARTNERSHIP
+
+
+@dataclass
+class EntityFeatureColumns:
+    """
+    Per-entity aggregates for a whole batch, one list slot per entity.
+
+    Built in a single pass over every signal and episode in the batch, so each
+    item's text is assembled and keyword-matched once instead of once per score
+    component.
+    """
+    capability_count: List[int]
+    initiative_count: List[int]
+    partnership_count: List[int]
+    executive_count: List[int]
+    procurement_count: List[int]
+    most_recent_days: List[float]
+
+    @classmethod
+    def empty(cls, size: int) -> "EntityFeatureColumns":
+        return cls(
+            capability_count=[0] * size,
+            initiative_count=[0] * size,
+            partnership_count=[0] * size,
+            executive_count=[0] * size,
+            procurement_count=[0] * size,
+            most_recent_days=[float('inf')] * size,
+        )
+
+
+def _keyword_mask(item: Any) -> int:
+    text = DashboardScorer._signal_text(item)
+    if not text:
+        return 0
+    mask = 0
+    if any(keyword in text for keyword in DashboardScorer._CAPABILITY_KEYWORDS):
+        mask |= _FEATURE_CAPABILITY
+    if any(keyword in text for keyword in DashboardScorer._INITIATIVE_KEYWORDS):
+        mask |= _FEATURE_INITIATIVE
+    if any(keyword in text for keyword in DashboardScorer._PARTNERSHIP_KEYWORDS):
+        mask |= _FEATURE_PARTNERSHIP
+    if any(keyword in text for keyword in DashboardScorer._EXECUTIVE_KEYWORDS):
+        mask |= _FEATURE_EXECUTIVE
+    if any(keyword in text for keyword in DashboardScorer._PROCUREMENT_KEYWORDS):
+        mask |= _FEATURE_PROCUREMENT
+    return mask
+
+
+def _parse_aware_timestamp(value: Any) -> Optional[datetime]:
+    """Same parsing as the per-entity scorer; naive or unparseable values yield None."""
+    try:
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        timestamp = datetime.fromisoformat(value)
+    except Exception:
+        return None
+    return timestamp if timestamp.tzinfo is not None else None
+
+
+def extract_entity_features(
+    signals_by_entity: List[Optional[List[Dict[str, Any]]]],
+    episodes_by_entity: List[Optional[List[Dict[str, Any]]]],
+    now: datetime,
+    config: ScoringConfig,
+) -> EntityFeatureColumns:
+    """
+    Columnar feature pass over a batch of entities.
+
+    Mirrors the counting rules of DashboardScorer's per-component methods:
+    signals must be scoreable, only episodes are windowed for density, and a
+    signal with a missing or unparseable timestamp counts as brand new for
+    recency.
+    """
+    columns = EntityFeatureColumns.empty(len(signals_by_entity))
+    density_window_start = now - timedelta(days=config.density_window_days)
+    counters = (
+        (_FEATURE_CAPABILITY, columns.capability_count),
+        (_FEATURE_INITIATIVE, columns.initiative_count),
+        (_FEATURE_PARTNERSHIP, columns.partnership_count),
+        (_FEATURE_EXECUTIVE, columns.executive_count),
+    )
+
+    for index, episodes in enumerate(episodes_by_entity):
+        for episode in episodes or ():
+            mask = _keyword_mask(episode)
+            for bit, counts in counters:
+                if mask & bit:
+                    counts[index] += 1
+            if not isinstance(episode, dict):
+                continue
+            timestamp = _parse_aware_timestamp(episode.get("timestamp", ""))
+            if timestamp is None:
+                continue
+            if mask & _FEATURE_PROCUREMENT and timestamp >= density_window_start:
+                columns.procurement_count[index] += 1
+            if mask & _FEATURE_RECENCY_RELEVANT:
+                age_days = (now - timestamp).total_seconds() / 86400
+                if age_days < columns.most_recent_days[index]:
+                    columns.most_recent_days[index] = age_days
+
+    for index, signals in enumerate(signals_by_entity):
+        for signal in signals or ():
+            if not DashboardScorer._is_scoreable_signal(signal):
+                continue
+            mask = _keyword_mask(signal)
+            for bit, counts in counters:
+                if mask & bit:
+                    counts[index] += 1
+            if mask & _FEATURE_PROCUREMENT:
+                columns.procurement_count[index] += 1
+            if not mask & _FEATURE_RECENCY_RELEVANT:
+                continue
+            timestamp_str = str(signal.get("timestamp") or signal.get("created_at") or signal.get("date") or "")
+            timestamp = _parse_aware_timestamp(timestamp_str) if timestamp_str else None
+            age_days = (now - timestamp).total_seconds() / 86400 if timestamp is not None else 0.0
+            if age_days < columns.most_recent_days[index]:
+                columns.most_recent_days[index] = age_days
+
+    return columns
+
+
+def _hypothesis_average_confidence(hypotheses: Optional[List[Any]]) -> Optional[float]:
+    active_hyps = [h for h in hypotheses or () if DashboardScorer._hypothesis_status(h) == "ACTIVE"]
+    if not active_hyps:
+        return None
+    return sum(DashboardScorer._hypothesis_confidence(h) for h in active_hyps) / len(active_hyps)
+
+
+def _assemble_entity_scores(
+    scorer: DashboardScorer,
+    columns: EntityFeatureColumns,
+    index: int,
+    entity_id: str,
+    entity_name: str,
+    hypotheses: Optional[List[Any]],
+    validated_rfps: Optional[List[Dict[str, Any]]],
+    calculated_at: str,
+) -> Dict[str, Any]:
+    config = scorer.config
+    capability = _capability_points(columns.capability_count[index])
+    initiative = _initiative_points(columns.initiative_count[index])
+    partnership = _partnership_points(columns.partnership_count[index])
+    executive = _executive_points(columns.executive_count[index])
+    density = _procurement_density(columns.procurement_count[index])
+    recency = _recency_decay(columns.most_recent_days[index])
+
+    average_confidence = _hypothesis_average_confidence(hypotheses) if hypotheses else None
+    if hypotheses:
+        maturity_score = _maturity_from_confidence(average_confidence)
+    else:
+        maturity_score = _weighted_maturity(capability, initiative, partnership, executive, config)
+    eig_conf = _eig_confidence(average_confidence)
+
+    has_rfp = bool(validated_rfps) and len(validated_rfps) > 0
+    probability = _MIN_ACTIVE_PROBABILITY
+    if has_rfp:
+        probability += config.rfp_bonus
+    probability += density * config.density_weight
+    probability += recency * config.recency_weight
+    if hypotheses:
+        probability += eig_conf * config.confidence_weight
+    active_probability = _clamp_active_probability(probability)
+
+    sales_readiness = scorer._determine_sales_readiness(maturity_score, active_probability, validated_rfps)
+    total = max(1.0, capability + initiative + partnership + executive)
+
+    return {
+        "entity_id": entity_id,
+        "entity_name": entity_name,
+        "procurement_maturity": round(maturity_score, 1),
+        "active_probability": round(active_probability, 3),
+        "sales_readiness": sales_readiness.value,
+        "confidence_interval": scorer._calculate_confidence_interval(maturity_score, active_probability, hypotheses),
+        "breakdown": {
+            "maturity": {
+                "capability": round(capability / total * 100, 1),
+                "initiative": round(initiative / total * 100, 1),
+                "partnership": round(partnership / total * 100, 1),
+                "executive": round(executive / total * 100, 1),
+                "raw_scores": {
+                    "capability": round(capability, 1),
+                    "initiative": round(initiative, 1),
+                    "partnership": round(partnership, 1),
+                    "executive": round(executive, 1)
+                }
+            },
+            "probability": {
+                "rfp_bonus_contribution": round(config.rfp_bonus if has_rfp else 0.0, 3),
+                "density_contribution": round(density * config.density_weight, 3),
+                "recency_contribution": round(recency * config.recency_weight, 3),
+                "eig_confidence_contribution": round(eig_conf * config.confidence_weight, 3),
+                "components": {
+                    "has_validated_rfp": has_rfp,
+                    "procurement_density": round(density, 2),
+                    "recency_score": round(recency, 2),
+                    "eig_confidence": round(eig_conf, 2)
+                }
+            }
+        },
+        "calculated_at": calculated_at
+    }
+
+
 async def score_entities_batch(
     entities: List[Dict[str, Any]],
     hypotheses_map: Dict[str, List[Any]] = None,
     signals_map: Dict[str, List[Dict[str, Any]]] = None,
     episodes_map: Dict[str, List[Dict[str, Any]]] = None,
-    config: ScoringConfig = None
+    config: ScoringConfig = None,
+    validated_rfps_map: Dict[str, List[Dict[str, Any]]] = None,
+    chunk_size: int = 500
 ) -> List[Dict[str, Any]]:
     """
     Score multiple entities in batch
 
+    Produces the same per-entity output as DashboardScorer.calculate_entity_scores,
+    but extracts features for the whole batch in one columnar pass and yields to
+    the event loop between chunks, so re-scoring every entity after a
+    calibration change does not stall other requests.
+
     Args:
         entities: List of entity dicts with entity_id and entity_name
         hypotheses_map: Optional map of entity_id -> hypotheses
         signals_map: Optional map of entity_id -> signals
         episodes_map: Optional map of entity_id -> episodes
         config: Optional scoring configuration
+        validated_rfps_map: Optional map of entity_id -> validated RFPs
+        chunk_size: Entities scored between event-loop yields
 
     Returns:
-        List of scored entities
+        List of scored entities, in input order
     """
     scorer = DashboardScorer(config)
-
-    results = []
-
-    for entity in entities:
-        entity_id = entity.get("entity_id")
-        entity_name = entity.get("entity_name", entity_id)
-
-        scores = await scorer.calculate_entity_scores(
-            entity_id=entity_id,
-            entity_name=entity_name,
-            hypotheses=hypotheses_map.get(entity_id) if hypotheses_map else None,
-            signals=signals_map.get(entity_id) if signals_map else None,
-            episodes=episodes_map.get(entity_id) if episodes_map else None
+    now = datetime.now(timezone.utc)
+    calculated_at = now.isoformat()
+    chunk_size = max(1, int(chunk_size))
+
+    results: List[Dict[str, Any]] = []
+    for start in range(0, len(entities), chunk_size):
+        chunk = entities[start:start + chunk_size]
+        entity_ids = [entity.get("entity_id") for entity in chunk]
+        columns = extract_entity_features(
+            [signals_map.get(entity_id) if signals_map else None for entity_id in entity_ids],
+            [episodes_map.get(entity_id) if episodes_map else None for entity_id in entity_ids],
+            now,
+            scorer.config,
         )
+        for index, entity in enumerate(chunk):
+            entity_id = entity_ids[index]
+            results.append(
+                _assemble_entity_scores(
+                    scorer,
+                    columns,
+                    index,
+                    entity_id,
+                    entity.get("entity_name", entity_id),
+                    hypotheses_map.get(entity_id) if hypotheses_map else None,
+                    validated_rfps_map.get(entity_id) if validated_rfps_map else None,
+                    calculated_at,
+                )
+            )
+        await asyncio.sleep(0)
 
-        results.append(scores)
-
+    logger.info(f"📊 Batch scored {len(results)} entities")
     return results
 
 
@@ -3,221 +3,378 @@ import json
 import uuid
 import datetime
 import os
-from typing import Dict, Any, Optional
+import threading
+import time
+import atexit
+from typing import Dict, Any, Iterable, List, Optional, Union
 import logging
 
 logger = logging.getLogger(__name__)
 
-DB_FILE = os.path.join(os.path.dirname(__file__), "tasks.db")
+DB_FILE = os.getenv("TASKS_DB_FILE") or os.path.join(os.path.dirname(__file__), "tasks.db")
+DB_BUSY_TIMEOUT_SECONDS = float(os.getenv("TASKS_DB_BUSY_TIMEOUT_SECONDS", "30"))
+PROGRESS_FLUSH_INTERVAL_SECONDS = float(os.getenv("TASKS_PROGRESS_FLUSH_SECONDS", "1.0"))
+MAX_QUERY_PARAMS = 500
+
+TASK_SUMMARY_COLUMNS = """id, entity_type, entity_name, priority, status, progress, current_step,
+               created_at, updated_at"""
+
+_local = threading.local()
+
+# Serialises task writes within a process, so a queued progress flush can
+# never land on top of a task's final update
+_write_lock = threading.Lock()
+
 
 def get_db_connection():
-    """Get database connection with proper configuration"""
-    conn = sqlite3.connect(DB_FILE, check_same_thread=False)
+    """Get this thread's database connection, opening it on first use
+
+    Connections are reused per thread and process (Celery forks workers after
+    import, so a parent's connection is never carried into a child) and run in
+    WAL mode so status readers do not block the writer. Do not close the
+    returned connection; use close_db_connection().
+    """
+    pid = os.getpid()
+    conn = getattr(_local, "conn", None)
+    if conn is not None and _local.pid == pid and _local.db_file == DB_FILE:
+        return conn
+
+    conn = sqlite3.connect(DB_FILE, timeout=DB_BUSY_TIMEOUT_SECONDS, check_same_thread=False)
     conn.row_factory = sqlite3.Row  # Enable dict-like access to rows
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    _local.conn = conn
+    _local.pid = pid
+    _local.db_file = DB_FILE
     return conn
 
+def close_db_connection() -> None:
+    """Close this thread's database connection, if open"""
+    conn = getattr(_local, "conn", None)
+    _local.conn = None
+    if conn is not None and _local.pid == os.getpid():
+        conn.close()
+
 def init_db():
     """Initialize database with required tables"""
     try:
         conn = get_db_connection()
-        c = conn.cursor()
-        
-        # Create tasks table
-        c.execute("""
-        CREATE TABLE IF NOT EXISTS tasks (
-            id TEXT PRIMARY KEY,
-            entity_type TEXT NOT NULL,
-            entity_name TEXT NOT NULL,
-            priority TEXT DEFAULT 'normal',
-            status TEXT DEFAULT 'pending',
-            progress TEXT DEFAULT '0%',
-            current_step TEXT,
-            result TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        """)
-        
-        # Create index for faster lookups
-        c.execute("""
-        CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status)
-        """)
-        c.execute("""
-        CREATE INDEX IF NOT EXISTS idx_tasks_entity ON tasks(entity_name, entity_type)
-        """)
-        
-        conn.commit()
+        with conn:
+            # Create tasks table
+            conn.execute("""
+            CREATE TABLE IF NOT EXISTS tasks (
+                id TEXT PRIMARY KEY,
+                entity_type TEXT NOT NULL,
+                entity_name TEXT NOT NULL,
+                priority TEXT DEFAULT 'normal',
+                status TEXT DEFAULT 'pending',
+                progress TEXT DEFAULT '0%',
+                current_step TEXT,
+                result TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            """)
+
+            # Create index for faster lookups
+            conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status)
+            """)
+            conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_tasks_entity ON tasks(entity_name, entity_type)
+            """)
+            # Status and recency listings are served straight from these indexes
+            conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_tasks_status_created ON tasks(status, created_at)
+            """)
+            conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_tasks_created ON tasks(created_at)
+            """)
+
         logger.info("Database initialized successfully")
-        
+
     except Exception as e:
         logger.error(f"Failed to initialize database: {str(e)}")
         raise
-    finally:
-        conn.close()
 
 def create_task(entity_type: str, entity_name: str, priority: str = "normal") -> str:
     """Create a new task and return the task ID"""
     try:
         task_id = str(uuid.uuid4())
         conn = get_db_connection()
-        c = conn.cursor()
-        
-        c.execute("""
-        INSERT INTO tasks (id, entity_type, entity_name, priority, status, created_at, updated_at)
-        VALUES (?, ?, ?, ?, 'pending', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-        """, (task_id, entity_type, entity_name, priority))
-        
-        conn.commit()
+
+        with _write_lock, conn:
+            conn.execute("""
+            INSERT INTO tasks (id, entity_type, entity_name, priority, status, created_at, updated_at)
+            VALUES (?, ?, ?, ?, 'pending', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+            """, (task_id, entity_type, entity_name, priority))
+
         logger.info(f"Created task {task_id} for {entity_name}")
         return task_id
-        
+
     except Exception as e:
         logger.error(f"Failed to create task: {str(e)}")
         raise
-    finally:
-        conn.close()
+
+def _task_update_params(task_id: str, result: Dict[str, Any]) -> tuple:
+    # Extract fields from result
+    status = result.get("status", "unknown")
+    progress = result.get("progress", "0%")
+    current_step = result.get("current_step")
+
+    # Convert result to JSON string
+    result_json = json.dumps(result) if result else None
+    return (status, progress, current_step, result_json, task_id)
 
 def update_task(task_id: str, result: Dict[str, Any]) -> bool:
-    """Update task with new result data"""
+    """Update task with new result data
+
+    Written immediately; any progress still queued for the task by
+    report_progress() is dropped, since this update supersedes it.
+    """
     try:
         conn = get_db_connection()
-        c = conn.cursor()
-        
-        # Extract fields from result
-        status = result.get("status", "unknown")
-        progress = result.get("progress", "0%")
-        current_step = result.get("current_step")
-        
-        # Convert result to JSON string
-        result_json = json.dumps(result) if result else None
-        
-        c.execute("""
-        UPDATE tasks 
-        SET status = ?, progress = ?, current_step = ?, result = ?, updated_at = CURRENT_TIMESTAMP
-        WHERE id = ?
-        """, (status, progress, current_step, result_json, task_id))
-        
-        if c.rowcount == 0:
+
+        with _write_lock:
+            _progress_coalescer.discard(task_id)
+            with conn:
+                cursor = conn.execute("""
+                UPDATE tasks
+                SET status = ?, progress = ?, current_step = ?, result = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+                """, _task_update_params(task_id, result))
+
+        if cursor.rowcount == 0:
             logger.warning(f"No task found with ID {task_id}")
             return False
-            
-        conn.commit()
-        logger.info(f"Updated task {task_id} with status: {status}")
+
+        logger.info(f"Updated task {task_id} with status: {result.get('status', 'unknown')}")
         return True
-        
+
     except Exception as e:
         logger.error(f"Failed to update task {task_id}: {str(e)}")
         raise
-    finally:
-        conn.close()
+
+
+class _TaskProgressCoalescer:
+    """Latest-wins background writer for task progress
+
+    Only the newest state per task is kept; a daemon thread writes whatever is
+    pending in one transaction, at most once per flush interval.
+    """
+
+    def __init__(self, interval_seconds: float):
+        self.interval_seconds = max(0.0, float(interval_seconds))
+        self._condition = threading.Condition()
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._busy = False
+        self._flush_requested = False
+        self._last_flush = 0.0
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+
+    def submit(self, task_id: str, result: Dict[str, Any]) -> None:
+        with self._condition:
+            self._pending[task_id] = dict(result)
+            if self._pid != os.getpid() or self._thread is None or not self._thread.is_alive():
+                self._pid = os.getpid()
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="task-progress-flusher",
+                    daemon=True,
+                )
+                self._thread.start()
+            self._condition.notify_all()
+
+    def discard(self, task_id: str) -> None:
+        with self._condition:
+            self._pending.pop(task_id, None)
+            self._condition.notify_all()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        with self._condition:
+            if not self._pending and not self._busy:
+                return True
+            self._flush_requested = bool(self._pending)
+            self._condition.notify_all()
+            return self._condition.wait_for(lambda: not self._pending and not self._busy, timeout=timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending:
+                    self._condition.wait()
+                # Bound the write rate; newer states replace queued ones meanwhile
+                deadline = self._last_flush + self.interval_seconds
+                while self._pending and not self._flush_requested and time.monotonic() < deadline:
+                    self._condition.wait(deadline - time.monotonic())
+                self._flush_requested = False
+
+            with _write_lock:
+                with self._condition:
+                    batch, self._pending = self._pending, {}
+                    self._busy = bool(batch)
+                try:
+                    if batch:
+                        _write_progress_batch(batch)
+                except Exception as e:
+                    logger.warning(f"Failed to flush progress for {len(batch)} task(s): {str(e)}")
+                finally:
+                    with self._condition:
+                        self._busy = False
+                        self._last_flush = time.monotonic()
+                        self._condition.notify_all()
+
+
+def _write_progress_batch(batch: Dict[str, Dict[str, Any]]) -> None:
+    conn = get_db_connection()
+    with conn:
+        # Progress never overwrites a finished task
+        conn.executemany("""
+        UPDATE tasks
+        SET status = ?, progress = ?, current_step = ?, result = ?, updated_at = CURRENT_TIMESTAMP
+        WHERE id = ? AND status NOT IN ('complete', 'failed')
+        """, [_task_update_params(task_id, result) for task_id, result in batch.items()])
+    logger.debug(f"Flushed progress for {len(batch)} task(s)")
+
+
+_progress_coalescer = _TaskProgressCoalescer(PROGRESS_FLUSH_INTERVAL_SECONDS)
+
+def report_progress(task_id: str, result: Dict[str, Any]) -> None:
+    """Queue a progress update for a task without waiting on the database
+
+    Updates are coalesced per task and flushed in the background at most
+    every TASKS_PROGRESS_FLUSH_SECONDS. Use update_task() for state that must
+    be durable before returning (final results, failures).
+    """
+    _progress_coalescer.submit(task_id, result)
+
+def flush_task_progress(timeout: float = 5.0) -> bool:
+    """Write queued progress now; returns False if it did not finish in time"""
+    return _progress_coalescer.flush(timeout)
+
+atexit.register(flush_task_progress)
+
+def _row_to_task(row: sqlite3.Row) -> Dict[str, Any]:
+    task_data = dict(row)
+
+    # Parse result JSON if it exists
+    if task_data.get("result"):
+        try:
+            task_data["result"] = json.loads(task_data["result"])
+        except json.JSONDecodeError:
+            logger.warning(f"Failed to parse result JSON for task {task_data.get('id')}")
+            task_data["result"] = {"error": "Invalid JSON in result"}
+
+    return task_data
 
 def get_task(task_id: str) -> Optional[Dict[str, Any]]:
     """Get task by ID"""
     try:
         conn = get_db_connection()
-        c = conn.cursor()
-        
-        c.execute("""
-        SELECT id, entity_type, entity_name, priority, status, progress, current_step, 
+
+        row = conn.execute("""
+        SELECT id, entity_type, entity_name, priority, status, progress, current_step,
                result, created_at, updated_at
         FROM tasks WHERE id = ?
-        """, (task_id,))
-        
-        row = c.fetchone()
+        """, (task_id,)).fetchone()
+
         if not row:
             return {"status": "not_found"}
-        
-        # Convert row to dict
-        task_data = dict(row)
-        
-        # Parse result JSON if it exists
-        if task_data.get("result"):
-            try:
-                task_data["result"] = json.loads(task_data["result"])
-            except json.JSONDecodeError:
-                logger.warning(f"Failed to parse result JSON for task {task_id}")
-                task_data["result"] = {"error": "Invalid JSON in result"}
-        
-        return task_data
-        
+
+        return _row_to_task(row)
+
     except Exception as e:
         logger.error(f"Failed to get task {task_id}: {str(e)}")
         raise
-    finally:
-        conn.close()
 
-def get_tasks_by_status(status: str, limit: int = 100) -> list:
-    """Get tasks by status with optional limit"""
+def get_tasks(task_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """Get many tasks by ID with one query per 500 IDs; unknown IDs are omitted"""
+    try:
+        conn = get_db_connection()
+        ids = list(dict.fromkeys(task_ids))
+        tasks: Dict[str, Dict[str, Any]] = {}
+
+        for start in range(0, len(ids), MAX_QUERY_PARAMS):
+            chunk = ids[start:start + MAX_QUERY_PARAMS]
+            rows = conn.execute(f"""
+            SELECT id, entity_type, entity_name, priority, status, progress, current_step,
+                   result, created_at, updated_at
+            FROM tasks WHERE id IN ({', '.join('?' * len(chunk))})
+            """, chunk).fetchall()
+            for row in rows:
+                tasks[row["id"]] = _row_to_task(row)
+
+        return tasks
+
+    except Exception as e:
+        logger.error(f"Failed to get tasks: {str(e)}")
+        raise
+
+def get_tasks_by_status(status: Union[str, Iterable[str]], limit: int = 100) -> list:
+    """Get tasks by one status or several (one query) with optional limit"""
+    statuses: List[str] = [status] if isinstance(status, str) else list(dict.fromkeys(status))
+    if not statuses:
+        return []
     try:
         conn = get_db_connection()
-        c = conn.cursor()
-        
-        c.execute("""
-        SELECT id, entity_type, entity_name, priority, status, progress, current_step, 
-               created_at, updated_at
-        FROM tasks 
-        WHERE status = ? 
-        ORDER BY created_at DESC 
+
+        rows = conn.execute(f"""
+        SELECT {TASK_SUMMARY_COLUMNS}
+        FROM tasks
+        WHERE status IN ({', '.join('?' * len(statuses))})
+        ORDER BY created_at DESC
         LIMIT ?
-        """, (status, limit))
-        
-        rows = c.fetchall()
+        """, (*statuses, limit)).fetchall()
+
         return [dict(row) for row in rows]
-        
+
     except Exception as e:
         logger.error(f"Failed to get tasks by status {status}: {str(e)}")
         raise
-    finally:
-        conn.close()
 
-def get_recent_tasks(limit: int = 50) -> list:
-    """Get recent tasks regardless of status"""
+def get_recent_tasks(limit: int = 50, statuses: Optional[Iterable[str]] = None) -> list:
+    """Get recent tasks, optionally restricted to some statuses"""
+    if statuses is not None:
+        return get_tasks_by_status(list(statuses), limit)
     try:
         conn = get_db_connection()
-        c = conn.cursor()
-        
-        c.execute("""
-        SELECT id, entity_type, entity_name, priority, status, progress, current_step, 
-               created_at, updated_at
-        FROM tasks 
-        ORDER BY created_at DESC 
+
+        rows = conn.execute(f"""
+        SELECT {TASK_SUMMARY_COLUMNS}
+        FROM tasks
+        ORDER BY created_at DESC
         LIMIT ?
-        """, (limit,))
-        
-        rows = c.fetchall()
+        """, (limit,)).fetchall()
+
         return [dict(row) for row in rows]
-        
+
     except Exception as e:
         logger.error(f"Failed to get recent tasks: {str(e)}")
         raise
-    finally:
-        conn.close()
 
 def cleanup_old_tasks(days: int = 30) -> int:
     """Clean up old completed/failed tasks"""
     try:
         conn = get_db_connection()
-        c = conn.cursor()
-        
-        c.execute("""
-        DELETE FROM tasks 
-        WHERE status IN ('complete', 'failed') 
-        AND created_at < datetime('now', '-{} days')
-        """.format(days))
-        
-        deleted_count = c.rowcount
-        conn.commit()
-        
+
+        with _write_lock, conn:
+            cursor = conn.execute("""
+            DELETE FROM tasks
+            WHERE status IN ('complete', 'failed')
+            AND created_at < datetime('now', '-{} days')
+            """.format(days))
+
+        deleted_count = cursor.rowcount
+
         if deleted_count > 0:
             logger.info(f"Cleaned up {deleted_count} old tasks")
-        
+
         return deleted_count
-        
+
     except Exception as e:
         logger.error(f"Failed to cleanup old tasks: {str(e)}")
         raise
-    finally:
-        conn.close()
 
 # Initialize database when module is imported
 init_db()
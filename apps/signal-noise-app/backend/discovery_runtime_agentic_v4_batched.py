@@ -24,6 +24,11 @@ try:
 except ImportError:
     from objective_profiles import get_objective_profile, normalize_run_objective
 
+try:
+    from backend.context_packer import context_packing_enabled, estimate_tokens, pack_context
+except ImportError:
+    from context_packer import context_packing_enabled, estimate_tokens, pack_context
+
 from backend.discovery_runtime_agentic_v3 import (
     HIGH_SIGNAL_PATH_TERMS,
     LOW_SIGNAL_PATH_TERMS,
@@ -1146,8 +1151,14 @@ class DiscoveryRuntimeAgenticV4Batched(DiscoveryRuntimeAgenticV3):
                 ),
             ),
         )
+        packing = context_packing_enabled()
         for item in sorted_items:
-            excerpt = self._pack_excerpt(item=item)
+            excerpt = self._pack_excerpt(item=item, entity_tokens=entity_tokens)
+            if packing:
+                # Exact budget: never add an item that would push the pack past its target.
+                item_tokens = estimate_tokens(excerpt) if excerpt else 20
+                if packed_items and token_estimate + item_tokens > token_target:
+                    break
             packed = {
                 "url": str(item.get("url") or "").strip(),
                 "host": str(item.get("host") or "").strip(),
@@ -1183,6 +1194,10 @@ class DiscoveryRuntimeAgenticV4Batched(DiscoveryRuntimeAgenticV3):
                 "candidate_links": list(item.get("candidate_links") or [])[:6],
                 "excerpt": excerpt,
             }
+            if packing:
+                token_estimate += item_tokens
+                packed_items.append(packed)
+                continue
             token_estimate += max(1, len(excerpt.split()) // 0.75) if excerpt else 20
             packed_items.append(packed)
             if token_estimate >= token_target:
@@ -1206,19 +1221,26 @@ class DiscoveryRuntimeAgenticV4Batched(DiscoveryRuntimeAgenticV3):
             return self.deepening_batch_input_token_target
         return self.batch_input_token_target
 
-    def _pack_excerpt(self, *, item: Dict[str, Any]) -> str:
+    _EXCERPT_PRIORITY_TERMS = (
+        "procurement", "supplier", "commercial", "partner", "director", "chief", "head of", "digital", "hiring",
+    )
+
+    def _pack_excerpt(self, *, item: Dict[str, Any], entity_tokens: Optional[List[str]] = None) -> str:
         title = str(item.get("title") or "").strip()
         snippet = str(item.get("snippet") or "").strip()
         normalized_text = str(item.get("normalized_text") or "").strip()
+        if normalized_text and context_packing_enabled():
+            # ~600 chars of the most relevant, de-duplicated sentences rather than the first four matches.
+            question = " ".join([*(entity_tokens or []), title, *self._EXCERPT_PRIORITY_TERMS])
+            excerpt = pack_context(question, {"page": normalized_text}, 150, max_passage_tokens=40).text
+            if excerpt:
+                return excerpt
         if normalized_text:
             chunks = [chunk.strip() for chunk in normalized_text.split(".") if chunk.strip()]
             priority_chunks = []
             for chunk in chunks:
                 lower = chunk.lower()
-                if any(
-                    term in lower
-                    for term in ("procurement", "supplier", "commercial", "partner", "director", "chief", "head of", "digital", "hiring")
-                ):
+                if any(term in lower for term in self._EXCERPT_PRIORITY_TERMS):
                     priority_chunks.append(chunk)
             selected = priority_chunks[:4] if priority_chunks else chunks[:4]
             excerpt = ". ".join(selected).strip()
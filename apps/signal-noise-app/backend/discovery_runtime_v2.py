@@ -31,6 +31,14 @@ try:
     from backend.objective_profiles import get_objective_profile, normalize_run_objective
 except ImportError:
     from objective_profiles import get_objective_profile, normalize_run_objective
+try:
+    from backend.json_scanner import scan_json
+except ImportError:
+    from json_scanner import scan_json
+try:
+    from backend.url_features import BatchUrlScorer, DomainSuffixTrie, host_matches_domain, strip_www, url_features
+except ImportError:
+    from url_features import BatchUrlScorer, DomainSuffixTrie, host_matches_domain, strip_www, url_features
 
 ALLOWED_CANDIDATE_ORIGINS = {
     "search",
@@ -88,6 +96,12 @@ HIGH_PRIORITY_REFERENCE_DOMAINS = (
     "bbc.co.uk",
 )
 
+_TRUSTED_NEWS_DOMAIN_TRIE = DomainSuffixTrie(TRUSTED_NEWS_DOMAINS)
+_HIGH_PRIORITY_REFERENCE_DOMAIN_TRIE = DomainSuffixTrie(HIGH_PRIORITY_REFERENCE_DOMAINS)
+_TIER_1_DOMAIN_TRIE = DomainSuffixTrie(hint.strip(".") for hint in TIER_1_DOMAIN_HINTS)
+# ".gov"/".org" style hints match the label anywhere in the host (e.g. council.gov.uk).
+_TIER_1_HOST_LABELS = frozenset(hint.strip(".") for hint in TIER_1_DOMAIN_HINTS if hint.startswith(".") and hint.count(".") == 1)
+
 LOW_AUTHORITY_DOMAIN_HINTS = (
     "facebook.com",
     "x.com",
@@ -467,6 +481,130 @@ class DiscoveryResultV2:
         }
 
 
+class _LaneScheduler:
+    """Run discovery lanes concurrently while yielding results in lane order.
+
+    Up to ``concurrency`` lanes are in flight at once, and never more than
+    the remaining hop budget, so in-flight lanes draw on the same budget the
+    sequential loop used. Results are yielded strictly in the selected lane
+    order, so hop timings, signals and checkpoints come out exactly as the
+    sequential loop wrote them. When a lane returns a validated signal at or
+    above ``early_stop_confidence``, lower-ranked lanes that have not
+    finished yet are cancelled (or never started). With ``concurrency`` of 1
+    and early stop disabled this is the original one-lane-at-a-time loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        lanes: List[str],
+        run_lane: Callable[[str], Awaitable[Dict[str, Any]]],
+        hops_remaining: Callable[[], int],
+        concurrency: int = 1,
+        early_stop_confidence: float = 0.0,
+    ):
+        self._lanes = list(lanes)
+        self._run_lane = run_lane
+        self._hops_remaining = hops_remaining
+        self._concurrency = max(1, int(concurrency))
+        self._early_stop_confidence = float(early_stop_confidence or 0.0)
+        self._tasks: Dict[int, asyncio.Task] = {}
+        self._skipped: Set[int] = set()
+        self._next_launch = 0
+        self._next_yield = 0
+        self.cancelled_lanes: List[str] = []
+        self.max_in_flight = 0
+
+    def __aiter__(self) -> "_LaneScheduler":
+        return self
+
+    async def __aenter__(self) -> "_LaneScheduler":
+        return self
+
+    async def __aexit__(self, *_exc_info: Any) -> None:
+        await self.aclose()
+
+    def _launch_ready(self) -> None:
+        while (
+            self._next_launch < len(self._lanes)
+            and len(self._tasks) < self._concurrency
+            and len(self._tasks) < self._hops_remaining()
+        ):
+            index = self._next_launch
+            self._next_launch += 1
+            if index in self._skipped:
+                continue
+            self._tasks[index] = asyncio.create_task(self._run_lane(self._lanes[index]))
+        self.max_in_flight = max(self.max_in_flight, len(self._tasks))
+
+    def _is_early_stop_hit(self, lane_result: Any) -> bool:
+        if self._early_stop_confidence <= 0 or not isinstance(lane_result, dict):
+            return False
+        signal = lane_result.get("signal")
+        if not isinstance(signal, dict):
+            return False
+        if str(signal.get("validation_state") or "").lower() != "validated":
+            return False
+        return float(signal.get("confidence") or 0.0) >= self._early_stop_confidence
+
+    def _apply_early_stop(self) -> None:
+        for index in sorted(self._tasks):
+            task = self._tasks.get(index)
+            if task is None or not task.done() or task.cancelled() or task.exception() is not None:
+                continue
+            if not self._is_early_stop_hit(task.result()):
+                continue
+            for later in range(index + 1, len(self._lanes)):
+                if later in self._skipped:
+                    continue
+                pending = self._tasks.get(later)
+                if pending is not None and pending.done() and not pending.cancelled():
+                    # Already paid for; keep the finished result.
+                    continue
+                if pending is not None:
+                    self._tasks.pop(later).cancel()
+                self._skipped.add(later)
+                self.cancelled_lanes.append(self._lanes[later])
+            logger.info(
+                "Lane %s hit early-stop confidence; cancelled lanes: %s",
+                self._lanes[index],
+                self.cancelled_lanes,
+            )
+
+    async def __anext__(self) -> Tuple[str, Dict[str, Any]]:
+        self._launch_ready()
+        while self._next_yield < len(self._lanes):
+            index = self._next_yield
+            if index in self._skipped:
+                self._next_yield += 1
+                continue
+            task = self._tasks.get(index)
+            if task is None:
+                # Hop budget exhausted before this lane could start.
+                break
+            if not task.done():
+                in_flight = [pending for pending in self._tasks.values() if not pending.done()]
+                await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                self._apply_early_stop()
+                continue
+            self._apply_early_stop()
+            del self._tasks[index]
+            self._next_yield += 1
+            if task.exception() is not None:
+                await self.aclose()
+            return self._lanes[index], task.result()
+        await self.aclose()
+        raise StopAsyncIteration
+
+    async def aclose(self) -> None:
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
 class DiscoveryRuntimeV2:
     """Deterministic, evidence-first discovery runtime."""
 
@@ -534,6 +672,11 @@ class DiscoveryRuntimeV2:
         self.provider_pause_state_file = self.runtime_state_dir / "provider_pause_state.json"
         self.provider_pause_extension_factor = float(os.getenv("DISCOVERY_PROVIDER_PAUSE_EXTENSION_FACTOR", "1.6"))
         self.provider_pause_max_seconds = float(os.getenv("DISCOVERY_PROVIDER_PAUSE_MAX_SECONDS", "3600"))
+        self.lane_concurrency = max(1, int(os.getenv("DISCOVERY_LANE_CONCURRENCY", "1")))
+        self.lane_early_stop_confidence = max(
+            0.0,
+            float(os.getenv("DISCOVERY_LANE_EARLY_STOP_CONFIDENCE", "0")),
+        )
 
         self._metrics: Dict[str, int] = {
             "synthetic_url_attempt_count": 0,
@@ -696,6 +839,7 @@ class DiscoveryRuntimeV2:
                     max_tokens=8,
                     max_retries_override=0,
                     fast_fail_on_length=True,
+                    cache=False,
                 )
         except Exception:
             return False
@@ -903,6 +1047,7 @@ class DiscoveryRuntimeV2:
         pass_a_validated = 0
         pass_a_candidates = 0
         procurement_validated = 0
+        lane_schedulers: List[_LaneScheduler] = []
         selected_pass_a_lanes = await self._choose_lane_order_with_llm(
             entity_name=entity_name,
             objective=objective,
@@ -910,169 +1055,29 @@ class DiscoveryRuntimeV2:
             available_lanes=pass_a_lanes,
             state=state,
         )
-        for lane in selected_pass_a_lanes:
-            if state["iterations_completed"] >= iteration_budget:
-                break
-            lane_result = await self._run_lane(
-                lane=lane,
-                entity_id=entity_id,
-                entity_name=entity_name,
-                dossier=dossier,
-                official_domain=official_domain,
-                state=state,
-                budget=objective_budget,
-                run_objective=objective,
-            )
-            hop_timings.append(lane_result["hop"])
-            candidate_evaluations.extend(lane_result.get("candidate_evaluations") or [])
-            state["iterations_completed"] += 1
-            if lane_result["signal"]:
-                signals.append(lane_result["signal"])
-                signal_state = str(lane_result["signal"].get("validation_state") or "").lower()
-                lane_name = str(lane_result["hop"].get("hop_type") or lane)
-                if signal_state == "validated":
-                    pass_a_validated += 1
-                    validated_candidate_count_by_lane[lane_name] = (
-                        int(validated_candidate_count_by_lane.get(lane_name, 0) or 0) + 1
-                    )
-                    signal_id = str(lane_result["signal"].get("id") or "").strip()
-                    if (
-                        self.dynamic_hop_credits_enabled
-                        and signal_id
-                        and signal_id not in seen_validated_signal_ids
-                    ):
-                        seen_validated_signal_ids.add(signal_id)
-                        credit_delta = max(0, int(self.dynamic_hop_credit_per_signal))
-                        if credit_delta > 0 and iteration_budget < hop_credit_cap:
-                            new_budget = min(hop_credit_cap, iteration_budget + credit_delta)
-                            granted = max(0, new_budget - iteration_budget)
-                            if granted > 0:
-                                iteration_budget = new_budget
-                                objective_budget["max_hops"] = int(new_budget)
-                                hop_credits_earned += granted
-                                hop_credit_events += 1
-                    if lane_name in {"rfp_procurement_tenders", "annual_report", "governance_pdf"}:
-                        procurement_validated += 1
-                elif signal_state == "candidate":
-                    pass_a_candidates += 1
-            if lane_result["diagnostic"]:
-                diagnostics.append(lane_result["diagnostic"])
-            llm_last_status = lane_result["hop"].get("llm_last_status", llm_last_status)
-            parse_path = lane_result["hop"].get("parse_path", parse_path)
-            if progress_callback:
-                await progress_callback(
-                    {
-                        "status": "running",
-                        "pass": "A",
-                        "lane": lane,
-                        "iterations_completed": state["iterations_completed"],
-                        "signals_discovered": len(signals),
-                    }
-                )
-            if self.continuous_mode_enabled and self.resume_checkpoint_enabled:
-                self._save_discovery_checkpoint(
-                    entity_id=entity_id,
-                    objective=objective,
-                    state=state,
-                    hop_timings=hop_timings,
-                    signals=signals,
-                    diagnostics=diagnostics,
-                    candidate_evaluations=candidate_evaluations,
-                )
-            if self.continuous_mode_enabled:
-                cooldown_remaining = self._provider_pause_remaining_seconds()
-                if cooldown_remaining > 0:
-                    self._save_provider_pause_state(
-                        cooldown_seconds=cooldown_remaining,
-                        reason="provider_rate_limit",
-                    )
-                    if self.resume_checkpoint_enabled:
-                        self._save_discovery_checkpoint(
-                            entity_id=entity_id,
-                            objective=objective,
-                            state=state,
-                            hop_timings=hop_timings,
-                            signals=signals,
-                            diagnostics=diagnostics,
-                            candidate_evaluations=candidate_evaluations,
-                        )
-                    return self._build_paused_result(
-                        entity_id=entity_id,
-                        entity_name=entity_name,
-                        objective=objective,
-                        reason="provider_rate_limit",
-                        resume_at_epoch=time.time() + cooldown_remaining,
-                    )
-
-        adaptive_extended = False
-        adaptive_candidate_mode = False
-        if (
-            pass_a_validated >= 2
-            and procurement_validated == 0
-            and state["iterations_completed"] < iteration_budget
-        ):
-            adaptive_cap = min(
-                7,
-                max(
-                    iteration_budget,
-                    int(iteration_budget) + 2,
-                ),
-            )
-            if adaptive_cap > iteration_budget:
-                iteration_budget = adaptive_cap
-                objective_budget["max_hops"] = adaptive_cap
-                adaptive_extended = True
-
-        if (
-            self.enable_agentic_router
-            and pass_a_validated == 0
-            and pass_a_candidates > 0
-            and state["iterations_completed"] >= max(1, min(self.candidate_mode_trigger_hops, len(pass_a_lanes)))
-            and state["iterations_completed"] < max(iteration_budget, self.candidate_mode_extended_hops)
-        ):
-            candidate_cap = min(
-                max(iteration_budget, self.candidate_mode_extended_hops),
-                max(iteration_budget, objective_budget["max_hops"] + 2),
-            )
-            if candidate_cap > iteration_budget:
-                iteration_budget = candidate_cap
-                objective_budget["max_hops"] = candidate_cap
-                adaptive_candidate_mode = True
-
-        pass_b_executed = False
-        selected_pass_b_lanes: List[str] = []
-        if (
-            (pass_a_validated > 0 or (adaptive_candidate_mode and pass_a_candidates > 0))
-            and state["iterations_completed"] < iteration_budget
-        ):
-            pass_b_executed = True
-            selected_pass_b_lanes = await self._choose_lane_order_with_llm(
-                entity_name=entity_name,
-                objective=objective,
-                pass_name="B",
-                available_lanes=pass_b_lanes,
-                state=state,
-            )
-            for lane in selected_pass_b_lanes:
-                if state["iterations_completed"] >= iteration_budget:
-                    break
-                lane_result = await self._run_lane(
-                    lane=lane,
-                    entity_id=entity_id,
-                    entity_name=entity_name,
-                    dossier=dossier,
-                    official_domain=official_domain,
-                    state=state,
-                    budget=objective_budget,
-                    run_objective=objective,
-                )
+        lane_scheduler = self._build_lane_scheduler(
+            lanes=selected_pass_a_lanes,
+            hops_remaining=lambda: iteration_budget - state["iterations_completed"],
+            entity_id=entity_id,
+            entity_name=entity_name,
+            dossier=dossier,
+            official_domain=official_domain,
+            state=state,
+            budget=objective_budget,
+            run_objective=objective,
+        )
+        lane_schedulers.append(lane_scheduler)
+        async with lane_scheduler:
+            async for lane, lane_result in lane_scheduler:
                 hop_timings.append(lane_result["hop"])
                 candidate_evaluations.extend(lane_result.get("candidate_evaluations") or [])
                 state["iterations_completed"] += 1
                 if lane_result["signal"]:
                     signals.append(lane_result["signal"])
-                    if lane_result["signal"].get("validation_state") == "validated":
-                        lane_name = str(lane_result["hop"].get("hop_type") or lane)
+                    signal_state = str(lane_result["signal"].get("validation_state") or "").lower()
+                    lane_name = str(lane_result["hop"].get("hop_type") or lane)
+                    if signal_state == "validated":
+                        pass_a_validated += 1
                         validated_candidate_count_by_lane[lane_name] = (
                             int(validated_candidate_count_by_lane.get(lane_name, 0) or 0) + 1
                         )
@@ -1092,6 +1097,10 @@ class DiscoveryRuntimeV2:
                                     objective_budget["max_hops"] = int(new_budget)
                                     hop_credits_earned += granted
                                     hop_credit_events += 1
+                        if lane_name in {"rfp_procurement_tenders", "annual_report", "governance_pdf"}:
+                            procurement_validated += 1
+                    elif signal_state == "candidate":
+                        pass_a_candidates += 1
                 if lane_result["diagnostic"]:
                     diagnostics.append(lane_result["diagnostic"])
                 llm_last_status = lane_result["hop"].get("llm_last_status", llm_last_status)
@@ -1100,10 +1109,11 @@ class DiscoveryRuntimeV2:
                     await progress_callback(
                         {
                             "status": "running",
-                            "pass": "B",
+                            "pass": "A",
                             "lane": lane,
                             "iterations_completed": state["iterations_completed"],
                             "signals_discovered": len(signals),
+                            "new_signals": [lane_result["signal"]] if lane_result["signal"] else [],
                         }
                     )
                 if self.continuous_mode_enabled and self.resume_checkpoint_enabled:
@@ -1141,6 +1151,145 @@ class DiscoveryRuntimeV2:
                             resume_at_epoch=time.time() + cooldown_remaining,
                         )
 
+        adaptive_extended = False
+        adaptive_candidate_mode = False
+        if (
+            pass_a_validated >= 2
+            and procurement_validated == 0
+            and state["iterations_completed"] < iteration_budget
+        ):
+            adaptive_cap = min(
+                7,
+                max(
+                    iteration_budget,
+                    int(iteration_budget) + 2,
+                ),
+            )
+            if adaptive_cap > iteration_budget:
+                iteration_budget = adaptive_cap
+                objective_budget["max_hops"] = adaptive_cap
+                adaptive_extended = True
+
+        if (
+            self.enable_agentic_router
+            and pass_a_validated == 0
+            and pass_a_candidates > 0
+            and state["iterations_completed"] >= max(1, min(self.candidate_mode_trigger_hops, len(pass_a_lanes)))
+            and state["iterations_completed"] < max(iteration_budget, self.candidate_mode_extended_hops)
+        ):
+            candidate_cap = min(
+                max(iteration_budget, self.candidate_mode_extended_hops),
+                max(iteration_budget, objective_budget["max_hops"] + 2),
+            )
+            if candidate_cap > iteration_budget:
+                iteration_budget = candidate_cap
+                objective_budget["max_hops"] = candidate_cap
+                adaptive_candidate_mode = True
+
+        pass_b_executed = False
+        selected_pass_b_lanes: List[str] = []
+        if (
+            (pass_a_validated > 0 or (adaptive_candidate_mode and pass_a_candidates > 0))
+            and state["iterations_completed"] < iteration_budget
+        ):
+            pass_b_executed = True
+            selected_pass_b_lanes = await self._choose_lane_order_with_llm(
+                entity_name=entity_name,
+                objective=objective,
+                pass_name="B",
+                available_lanes=pass_b_lanes,
+                state=state,
+            )
+            lane_scheduler = self._build_lane_scheduler(
+                lanes=selected_pass_b_lanes,
+                hops_remaining=lambda: iteration_budget - state["iterations_completed"],
+                entity_id=entity_id,
+                entity_name=entity_name,
+                dossier=dossier,
+                official_domain=official_domain,
+                state=state,
+                budget=objective_budget,
+                run_objective=objective,
+            )
+            lane_schedulers.append(lane_scheduler)
+            async with lane_scheduler:
+                async for lane, lane_result in lane_scheduler:
+                    hop_timings.append(lane_result["hop"])
+                    candidate_evaluations.extend(lane_result.get("candidate_evaluations") or [])
+                    state["iterations_completed"] += 1
+                    if lane_result["signal"]:
+                        signals.append(lane_result["signal"])
+                        if lane_result["signal"].get("validation_state") == "validated":
+                            lane_name = str(lane_result["hop"].get("hop_type") or lane)
+                            validated_candidate_count_by_lane[lane_name] = (
+                                int(validated_candidate_count_by_lane.get(lane_name, 0) or 0) + 1
+                            )
+                            signal_id = str(lane_result["signal"].get("id") or "").strip()
+                            if (
+                                self.dynamic_hop_credits_enabled
+                                and signal_id
+                                and signal_id not in seen_validated_signal_ids
+                            ):
+                                seen_validated_signal_ids.add(signal_id)
+                                credit_delta = max(0, int(self.dynamic_hop_credit_per_signal))
+                                if credit_delta > 0 and iteration_budget < hop_credit_cap:
+                                    new_budget = min(hop_credit_cap, iteration_budget + credit_delta)
+                                    granted = max(0, new_budget - iteration_budget)
+                                    if granted > 0:
+                                        iteration_budget = new_budget
+                                        objective_budget["max_hops"] = int(new_budget)
+                                        hop_credits_earned += granted
+                                        hop_credit_events += 1
+                    if lane_result["diagnostic"]:
+                        diagnostics.append(lane_result["diagnostic"])
+                    llm_last_status = lane_result["hop"].get("llm_last_status", llm_last_status)
+                    parse_path = lane_result["hop"].get("parse_path", parse_path)
+                    if progress_callback:
+                        await progress_callback(
+                            {
+                                "status": "running",
+                                "pass": "B",
+                                "lane": lane,
+                                "iterations_completed": state["iterations_completed"],
+                                "signals_discovered": len(signals),
+                                "new_signals": [lane_result["signal"]] if lane_result["signal"] else [],
+                            }
+                        )
+                    if self.continuous_mode_enabled and self.resume_checkpoint_enabled:
+                        self._save_discovery_checkpoint(
+                            entity_id=entity_id,
+                            objective=objective,
+                            state=state,
+                            hop_timings=hop_timings,
+                            signals=signals,
+                            diagnostics=diagnostics,
+                            candidate_evaluations=candidate_evaluations,
+                        )
+                    if self.continuous_mode_enabled:
+                        cooldown_remaining = self._provider_pause_remaining_seconds()
+                        if cooldown_remaining > 0:
+                            self._save_provider_pause_state(
+                                cooldown_seconds=cooldown_remaining,
+                                reason="provider_rate_limit",
+                            )
+                            if self.resume_checkpoint_enabled:
+                                self._save_discovery_checkpoint(
+                                    entity_id=entity_id,
+                                    objective=objective,
+                                    state=state,
+                                    hop_timings=hop_timings,
+                                    signals=signals,
+                                    diagnostics=diagnostics,
+                                    candidate_evaluations=candidate_evaluations,
+                                )
+                            return self._build_paused_result(
+                                entity_id=entity_id,
+                                entity_name=entity_name,
+                                objective=objective,
+                                reason="provider_rate_limit",
+                                resume_at_epoch=time.time() + cooldown_remaining,
+                            )
+
         validated_signals = [
             signal
             for signal in signals
@@ -1298,6 +1447,12 @@ class DiscoveryRuntimeV2:
             "hop_selector": "llm" if self.enable_llm_hop_selection else "deterministic",
             "candidate_evaluations_count": len(candidate_evaluations),
             "validated_candidate_count_by_lane": validated_candidate_count_by_lane,
+            "lane_scheduler": {
+                "concurrency": int(self.lane_concurrency),
+                "early_stop_confidence": float(self.lane_early_stop_confidence),
+                "max_in_flight": max((sched.max_in_flight for sched in lane_schedulers), default=0),
+                "cancelled_lanes": [lane for sched in lane_schedulers for lane in sched.cancelled_lanes],
+            },
         }
 
         confidence_band = "HIGH" if final_confidence >= 0.7 else "MEDIUM" if final_confidence >= 0.55 else "LOW"
@@ -1329,6 +1484,39 @@ class DiscoveryRuntimeV2:
             self._clear_discovery_checkpoint(entity_id=entity_id, objective=objective)
         return result
 
+    def _build_lane_scheduler(
+        self,
+        *,
+        lanes: List[str],
+        hops_remaining: Callable[[], int],
+        entity_id: str,
+        entity_name: str,
+        dossier: Dict[str, Any],
+        official_domain: Optional[str],
+        state: Dict[str, Any],
+        budget: Dict[str, Any],
+        run_objective: str,
+    ) -> _LaneScheduler:
+        async def _run(lane: str) -> Dict[str, Any]:
+            return await self._run_lane(
+                lane=lane,
+                entity_id=entity_id,
+                entity_name=entity_name,
+                dossier=dossier,
+                official_domain=official_domain,
+                state=state,
+                budget=budget,
+                run_objective=run_objective,
+            )
+
+        return _LaneScheduler(
+            lanes=lanes,
+            run_lane=_run,
+            hops_remaining=hops_remaining,
+            concurrency=self.lane_concurrency,
+            early_stop_confidence=self.lane_early_stop_confidence,
+        )
+
     async def _run_lane(
         self,
         *,
@@ -1531,6 +1719,14 @@ class DiscoveryRuntimeV2:
                     self._register_lane_failure(lane, state, "same_domain_revisit_cap")
                     continue
 
+            # Claim the URL and domain slot before the first await: lanes share
+            # ``state`` and run concurrently, so a check here followed by a write
+            # after the fetch would let two lanes scrape the same page or overrun
+            # the same-domain cap.
+            state["visited_urls"].add(url)
+            if host:
+                state["domain_visits"][host] = int(state["domain_visits"].get(host, 0) or 0) + 1
+
             scraped = pre_scraped_by_url.get(url)
             if not scraped:
                 scraped = await self._scrape_with_budget(url, budget=effective_budget)
@@ -1605,6 +1801,8 @@ class DiscoveryRuntimeV2:
             if content_hash and content_hash in state["visited_hashes"]:
                 self._register_lane_failure(lane, state, "duplicate_content_hash")
                 low_signal_reason = low_signal_reason or "duplicate_content_hash"
+            elif content_hash:
+                state["visited_hashes"].add(content_hash)
 
             # Pre-judge quality gate: force one rendered probe on likely JS-shell pages before rejecting.
             if low_signal_reason and lane in {"official_site", "press_release", "trusted_news", "careers"}:
@@ -1650,7 +1848,7 @@ class DiscoveryRuntimeV2:
                 self._register_lane_failure(lane, state, low_signal_reason)
                 planner_feedback = state.setdefault("planner_feedback", {})
                 planner_feedback[url] = float(planner_feedback.get(url, 0.0) or 0.0) - 0.15
-                low_signal_host = (urlparse(url).hostname or "").lower().lstrip("www.")
+                low_signal_host = url_features(url).host
                 if low_signal_host:
                     host_key = f"host:{low_signal_host}"
                     planner_feedback[host_key] = float(planner_feedback.get(host_key, 0.0) or 0.0) - 0.08
@@ -1855,7 +2053,7 @@ class DiscoveryRuntimeV2:
                 state["accepted_signatures"].add(signature)
                 planner_feedback = state.setdefault("planner_feedback", {})
                 planner_feedback[url] = float(planner_feedback.get(url, 0.0) or 0.0) + 0.22
-                validated_host = (urlparse(url).hostname or "").lower().lstrip("www.")
+                validated_host = url_features(url).host
                 if validated_host:
                     host_key = f"host:{validated_host}"
                     planner_feedback[host_key] = float(planner_feedback.get(host_key, 0.0) or 0.0) + 0.12
@@ -1912,11 +2110,11 @@ class DiscoveryRuntimeV2:
             }
             candidate_evaluations.append(candidate_eval)
 
+            # ``url`` may have moved to a promoted tender link; the domain slot
+            # was already claimed before the fetch.
             state["visited_urls"].add(url)
             if content_hash:
                 state["visited_hashes"].add(content_hash)
-            if host:
-                state["domain_visits"][host] = int(state["domain_visits"].get(host, 0) or 0) + 1
 
             hop_record.update(
                 {
@@ -2046,7 +2244,7 @@ class DiscoveryRuntimeV2:
         # Include known canonical source as discovered candidate, not synthetic.
         canonical = (dossier.get("metadata", {}) if isinstance(dossier, dict) else {}).get("canonical_sources", {})
         official = canonical.get("official_site") if isinstance(canonical, dict) else None
-        official_domain = (urlparse(str(official or "")).hostname or "").lower().lstrip("www.")
+        official_domain = url_features(str(official or "")).host
         if not official_domain:
             official_domain = None
         if lane == "official_site" and isinstance(official, str) and official.strip():
@@ -2159,23 +2357,22 @@ class DiscoveryRuntimeV2:
                     }
                 )
 
-        ranked = sorted(
+        scorer = BatchUrlScorer(
+            self._candidate_scorer(
+                lane=lane,
+                entity_name=entity_name,
+                official_domain=official_domain,
+                state=state,
+            )
+        )
+        return scorer.rank(
             discovered,
-            key=lambda candidate: (
+            key_prefix=lambda candidate: (
                 self._rfp_tier_priority(candidate=candidate, official_domain=official_domain)
                 if lane == "rfp_procurement_tenders"
-                else 0.0,
-                self._candidate_score(
-                    candidate,
-                    lane=lane,
-                    entity_name=entity_name,
-                    official_domain=official_domain,
-                    state=state,
-                ),
+                else 0.0
             ),
-            reverse=True,
         )
-        return ranked
 
     async def _discover_official_pdf_candidates(
         self,
@@ -2378,7 +2575,7 @@ class DiscoveryRuntimeV2:
                     candidate = _normalize_url(loc)
                     if not candidate:
                         continue
-                    host = (urlparse(candidate).hostname or "").lower().lstrip("www.")
+                    host = url_features(candidate).host
                     if not host.endswith(official_domain):
                         continue
                     lower = candidate.lower()
@@ -2406,7 +2603,7 @@ class DiscoveryRuntimeV2:
                 resolved = _normalize_url(urljoin(page_url, href))
                 if not resolved:
                     continue
-                host = (urlparse(resolved).hostname or "").lower().lstrip("www.")
+                host = url_features(resolved).host
                 if not host.endswith(official_domain):
                     continue
                 if self._looks_like_pdf_signal_url(resolved):
@@ -2505,9 +2702,9 @@ class DiscoveryRuntimeV2:
                 or metadata.get("entity_website")
                 or metadata.get("official_site_url")
             )
-        official_host = (urlparse(str(official or "")).hostname or "").lower().lstrip("www.")
+        official_host = url_features(str(official or "")).host
         if not official_host:
-            official_host = (self._official_domain(entity_name=entity_name, dossier=dossier) or "").lower().lstrip("www.")
+            official_host = strip_www((self._official_domain(entity_name=entity_name, dossier=dossier) or "").lower())
         entity_aliases = self._entity_aliases(entity_name=entity_name, official_host=official_host)
 
         query_pool: List[str] = []
@@ -2657,98 +2854,123 @@ class DiscoveryRuntimeV2:
         official_domain: Optional[str] = None,
         state: Optional[Dict[str, Any]] = None,
     ) -> float:
-        score = 0.0
-        url = str(candidate.get("url") or "").lower()
-        title = str(candidate.get("title") or "").lower()
-        snippet = str(candidate.get("snippet") or "").lower()
-        text = f"{title} {snippet} {url}"
-        host = (urlparse(url).hostname or "").lower().lstrip("www.")
-        source_tier = self._source_tier(url=url, official_domain=official_domain)
+        scorer = self._candidate_scorer(
+            lane=lane,
+            entity_name=entity_name,
+            official_domain=official_domain,
+            state=state,
+        )
+        return scorer(candidate, url_features(str(candidate.get("url") or "")))
 
-        if entity_name.lower() in text:
-            score += 0.35
-        for token in LANE_KEYWORDS.get(lane, ()):
-            if token in text:
-                score += 0.12
-        if official_domain and (host == official_domain or host.endswith(f".{official_domain}")):
-            score += 0.35
-        if source_tier == "tier_1":
-            score += 0.25
-        elif source_tier == "tier_2":
-            score += 0.12
-        else:
-            score -= 0.06
-        if url.endswith(".pdf"):
-            score += 0.08 if lane in {"annual_report", "governance_pdf"} else -0.05
-        if "linkedin.com/jobs" in url and lane == "linkedin_jobs":
-            score += 0.2
-        if lane in {"press_release", "trusted_news"} and any(domain in url for domain in TRUSTED_NEWS_DOMAINS):
-            score += 0.2
-        if any(domain in url for domain in HIGH_PRIORITY_REFERENCE_DOMAINS):
-            score += 0.1
-        if lane in {"careers", "linkedin_jobs"} and "linkedin.com/in/" in url:
-            score += 0.04
-        if lane in {"official_site", "trusted_news"} and "wikipedia.org/wiki/" in url:
-            score -= 0.1
-        if lane == "trusted_news" and ("bbc.com/sport" in url or "bbc.co.uk/sport" in url):
-            score += 0.16
-        parsed = urlparse(url)
-        path = (parsed.path or "").strip("/").lower()
-        path_tokens = {token for token in re.findall(r"[a-z0-9]+", path) if token}
-        if lane == "official_site":
-            if not path:
-                score += 0.4
-            else:
-                low_signal_terms = {"match", "matches", "fixture", "fixtures", "result", "results", "calendar", "schedule", "ticket", "tickets"}
-                high_signal_terms = {"news", "press", "about", "club", "commercial", "careers", "contact", "partners"}
-                low_hits = path_tokens.intersection(low_signal_terms)
-                high_hits = path_tokens.intersection(high_signal_terms)
-                if low_hits:
-                    score -= 0.95
-                    if len(path.split("/")) >= 3:
-                        score -= 0.2
-                if high_hits:
-                    score += 0.35
-        if lane in {"rfp_procurement_tenders", "annual_report", "governance_pdf", "careers", "linkedin_jobs"}:
-            if any(domain in host for domain in LOW_AUTHORITY_DOMAIN_HINTS):
-                score -= 0.5
-            if any(marker in host for marker in ("edemocracy.", "charitycommission.", "gov.uk", "locality.org.uk")):
-                score -= 0.35
-        if lane == "rfp_procurement_tenders":
-            source_tier = self._source_tier(url=url, official_domain=official_domain)
-            origin = str(candidate.get("candidate_origin") or "").strip().lower()
+    def _candidate_scorer(
+        self,
+        *,
+        lane: str,
+        entity_name: str,
+        official_domain: Optional[str] = None,
+        state: Optional[Dict[str, Any]] = None,
+    ) -> Callable[[Dict[str, Any], Any], float]:
+        """Build a per-candidate scorer with the lane/entity invariants hoisted out."""
+        entity_lower = entity_name.lower()
+        lane_keywords = tuple(LANE_KEYWORDS.get(lane, ()))
+        pdf_bonus = 0.08 if lane in {"annual_report", "governance_pdf"} else -0.05
+        trusted_news_lane = lane in {"press_release", "trusted_news"}
+        jobs_lane = lane in {"careers", "linkedin_jobs"}
+        wiki_penalty_lane = lane in {"official_site", "trusted_news"}
+        authority_lane = lane in {"rfp_procurement_tenders", "annual_report", "governance_pdf", "careers", "linkedin_jobs"}
+        official_site_low_signal_terms = {"match", "matches", "fixture", "fixtures", "result", "results", "calendar", "schedule", "ticket", "tickets"}
+        official_site_high_signal_terms = {"news", "press", "about", "club", "commercial", "careers", "contact", "partners"}
+        domain_visits = (state or {}).get("domain_visits", {})
+        rejected_domain_families = (state or {}).get("rejected_domain_families") or {}
+        rejected_urls = (state or {}).get("rejected_urls", set())
+        low_signal = (state or {}).get("low_signal_urls", {})
+
+        def score_candidate(candidate: Dict[str, Any], features) -> float:
+            score = 0.0
+            url = str(candidate.get("url") or "").lower()
+            title = str(candidate.get("title") or "").lower()
+            snippet = str(candidate.get("snippet") or "").lower()
+            text = f"{title} {snippet} {url}"
+            host = features.host
+            source_tier = self._source_tier_for_features(features, official_domain=official_domain)
+            is_pdf = features.file_type == "pdf"
+
+            if entity_lower in text:
+                score += 0.35
+            for token in lane_keywords:
+                if token in text:
+                    score += 0.12
+            if official_domain and host_matches_domain(host, official_domain):
+                score += 0.35
             if source_tier == "tier_1":
-                score += 0.45
+                score += 0.25
             elif source_tier == "tier_2":
-                score += 0.16
+                score += 0.12
             else:
-                score -= 0.22
-            if origin in {"known_doc_index", "sitemap", "crawl"}:
-                score += 0.35
-            if origin == "search":
-                score += 0.08
-            if any(token in url for token in ("procurement", "tender", "rfp", "request-for-proposal", "supplier")):
-                score += 0.24
-            if url.endswith(".pdf"):
-                score += 0.18
-        if state:
-            domain_visits = state.get("domain_visits", {})
-            if host and int(domain_visits.get(host, 0) or 0) > 0:
-                score -= 0.22
-            domain_family = self._domain_family(url)
-            if domain_family and int((state.get("rejected_domain_families") or {}).get(domain_family, 0) or 0) > 0:
-                score -= 0.25
-            rejected_urls = state.get("rejected_urls", set())
-            normalized = _normalize_url(url)
-            if isinstance(rejected_urls, set) and normalized and normalized in rejected_urls:
-                score -= 0.5
-            low_signal = state.get("low_signal_urls", {})
-            low_signal_count = int((low_signal or {}).get(normalized, 0) or 0) if normalized else 0
-            if low_signal_count > 0:
-                score -= min(0.4, low_signal_count * 0.15)
-            score += self._planner_feedback_score(url=normalized, state=state)
-        score += self._freshness_score_from_text(text)
-        return score
+                score -= 0.06
+            if is_pdf:
+                score += pdf_bonus
+            if lane == "linkedin_jobs" and "linkedin.com/jobs" in url:
+                score += 0.2
+            if trusted_news_lane and _TRUSTED_NEWS_DOMAIN_TRIE.matches(host):
+                score += 0.2
+            if _HIGH_PRIORITY_REFERENCE_DOMAIN_TRIE.matches(host):
+                score += 0.1
+            if jobs_lane and "linkedin.com/in/" in url:
+                score += 0.04
+            if wiki_penalty_lane and "wikipedia.org/wiki/" in url:
+                score -= 0.1
+            if lane == "trusted_news" and ("bbc.com/sport" in url or "bbc.co.uk/sport" in url):
+                score += 0.16
+            if lane == "official_site":
+                if features.is_root:
+                    score += 0.4
+                else:
+                    low_hits = features.path_tokens.intersection(official_site_low_signal_terms)
+                    if low_hits:
+                        score -= 0.95
+                        if len(features.path_segments) >= 3:
+                            score -= 0.2
+                    if features.path_tokens.intersection(official_site_high_signal_terms):
+                        score += 0.35
+            if authority_lane:
+                if any(domain in host for domain in LOW_AUTHORITY_DOMAIN_HINTS):
+                    score -= 0.5
+                if any(marker in host for marker in ("edemocracy.", "charitycommission.", "gov.uk", "locality.org.uk")):
+                    score -= 0.35
+            if lane == "rfp_procurement_tenders":
+                origin = str(candidate.get("candidate_origin") or "").strip().lower()
+                if source_tier == "tier_1":
+                    score += 0.45
+                elif source_tier == "tier_2":
+                    score += 0.16
+                else:
+                    score -= 0.22
+                if origin in {"known_doc_index", "sitemap", "crawl"}:
+                    score += 0.35
+                if origin == "search":
+                    score += 0.08
+                if any(token in url for token in ("procurement", "tender", "rfp", "request-for-proposal", "supplier")):
+                    score += 0.24
+                if is_pdf:
+                    score += 0.18
+            if state:
+                if host and int(domain_visits.get(host, 0) or 0) > 0:
+                    score -= 0.22
+                domain_family = self._domain_family(url)
+                if domain_family and int(rejected_domain_families.get(domain_family, 0) or 0) > 0:
+                    score -= 0.25
+                normalized = _normalize_url(url)
+                if isinstance(rejected_urls, set) and normalized and normalized in rejected_urls:
+                    score -= 0.5
+                low_signal_count = int((low_signal or {}).get(normalized, 0) or 0) if normalized else 0
+                if low_signal_count > 0:
+                    score -= min(0.4, low_signal_count * 0.15)
+                score += self._planner_feedback_score(url=normalized, state=state)
+            score += self._freshness_score_from_text(text)
+            return score
+
+        return score_candidate
 
     def _rfp_tier_priority(self, *, candidate: Dict[str, Any], official_domain: Optional[str]) -> float:
         url = str(candidate.get("url") or "").strip()
@@ -2772,7 +2994,7 @@ class DiscoveryRuntimeV2:
 
     @staticmethod
     def _domain_family(url: str) -> str:
-        host = (urlparse(url).hostname or "").lower().lstrip("www.")
+        host = url_features(url).host
         if not host:
             return ""
         parts = host.split(".")
@@ -3221,22 +3443,12 @@ class DiscoveryRuntimeV2:
         raw = str(text or "").strip()
         if not raw:
             return None
-        if "```" in raw:
-            normalized = raw.replace("```json", "```").replace("```JSON", "```")
-            candidates = [segment.strip() for segment in normalized.split("```") if segment.strip()]
-            fenced = next((segment for segment in candidates if segment.startswith("{") and segment.endswith("}")), "")
-            if fenced:
-                raw = fenced
-        if not raw.startswith("{"):
-            start = raw.find("{")
-            end = raw.rfind("}")
-            if start >= 0 and end > start:
-                raw = raw[start : end + 1]
         try:
-            payload = json.loads(raw)
+            return json.loads(raw)
         except Exception:
-            return None
-        return payload
+            pass
+        # Fenced or prose-wrapped payloads: first complete object, no truncation repair.
+        return next((value for _, value in scan_json(raw).values() if isinstance(value, dict)), None)
 
     def _planner_payload_from_response(self, response: Dict[str, Any], *, batch: bool) -> Optional[Any]:
         structured_output = (response or {}).get("structured_output")
@@ -3309,7 +3521,7 @@ class DiscoveryRuntimeV2:
     def _is_relaxed_tender_first_pass(*, lane: str, url: str, official_domain: Optional[str]) -> bool:
         if lane not in {"rfp_procurement_tenders", "annual_report", "governance_pdf"}:
             return False
-        host = (urlparse(str(url or "")).hostname or "").lower().lstrip("www.")
+        host = url_features(str(url or "")).host
         if not official_domain or not host:
             return False
         if host != official_domain and not host.endswith(f".{official_domain}"):
@@ -3327,7 +3539,7 @@ class DiscoveryRuntimeV2:
     ) -> List[Dict[str, Any]]:
         if not official_domain:
             return []
-        host = (urlparse(str(page_url or "")).hostname or "").lower().lstrip("www.")
+        host = url_features(str(page_url or "")).host
         if not host or (host != official_domain and not host.endswith(f".{official_domain}")):
             return []
 
@@ -3352,7 +3564,7 @@ class DiscoveryRuntimeV2:
             if not resolved:
                 continue
             parsed = urlparse(resolved)
-            resolved_host = (parsed.hostname or "").lower().lstrip("www.")
+            resolved_host = strip_www((parsed.hostname or "").lower())
             if resolved_host != official_domain and not resolved_host.endswith(f".{official_domain}"):
                 continue
             lowered = resolved.lower()
@@ -3961,7 +4173,7 @@ class DiscoveryRuntimeV2:
         if not isinstance(feedback, dict):
             return 0.0
         url_score = float(feedback.get(url, 0.0) or 0.0)
-        host = (urlparse(url).hostname or "").lower().lstrip("www.")
+        host = url_features(url).host
         host_score = float(feedback.get(f"host:{host}", 0.0) or 0.0) if host else 0.0
         return max(-0.45, min(0.45, (url_score * 0.8) + (host_score * 0.4)))
 
@@ -4226,7 +4438,7 @@ class DiscoveryRuntimeV2:
                 if isinstance(official, str):
                     host = (urlparse(official).hostname or "").lower()
                     if host:
-                        return host.lstrip("www.")
+                        return strip_www(host)
             website = metadata.get("website")
             if isinstance(website, str):
                 parsed_website = urlparse(website)
@@ -4240,7 +4452,7 @@ class DiscoveryRuntimeV2:
                 if isinstance(website, str):
                     host = (urlparse(website).hostname or "").lower()
                     if host:
-                        return host.lstrip("www.")
+                        return strip_www(host)
         sections = dossier.get("sections") if isinstance(dossier, dict) else None
         if isinstance(sections, list):
             for section in sections:
@@ -4254,7 +4466,7 @@ class DiscoveryRuntimeV2:
                 if match:
                     host = (urlparse(match.group(0)).hostname or "").lower()
                     if host:
-                        return host.lstrip("www.")
+                        return strip_www(host)
                 bare_match = re.search(
                     r"\b(?:www\.)?[a-z0-9.-]+\.[a-z]{2,}(?:/[a-z0-9._~:/?#@!$&'()*+,;=-]*)?\b",
                     joined,
@@ -4263,7 +4475,7 @@ class DiscoveryRuntimeV2:
                 if bare_match:
                     host = (urlparse(f"https://{bare_match.group(0)}").hostname or "").lower()
                     if host:
-                        return host.lstrip("www.")
+                        return strip_www(host)
         return None
 
     @staticmethod
@@ -4293,12 +4505,16 @@ class DiscoveryRuntimeV2:
         return deduped
 
     def _source_tier(self, *, url: str, official_domain: Optional[str]) -> str:
-        host = (urlparse(url).hostname or "").lower().lstrip("www.")
-        if official_domain and (host == official_domain or host.endswith(f".{official_domain}")):
+        return self._source_tier_for_features(url_features(url), official_domain=official_domain)
+
+    @staticmethod
+    def _source_tier_for_features(features, *, official_domain: Optional[str]) -> str:
+        host = features.host
+        if official_domain and host_matches_domain(host, official_domain):
             return "tier_1"
-        if any(host.endswith(domain) for domain in TRUSTED_NEWS_DOMAINS):
+        if _TRUSTED_NEWS_DOMAIN_TRIE.matches(host):
             return "tier_2"
-        if any(host.endswith(hint) or hint in host for hint in TIER_1_DOMAIN_HINTS):
+        if _TIER_1_DOMAIN_TRIE.matches(host) or not _TIER_1_HOST_LABELS.isdisjoint(features.labels):
             return "tier_1"
         return "tier_3"
 
@@ -4317,7 +4533,7 @@ class DiscoveryRuntimeV2:
         url = str(candidate.get("url") or "").strip()
         if not url:
             return False
-        host = (urlparse(url).hostname or "").lower().lstrip("www.")
+        host = url_features(url).host
         if not language_ok:
             return False
         if official_domain and (host == official_domain or host.endswith(f".{official_domain}")):
@@ -4413,7 +4629,7 @@ class DiscoveryRuntimeV2:
     def _is_entity_domain_match(*, url: str, official_domain: Optional[str]) -> bool:
         if not official_domain:
             return False
-        host = (urlparse(url).hostname or "").lower().lstrip("www.")
+        host = url_features(url).host
         return bool(host and (host == official_domain or host.endswith(f".{official_domain}")))
 
     def _candidate_language_ok(self, *, lane: str, url: str) -> bool:
@@ -4449,11 +4665,11 @@ class DiscoveryRuntimeV2:
         official_domain: Optional[str],
         grounding_score: float,
     ) -> bool:
-        host = (urlparse(url).hostname or "").lower().lstrip("www.")
+        host = url_features(url).host
         if official_domain and (host == official_domain or host.endswith(f".{official_domain}")):
             return True
         allowed_env = str(os.getenv("DISCOVERY_FEDERATION_PROCUREMENT_ALLOWED_DOMAINS", "") or "").strip()
-        allowlist = [domain.strip().lower().lstrip("www.") for domain in allowed_env.split(",") if domain.strip()]
+        allowlist = [strip_www(domain.strip().lower()) for domain in allowed_env.split(",") if domain.strip()]
         if any(host == domain or host.endswith(f".{domain}") for domain in allowlist):
             return grounding_score >= 0.75
         return False
@@ -4589,7 +4805,7 @@ class DiscoveryRuntimeV2:
         specificity = self._entity_specificity_score(snippet=combined, entity_name=entity_name)
         if specificity < 0.5:
             return ""
-        host = (urlparse(url).hostname or "").lower().lstrip("www.")
+        host = url_features(url).host
         if official_domain and not (host == official_domain or host.endswith(f".{official_domain}")):
             return ""
         is_coventry_entity = "coventry city" in str(entity_name or "").lower()
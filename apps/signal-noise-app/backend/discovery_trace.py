@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+Discovery Trace Record/Replay
+
+Captures every BrightData search/scrape and every LLM response from a live
+discovery run into a compact trace file (gzip JSONL), then feeds those
+traces back deterministically so discovery runtimes can be profiled and
+regression-tested offline.
+
+Recording:
+    recorder = TraceRecorder("data/traces/arsenal.jsonl.gz", metadata={...})
+    brightdata = RecordingBrightDataClient(BrightDataSDKClient(), recorder)
+    claude = RecordingClaudeClient(ClaudeClient(), recorder)
+    ... run discovery ...
+    recorder.close()
+
+Replay:
+    trace = DiscoveryTrace.load("data/traces/arsenal.jsonl.gz")
+    brightdata = ReplayBrightDataClient(trace, latency_scale=1.0)
+    claude = ReplayClaudeClient(trace, latency_scale=1.0)
+
+Requests are matched by a content hash of their arguments. Repeated
+identical requests (retries, re-evaluations) replay their recorded
+responses in order; once exhausted the last response is reused.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+TRACE_FORMAT_VERSION = 1
+
+KIND_SEARCH = "search"
+KIND_SCRAPE = "scrape"
+KIND_SCRAPE_BATCH = "scrape_batch"
+KIND_LLM = "llm"
+
+# LLM kwargs that change the response; transport knobs (stream, retries) do not.
+_LLM_KEY_FIELDS = ("model", "max_tokens", "system_prompt", "json_mode", "json_schema", "tools")
+
+
+class TraceMissError(LookupError):
+    """Replay was asked for a request that the trace never recorded."""
+
+
+class ReplayedCallError(RuntimeError):
+    """A recorded call failed during recording; replay raises it again."""
+
+
+def request_key(kind: str, payload: Dict[str, Any]) -> str:
+    """Stable content hash for a request (kind + canonical JSON of its arguments)."""
+    canonical = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    digest = hashlib.sha256(f"{kind}\n{canonical}".encode("utf-8")).hexdigest()
+    return digest[:24]
+
+
+def _llm_payload(method: str, prompt: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    payload = {"method": method, "prompt": prompt}
+    for name in _LLM_KEY_FIELDS:
+        if kwargs.get(name) is not None:
+            payload[name] = kwargs[name]
+    return payload
+
+
+def count_llm_tokens(response: Any) -> Dict[str, int]:
+    """Input/output token counts from a ClaudeClient response dict."""
+    usage = response.get("tokens_used") if isinstance(response, dict) else None
+    if not isinstance(usage, dict):
+        return {"input_tokens": 0, "output_tokens": 0}
+    input_tokens = usage.get("input_tokens", usage.get("prompt_tokens")) or 0
+    output_tokens = usage.get("output_tokens", usage.get("completion_tokens")) or 0
+    try:
+        return {"input_tokens": int(input_tokens), "output_tokens": int(output_tokens)}
+    except (TypeError, ValueError):
+        return {"input_tokens": 0, "output_tokens": 0}
+
+
+@dataclass
+class TraceRecord:
+    """One captured provider call."""
+    kind: str
+    key: str
+    request: Dict[str, Any]
+    response: Any = None
+    error: Optional[Dict[str, str]] = None
+    latency_seconds: float = 0.0
+    sequence: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "kind": self.kind,
+            "key": self.key,
+            "request": self.request,
+            "latency_seconds": round(self.latency_seconds, 4),
+            "sequence": self.sequence,
+        }
+        if self.error is not None:
+            data["error"] = self.error
+        else:
+            data["response"] = self.response
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TraceRecord":
+        return cls(
+            kind=data["kind"],
+            key=data["key"],
+            request=data.get("request") or {},
+            response=data.get("response"),
+            error=data.get("error"),
+            latency_seconds=float(data.get("latency_seconds") or 0.0),
+            sequence=int(data.get("sequence") or 0),
+        )
+
+
+def _open_trace(path: Path, mode: str):
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class TraceRecorder:
+    """
+    Append-only trace writer shared by the recording clients.
+
+    The first line holds trace metadata; every following line is one
+    TraceRecord. Paths ending in `.gz` are gzip-compressed.
+    """
+
+    def __init__(self, path: str, metadata: Optional[Dict[str, Any]] = None):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._sequence = 0
+        self._file = _open_trace(self.path, "w")
+        header = {
+            "trace_format_version": TRACE_FORMAT_VERSION,
+            "recorded_at": time.time(),
+            "metadata": dict(metadata or {}),
+        }
+        self._file.write(json.dumps(header, default=str) + "\n")
+
+    def record(self, record: TraceRecord) -> None:
+        with self._lock:
+            self._sequence += 1
+            record.sequence = self._sequence
+            self._file.write(json.dumps(record.to_dict(), default=str) + "\n")
+
+    @property
+    def record_count(self) -> int:
+        return self._sequence
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def __enter__(self) -> "TraceRecorder":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class _RecordingClientBase:
+    """Delegates every attribute to the wrapped client except the recorded calls."""
+
+    def __init__(self, inner: Any, recorder: TraceRecorder):
+        self._inner = inner
+        self._recorder = recorder
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._inner, name)
+
+    async def _record_call(self, kind: str, payload: Dict[str, Any], call):
+        key = request_key(kind, payload)
+        started = time.perf_counter()
+        try:
+            response = await call()
+        except Exception as error:  # noqa: BLE001 - recorded, then re-raised
+            self._recorder.record(TraceRecord(
+                kind=kind,
+                key=key,
+                request=payload,
+                error={"type": error.__class__.__name__, "message": str(error)},
+                latency_seconds=time.perf_counter() - started,
+            ))
+            raise
+        self._recorder.record(TraceRecord(
+            kind=kind,
+            key=key,
+            request=payload,
+            response=response,
+            latency_seconds=time.perf_counter() - started,
+        ))
+        return response
+
+
+class RecordingBrightDataClient(_RecordingClientBase):
+    """BrightDataSDKClient wrapper that records searches and scrapes."""
+
+    async def search_engine(self, query: str, engine: str = "google", **kwargs: Any) -> Dict[str, Any]:
+        payload = {"query": query, "engine": engine, **kwargs}
+        return await self._record_call(
+            KIND_SEARCH,
+            payload,
+            lambda: self._inner.search_engine(query=query, engine=engine, **kwargs),
+        )
+
+    async def scrape_as_markdown(self, url: str) -> Dict[str, Any]:
+        return await self._record_call(
+            KIND_SCRAPE,
+            {"url": url},
+            lambda: self._inner.scrape_as_markdown(url),
+        )
+
+    async def scrape_batch(self, urls: List[str]) -> Dict[str, Any]:
+        return await self._record_call(
+            KIND_SCRAPE_BATCH,
+            {"urls": list(urls)},
+            lambda: self._inner.scrape_batch(urls),
+        )
+
+
+class RecordingClaudeClient(_RecordingClientBase):
+    """ClaudeClient wrapper that records model responses."""
+
+    async def query(self, prompt: str, **kwargs: Any) -> Dict[str, Any]:
+        return await self._record_call(
+            KIND_LLM,
+            _llm_payload("query", prompt, kwargs),
+            lambda: self._inner.query(prompt=prompt, **kwargs),
+        )
+
+    async def query_with_cascade(self, prompt: str, **kwargs: Any) -> Dict[str, Any]:
+        return await self._record_call(
+            KIND_LLM,
+            _llm_payload("query_with_cascade", prompt, kwargs),
+            lambda: self._inner.query_with_cascade(prompt=prompt, **kwargs),
+        )
+
+
+@dataclass
+class ReplayStats:
+    """Counters collected while replaying a trace."""
+    calls: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    misses: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    simulated_latency_seconds: float = 0.0
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": dict(self.calls),
+            "misses": dict(self.misses),
+            "simulated_latency_seconds": round(self.simulated_latency_seconds, 4),
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+        }
+
+
+class DiscoveryTrace:
+    """
+    Loaded trace, indexed by request key.
+
+    Responses for a key are served in recorded order; `stats` is shared by
+    every replay client built on the same trace.
+    """
+
+    def __init__(self, records: List[TraceRecord], metadata: Optional[Dict[str, Any]] = None):
+        self.metadata = dict(metadata or {})
+        self.records = sorted(records, key=lambda record: record.sequence)
+        self._by_key: Dict[str, List[TraceRecord]] = defaultdict(list)
+        for record in self.records:
+            self._by_key[record.key].append(record)
+        self._cursors: Dict[str, Deque[TraceRecord]] = {}
+        self.stats = ReplayStats()
+        self.reset()
+
+    @classmethod
+    def load(cls, path: str) -> "DiscoveryTrace":
+        trace_path = Path(path)
+        metadata: Dict[str, Any] = {}
+        records: List[TraceRecord] = []
+        with _open_trace(trace_path, "r") as f:
+            for line_number, line in enumerate(f):
+                line = line.strip()
+                if not line:
+                    continue
+                data = json.loads(line)
+                if line_number == 0 and "trace_format_version" in data:
+                    metadata = data.get("metadata") or {}
+                    continue
+                records.append(TraceRecord.from_dict(data))
+        logger.info(f"Loaded discovery trace {trace_path}: {len(records)} records")
+        return cls(records, metadata=metadata)
+
+    def reset(self) -> None:
+        """Rewind every key so the trace can be replayed again."""
+        self._cursors = {key: deque(records) for key, records in self._by_key.items()}
+        self.stats = ReplayStats()
+
+    def next_record(self, kind: str, payload: Dict[str, Any]) -> Optional[TraceRecord]:
+        key = request_key(kind, payload)
+        self.stats.calls[kind] += 1
+        recorded = self._by_key.get(key)
+        if not recorded:
+            self.stats.misses[kind] += 1
+            return None
+        cursor = self._cursors[key]
+        return cursor.popleft() if len(cursor) > 1 else cursor[0]
+
+    def summary(self) -> Dict[str, Any]:
+        counts: Dict[str, int] = defaultdict(int)
+        for record in self.records:
+            counts[record.kind] += 1
+        return {
+            "records": len(self.records),
+            "by_kind": dict(counts),
+            "recorded_latency_seconds": round(sum(record.latency_seconds for record in self.records), 4),
+        }
+
+
+class _ReplayClientBase:
+    """Serves recorded responses with simulated latency."""
+
+    def __init__(self, trace: DiscoveryTrace, latency_scale: float = 1.0, strict: bool = False):
+        self.trace = trace
+        self.latency_scale = max(0.0, float(latency_scale))
+        self.strict = strict
+
+    async def _replay(self, kind: str, payload: Dict[str, Any], miss_response: Any = None) -> Any:
+        record = self.trace.next_record(kind, payload)
+        if record is None:
+            if self.strict or miss_response is None:
+                raise TraceMissError(f"No recorded {kind} response for {json.dumps(payload, default=str)[:200]}")
+            logger.debug(f"Trace miss for {kind}: returning miss response")
+            return miss_response
+
+        delay = record.latency_seconds * self.latency_scale
+        self.trace.stats.simulated_latency_seconds += delay
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if record.error is not None:
+            raise ReplayedCallError(f"{record.error.get('type')}: {record.error.get('message')}")
+        return json.loads(json.dumps(record.response))
+
+    async def close(self) -> None:
+        return None
+
+
+class ReplayBrightDataClient(_ReplayClientBase):
+    """Drop-in BrightDataSDKClient replacement backed by a trace."""
+
+    _rate_limit_cooldown_until = 0.0
+    _rate_limit_cooldown_until_epoch = 0.0
+
+    async def search_engine(self, query: str, engine: str = "google", **kwargs: Any) -> Dict[str, Any]:
+        payload = {"query": query, "engine": engine, **kwargs}
+        return await self._replay(
+            KIND_SEARCH,
+            payload,
+            miss_response={"status": "error", "error": "trace_miss", "query": query, "results": []},
+        )
+
+    async def scrape_as_markdown(self, url: str) -> Dict[str, Any]:
+        return await self._replay(
+            KIND_SCRAPE,
+            {"url": url},
+            miss_response={"status": "error", "error": "trace_miss", "url": url, "content": ""},
+        )
+
+    async def scrape_batch(self, urls: List[str]) -> Dict[str, Any]:
+        return await self._replay(
+            KIND_SCRAPE_BATCH,
+            {"urls": list(urls)},
+            miss_response={"status": "error", "error": "trace_miss", "results": []},
+        )
+
+    async def _wait_for_rate_limit_cooldown(self) -> None:
+        return None
+
+
+class ReplayClaudeClient(_ReplayClientBase):
+    """Drop-in ClaudeClient replacement backed by a trace."""
+
+    _chutes_rate_limit_cooldown_until_epoch = 0.0
+
+    def __init__(self, trace: DiscoveryTrace, latency_scale: float = 1.0, strict: bool = False):
+        super().__init__(trace, latency_scale=latency_scale, strict=strict)
+        self.provider = str(trace.metadata.get("llm_provider") or "replay")
+        self._last_request_diagnostics: Dict[str, Any] = {"llm_provider": self.provider, "llm_last_status": "init"}
+
+    async def _replay_llm(self, method: str, prompt: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        response = await self._replay(KIND_LLM, _llm_payload(method, prompt, kwargs))
+        tokens = count_llm_tokens(response)
+        self.trace.stats.input_tokens += tokens["input_tokens"]
+        self.trace.stats.output_tokens += tokens["output_tokens"]
+        self._last_request_diagnostics = {"llm_provider": self.provider, "llm_last_status": "ok"}
+        return response
+
+    async def query(self, prompt: str, **kwargs: Any) -> Dict[str, Any]:
+        return await self._replay_llm("query", prompt, kwargs)
+
+    async def query_with_cascade(self, prompt: str, **kwargs: Any) -> Dict[str, Any]:
+        return await self._replay_llm("query_with_cascade", prompt, kwargs)
+
+    def get_runtime_diagnostics(self) -> Dict[str, Any]:
+        return dict(self._last_request_diagnostics)
@@ -11,9 +11,13 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from urllib.parse import urlparse
 from typing import Iterable, Mapping, Optional
 
+try:
+    from backend.url_features import host_matches_domain, url_features
+except ImportError:
+    from url_features import host_matches_domain, url_features
+
 
 @dataclass(frozen=True)
 class UrlPolicyDecision:
@@ -81,8 +85,8 @@ class DiscoveryUrlPolicy:
     ) -> UrlPolicyDecision:
         normalized_entity = str(entity_name or "").strip().lower()
 
-        parsed = urlparse(str(url or "").strip())
-        host = (parsed.netloc or "").lower().lstrip("www.")
+        features = url_features(url)
+        host = features.host
         if not host:
             return UrlPolicyDecision(False, "missing_host")
 
@@ -90,9 +94,7 @@ class DiscoveryUrlPolicy:
         if hop_key not in self._HIGH_VALUE_HOPS:
             return UrlPolicyDecision(True, "allow")
 
-        path = (parsed.path or "/").strip().lower()
-        if not path:
-            path = "/"
+        path = features.path.strip() or "/"
         if not path.startswith("/"):
             path = f"/{path}"
 
@@ -148,7 +150,7 @@ class DiscoveryUrlPolicy:
 
     @staticmethod
     def _host_matches(host: str, domain: str) -> bool:
-        return host == domain or host.endswith(f".{domain}")
+        return host_matches_domain(host, domain)
 
     @staticmethod
     def _path_matches(path: str, blocked_paths: Iterable[str]) -> bool:
@@ -79,6 +79,11 @@ def _local_falkordb_auth_enabled() -> bool:
         "on",
     }
 
+try:
+    from backend.llm_batch_broker import query_json as batched_query_json
+except ImportError:
+    from llm_batch_broker import query_json as batched_query_json
+
 try:
     from official_site_resolver import choose_canonical_official_site, rank_official_site_candidates
 except ImportError:  # pragma: no cover - package import path fallback
@@ -476,6 +481,14 @@ class DossierDataCollector:
         self.parallel_collection_min_remaining_seconds = self._parse_positive_float_env(
             os.getenv("DOSSIER_PARALLEL_COLLECTION_MIN_REMAINING_SECONDS", "6")
         ) or 6.0
+        self.field_resolution_planner_enabled = self._parse_bool_env(
+            os.getenv("DOSSIER_FIELD_PLANNER_ENABLED"),
+            default=True,
+        )
+        self.field_scrape_concurrency = max(
+            1,
+            int(self._parse_positive_float_env(os.getenv("DOSSIER_FIELD_SCRAPE_CONCURRENCY", "3")) or 3),
+        )
         self._preferred_official_site_urls: Dict[str, str] = {}
         self._official_site_url_cache = self._load_official_site_url_cache()
         self._official_site_content_cache = self._load_official_site_content_cache()
@@ -1640,15 +1653,18 @@ class DossierDataCollector:
         current_objective = normalize_run_objective(run_objective, default=self.default_run_objective)
         if not self._is_rfp_objective(current_objective):
             # Source 3: Field-specific searches for missing data
-            if not all_extracted_data.get("founded"):
-                founded_data = await self._scrape_field_specific(entity_name, "founded")
-                if founded_data:
-                    all_extracted_data.update(founded_data)
-
-            if not all_extracted_data.get("stadium"):
-                stadium_data = await self._scrape_field_specific(entity_name, "stadium")
-                if stadium_data:
-                    all_extracted_data.update(stadium_data)
+            missing_fields = [
+                field_name for field_name in ("founded", "stadium") if not all_extracted_data.get(field_name)
+            ]
+            if len(missing_fields) > 1 and self.field_resolution_planner_enabled:
+                field_data = await self._resolve_missing_fields(entity_name, missing_fields)
+                if field_data:
+                    all_extracted_data.update(field_data)
+            else:
+                for field_name in missing_fields:
+                    field_data = await self._scrape_field_specific(entity_name, field_name)
+                    if field_data:
+                        all_extracted_data.update(field_data)
 
         if not all_extracted_data.get("website"):
             all_extracted_data["website"] = all_extracted_data.get("official_site_url", "")
@@ -1686,11 +1702,12 @@ class DossierDataCollector:
         if not self.claude_client:
             return None
         try:
-            result = await self.claude_client.query(
+            result = await batched_query_json(
+                self.claude_client,
+                family="dossier_field_extraction",
                 prompt=prompt,
                 model=model,
                 max_tokens=max_tokens,
-                json_mode=True,
                 max_retries_override=0,
                 empty_retries_before_fallback_override=1,
                 fast_fail_on_length=True,
@@ -1914,12 +1931,8 @@ class DossierDataCollector:
             logger.warning(f"⚠️ Official site scraping failed: {e}")
             return {}
 
-    async def _scrape_field_specific(self, entity_name: str, field: str) -> Dict[str, Any]:
-        """
-        Field-specific scraping for missing data.
-
-        Uses targeted search queries for each field type.
-        """
+    @staticmethod
+    def _field_search_queries(entity_name: str, field: str) -> List[str]:
         field_queries = {
             "founded": [
                 f'"{entity_name}" founded year history',
@@ -1941,9 +1954,106 @@ class DossierDataCollector:
                 f'how many employees does "{entity_name}" have'
             ]
         }
+        return field_queries.get(field, [])
+
+    def _field_page_key(self, url: str) -> str:
+        normalized = self._normalize_http_url(url) or str(url or "").strip()
+        return normalized.split("#", 1)[0].rstrip("/").lower()
+
+    async def _search_field_top_url(self, entity_name: str, field: str) -> Optional[str]:
+        queries = self._field_search_queries(entity_name, field)
+        if not queries:
+            return None
+        try:
+            search_results = await self.brightdata_client.search_engine(
+                query=queries[0],
+                engine="google",
+                num_results=5
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Field-specific search failed for {field}: {e}")
+            return None
+        if search_results.get('status') != 'success':
+            return None
+        results = search_results.get("results")
+        if not isinstance(results, list) or not results:
+            return None
+        first_result = results[0] if isinstance(results[0], dict) else {}
+        return first_result.get("url") or None
+
+    async def _resolve_missing_fields(self, entity_name: str, fields: List[str]) -> Dict[str, Any]:
+        """
+        Resolve several missing fields with one scrape and one extraction per page.
+
+        Plans the work by searching every field first (concurrently, capped by
+        DOSSIER_FIELD_SCRAPE_CONCURRENCY), grouping fields by the page their
+        top result points at, then scraping each distinct page once. Pages
+        serving several fields get a single structured extraction call.
+
+        Returns:
+            Extracted field values plus ``field_provenance``
+            (field -> url, confidence, method).
+        """
+        semaphore = asyncio.Semaphore(self.field_scrape_concurrency)
+
+        async def locate(field_name: str) -> tuple:
+            async with semaphore:
+                return field_name, await self._search_field_top_url(entity_name, field_name)
+
+        plan: Dict[str, List[str]] = {}
+        page_urls: Dict[str, str] = {}
+        for field_name, url in await asyncio.gather(*(locate(field_name) for field_name in fields)):
+            if not url:
+                continue
+            page_key = self._field_page_key(url)
+            plan.setdefault(page_key, []).append(field_name)
+            page_urls.setdefault(page_key, url)
+        if not plan:
+            return {}
+        logger.info(f"🧭 Field plan for {entity_name}: {len(fields)} fields -> {len(plan)} pages")
+
+        async def resolve_page(page_key: str) -> Dict[str, Dict[str, Any]]:
+            page_fields = plan[page_key]
+            url = page_urls[page_key]
+            try:
+                async with semaphore:
+                    logger.info(f"🔍 Field-specific scraping for {', '.join(page_fields)}: {url}")
+                    scrape_result = await self.brightdata_client.scrape_as_markdown(url)
+                if scrape_result.get('status') != 'success':
+                    return {}
+                content = scrape_result.get('content', '')
+                if len(page_fields) == 1:
+                    extracted = await self._extract_single_field(content, entity_name, page_fields[0])
+                    return {
+                        name: {"value": value, "url": url, "confidence": None, "method": "single_field"}
+                        for name, value in extracted.items()
+                    }
+                return {
+                    name: {**resolved, "url": url}
+                    for name, resolved in (await self._extract_page_fields(content, entity_name, page_fields)).items()
+                }
+            except Exception as e:
+                logger.warning(f"⚠️ Field-specific scraping failed for {', '.join(page_fields)}: {e}")
+                return {}
 
+        extracted_data: Dict[str, Any] = {}
+        provenance: Dict[str, Dict[str, Any]] = {}
+        for page_result in await asyncio.gather(*(resolve_page(page_key) for page_key in plan)):
+            for field_name, resolved in page_result.items():
+                extracted_data[field_name] = resolved.get("value")
+                provenance[field_name] = {key: value for key, value in resolved.items() if key != "value"}
+        if provenance:
+            extracted_data["field_provenance"] = provenance
+        return extracted_data
+
+    async def _scrape_field_specific(self, entity_name: str, field: str) -> Dict[str, Any]:
+        """
+        Field-specific scraping for missing data.
+
+        Uses targeted search queries for each field type.
+        """
         try:
-            queries = field_queries.get(field, [])
+            queries = self._field_search_queries(entity_name, field)
             if not queries:
                 return {}
 
@@ -2683,6 +2793,74 @@ Return ONLY the value (no extra text).""",
             logger.error(f"❌ Web scraping failed: {e}")
             return None
 
+    _FIELD_EXTRACTION_DESCRIPTIONS = {
+        "founded": "4-digit year the organisation was founded",
+        "stadium": "name of the home stadium or ground",
+        "hq": "headquarters location",
+        "employees": "number of employees or staff",
+    }
+
+    async def _extract_page_fields(
+        self,
+        content: str,
+        entity_name: str,
+        fields: List[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Extract several fields from one page with a single structured call.
+
+        Falls back to one `_extract_single_field` call per field when the
+        structured response is unusable.
+        """
+        field_lines = "\n".join(
+            f'- "{name}": {self._FIELD_EXTRACTION_DESCRIPTIONS.get(name, name)}' for name in fields
+        )
+        content_budget = min(4000, 2000 + 1000 * (len(fields) - 1))
+        prompt = f"""Extract these facts about {entity_name} from the content.
+
+Fields:
+{field_lines}
+
+Content:
+{content[:content_budget]}
+
+Return ONLY JSON mapping each field to {{"value": string or null, "confidence": number 0-1}}.
+Use null when the content does not state the value."""
+        parsed = await self._query_json_strict(prompt=prompt, max_tokens=60 + 50 * len(fields))
+        if not isinstance(parsed, dict) or not any(name in parsed for name in fields):
+            single_results = await asyncio.gather(
+                *(self._extract_single_field(content, entity_name, name) for name in fields)
+            )
+            return {
+                name: {"value": value, "confidence": None, "method": "single_field"}
+                for extracted in single_results
+                for name, value in extracted.items()
+            }
+
+        resolved: Dict[str, Dict[str, Any]] = {}
+        for name in fields:
+            entry = parsed.get(name)
+            if isinstance(entry, dict):
+                value, confidence = entry.get("value"), entry.get("confidence")
+            else:
+                value, confidence = entry, None
+            value = None if value is None else str(value).strip()
+            if not value or value.lower() in ['null', 'not found', 'unknown', 'n/a']:
+                value = None
+            elif name == "founded":
+                year_match = re.search(r'\d{4}', value)
+                value = year_match.group(0) if year_match else None
+            try:
+                confidence = max(0.0, min(1.0, float(confidence))) if confidence is not None else None
+            except (TypeError, ValueError):
+                confidence = None
+            resolved[name] = {
+                "value": value,
+                "confidence": confidence if value is not None else 0.0,
+                "method": "multi_field",
+            }
+        return resolved
+
     async def _extract_entity_properties(self, content: str, entity_name: str) -> Dict[str, Any]:
         """
         Extract entity properties from scraped content using Claude AI
@@ -4873,10 +5051,24 @@ If there are conflicts, explain in analysis and rank accordingly."""
 
         url = extracted_data.get("url", extracted_data.get("wikipedia_url", ""))
         source_type = extracted_data.get("source", extracted_data.get("source_type", "wikipedia"))
+        field_provenance = extracted_data.get("field_provenance")
+        if not isinstance(field_provenance, dict):
+            field_provenance = {}
 
         for extracted_key, field_name, default_source, credibility in field_mapping:
             value = extracted_data.get(extracted_key)
             if value and value not in ["null", None, ""]:
+                provenance = field_provenance.get(extracted_key)
+                if isinstance(provenance, dict):
+                    # Resolved by field-specific search: keep the page it came from and its extraction confidence.
+                    confidence = provenance.get("confidence")
+                    field_sources[field_name].append({
+                        "value": str(value),
+                        "source": "field_search",
+                        "url": provenance.get("url") or url,
+                        "credibility": min(credibility, confidence) if isinstance(confidence, (int, float)) else credibility
+                    })
+                    continue
                 field_sources[field_name].append({
                     "value": str(value),
                     "source": source_type if extracted_key != "official_site_url" else "official_website",
@@ -20,6 +20,7 @@ import logging
 import os
 import random
 import re
+import string
 from copy import deepcopy
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any, Callable, Awaitable
@@ -48,6 +49,16 @@ except ImportError:
         get_objective_profile,
         normalize_run_objective,
     )
+try:
+    from backend.context_packer import context_packing_enabled, model_token_budget, pack_context
+except ImportError:
+    from context_packer import context_packing_enabled, model_token_budget, pack_context  # type: ignore
+
+try:
+    from backend.json_scanner import extract_last_json_value
+except ImportError:
+    from json_scanner import extract_last_json_value  # type: ignore
+
 try:
     from backend.dossier_persistence import apply_dossier_persistence_context
 except ImportError:
@@ -413,6 +424,9 @@ class EntityDossierGenerator:
         priority_score: int = 50,
         entity_data: Optional[Dict[str, Any]] = None,
         run_objective: Optional[str] = None,
+        section_ids: Optional[List[str]] = None,
+        previous_sections: Optional[List[DossierSection]] = None,
+        previous_section_fingerprints: Optional[Dict[str, str]] = None,
     ) -> EntityDossier:
         """
         Generate complete dossier based on priority tier
@@ -423,6 +437,9 @@ class EntityDossierGenerator:
             entity_type: Entity type (CLUB, LEAGUE, VENUE, etc.)
             priority_score: Priority score (0-100) for tier determination
             entity_data: Optional pre-collected entity data (deprecated, auto-collected if None)
+            section_ids: Optional explicit section list (overrides the tier sections)
+            previous_sections: Sections from an earlier run, reused when their inputs are unchanged
+            previous_section_fingerprints: Section input fingerprints from that run
 
         Returns:
             Complete EntityDossier with all sections
@@ -447,6 +464,8 @@ class EntityDossierGenerator:
         if objective in {"rfp_pdf", "rfp_web"}:
             # Objective-scoped compact baseline for RFP-focused runs.
             sections_to_generate = ["core_information", "quick_actions", "contact_information", "recent_news"]
+        if section_ids:
+            sections_to_generate = [section_id for section_id in section_ids if section_id in self.section_templates]
 
         # Create dossier object
         dossier = EntityDossier(
@@ -621,13 +640,33 @@ Website: N/A
 
         self._last_entity_data_by_id[entity_id] = deepcopy(entity_data)
 
+        # Sections whose inputs are unchanged since the previous run are carried
+        # over instead of being generated again
+        section_fingerprints = {
+            section_id: self.section_input_fingerprint(section_id, entity_data)
+            for section_id in sections_to_generate
+        }
+        previous_by_id = {section.id: section for section in previous_sections or []}
+        previous_section_fingerprints = previous_section_fingerprints or {}
+        reused_section_ids = [
+            section_id
+            for section_id in sections_to_generate
+            if section_id in previous_by_id
+            and self._is_reusable_section(previous_by_id[section_id])
+            and previous_section_fingerprints.get(section_id) == section_fingerprints[section_id]
+        ]
+        pending_sections = [s for s in sections_to_generate if s not in reused_section_ids]
+
         # Generate sections in parallel where possible
-        logger.info(f"Generating {len(sections_to_generate)} sections for {entity_name} ({tier} tier)")
+        logger.info(
+            f"Generating {len(pending_sections)} sections for {entity_name} ({tier} tier, "
+            f"{len(reused_section_ids)} unchanged sections reused)"
+        )
 
         # Group sections by model for parallel execution
-        haiku_sections = [s for s in sections_to_generate if self.section_templates[s]["model"] == "haiku"]
-        sonnet_sections = [s for s in sections_to_generate if self.section_templates[s]["model"] == "sonnet"]
-        opus_sections = [s for s in sections_to_generate if self.section_templates[s]["model"] == "opus"]
+        haiku_sections = [s for s in pending_sections if self.section_templates[s]["model"] == "haiku"]
+        sonnet_sections = [s for s in pending_sections if self.section_templates[s]["model"] == "sonnet"]
+        opus_sections = [s for s in pending_sections if self.section_templates[s]["model"] == "opus"]
 
         # Generate Haiku sections in parallel
         if haiku_sections:
@@ -656,6 +695,11 @@ Website: N/A
             )
             dossier.sections.extend(opus_results)
 
+        if reused_section_ids:
+            dossier.sections.extend(previous_by_id[section_id] for section_id in reused_section_ids)
+            section_order = {section_id: index for index, section_id in enumerate(sections_to_generate)}
+            dossier.sections.sort(key=lambda section: section_order.get(section.id, len(section_order)))
+
         # Extract questions from sections (for discovery feedback loop)
         if self.disable_question_extraction or not enable_question_extraction:
             logger.info(
@@ -686,8 +730,9 @@ Website: N/A
                         self.claude_client,
                         disable_ai_questions=bool(objective_profile.get("disable_ai_question_generation", False)),
                     )
+                    # Reused sections already had their questions extracted
                     dossier.questions = await question_extractor.extract_questions_from_dossier(
-                        dossier.sections,
+                        [section for section in dossier.sections if section.id not in reused_section_ids],
                         entity_name,
                         max_per_section=3
                     )
@@ -710,6 +755,15 @@ Website: N/A
             entity_data=entity_data or {},
             dossier_data_obj=dossier_data_obj,
         )
+        # Failed or fallback sections must be regenerated next run even if
+        # their inputs are unchanged, so their fingerprints are not recorded
+        generated_by_id = {section.id: section for section in dossier.sections}
+        dossier.metadata["section_fingerprints"] = {
+            section_id: fingerprint
+            for section_id, fingerprint in section_fingerprints.items()
+            if section_id in generated_by_id and self._is_reusable_section(generated_by_id[section_id])
+        }
+        dossier.metadata["reused_sections"] = reused_section_ids
 
         logger.info(
             f"Dossier generated for {entity_name}: "
@@ -913,6 +967,7 @@ Website: N/A
             section_id=section_id,
             entity_name=entity_name,
             safe_entity_data=safe_entity_data,
+            model=model,
         )
 
         deterministic_data = self._build_data_driven_section_content(section_id, entity_data)
@@ -1043,6 +1098,52 @@ Website: N/A
             logger.error(f"Error generating section {section_id} with {model}: {e}")
             raise
 
+    def section_input_fingerprint(self, section_id: str, entity_data: Dict[str, Any]) -> str:
+        """
+        Fingerprint everything a section's generation reads
+
+        Data-driven sections hash their deterministic content; prompted
+        sections hash their template and the entity_data fields it
+        references. An unchanged fingerprint means the section can be reused.
+
+        Args:
+            section_id: Section identifier
+            entity_data: Collected entity data
+
+        Returns:
+            Hex digest of the section inputs
+        """
+        template_info = self.section_templates.get(section_id)
+        if not template_info:
+            raise ValueError(f"Unknown section ID: {section_id}")
+        model = template_info["model"]
+        payload: Dict[str, Any] = {"section_id": section_id, "model": model}
+
+        deterministic_data = None
+        if self.use_data_driven_section_baseline and section_id in self.data_driven_section_ids:
+            deterministic_data = self._build_data_driven_section_content(section_id, entity_data)
+
+        if deterministic_data is not None:
+            payload["deterministic"] = deterministic_data
+        else:
+            try:
+                from backend.dossier_templates import get_prompt_template
+                prompt_template = get_prompt_template(template_info["prompt_template"], model)
+                fields = sorted({
+                    re.split(r"[.\[]", name, maxsplit=1)[0]
+                    for _, name, _, _ in string.Formatter().parse(prompt_template)
+                    if name
+                })
+                payload["template"] = hashlib.sha256(prompt_template.encode("utf-8")).hexdigest()
+                payload["inputs"] = {name: entity_data.get(name) for name in fields}
+            except Exception as e:
+                # Unparseable template: fall back to every input, which only costs reuse
+                logger.debug(f"Fingerprinting {section_id} on full entity data: {e}")
+                payload["inputs"] = entity_data
+
+        encoded = json.dumps(payload, sort_keys=True, default=str, ensure_ascii=True)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
     def _extract_section_data(self, content_text: str) -> Dict[str, Any]:
         """Extract structured section data from model output."""
         section_data = self._extract_last_valid_json_block(content_text)
@@ -1088,10 +1189,12 @@ Website: N/A
         section_id: str,
         entity_name: str,
         safe_entity_data: Dict[str, Any],
+        model: Optional[str] = None,
     ) -> Dict[str, Any]:
         values = {"entity_name": entity_name, **safe_entity_data}
         limits = dict(self.section_prompt_field_limits_default)
         limits.update(self.section_prompt_field_limits_by_section.get(section_id, {}))
+        packable: Dict[str, str] = {}
         for key, max_chars in limits.items():
             raw = values.get(key)
             if raw is None:
@@ -1100,9 +1203,50 @@ Website: N/A
                 raw_text = json.dumps(raw, ensure_ascii=True)
             else:
                 raw_text = str(raw)
+                if context_packing_enabled():
+                    packable[key] = raw_text
+                    continue
             values[key] = self._truncate_prompt_value(raw_text, int(max_chars))
+        if packable:
+            values.update(
+                self._pack_section_prompt_fields(
+                    section_id=section_id,
+                    entity_name=entity_name,
+                    fields=packable,
+                    limits=limits,
+                    model=model,
+                )
+            )
         return values
 
+    def _pack_section_prompt_fields(
+        self,
+        *,
+        section_id: str,
+        entity_name: str,
+        fields: Dict[str, str],
+        limits: Dict[str, int],
+        model: Optional[str],
+    ) -> Dict[str, str]:
+        """Pack free-text prompt fields by relevance to the section under the model's token budget."""
+        # Character limits become per-field token caps (~4 chars/token).
+        caps = {key: max(1, int(limits[key]) // 4) for key in fields}
+        budget = min(sum(caps.values()), model_token_budget(model or "", default=sum(caps.values())))
+        template_info = self.section_templates.get(section_id) or {}
+        question = " ".join(
+            [entity_name, section_id.replace("_", " "), str(template_info.get("description") or "")]
+        )
+        packed = pack_context(question, fields, budget, source_caps=caps)
+        logger.debug(
+            "Packed %s prompt fields: %s -> %s tokens (saved %s, %s duplicates dropped)",
+            section_id,
+            packed.input_tokens,
+            packed.packed_tokens,
+            packed.saved_tokens,
+            packed.dropped_duplicates,
+        )
+        return packed.sections
+
     def _apply_section_response_budget(self, *, section_id: str, model: str, prompt: str) -> str:
         if section_id not in self.compact_response_section_ids:
             return prompt
@@ -1129,30 +1273,17 @@ Website: N/A
         if not isinstance(content_text, str) or not content_text.strip():
             return {}
 
-        candidate_blocks: List[str] = []
-
-        fenced_matches = re.findall(
-            r"```(?:json)?\s*([\s\S]*?)```",
-            content_text,
-            flags=re.IGNORECASE,
-        )
-        candidate_blocks.extend([block.strip() for block in fenced_matches if block and block.strip()])
-
-        for pattern in (r"\{[\s\S]*\}", r"\[[\s\S]*\]"):
-            match = re.search(pattern, content_text)
-            if match:
-                candidate_blocks.append(match.group(0).strip())
-
-        candidate_blocks.append(content_text.strip())
-
-        for block in reversed(candidate_blocks):
-            try:
-                parsed = json.loads(block)
-                if isinstance(parsed, (dict, list)):
-                    return parsed
-            except Exception:
-                continue
-
+        try:
+            parsed = json.loads(content_text.strip())
+            if isinstance(parsed, (dict, list)):
+                return parsed
+        except Exception:
+            pass
+
+        # Single scan over prose/fences; a truncated trailing object is closed rather than dropped.
+        parsed = extract_last_json_value(content_text, repair=True, numeric_keys=("confidence",))
+        if isinstance(parsed, (dict, list)):
+            return parsed
         return {}
 
     def _section_data_needs_repair(self, section_data: Dict[str, Any]) -> bool:
@@ -1827,6 +1958,14 @@ Website: N/A
         cost_per_million = pricing.get(model, 0.25)
         return (estimated_tokens / 1_000_000) * cost_per_million
 
+    @staticmethod
+    def _is_reusable_section(section: DossierSection) -> bool:
+        """Whether a section from a previous run can be carried over unchanged"""
+        return (
+            str(getattr(section, "output_status", "completed") or "") in {"completed", "completed_evidence_led"}
+            and not getattr(section, "fallback_used", False)
+        )
+
     def _create_fallback_section(
         self,
         section_id: str,
@@ -7,6 +7,7 @@ import time
 import logging
 from uuid import UUID
 from copy import deepcopy
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -23,6 +24,13 @@ try:
 except ImportError:  # pragma: no cover - allows unit tests without supabase package
     create_client = None
 from local_pg_client import create_local_pg_client, should_use_local_pg
+from pipeline_wakeup import (
+    PIPELINE_WAKEUP_PATH,
+    PipelineWakeup,
+    notify_pipeline_wakeup,
+    pipeline_idle_poll_seconds,
+    pipeline_wakeup_enabled,
+)
 from pipeline_run_metadata import (
     derive_discovery_context,
     derive_monitoring_summary,
@@ -492,10 +500,312 @@ def _write_pipeline_control_state_to_store(state: Dict[str, Any]) -> None:
 
 def _write_pipeline_control_state_to_file(state: Dict[str, Any]) -> None:
     PIPELINE_CONTROL_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
-    PIPELINE_CONTROL_STATE_PATH.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    temp_path = PIPELINE_CONTROL_STATE_PATH.with_name(f"{PIPELINE_CONTROL_STATE_PATH.name}.{os.getpid()}.tmp")
+    temp_path.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    os.replace(temp_path, PIPELINE_CONTROL_STATE_PATH)
+
+
+def _pipeline_control_state_cache_enabled() -> bool:
+    return str(os.getenv("PIPELINE_CONTROL_STATE_CACHE_ENABLED") or "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _pipeline_control_state_revalidate_seconds() -> float:
+    try:
+        return max(0.0, float(os.getenv("PIPELINE_CONTROL_STATE_REVALIDATE_SECONDS", "2")))
+    except ValueError:
+        return 2.0
+
+
+PIPELINE_CONTROL_STATE_CAS_ATTEMPTS = 5
+
+
+@dataclass
+class PipelineControlStateRecord:
+    """Cached control state plus the version it was read or written at.
+
+    ``marker`` is what the cheap revalidation probe compares against: the store
+    row version when Postgres is the source of truth, otherwise the mirror
+    file's mtime so edits from another process are still picked up.
+    ``unsynced_patch`` holds updates served locally that Postgres has not
+    accepted yet; they are replayed on the next write or revalidation.
+    """
+
+    version: int
+    state: Dict[str, Any]
+    source: str
+    marker: Any = None
+    checked_at: float = 0.0
+    unsynced_patch: Optional[Dict[str, Any]] = None
+
+
+_pipeline_control_state_lock = threading.RLock()
+_pipeline_control_state_record: Optional[PipelineControlStateRecord] = None
+
+
+def _pipeline_control_state_file_marker() -> Optional[int]:
+    try:
+        return PIPELINE_CONTROL_STATE_PATH.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _read_pipeline_control_state_row_from_store() -> Optional[Dict[str, Any]]:
+    client = create_local_pg_client()
+    response = (
+        client.table(PIPELINE_CONTROL_STATE_TABLE)
+        .select("state,version")
+        .eq("id", PIPELINE_CONTROL_STATE_ROW_ID)
+        .maybe_single()
+    )
+    row = response.data if hasattr(response, "data") else None
+    return row if isinstance(row, dict) else None
+
+
+def _read_pipeline_control_state_version_from_store() -> int:
+    client = create_local_pg_client()
+    response = (
+        client.table(PIPELINE_CONTROL_STATE_TABLE)
+        .select("version")
+        .eq("id", PIPELINE_CONTROL_STATE_ROW_ID)
+        .maybe_single()
+    )
+    row = response.data if hasattr(response, "data") else None
+    return int(row.get("version") or 0) if isinstance(row, dict) else 0
+
+
+def _load_pipeline_control_state_record(
+    previous: Optional[PipelineControlStateRecord],
+) -> PipelineControlStateRecord:
+    now = time.monotonic()
+    if should_use_local_pg():
+        try:
+            row = _read_pipeline_control_state_row_from_store()
+        except Exception as error:
+            logger.warning("Failed to read pipeline control state from Postgres: %s", error)
+            if previous is not None:
+                previous.checked_at = now
+                return previous
+            row = None
+        if row is not None and isinstance(row.get("state"), dict):
+            version = int(row.get("version") or 0)
+            state = _normalize_pipeline_control_state_payload(row["state"], source="store")
+            return PipelineControlStateRecord(version=version, state=state, source="store", marker=version, checked_at=now)
+        # No row yet: seed from the mirror file; version 0 makes the first CAS an insert.
+        file_payload = _read_pipeline_control_state_from_file()
+        state = (
+            _normalize_pipeline_control_state_payload(file_payload, source="file")
+            if file_payload is not None
+            else _default_pipeline_control_state()
+        )
+        return PipelineControlStateRecord(version=0, state=state, source="file", marker=0, checked_at=now)
+
+    marker = _pipeline_control_state_file_marker()
+    file_payload = _read_pipeline_control_state_from_file()
+    state = (
+        _normalize_pipeline_control_state_payload(file_payload, source="file")
+        if file_payload is not None
+        else _default_pipeline_control_state()
+    )
+    version = (previous.version if previous is not None else 0) + 1
+    return PipelineControlStateRecord(version=version, state=state, source="file", marker=marker, checked_at=now)
+
+
+def _current_pipeline_control_state_record(force: bool = False) -> PipelineControlStateRecord:
+    global _pipeline_control_state_record
+    with _pipeline_control_state_lock:
+        record = _pipeline_control_state_record
+        now = time.monotonic()
+        if record is not None and not force:
+            if now - record.checked_at < _pipeline_control_state_revalidate_seconds():
+                return record
+            if record.unsynced_patch is not None:
+                # Reloading now would drop the local update; push it instead.
+                _store_pipeline_control_state_patch(record, {})
+                return _pipeline_control_state_record
+            try:
+                if should_use_local_pg():
+                    marker: Any = _read_pipeline_control_state_version_from_store()
+                else:
+                    marker = _pipeline_control_state_file_marker()
+            except Exception as error:
+                logger.warning("Failed to probe pipeline control state version: %s", error)
+                marker = record.marker
+            if marker == record.marker:
+                record.checked_at = now
+                return record
+        record = _load_pipeline_control_state_record(record)
+        _pipeline_control_state_record = record
+        return record
+
+
+class _PipelineControlStateFileMirror:
+    """Latest-wins background writer that keeps the JSON file in step with the cache."""
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._pending: Optional[tuple[int, Dict[str, Any]]] = None
+        self._busy = False
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, version: int, state: Dict[str, Any]) -> None:
+        with self._condition:
+            self._pending = (version, deepcopy(state))
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="pipeline-control-state-mirror",
+                    daemon=True,
+                )
+                self._thread.start()
+            self._condition.notify_all()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        with self._condition:
+            return self._condition.wait_for(lambda: self._pending is None and not self._busy, timeout=timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending is None:
+                    self._condition.wait()
+                version, state = self._pending
+                self._pending = None
+                self._busy = True
+            try:
+                _write_pipeline_control_state_to_file(state)
+                _note_pipeline_control_state_mirrored(version)
+            except Exception as error:
+                logger.warning("Failed to persist pipeline control state file: %s", error)
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+
+
+_pipeline_control_state_mirror = _PipelineControlStateFileMirror()
+
+
+def _note_pipeline_control_state_mirrored(version: int) -> None:
+    # Our own mirror write must not look like an external edit to the file-mode probe.
+    with _pipeline_control_state_lock:
+        record = _pipeline_control_state_record
+        if record is not None and record.version == version and not should_use_local_pg():
+            record.marker = _pipeline_control_state_file_marker()
+
+
+def _commit_pipeline_control_state_record(
+    version: int,
+    state: Dict[str, Any],
+    *,
+    source: str,
+    marker: Any,
+    unsynced_patch: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    global _pipeline_control_state_record
+    _pipeline_control_state_record = PipelineControlStateRecord(
+        version=version,
+        state=state,
+        source=source,
+        marker=marker,
+        checked_at=time.monotonic(),
+        unsynced_patch=unsynced_patch,
+    )
+    _pipeline_control_state_mirror.submit(version, state)
+    return deepcopy(state)
+
+
+def _compare_and_swap_pipeline_control_state(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply ``payload`` as a patch on the latest version, retrying on version conflicts.
+
+    Postgres mode uses a conditional upsert keyed on the row version, so a
+    concurrent writer in another process (worker vs API) makes this attempt
+    fail and re-merge instead of silently overwriting its update. Without
+    Postgres the in-process lock is the only writer guard.
+    """
+    with _pipeline_control_state_lock:
+        record = _current_pipeline_control_state_record()
+        if not should_use_local_pg():
+            next_state = _merge_pipeline_control_state(record.state, payload)
+            return _commit_pipeline_control_state_record(
+                record.version + 1,
+                next_state,
+                source="file",
+                marker=record.marker,
+            )
+        return _store_pipeline_control_state_patch(record, payload)
+
+
+def _store_pipeline_control_state_patch(record: PipelineControlStateRecord, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Write ``payload`` plus any unsynced patch to Postgres on top of ``record``.
+
+    If Postgres cannot be reached the merged state is still served locally,
+    but the record is marked unsynced so it is not mistaken for the store's
+    copy at ``record.version``.
+    """
+    with _pipeline_control_state_lock:
+        payload = {**(record.unsynced_patch or {}), **payload}
+        for attempt in range(PIPELINE_CONTROL_STATE_CAS_ATTEMPTS):
+            next_state = _merge_pipeline_control_state(record.state, payload)
+            try:
+                response = create_local_pg_client().rpc(
+                    "compare_and_swap_pipeline_control_state",
+                    {
+                        "row_id": PIPELINE_CONTROL_STATE_ROW_ID,
+                        "expected_version": record.version,
+                        "state": next_state,
+                        "updated_at": next_state.get("updated_at"),
+                    },
+                ).execute()
+            except Exception as error:
+                logger.warning("Failed to persist pipeline control state to Postgres, serving it unsynced: %s", error)
+                return _commit_pipeline_control_state_record(
+                    record.version,
+                    next_state,
+                    source="store",
+                    marker=record.marker,
+                    unsynced_patch=payload,
+                )
+            rows = response.data if isinstance(getattr(response, "data", None), list) else []
+            if rows:
+                version = int(rows[0].get("version") or record.version + 1)
+                return _commit_pipeline_control_state_record(version, next_state, source="store", marker=version)
+            logger.info(
+                "Pipeline control state version conflict at v%s (attempt %s/%s); re-merging",
+                record.version,
+                attempt + 1,
+                PIPELINE_CONTROL_STATE_CAS_ATTEMPTS,
+            )
+            record = _current_pipeline_control_state_record(force=True)
+
+        logger.warning("Pipeline control state CAS kept conflicting; writing last-writer-wins")
+        next_state = _merge_pipeline_control_state(record.state, payload)
+        try:
+            _write_pipeline_control_state_to_store(next_state)
+        except Exception as error:
+            logger.warning("Failed to persist pipeline control state to Postgres, serving it unsynced: %s", error)
+            return _commit_pipeline_control_state_record(
+                record.version,
+                next_state,
+                source="store",
+                marker=None,
+                unsynced_patch=payload,
+            )
+        return _commit_pipeline_control_state_record(record.version, next_state, source="store", marker=None)
+
+
+def invalidate_pipeline_control_state_cache() -> None:
+    global _pipeline_control_state_record
+    with _pipeline_control_state_lock:
+        _pipeline_control_state_record = None
+
+
+def flush_pipeline_control_state_mirror(timeout: float = 5.0) -> bool:
+    return _pipeline_control_state_mirror.flush(timeout)
 
 
 def read_pipeline_control_state() -> Dict[str, Any]:
+    if _pipeline_control_state_cache_enabled():
+        return deepcopy(_current_pipeline_control_state_record().state)
     store_payload = _read_pipeline_control_state_from_store()
     file_payload = _read_pipeline_control_state_from_file()
     payload = _choose_newest_pipeline_control_state(store_payload, file_payload)
@@ -505,8 +815,7 @@ def read_pipeline_control_state() -> Dict[str, Any]:
     return _default_pipeline_control_state()
 
 
-def write_pipeline_control_state(payload: Dict[str, Any]) -> Dict[str, Any]:
-    current_state = read_pipeline_control_state()
+def _merge_pipeline_control_state(current_state: Dict[str, Any], payload: Dict[str, Any]) -> Dict[str, Any]:
     merged_payload = {**current_state, **payload}
     requested_state = str(merged_payload.get("requested_state") or "").strip().lower()
     if requested_state not in PIPELINE_CONTROL_REQUESTED_STATES:
@@ -579,6 +888,13 @@ def write_pipeline_control_state(payload: Dict[str, Any]) -> Dict[str, Any]:
         else None,
 
     }
+    return next_state
+
+
+def write_pipeline_control_state(payload: Dict[str, Any]) -> Dict[str, Any]:
+    if _pipeline_control_state_cache_enabled():
+        return _compare_and_swap_pipeline_control_state(payload)
+    next_state = _merge_pipeline_control_state(read_pipeline_control_state(), payload)
     try:
         _write_pipeline_control_state_to_store(next_state)
     except Exception as error:
@@ -3807,6 +4123,7 @@ class EntityPipelineWorker:
         )
         if not (batch_inserted and run_inserted):
             return None
+        self._announce_queued_batch(batch_id)
         return batch_id
 
     def _queue_manifest_auto_advance(
@@ -3935,6 +4252,7 @@ class EntityPipelineWorker:
         )
         if not (batch_inserted and run_inserted):
             return None
+        self._announce_queued_batch(next_batch_id)
 
         return {
             "batch_id": next_batch_id,
@@ -4109,6 +4427,7 @@ class EntityPipelineWorker:
         )
         if not (batch_inserted and run_inserted):
             return None
+        self._announce_queued_batch(continuation_batch_id)
 
         return {
             "batch_id": continuation_batch_id,
@@ -4583,6 +4902,8 @@ class EntityPipelineWorker:
             context=f"insert self-healing run {follow_on_batch_id}/{run['entity_id']}",
         )
         next_status = "queued" if batch_inserted and run_inserted else "planned"
+        if next_status == "queued":
+            self._announce_queued_batch(follow_on_batch_id)
         log_worker_transition(
             "follow_on_repair_queued",
             worker_id=getattr(self, "worker_id", "worker-test"),
@@ -5737,6 +6058,38 @@ class EntityPipelineWorker:
                     message="no resumable or manifest follow-on entity available",
                 )
 
+    def _get_wakeup(self) -> Optional[PipelineWakeup]:
+        if not pipeline_wakeup_enabled():
+            return None
+        wakeup = getattr(self, "_wakeup", None)
+        if wakeup is None:
+            wakeup = PipelineWakeup(
+                database_url=os.getenv("DATABASE_URL") if should_use_local_pg() else None,
+                watch_paths=(PIPELINE_WAKEUP_PATH,),
+                control_state_path=PIPELINE_CONTROL_STATE_PATH,
+            ).start()
+            self._wakeup = wakeup
+        return wakeup
+
+    def _idle_poll_seconds(self) -> int:
+        # With a wakeup channel the poll is only a safety net for missed notifications.
+        return pipeline_idle_poll_seconds() if self._get_wakeup() is not None else POLL_INTERVAL_SECONDS
+
+    def _wait_for_work(self, seconds: float) -> None:
+        wakeup = self._get_wakeup()
+        if wakeup is None:
+            time.sleep(seconds)
+            return
+        reason = wakeup.wait(seconds)
+        if reason:
+            logger.info("Worker woken for claim: %s", reason)
+
+    def _announce_queued_batch(self, batch_id: str) -> None:
+        if not pipeline_wakeup_enabled():
+            return
+        # Postgres triggers already notify other workers; the file stand-in covers local mode.
+        notify_pipeline_wakeup(f"batch_queued:{batch_id}", touch_file=not should_use_local_pg())
+
     def run_forever(self) -> None:
         claim_failure_streak = 0
         while True:
@@ -5775,9 +6128,9 @@ class EntityPipelineWorker:
                 time.sleep(POLL_INTERVAL_SECONDS)
                 continue
             if not batch:
-                idle_sleep_seconds = int(getattr(self, "_next_idle_sleep_seconds", POLL_INTERVAL_SECONDS) or POLL_INTERVAL_SECONDS)
-                self._next_idle_sleep_seconds = POLL_INTERVAL_SECONDS
-                time.sleep(max(1, idle_sleep_seconds))
+                idle_sleep_seconds = int(getattr(self, "_next_idle_sleep_seconds", None) or self._idle_poll_seconds())
+                self._next_idle_sleep_seconds = None
+                self._wait_for_work(max(1, idle_sleep_seconds))
                 continue
             logger.info("Worker claimed batch %s", batch.get("id"))
             try:
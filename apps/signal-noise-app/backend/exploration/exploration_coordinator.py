@@ -25,6 +25,7 @@ from backend.exploration.canonical_categories import (
 )
 from backend.exploration.exploration_log import ExplorationLogEntry, ExplorationReport
 from backend.exploration.evidence_store import EvidenceStore
+from backend.llm_scheduler import PRIORITY_BULK, llm_priority
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +52,7 @@ class ExplorationCoordinator:
 
         logger.info("🔍 ExplorationCoordinator initialized")
 
+    @llm_priority(PRIORITY_BULK, tenant="exploration")
     async def run_exploration_cycle(
         self,
         cluster_id: str,
@@ -21,12 +21,18 @@ Add to mcp-config.json:
 
 import os
 import sys
+import base64
+import hashlib
+import json
 import logging
 import re
+import threading
+import time
 import urllib.parse
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 # Load environment
 project_root = Path(__file__).parent.parent
@@ -108,9 +114,151 @@ def get_graph():
     global _db, _graph_name
     if _db is None:
         _db, _graph_name = get_falkordb_client()
+        ensure_search_indexes(_db.select_graph(_graph_name))
     return _db.select_graph(_graph_name)
 
 
+# =============================================================================
+# Search Indexes & Result Cache
+# =============================================================================
+
+# Labels with a full-text index, and the properties each one covers
+FULLTEXT_INDEXES = {
+    "RFP": ("name", "description", "organization"),
+    "Entity": ("name", "description", "organization"),
+}
+
+# Exact-match / range indexes used by search filters and ordering
+RANGE_INDEXES = [
+    ("RFP", "sport"),
+    ("RFP", "type"),
+    ("RFP", "organization"),
+    ("RFP", "yellowPantherPriority"),
+    ("Entity", "name"),
+]
+
+SEARCH_CACHE_SIZE = int(os.getenv("FALKORDB_MCP_SEARCH_CACHE_SIZE", "128"))
+# Writes made outside this server never invalidate the cache, so entries also expire
+SEARCH_CACHE_TTL_SECONDS = float(os.getenv("FALKORDB_MCP_SEARCH_CACHE_TTL_SECONDS", "300"))
+MAX_SEARCH_TERMS = 6
+# After a full-text failure, searches use the keyword scan for this long before retrying
+FULLTEXT_RETRY_SECONDS = float(os.getenv("FALKORDB_MCP_FULLTEXT_RETRY_SECONDS", "60"))
+
+_WRITE_CYPHER = re.compile(r"\b(CREATE|MERGE|SET|DELETE|REMOVE|DROP)\b", re.IGNORECASE)
+_search_cache: "OrderedDict[Tuple, Tuple[float, str]]" = OrderedDict()
+_search_cache_lock = threading.Lock()
+_fulltext_retry_at = 0.0
+
+
+def _mark_fulltext_failed(error: Exception) -> None:
+    """Fall back to keyword scans until FULLTEXT_RETRY_SECONDS have passed"""
+    global _fulltext_retry_at
+    logger.warning(f"Full-text search unavailable, retrying in {FULLTEXT_RETRY_SECONDS:.0f}s: {error}")
+    _fulltext_retry_at = time.monotonic() + FULLTEXT_RETRY_SECONDS
+
+
+def _fulltext_ready(g) -> bool:
+    """Whether to try full-text now; re-creates the indexes once a back-off expires"""
+    global _fulltext_retry_at
+    if not _fulltext_retry_at:
+        return True
+    if time.monotonic() < _fulltext_retry_at:
+        return False
+    _fulltext_retry_at = 0.0
+    ensure_search_indexes(g)
+    return not _fulltext_retry_at
+
+
+def ensure_search_indexes(g) -> None:
+    """Create full-text and range indexes (no-op for indexes that already exist)"""
+    for label, properties in FULLTEXT_INDEXES.items():
+        args = ", ".join(f"'{prop}'" for prop in properties)
+        try:
+            g.query(f"CALL db.idx.fulltext.createNodeIndex('{label}', {args})")
+        except Exception as e:
+            if "already" not in str(e).lower():
+                _mark_fulltext_failed(e)
+
+    for label, prop in RANGE_INDEXES:
+        try:
+            g.query(f"CREATE INDEX FOR (n:{label}) ON (n.{prop})")
+        except Exception as e:
+            if "already" not in str(e).lower():
+                logger.warning(f"Range index on {label}.{prop} unavailable: {e}")
+
+
+def fulltext_query(text: str) -> str:
+    """Turn free text into a RediSearch OR-of-prefixes query ('' if nothing searchable)"""
+    terms = []
+    for token in re.findall(r"\w+", (text or "").lower()):
+        if len(token) > 2 and token not in terms:
+            terms.append(token)
+    return " | ".join(f"{term}*" for term in terms[:MAX_SEARCH_TERMS])
+
+
+def encode_cursor(offset: int, fingerprint: str) -> str:
+    """Opaque pagination cursor bound to the search it came from"""
+    raw = json.dumps({"o": offset, "f": fingerprint}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], fingerprint: str) -> int:
+    """Offset encoded in cursor (0 when absent); rejects cursors from another search"""
+    if not cursor:
+        return 0
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        offset = int(data["o"])
+    except Exception:
+        raise ValueError("invalid cursor")
+    if data.get("f") != fingerprint or offset < 0:
+        raise ValueError("cursor does not belong to this search")
+    return offset
+
+
+def _search_fingerprint(*parts: Any) -> str:
+    """Digest of every search parameter (result-cache key and cursor binding)"""
+    return hashlib.sha256(
+        json.dumps(parts, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def cached_search(key: Tuple, compute) -> str:
+    """Serve a search result from the LRU cache, computing it on miss or expiry"""
+    with _search_cache_lock:
+        entry = _search_cache.get(key)
+        if entry is not None:
+            expires_at, cached = entry
+            if time.monotonic() < expires_at:
+                _search_cache.move_to_end(key)
+                return cached
+            del _search_cache[key]
+
+    result = compute()
+
+    # Errors are not cached so a transient failure does not stick
+    if not result.startswith("❌"):
+        with _search_cache_lock:
+            _search_cache[key] = (time.monotonic() + SEARCH_CACHE_TTL_SECONDS, result)
+            _search_cache.move_to_end(key)
+            while len(_search_cache) > SEARCH_CACHE_SIZE:
+                _search_cache.popitem(last=False)
+    return result
+
+
+def invalidate_search_cache() -> None:
+    """Drop all cached search results after a graph write"""
+    with _search_cache_lock:
+        _search_cache.clear()
+
+
+def _page_footer(has_more: bool, offset: int, limit: int, fingerprint: str) -> List[str]:
+    if not has_more:
+        return []
+    return [f"\n➡️ More results available. Next cursor: {encode_cursor(offset + limit, fingerprint)}"]
+
+
 # =============================================================================
 # MCP Tools
 # =============================================================================
@@ -194,83 +342,123 @@ def add_rfp_episode(
             }})
         """)
 
+        invalidate_search_cache()
         return f"✅ RFP episode '{name}' added for {organization}"
 
     except Exception as e:
         return f"❌ Error adding RFP episode: {e}"
 
 
+RFP_RETURN_COLUMNS = """
+    rfp.name as name,
+    rfp.description as description,
+    rfp.organization as organization,
+    rfp.sport as sport,
+    rfp.type as type,
+    rfp.value as value,
+    rfp.source as source,
+    rfp.priority as priority,
+    rfp.timeline as timeline
+"""
+
+
+def _rfp_filters(sport: Optional[str], category: Optional[str]) -> Tuple[List[str], Dict[str, Any]]:
+    conditions = []
+    params: Dict[str, Any] = {}
+    if sport:
+        conditions.append("rfp.sport = $sport")
+        params["sport"] = sport
+    if category:
+        conditions.append("rfp.type CONTAINS $category")
+        params["category"] = category
+    return conditions, params
+
+
+def _query_rfps(g, query: str, sport: Optional[str], category: Optional[str], skip: int, limit: int):
+    """Ranked RFP rows for one page (fetches limit + 1 to detect a next page)"""
+    conditions, params = _rfp_filters(sport, category)
+    params.update({"skip": skip, "limit": limit + 1})
+    ft = fulltext_query(query)
+
+    if ft and _fulltext_ready(g):
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        cypher = f"""
+            CALL db.idx.fulltext.queryNodes('RFP', $ft) YIELD node, score
+            WITH node AS rfp, score
+            {where}
+            RETURN {RFP_RETURN_COLUMNS}
+            ORDER BY score DESC, rfp.yellowPantherPriority DESC
+            SKIP $skip LIMIT $limit
+        """
+        try:
+            return g.query(cypher, {**params, "ft": ft}).result_set
+        except Exception as e:
+            _mark_fulltext_failed(e)
+
+    if ft:
+        # No full-text support right now: parameterized keyword scan
+        terms = [term.rstrip("*") for term in ft.split(" | ")]
+        keyword_conditions = []
+        for index, term in enumerate(terms):
+            params[f"kw{index}"] = term
+            keyword_conditions.extend(
+                f"toLower(rfp.{prop}) CONTAINS $kw{index}" for prop in FULLTEXT_INDEXES["RFP"]
+            )
+        conditions.append(f"({' OR '.join(keyword_conditions)})")
+
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    cypher = f"""
+        MATCH (rfp:RFP)
+        {where}
+        RETURN {RFP_RETURN_COLUMNS}
+        ORDER BY rfp.yellowPantherPriority DESC
+        SKIP $skip LIMIT $limit
+    """
+    return g.query(cypher, params).result_set
+
+
 @mcp.tool()
 def search_rfps(
     query: str,
     sport: Optional[str] = None,
     category: Optional[str] = None,
-    limit: int = 10
+    limit: int = 10,
+    cursor: Optional[str] = None
 ) -> str:
     """
-    Search for RFPs in the knowledge graph.
+    Search for RFPs in the knowledge graph, ranked by full-text relevance.
 
     Args:
         query: Search query (keywords, phrases)
         sport: Filter by sport (e.g., Tennis, Golf, Cricket)
         category: Filter by RFP type/category
-        limit: Maximum number of results (default: 10)
+        limit: Maximum number of results per page (default: 10)
+        cursor: Pagination cursor returned by a previous call
 
     Returns:
         List of matching RFPs with details
     """
     try:
-        g = get_graph()
-
-        # Build WHERE conditions for standalone RFP nodes
-        conditions = []
-
-        if sport:
-            esc_sport = sport.replace("'", "\\'")
-            conditions.append(f"rfp.sport = '{esc_sport}'")
-
-        if category:
-            esc_cat = category.replace("'", "\\'")
-            conditions.append(f"rfp.type CONTAINS '{esc_cat}'")
-
-        # Add keyword search from query - search in name, description, organization
-        if query and len(query) > 2:
-            keywords = query.lower().split()
-            keyword_conditions = []
-            for kw in keywords[:3] if len(query) > 2 else []:
-                if len(kw) > 2:
-                    keyword_conditions.append(f"toLower(rfp.name) CONTAINS '{kw}'")
-                    keyword_conditions.append(f"toLower(rfp.description) CONTAINS '{kw}'")
-                    keyword_conditions.append(f"toLower(rfp.organization) CONTAINS '{kw}'")
-            if keyword_conditions:
-                conditions.append(f"({' OR '.join(keyword_conditions[:5])})")
-
-        where_clause = " AND ".join(conditions) if conditions else "true"
-
-        cypher = f"""
-            MATCH (rfp:RFP)
-            WHERE {where_clause}
-            RETURN rfp.name as name,
-                   rfp.description as description,
-                   rfp.organization as organization,
-                   rfp.sport as sport,
-                   rfp.type as type,
-                   rfp.value as value,
-                   rfp.source as source,
-                   rfp.priority as priority,
-                   rfp.timeline as timeline
-            ORDER BY rfp.yellowPantherPriority DESC
-            LIMIT {limit}
-        """
+        limit = max(1, int(limit))
+        fingerprint = _search_fingerprint("rfps", fulltext_query(query), sport, category, limit)
+        skip = decode_cursor(cursor, fingerprint)
+    except ValueError as e:
+        return f"❌ Error searching RFPs: {e}"
 
-        result = g.query(cypher)
+    def compute() -> str:
+        try:
+            rows = _query_rfps(get_graph(), query, sport, category, skip, limit)
+        except Exception as e:
+            return f"❌ Error searching RFPs: {e}"
 
-        if not result.result_set:
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if not rows:
             return f"No RFPs found matching query: '{query}'"
 
-        output = [f"📊 Found {len(result.result_set)} RFP(s):\n"]
+        output = [f"📊 Found {len(rows)} RFP(s):\n"]
 
-        for row in result.result_set:
+        for row in rows:
             name = row[0] or "Unnamed RFP"
             description = row[1] or ""
             organization = row[2] or "Unknown"
@@ -294,10 +482,10 @@ def search_rfps(
             if priority and priority != "N/A":
                 output.append(f"   Priority: {priority}")
 
+        output.extend(_page_footer(has_more, skip, limit, fingerprint))
         return "\n".join(output)
 
-    except Exception as e:
-        return f"❌ Error searching RFPs: {e}"
+    return cached_search(("search_rfps", fingerprint, skip), compute)
 
 
 @mcp.tool()
@@ -395,6 +583,8 @@ def query_graph(
     try:
         g = get_graph()
         result = g.query(cypher)
+        if _WRITE_CYPHER.search(cypher):
+            invalidate_search_cache()
 
         if not result.result_set:
             return "Query returned no results."
@@ -469,6 +659,7 @@ def add_entity_relationship(
             MERGE (a)-[r:{esc(relationship_type).upper().replace(' ', '_')}]->(b)
         """)
 
+        invalidate_search_cache()
         return f"✅ Relationship added: {from_entity} -[{relationship_type}]-> {to_entity}"
 
     except Exception as e:
@@ -531,62 +722,129 @@ def get_graph_stats() -> str:
         return f"❌ Error getting stats: {e}"
 
 
+ENTITY_RETURN_COLUMNS = """
+    labels(n)[0] as type,
+    n.name as name,
+    n.description as description,
+    n.organization as organization,
+    n.sport as sport,
+    n.type as rfp_type,
+    n.yellowPantherPriority as yp_priority
+"""
+
+
+def _keyword_entity_rows(g, ft: str, pattern: str, extra_condition: str, fetch: int) -> List[list]:
+    """Parameterized CONTAINS scan over name/organization/description"""
+    params: Dict[str, Any] = {"limit": fetch, "indexed_labels": list(FULLTEXT_INDEXES)}
+    keyword_conditions = []
+    terms = [term.rstrip("*") for term in ft.split(" | ")] if ft else []
+    for index, term in enumerate(terms):
+        params[f"kw{index}"] = term
+        keyword_conditions.extend(
+            f"toLower(n.{prop}) CONTAINS $kw{index}" for prop in ("name", "organization", "description")
+        )
+    conditions = [f"({' OR '.join(keyword_conditions)})"] if keyword_conditions else []
+    if extra_condition:
+        conditions.append(extra_condition)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    cypher = f"""
+        MATCH {pattern}
+        {where}
+        RETURN {ENTITY_RETURN_COLUMNS}, null as score
+        ORDER BY yp_priority DESC
+        LIMIT $limit
+    """
+    return g.query(cypher, params).result_set
+
+
+def _query_entities(g, query: str, entity_type: Optional[str], fetch: int) -> List[list]:
+    """
+    Top `fetch` entity rows ranked by relevance
+
+    Indexed labels are searched through their full-text index; every other
+    label (SportsClub, Person, ...) gets a keyword scan. Full-text hits rank
+    ahead of keyword-only hits.
+    """
+    ft = fulltext_query(query)
+    if entity_type and not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", entity_type):
+        raise ValueError(f"invalid entity type: {entity_type}")
+
+    indexed_labels = [label for label in FULLTEXT_INDEXES if not entity_type or label == entity_type]
+    use_fulltext = bool(ft and indexed_labels and _fulltext_ready(g))
+
+    scored = []
+    if use_fulltext:
+        try:
+            for label in indexed_labels:
+                cypher = f"""
+                    CALL db.idx.fulltext.queryNodes('{label}', $ft) YIELD node, score
+                    WITH node AS n, score
+                    RETURN {ENTITY_RETURN_COLUMNS}, score
+                    ORDER BY score DESC, yp_priority DESC
+                    LIMIT $limit
+                """
+                scored.extend(g.query(cypher, {"ft": ft, "limit": fetch}).result_set)
+        except Exception as e:
+            _mark_fulltext_failed(e)
+            scored, use_fulltext = [], False
+    scored.sort(key=lambda row: (row[7] or 0, row[6] or 0), reverse=True)
+
+    if use_fulltext and entity_type:
+        return scored[:fetch]
+
+    # Labels without a full-text index (or every label when it is unavailable)
+    if entity_type:
+        pattern, extra_condition = f"(n:{entity_type})", ""
+    elif use_fulltext:
+        pattern, extra_condition = "(n)", "none(label IN labels(n) WHERE label IN $indexed_labels)"
+    else:
+        pattern, extra_condition = "(n)", ""
+    keyword_rows = _keyword_entity_rows(g, ft, pattern, extra_condition, fetch)
+
+    return (scored + keyword_rows)[:fetch]
+
+
 @mcp.tool()
 def search_entities(
     query: str,
     entity_type: Optional[str] = None,
-    limit: int = 10
+    limit: int = 10,
+    cursor: Optional[str] = None
 ) -> str:
     """
-    Search for entities in the knowledge graph using keyword matching.
+    Search for entities in the knowledge graph, ranked by full-text relevance.
 
     Args:
         query: Search query for entity names
         entity_type: Optional filter by entity type (RFP, Entity, SportsClub, Person, etc.)
-        limit: Maximum results to return
+        limit: Maximum results per page
+        cursor: Pagination cursor returned by a previous call
 
     Returns:
         List of matching entities with details
     """
     try:
-        g = get_graph()
-
-        # Build keyword search - search in name, organization, description
-        keywords = query.lower().split()
-        keyword_clauses = []
-        for kw in keywords[:4] if len(query) > 2 else []:
-            if len(kw) > 2:
-                keyword_clauses.append(f"toLower(n.name) CONTAINS '{kw}'")
-                keyword_clauses.append(f"toLower(n.organization) CONTAINS '{kw}'")
-                keyword_clauses.append(f"toLower(n.description) CONTAINS '{kw}'")
-
-        if not keyword_clauses:
-            keyword_clauses = ["true"]
-
-        keyword_filter = " OR ".join(keyword_clauses[:6])
-        type_filter = f"AND n:{entity_type}" if entity_type else ""
-
-        cypher = f"""
-            MATCH (n)
-            WHERE {keyword_filter} {type_filter}
-            RETURN labels(n)[0] as type,
-                   n.name as name,
-                   n.description as description,
-                   n.organization as organization,
-                   n.sport as sport,
-                   n.type as rfp_type
-            ORDER BY n.yellowPantherPriority DESC
-            LIMIT {limit}
-        """
+        limit = max(1, int(limit))
+        fingerprint = _search_fingerprint("entities", fulltext_query(query), entity_type, limit)
+        skip = decode_cursor(cursor, fingerprint)
+    except ValueError as e:
+        return f"❌ Error searching entities: {e}"
 
-        result = g.query(cypher)
+    def compute() -> str:
+        try:
+            # Results merge across labels, so page over the merged top-N
+            rows = _query_entities(get_graph(), query, entity_type, skip + limit + 1)
+        except Exception as e:
+            return f"❌ Error searching entities: {e}"
 
-        if not result.result_set:
+        has_more = len(rows) > skip + limit
+        rows = rows[skip:skip + limit]
+        if not rows:
             return f"No entities found matching: '{query}'"
 
-        output = [f"🔍 Found {len(result.result_set)} entity(ies):\n"]
+        output = [f"🔍 Found {len(rows)} entity(ies):\n"]
 
-        for row in result.result_set:
+        for row in rows:
             ent_type = row[0] or "Unknown"
             name = row[1] or "Unnamed"
             description = row[2] or ""
@@ -606,10 +864,10 @@ def search_entities(
                 preview = description[:80] + "..." if len(description) > 80 else description
                 output.append(f"   {preview}")
 
+        output.extend(_page_footer(has_more, skip, limit, fingerprint))
         return "\n".join(output)
 
-    except Exception as e:
-        return f"❌ Error searching entities: {e}"
+    return cached_search(("search_entities", fingerprint, skip), compute)
 
 
 # =============================================================================
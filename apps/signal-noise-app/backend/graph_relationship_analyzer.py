@@ -20,13 +20,59 @@ Usage:
     )
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+NETWORK_CONTEXT_CACHE_MAX_ENTRIES = int(os.getenv("GRAPH_ANALYZER_CACHE_MAX_ENTRIES", "512"))
+NETWORK_CONTEXT_CACHE_TTL_SECONDS = float(os.getenv("GRAPH_ANALYZER_CACHE_TTL_SECONDS", "900"))
+NETWORK_CONTEXT_BATCH_SIZE = int(os.getenv("GRAPH_ANALYZER_BATCH_SIZE", "50"))
+NETWORK_NEIGHBOUR_LIMIT = 20
+TECHNOLOGY_STACK_LIMIT = 50
+
+# One round trip per cohort: name, partners and competitors (each with their
+# technology stack) and the entity's own stack. The entity itself is matched
+# by id without a label, like the per-entity lookups, since not every node
+# carrying an id is labelled Entity.
+NETWORK_CONTEXT_BATCH_QUERY = """
+    UNWIND $entity_ids AS entity_id
+    MATCH (e {id: entity_id})
+    OPTIONAL MATCH (e)-[:PARTNER_OF]-(partner:Entity)
+    OPTIONAL MATCH (partner)-[:USES]->(partner_tech:Technology)
+    WITH e, partner,
+         collect(DISTINCT {name: partner_tech.name, category: partner_tech.category})[..$tech_limit] AS partner_stack
+    WITH e, collect({id: partner.id, name: partner.name, type: partner.type, technology_stack: partner_stack})[..$limit] AS partners
+    OPTIONAL MATCH (e)-[:COMPETES_WITH]-(competitor:Entity)
+    OPTIONAL MATCH (competitor)-[:USES]->(competitor_tech:Technology)
+    WITH e, partners, competitor,
+         collect(DISTINCT {name: competitor_tech.name, category: competitor_tech.category})[..$tech_limit] AS competitor_stack
+    WITH e, partners,
+         collect({id: competitor.id, name: competitor.name, type: competitor.type, technology_stack: competitor_stack})[..$limit] AS competitors
+    OPTIONAL MATCH (e)-[:USES]->(tech:Technology)
+    RETURN e.id AS entity_id,
+           e.name AS name,
+           partners,
+           competitors,
+           collect(DISTINCT {name: tech.name, category: tech.category})[..$tech_limit] AS technology_stack
+"""
+
+TECHNOLOGY_STACK_BATCH_QUERY = """
+    UNWIND $entity_ids AS entity_id
+    MATCH (e {id: entity_id})
+    OPTIONAL MATCH (e)-[:USES]->(tech:Technology)
+    RETURN e.id AS entity_id,
+           collect(DISTINCT {name: tech.name, category: tech.category})[..$tech_limit] AS technology_stack
+"""
+
 
 @dataclass
 class TechnologyStack:
@@ -120,6 +166,81 @@ class NetworkHypothesis:
     technology: Optional[str] = None
 
 
+class NetworkContextCache:
+    """
+    Size- and TTL-bounded LRU cache of NetworkContext by entity id.
+
+    Invalidating an entity also drops any cached neighbour whose context
+    references it, since relationship edges are shared by both endpoints.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = NETWORK_CONTEXT_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = NETWORK_CONTEXT_CACHE_TTL_SECONDS,
+    ):
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = float(ttl_seconds)
+        self._entries: "OrderedDict[str, Tuple[NetworkContext, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, entity_id: str) -> Optional[NetworkContext]:
+        entry = self._entries.get(entity_id)
+        if entry is None:
+            self.misses += 1
+            return None
+        context, stored_at = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[entity_id]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(entity_id)
+        self.hits += 1
+        return context
+
+    def set(self, entity_id: str, context: NetworkContext) -> None:
+        self._entries[entity_id] = (context, time.monotonic())
+        self._entries.move_to_end(entity_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, entity_id: str) -> int:
+        """Drop an entity and every cached context that links to it."""
+        stale = [entity_id] if entity_id in self._entries else []
+        for cached_id, (context, _) in self._entries.items():
+            if cached_id == entity_id:
+                continue
+            if any(neighbour.get('id') == entity_id for neighbour in context.partners + context.competitors):
+                stale.append(cached_id)
+        for cached_id in stale:
+            del self._entries[cached_id]
+        return len(stale)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __contains__(self, entity_id: str) -> bool:
+        return self.get(entity_id) is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl_seconds,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+
 class GraphRelationshipAnalyzer:
     """
     Analyzes FalkorDB graph relationships for hypothesis generation
@@ -135,21 +256,28 @@ class GraphRelationshipAnalyzer:
     def __init__(self):
         """Initialize analyzer"""
         self._falkordb_client = None
-        self._cache: Dict[str, NetworkContext] = {}
+        self._client_init_lock = asyncio.Lock()
+        self._cache = NetworkContextCache()
 
         logger.info("🕸️ GraphRelationshipAnalyzer initialized")
 
     async def _get_client(self):
         """Get or create FalkorDB client"""
-        if self._falkordb_client is None:
-            try:
-                from falkordb_client import FalkorDBClient
-                self._falkordb_client = FalkorDBClient()
-                await self._falkordb_client.initialize()
-                logger.info("✅ FalkorDB client initialized")
-            except Exception as e:
-                logger.error(f"❌ Failed to initialize FalkorDB client: {e}")
-                raise
+        if self._falkordb_client is not None:
+            return self._falkordb_client
+
+        async with self._client_init_lock:
+            if self._falkordb_client is None:
+                try:
+                    from falkordb_client import FalkorDBClient
+                    client = FalkorDBClient()
+                    await client.initialize()
+                    self._falkordb_client = client
+                    logger.info("✅ FalkorDB client initialized")
+                except Exception as e:
+                    logger.error(f"❌ Failed to initialize FalkorDB client: {e}")
+                    raise
+
         return self._falkordb_client
 
     async def analyze_network_context(
@@ -175,186 +303,192 @@ class GraphRelationshipAnalyzer:
             NetworkContext with all network intelligence
         """
         logger.info(f"🕸️ Analyzing network context for {entity_id}")
+        contexts = await self.analyze_network_contexts([entity_id], force_refresh)
+        return contexts[entity_id]
 
-        # Check cache
-        if not force_refresh and entity_id in self._cache:
-            logger.info(f"  ✅ Using cached network context")
-            return self._cache[entity_id]
-
-        client = await self._get_client()
-
-        # Get entity name
-        entity_name = await self._get_entity_name(entity_id, client)
-
-        # Analyze partners
-        partners = await self._get_partners(entity_id, client)
-        logger.info(f"  ✓ Found {len(partners)} partners")
-
-        # Analyze competitors
-        competitors = await self._get_competitors(entity_id, client)
-        logger.info(f"  ✓ Found {len(competitors)} competitors")
-
-        # Get technology stack
-        tech_stack = await self._get_technology_stack(entity_id, client)
-        logger.info(f"  ✓ Technology stack: {len(tech_stack.to_dict())} categories")
-
-        # Generate network hypotheses
-        network_hypotheses = await self._generate_network_hypotheses(
-            entity_id,
-            entity_name,
-            partners,
-            competitors,
-            tech_stack
-        )
-        logger.info(f"  ✓ Generated {len(network_hypotheses)} network hypotheses")
-
-        # Analyze technology diffusion
-        diffusion = await self._analyze_technology_diffusion(
-            partners,
-            tech_stack
-        )
-
-        # Create network context
-        context = NetworkContext(
-            entity_id=entity_id,
-            entity_name=entity_name,
-            partners=partners,
-            partner_count=len(partners),
-            competitors=competitors,
-            competitor_count=len(competitors),
-            technology_stack=tech_stack,
-            network_hypotheses=network_hypotheses,
-            technology_diffusion=diffusion
-        )
-
-        # Cache and return
-        self._cache[entity_id] = context
-        return context
-
-    async def _get_entity_name(
+    async def analyze_network_contexts(
         self,
-        entity_id: str,
-        client
-    ) -> str:
-        """Get entity name from database"""
-        try:
-            query = """
-                MATCH (e {id: $entity_id})
-                RETURN e.name as name
-                LIMIT 1
-            """
-
-            results = await client.execute_query(query, {'entity_id': entity_id})
-
-            if results and len(results) > 0:
-                return results[0].get('name', entity_id)
-
-            return entity_id
+        entity_ids: Iterable[str],
+        force_refresh: bool = False
+    ) -> Dict[str, NetworkContext]:
+        """
+        Analyze network context for a cohort of entities
 
-        except Exception as e:
-            logger.warning(f"⚠️ Could not get entity name: {e}")
-            return entity_id
+        Cached contexts are served directly; the remainder is loaded in
+        chunks of NETWORK_CONTEXT_BATCH_SIZE, one query per chunk, with the
+        chunks running concurrently.
 
-    async def _get_partners(
-        self,
-        entity_id: str,
-        client
-    ) -> List[Dict[str, Any]]:
-        """Get partner entities with their technology stacks"""
-        try:
-            query = """
-                MATCH (e {id: $entity_id})-[:PARTNER_OF]-(partner:Entity)
-                RETURN partner.id as id,
-                       partner.name as name,
-                       partner.type as type
-                LIMIT 20
-            """
+        Args:
+            entity_ids: Entity identifiers
+            force_refresh: Force refresh from DB (skip cache)
 
-            results = await client.execute_query(query, {'entity_id': entity_id})
+        Returns:
+            NetworkContext per requested entity id
+        """
+        requested = list(dict.fromkeys(entity_ids))
+        contexts: Dict[str, NetworkContext] = {}
+        missing: List[str] = []
+        for entity_id in requested:
+            cached = None if force_refresh else self._cache.get(entity_id)
+            if cached is not None:
+                contexts[entity_id] = cached
+            else:
+                missing.append(entity_id)
+
+        if missing:
+            client = await self._get_client()
+            loaded = await asyncio.gather(*(
+                self._load_network_context_chunk(chunk, client)
+                for chunk in self._chunks(missing)
+            ))
+            for chunk_contexts in loaded:
+                contexts.update(chunk_contexts)
+
+        return {entity_id: contexts[entity_id] for entity_id in requested}
+
+    def invalidate_network_context(self, entity_id: str) -> None:
+        """Forget cached network context after an entity's relationships change"""
+        dropped = self._cache.invalidate(entity_id)
+        if dropped:
+            logger.debug(f"🕸️ Invalidated {dropped} cached network context(s) for {entity_id}")
+
+    async def get_technology_stacks(self, entity_ids: Iterable[str]) -> Dict[str, TechnologyStack]:
+        """
+        Get technology stacks for many entities with one query per chunk
 
-            partners = []
-            for result in results:
-                # Get technology stack for each partner
-                tech_stack = await self._get_technology_stack(result['id'], client)
-
-                partners.append({
-                    'id': result['id'],
-                    'name': result['name'],
-                    'type': result.get('type', 'ORG'),
-                    'technology_stack': tech_stack
-                })
+        Args:
+            entity_ids: Entity identifiers
 
-            return partners
+        Returns:
+            TechnologyStack per requested entity id (empty if unknown)
+        """
+        requested = list(dict.fromkeys(entity_ids))
+        if not requested:
+            return {}
 
-        except Exception as e:
-            logger.warning(f"⚠️ Could not get partners: {e}")
-            return []
+        client = await self._get_client()
+        loaded = await asyncio.gather(*(
+            self._load_technology_stack_chunk(chunk, client)
+            for chunk in self._chunks(requested)
+        ))
+        stacks: Dict[str, TechnologyStack] = {}
+        for chunk_stacks in loaded:
+            stacks.update(chunk_stacks)
+        return stacks
+
+    @staticmethod
+    def _chunks(entity_ids: List[str]) -> List[List[str]]:
+        size = max(1, NETWORK_CONTEXT_BATCH_SIZE)
+        return [entity_ids[start:start + size] for start in range(0, len(entity_ids), size)]
+
+    @staticmethod
+    def _technology_stack_from_rows(rows: Optional[List[Dict[str, Any]]]) -> TechnologyStack:
+        """Build a TechnologyStack from collected {name, category} maps"""
+        tech_stack = TechnologyStack()
+        for tech in rows or []:
+            if tech and tech.get('name'):
+                tech_stack.add_tech(tech.get('category') or 'infrastructure', tech['name'])
+        return tech_stack
 
-    async def _get_competitors(
+    def _neighbours_from_rows(self, rows: Optional[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        # OPTIONAL MATCH with no neighbours still collects one all-null map
+        return [
+            {
+                'id': neighbour['id'],
+                'name': neighbour.get('name'),
+                'type': neighbour.get('type') or 'ORG',
+                'technology_stack': self._technology_stack_from_rows(neighbour.get('technology_stack')),
+            }
+            for neighbour in rows or []
+            if neighbour and neighbour.get('id')
+        ]
+
+    async def _load_network_context_chunk(
         self,
-        entity_id: str,
+        entity_ids: List[str],
         client
-    ) -> List[Dict[str, Any]]:
-        """Get competitor entities with their capabilities"""
+    ) -> Dict[str, NetworkContext]:
+        """Load, analyze and cache network context for one chunk of entities in a single query"""
         try:
-            query = """
-                MATCH (e {id: $entity_id})-[:COMPETES_WITH]-(competitor:Entity)
-                RETURN competitor.id as id,
-                       competitor.name as name,
-                       competitor.type as type
-                LIMIT 20
-            """
-
-            results = await client.execute_query(query, {'entity_id': entity_id})
-
-            competitors = []
-            for result in results:
-                # Get technology stack for each competitor
-                tech_stack = await self._get_technology_stack(result['id'], client)
-
-                competitors.append({
-                    'id': result['id'],
-                    'name': result['name'],
-                    'type': result.get('type', 'ORG'),
-                    'technology_stack': tech_stack
-                })
-
-            return competitors
-
+            rows = await client.execute_query(
+                NETWORK_CONTEXT_BATCH_QUERY,
+                {
+                    'entity_ids': entity_ids,
+                    'limit': NETWORK_NEIGHBOUR_LIMIT,
+                    'tech_limit': TECHNOLOGY_STACK_LIMIT,
+                },
+            )
+            cacheable = True
         except Exception as e:
-            logger.warning(f"⚠️ Could not get competitors: {e}")
-            return []
+            # Not cached: a transient outage should not pin empty context for the TTL
+            logger.warning(f"⚠️ Could not load network context: {e}")
+            rows = []
+            cacheable = False
 
-    async def _get_technology_stack(
+        rows_by_entity = {row.get('entity_id'): row for row in rows or [] if row}
+        contexts: Dict[str, NetworkContext] = {}
+
+        for entity_id in entity_ids:
+            row = rows_by_entity.get(entity_id) or {}
+            entity_name = row.get('name') or entity_id
+            partners = self._neighbours_from_rows(row.get('partners'))
+            competitors = self._neighbours_from_rows(row.get('competitors'))
+            tech_stack = self._technology_stack_from_rows(row.get('technology_stack'))
+
+            network_hypotheses = await self._generate_network_hypotheses(
+                entity_id,
+                entity_name,
+                partners,
+                competitors,
+                tech_stack
+            )
+            diffusion = await self._analyze_technology_diffusion(
+                partners,
+                tech_stack
+            )
+
+            context = NetworkContext(
+                entity_id=entity_id,
+                entity_name=entity_name,
+                partners=partners,
+                partner_count=len(partners),
+                competitors=competitors,
+                competitor_count=len(competitors),
+                technology_stack=tech_stack,
+                network_hypotheses=network_hypotheses,
+                technology_diffusion=diffusion
+            )
+            contexts[entity_id] = context
+            if cacheable:
+                self._cache.set(entity_id, context)
+
+            logger.info(f"  ✓ {entity_id}: {len(partners)} partners, {len(competitors)} competitors, "
+                       f"{len(network_hypotheses)} network hypotheses")
+
+        return contexts
+
+    async def _load_technology_stack_chunk(
         self,
-        entity_id: str,
+        entity_ids: List[str],
         client
-    ) -> TechnologyStack:
-        """Get entity's technology stack from relationships"""
-        tech_stack = TechnologyStack()
-
+    ) -> Dict[str, TechnologyStack]:
+        """Load technology stacks for one chunk of entities in a single query"""
         try:
-            # Query for TECHNOLOGY_USES relationships
-            query = """
-                MATCH (e {id: $entity_id})-[:USES]->(tech:Technology)
-                RETURN tech.name as technology,
-                       tech.category as category
-                LIMIT 50
-            """
-
-            results = await client.execute_query(query, {'entity_id': entity_id})
-
-            for result in results:
-                tech = result.get('technology', '')
-                category = result.get('category', 'infrastructure')
-
-                if tech:
-                    tech_stack.add_tech(category, tech)
-
+            rows = await client.execute_query(
+                TECHNOLOGY_STACK_BATCH_QUERY,
+                {'entity_ids': entity_ids, 'tech_limit': TECHNOLOGY_STACK_LIMIT},
+            )
         except Exception as e:
-            logger.warning(f"⚠️ Could not get technology stack: {e}")
+            logger.warning(f"⚠️ Could not get technology stacks: {e}")
+            rows = []
 
-        return tech_stack
+        rows_by_entity = {row.get('entity_id'): row for row in rows or [] if row}
+        return {
+            entity_id: self._technology_stack_from_rows(
+                (rows_by_entity.get(entity_id) or {}).get('technology_stack')
+            )
+            for entity_id in entity_ids
+        }
 
     async def _generate_network_hypotheses(
         self,
@@ -644,6 +778,9 @@ class GraphRelationshipAnalyzer:
 
             priorities = []
 
+            # Tech stacks for every connected entity in one batched lookup
+            tech_stacks = await self.get_technology_stacks(result['id'] for result in results)
+
             for result in results:
                 connected_id = result['id']
                 connection_count = result['connection_count']
@@ -656,15 +793,11 @@ class GraphRelationshipAnalyzer:
                 if result.get('type') == 'ORG' and 'fc' in connected_id.lower():
                     score += 0.3
 
-                # Get tech stack for connected entity
-                try:
-                    tech_stack = await self._get_technology_stack(connected_id, client)
-                    tech_diversity = sum(len(techs) for techs in tech_stack.to_dict().values())
+                tech_stack = tech_stacks.get(connected_id, TechnologyStack())
+                tech_diversity = sum(len(techs) for techs in tech_stack.to_dict().values())
 
-                    # Boost for tech diversity (more signals)
-                    score += tech_diversity * 0.05
-                except:
-                    tech_diversity = 0
+                # Boost for tech diversity (more signals)
+                score += tech_diversity * 0.05
 
                 # Normalize to 0-1
                 priority_score = min(1.0, score / 5.0)
@@ -675,7 +808,7 @@ class GraphRelationshipAnalyzer:
                     'connection_count': connection_count,
                     'tech_diversity': tech_diversity,
                     'priority_score': priority_score,
-                    'reason': f"{connection_count} connections, {tech_diversify} tech categories"
+                    'reason': f"{connection_count} connections, {tech_diversity} tech categories"
                 })
 
             # Sort by priority
@@ -708,50 +841,84 @@ class GraphRelationshipAnalyzer:
         """
         logger.info(f"🕸️ Detecting technology clusters across {len(entity_ids)} entities")
 
-        # Get technology stacks for all entities
-        tech_stacks = {}
-        client = await self._get_client()
-
-        for entity_id in entity_ids:
-            try:
-                tech_stack = await self._get_technology_stack(entity_id, client)
-                tech_stacks[entity_id] = tech_stack
-            except Exception as e:
-                logger.warning(f"⚠️ Could not get tech stack for {entity_id}: {e}")
-
-        # Cluster by technology similarity
-        clusters = {}
+        # Get technology stacks for all entities in batched queries
+        tech_stacks = await self.get_technology_stacks(entity_ids)
         entity_list = list(tech_stacks.keys())
 
-        for entity_id in entity_list:
-            tech_stack = tech_stacks[entity_id]
-            best_cluster = None
-            best_similarity = 0.0
-
-            # Check against existing clusters
-            for cluster_id, cluster_entities in clusters.items():
-                # Calculate similarity to cluster (using first entity in cluster)
-                sample_entity_id = cluster_entities[0]
-                sample_tech = tech_stacks[sample_entity_id]
+        # Greedy clustering: each entity joins the most similar existing
+        # cluster (compared against the cluster's first entity) or seeds a
+        # new one. Similarities come precomputed from one sparse pass.
+        similarity = self._tech_similarity_matrix([tech_stacks[entity_id] for entity_id in entity_list])
+        seeds: List[int] = []
+        clusters: Dict[str, List[str]] = {}
 
-                similarity = self._calculate_tech_similarity(tech_stack, sample_tech)
-
-                if similarity > best_similarity:
-                    best_similarity = similarity
-                    best_cluster = cluster_id
+        for index, entity_id in enumerate(entity_list):
+            best_similarity = 0.0
+            if seeds:
+                seed_similarity = similarity[index, seeds]
+                best_seed = int(np.argmax(seed_similarity))
+                best_similarity = float(seed_similarity[best_seed])
 
-            # If found similar cluster, add to it
-            if best_cluster and best_similarity >= cluster_threshold:
-                clusters[best_cluster].append(entity_id)
+            if best_similarity > 0.0 and best_similarity >= cluster_threshold:
+                clusters[f"cluster_{best_seed}"].append(entity_id)
             else:
-                # Create new cluster
-                cluster_id = f"cluster_{len(clusters)}"
-                clusters[cluster_id] = [entity_id]
+                clusters[f"cluster_{len(seeds)}"] = [entity_id]
+                seeds.append(index)
 
         logger.info(f"  ✓ Detected {len(clusters)} technology clusters")
 
         return clusters
 
+    @staticmethod
+    def _technology_tokens(tech_stack: TechnologyStack) -> Set[str]:
+        """Flatten a stack to lowercase "category:tech" tokens"""
+        return {
+            f"{category}:{tech}".lower()
+            for category, techs in tech_stack.to_dict().items()
+            for tech in techs
+        }
+
+    def _tech_similarity_matrix(self, tech_stacks: List[TechnologyStack]) -> np.ndarray:
+        """
+        Pairwise Jaccard similarity for a list of technology stacks
+
+        Each stack is a sparse binary row over the shared "category:tech"
+        vocabulary. Intersection counts are accumulated from each
+        technology's posting list, so the cost follows technology
+        co-occurrence rather than entities² x vocabulary. Matches
+        _calculate_tech_similarity pair for pair.
+
+        Args:
+            tech_stacks: Technology stacks, one per row/column
+
+        Returns:
+            (n, n) similarity matrix (0.0-1.0)
+        """
+        count = len(tech_stacks)
+        vocabulary: Dict[str, int] = {}
+        rows: List[int] = []
+        columns: List[int] = []
+        for row, tech_stack in enumerate(tech_stacks):
+            for token in self._technology_tokens(tech_stack):
+                rows.append(row)
+                columns.append(vocabulary.setdefault(token, len(vocabulary)))
+
+        row_index = np.asarray(rows, dtype=np.intp)
+        column_index = np.asarray(columns, dtype=np.intp)
+        sizes = np.bincount(row_index, minlength=count)
+        intersections = np.zeros((count, count), dtype=np.int64)
+
+        if rows:
+            order = np.argsort(column_index, kind='stable')
+            row_index = row_index[order]
+            boundaries = np.flatnonzero(np.diff(column_index[order])) + 1
+            for postings in np.split(row_index, boundaries):
+                intersections[np.ix_(postings, postings)] += 1
+
+        unions = sizes[:, None] + sizes[None, :] - intersections
+        # Two empty stacks are identical, as in _calculate_tech_similarity
+        return np.where(unions > 0, intersections / np.maximum(unions, 1), 1.0)
+
     def _calculate_tech_similarity(
         self,
         tech_stack1: TechnologyStack,
@@ -226,6 +226,33 @@ class GraphitiAppConfig(BaseModel):
             self.episode_id_prefix = ''
 
 
+class QueueConfig(BaseModel):
+    """Episode queue configuration."""
+
+    max_size: int = Field(
+        default=1000, description='Maximum queued plus in-flight episodes per group_id'
+    )
+    workers_per_group: int = Field(
+        default=1,
+        description='Concurrent workers per group_id (1 preserves strict per-group ordering)',
+    )
+    enqueue_timeout: float = Field(
+        default=5.0, description='Seconds add_memory waits for queue space before rejecting'
+    )
+    persistence_path: str | None = Field(
+        default=None, description='SQLite file for durable queueing (unset keeps queue in memory)'
+    )
+    max_attempts: int = Field(
+        default=3, description='Attempts per episode before it is kept as failed'
+    )
+    retry_backoff: float = Field(
+        default=1.0, description='Seconds before retrying a failed episode, doubled per attempt'
+    )
+    max_retry_backoff: float = Field(
+        default=30.0, description='Upper bound in seconds on the delay between attempts'
+    )
+
+
 class GraphitiConfig(BaseSettings):
     """Graphiti configuration with YAML and environment support."""
 
@@ -234,6 +261,7 @@ class GraphitiConfig(BaseSettings):
     embedder: EmbedderConfig = Field(default_factory=EmbedderConfig)
     database: DatabaseConfig = Field(default_factory=DatabaseConfig)
     graphiti: GraphitiAppConfig = Field(default_factory=GraphitiAppConfig)
+    queue: QueueConfig = Field(default_factory=QueueConfig)
 
     # Additional server options
     destroy_graph: bool = Field(default=False, description='Clear graph on startup')
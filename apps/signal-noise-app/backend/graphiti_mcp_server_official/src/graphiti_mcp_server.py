@@ -32,7 +32,7 @@ from models.response_types import (
     SuccessResponse,
 )
 from services.factories import DatabaseDriverFactory, EmbedderFactory, LLMClientFactory
-from services.queue_service import QueueService
+from services.queue_service import QueueFullError, QueueService
 from utils.formatting import format_fact_result
 
 # Load .env file from mcp_server directory
@@ -399,6 +399,9 @@ async def add_memory(
         return SuccessResponse(
             message=f"Episode '{name}' queued for processing in group '{effective_group_id}'"
         )
+    except QueueFullError as e:
+        logger.warning(f'Episode queue full: {str(e)}')
+        return ErrorResponse(error=f'Queue full, retry later: {str(e)}')
     except Exception as e:
         error_msg = str(e)
         logger.error(f'Error queuing episode: {error_msg}')
@@ -754,6 +757,59 @@ async def get_status() -> StatusResponse:
         )
 
 
+@mcp.tool()
+async def get_queue_metrics(group_id: str | None = None) -> dict[str, Any] | ErrorResponse:
+    """Get episode queue depth, throughput and latency metrics per group.
+
+    Args:
+        group_id: Restrict the report to one group (all groups when omitted)
+    """
+    global queue_service
+
+    if queue_service is None:
+        return ErrorResponse(error='Services not initialized')
+
+    return {'groups': queue_service.get_metrics(group_id)}
+
+
+@mcp.tool()
+async def get_failed_episodes(group_id: str | None = None) -> dict[str, Any] | ErrorResponse:
+    """List queued episodes that failed every attempt and were kept for inspection.
+
+    Requires queue persistence; without it the list is always empty.
+
+    Args:
+        group_id: Restrict the list to one group (all groups when omitted)
+    """
+    global queue_service
+
+    if queue_service is None:
+        return ErrorResponse(error='Services not initialized')
+
+    return {'episodes': queue_service.get_failed_episodes(group_id)}
+
+
+@mcp.tool()
+async def retry_failed_episodes(group_id: str | None = None) -> SuccessResponse | ErrorResponse:
+    """Re-queue failed episodes with a fresh attempt budget.
+
+    Args:
+        group_id: Restrict the retry to one group (all groups when omitted)
+    """
+    global queue_service
+
+    if queue_service is None:
+        return ErrorResponse(error='Services not initialized')
+
+    try:
+        count = queue_service.retry_failed_episodes(group_id)
+    except Exception as e:
+        error_msg = str(e)
+        logger.error(f'Error retrying failed episodes: {error_msg}')
+        return ErrorResponse(error=f'Error retrying failed episodes: {error_msg}')
+    return SuccessResponse(message=f'Re-queued {count} failed episodes')
+
+
 @mcp.custom_route('/health', methods=['GET'])
 async def health_check(request) -> JSONResponse:
     """Health check endpoint for Docker and load balancers."""
@@ -886,7 +942,15 @@ async def initialize_server() -> ServerConfig:
 
     # Initialize services
     graphiti_service = GraphitiService(config, SEMAPHORE_LIMIT)
-    queue_service = QueueService()
+    queue_service = QueueService(
+        max_queue_size=config.queue.max_size,
+        workers_per_group=config.queue.workers_per_group,
+        enqueue_timeout=config.queue.enqueue_timeout,
+        persistence_path=config.queue.persistence_path or None,
+        max_attempts=config.queue.max_attempts,
+        retry_backoff=config.queue.retry_backoff,
+        max_retry_backoff=config.queue.max_retry_backoff,
+    )
     await graphiti_service.initialize()
 
     # Set global client for backward compatibility
@@ -894,7 +958,7 @@ async def initialize_server() -> ServerConfig:
     semaphore = graphiti_service.semaphore
 
     # Initialize queue service with the client
-    await queue_service.initialize(graphiti_client)
+    await queue_service.initialize(graphiti_client, entity_types=graphiti_service.entity_types)
 
     # Set MCP server settings
     if config.server.host:
@@ -911,6 +975,17 @@ async def run_mcp_server():
     # Initialize the server
     mcp_config = await initialize_server()
 
+    try:
+        await _run_transport(mcp_config)
+    finally:
+        # Stop queue workers and close the episode store; unfinished episodes
+        # stay persisted for the next start
+        if queue_service is not None:
+            await queue_service.shutdown()
+
+
+async def _run_transport(mcp_config: ServerConfig) -> None:
+    """Serve MCP over the configured transport until it exits."""
     # Run the server with configured transport
     logger.info(f'Starting MCP server with transport: {mcp_config.transport}')
     if mcp_config.transport == 'stdio':
@@ -1,28 +1,286 @@
 """Queue service for managing episode processing."""
 
 import asyncio
+import json
 import logging
+import sqlite3
+import time
+from collections import deque
 from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Window used for the per-group enqueue rate metric
+ENQUEUE_RATE_WINDOW_SECONDS = 60.0
+# Number of recent processing latencies kept per group for percentiles
+LATENCY_SAMPLE_SIZE = 500
+
+
+class QueueFullError(RuntimeError):
+    """Raised when a group's queue stays at capacity for the whole enqueue timeout."""
+
+    def __init__(self, group_id: str, depth: int, capacity: int, retry_after_seconds: float):
+        self.group_id = group_id
+        self.depth = depth
+        self.capacity = capacity
+        self.retry_after_seconds = retry_after_seconds
+        super().__init__(
+            f"Episode queue for group '{group_id}' is full ({depth}/{capacity}); "
+            f'retry in ~{retry_after_seconds:.0f}s'
+        )
+
+
+@dataclass
+class _QueuedEpisode:
+    """A unit of work in a group queue."""
+
+    process_func: Callable[[], Awaitable[None]]
+    enqueued_at: float
+    store_id: int | None = None
+    holds_slot: bool = True
+    attempts: int = 0
+
+
+@dataclass
+class _GroupMetrics:
+    """Counters and samples for one group_id."""
+
+    enqueued_total: int = 0
+    processed_total: int = 0
+    failed_total: int = 0
+    rejected_total: int = 0
+    recovered_total: int = 0
+    retried_total: int = 0
+    in_flight: int = 0
+    enqueue_times: deque = field(default_factory=deque)
+    latencies: deque = field(default_factory=lambda: deque(maxlen=LATENCY_SAMPLE_SIZE))
+    queue_waits: deque = field(default_factory=lambda: deque(maxlen=LATENCY_SAMPLE_SIZE))
+
+    def record_enqueue(self, now: float) -> None:
+        self.enqueued_total += 1
+        self.enqueue_times.append(now)
+        self._trim(now)
+
+    def enqueue_rate_per_minute(self, now: float) -> float:
+        self._trim(now)
+        return len(self.enqueue_times) * (60.0 / ENQUEUE_RATE_WINDOW_SECONDS)
+
+    def _trim(self, now: float) -> None:
+        while self.enqueue_times and now - self.enqueue_times[0] > ENQUEUE_RATE_WINDOW_SECONDS:
+            self.enqueue_times.popleft()
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class EpisodeStore:
+    """SQLite-backed durable log of queued episodes.
+
+    Rows are inserted on enqueue and deleted once processing succeeds, so
+    the pending rows left on startup are exactly the work lost by the
+    previous process. Episodes that exhaust their attempts stay behind with
+    status ``failed`` and their last error, for inspection and retry.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS queued_episodes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                group_id TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                enqueued_at TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                status TEXT NOT NULL DEFAULT 'pending',
+                last_error TEXT
+            )
+            """
+        )
+        columns = {row[1] for row in self._conn.execute('PRAGMA table_info(queued_episodes)')}
+        if 'status' not in columns:
+            self._conn.execute(
+                "ALTER TABLE queued_episodes ADD COLUMN status TEXT NOT NULL DEFAULT 'pending'"
+            )
+        if 'last_error' not in columns:
+            self._conn.execute('ALTER TABLE queued_episodes ADD COLUMN last_error TEXT')
+        self._conn.execute(
+            'CREATE INDEX IF NOT EXISTS idx_queued_episodes_group ON queued_episodes(group_id, id)'
+        )
+        self._conn.commit()
+
+    def insert(self, group_id: str, payload: dict[str, Any]) -> int:
+        cursor = self._conn.execute(
+            'INSERT INTO queued_episodes (group_id, payload, enqueued_at) VALUES (?, ?, ?)',
+            (group_id, json.dumps(payload), datetime.now(timezone.utc).isoformat()),
+        )
+        self._conn.commit()
+        return int(cursor.lastrowid)
+
+    def mark_attempt(self, store_id: int) -> None:
+        self._conn.execute(
+            'UPDATE queued_episodes SET attempts = attempts + 1 WHERE id = ?', (store_id,)
+        )
+        self._conn.commit()
+
+    def mark_failed(self, store_id: int, error: str) -> None:
+        self._conn.execute(
+            "UPDATE queued_episodes SET status = 'failed', last_error = ? WHERE id = ?",
+            (error, store_id),
+        )
+        self._conn.commit()
+
+    def reset_failed(self, store_id: int) -> None:
+        self._conn.execute(
+            "UPDATE queued_episodes SET status = 'pending', attempts = 0 WHERE id = ?",
+            (store_id,),
+        )
+        self._conn.commit()
+
+    def delete(self, store_id: int) -> None:
+        self._conn.execute('DELETE FROM queued_episodes WHERE id = ?', (store_id,))
+        self._conn.commit()
+
+    def pending(self) -> list[tuple[int, str, dict[str, Any], int]]:
+        rows = self._conn.execute(
+            "SELECT id, group_id, payload, attempts FROM queued_episodes "
+            "WHERE status = 'pending' ORDER BY id"
+        ).fetchall()
+        return [(row[0], row[1], json.loads(row[2]), row[3]) for row in rows]
+
+    def failed(self, group_id: str | None = None) -> list[dict[str, Any]]:
+        query = (
+            'SELECT id, group_id, payload, enqueued_at, attempts, last_error '
+            "FROM queued_episodes WHERE status = 'failed'"
+        )
+        params: tuple[Any, ...] = ()
+        if group_id is not None:
+            query += ' AND group_id = ?'
+            params = (group_id,)
+        rows = self._conn.execute(query + ' ORDER BY id', params).fetchall()
+        return [
+            {
+                'id': row[0],
+                'group_id': row[1],
+                'payload': json.loads(row[2]),
+                'enqueued_at': row[3],
+                'attempts': row[4],
+                'last_error': row[5],
+            }
+            for row in rows
+        ]
+
+    def close(self) -> None:
+        self._conn.close()
+
 
 class QueueService:
-    """Service for managing sequential episode processing queues by group_id."""
+    """Service for managing bounded, durable episode processing queues by group_id.
+
+    Each group gets its own FIFO queue drained by up to ``workers_per_group``
+    workers (1 keeps Graphiti's strict per-group ordering). At most
+    ``max_queue_size`` episodes per group may be queued or in flight; beyond
+    that ``add_episode`` waits up to ``enqueue_timeout`` seconds for space
+    and then raises ``QueueFullError``. A failing episode is retried in
+    place, with exponential backoff starting at ``retry_backoff`` seconds
+    and capped at ``max_retry_backoff``, until it has been tried
+    ``max_attempts`` times; later episodes of the group wait behind it.
+    When ``persistence_path`` is set, episodes added through ``add_episode``
+    are logged to SQLite and replayed by ``initialize`` after a restart, and
+    episodes that exhaust their attempts are kept there as failed (see
+    ``get_failed_episodes`` and ``retry_failed_episodes``).
+    """
 
-    def __init__(self):
-        """Initialize the queue service."""
+    def __init__(
+        self,
+        max_queue_size: int = 1000,
+        workers_per_group: int = 1,
+        enqueue_timeout: float = 5.0,
+        persistence_path: str | None = None,
+        max_attempts: int = 3,
+        retry_backoff: float = 1.0,
+        max_retry_backoff: float = 30.0,
+    ):
+        """Initialize the queue service.
+
+        Args:
+            max_queue_size: Maximum queued plus in-flight episodes per group_id
+            workers_per_group: Concurrent workers per group_id
+            enqueue_timeout: Seconds to wait for capacity before rejecting
+            persistence_path: SQLite file for durable queueing (None disables)
+            max_attempts: Attempts per episode before it is given up on and,
+                when persistent, kept as failed instead of replayed
+            retry_backoff: Seconds before the first retry, doubled per attempt
+            max_retry_backoff: Upper bound on the delay between attempts
+        """
+        self.max_queue_size = max(1, int(max_queue_size))
+        self.workers_per_group = max(1, int(workers_per_group))
+        self.enqueue_timeout = max(0.0, float(enqueue_timeout))
+        self.max_attempts = max(1, int(max_attempts))
+        self.retry_backoff = max(0.0, float(retry_backoff))
+        self.max_retry_backoff = max(self.retry_backoff, float(max_retry_backoff))
         # Dictionary to store queues for each group_id
         self._episode_queues: dict[str, asyncio.Queue] = {}
-        # Dictionary to track if a worker is running for each group_id
-        self._queue_workers: dict[str, bool] = {}
+        # Per-group capacity slots (queued + in flight)
+        self._capacity: dict[str, asyncio.Semaphore] = {}
+        # Worker tasks for each group_id
+        self._queue_workers: dict[str, set[asyncio.Task]] = {}
+        self._metrics: dict[str, _GroupMetrics] = {}
+        self._store = EpisodeStore(persistence_path) if persistence_path else None
         # Store the graphiti client after initialization
         self._graphiti_client: Any = None
+        self._entity_types: Any = None
+
+    def _ensure_group(self, group_id: str) -> None:
+        if group_id not in self._episode_queues:
+            self._episode_queues[group_id] = asyncio.Queue()
+            self._capacity[group_id] = asyncio.Semaphore(self.max_queue_size)
+            self._queue_workers[group_id] = set()
+            self._metrics[group_id] = _GroupMetrics()
+
+    def _start_workers(self, group_id: str) -> None:
+        workers = self._queue_workers[group_id]
+        while len(workers) < self.workers_per_group:
+            task = asyncio.create_task(self._process_episode_queue(group_id))
+            workers.add(task)
+            task.add_done_callback(workers.discard)
+
+    async def _acquire_slot(self, group_id: str) -> None:
+        capacity = self._capacity[group_id]
+        try:
+            await asyncio.wait_for(capacity.acquire(), timeout=self.enqueue_timeout or 0.001)
+        except asyncio.TimeoutError:
+            metrics = self._metrics[group_id]
+            metrics.rejected_total += 1
+            latencies = list(metrics.latencies)
+            per_episode = sum(latencies) / len(latencies) if latencies else 1.0
+            raise QueueFullError(
+                group_id,
+                depth=self.get_queue_size(group_id) + metrics.in_flight,
+                capacity=self.max_queue_size,
+                retry_after_seconds=per_episode * self.max_queue_size / self.workers_per_group,
+            ) from None
 
     async def add_episode_task(
-        self, group_id: str, process_func: Callable[[], Awaitable[None]]
+        self,
+        group_id: str,
+        process_func: Callable[[], Awaitable[None]],
+        *,
+        _store_id: int | None = None,
+        _slot_acquired: bool = False,
     ) -> int:
         """Add an episode processing task to the queue.
 
@@ -32,51 +290,93 @@ class QueueService:
 
         Returns:
             The position in the queue
+
+        Raises:
+            QueueFullError: If the group stays at capacity for enqueue_timeout
         """
-        # Initialize queue for this group_id if it doesn't exist
-        if group_id not in self._episode_queues:
-            self._episode_queues[group_id] = asyncio.Queue()
+        self._ensure_group(group_id)
+        if not _slot_acquired:
+            await self._acquire_slot(group_id)
 
-        # Add the episode processing function to the queue
-        await self._episode_queues[group_id].put(process_func)
+        now = time.monotonic()
+        await self._episode_queues[group_id].put(
+            _QueuedEpisode(process_func=process_func, enqueued_at=now, store_id=_store_id)
+        )
+        self._metrics[group_id].record_enqueue(now)
 
-        # Start a worker for this queue if one isn't already running
-        if not self._queue_workers.get(group_id, False):
-            asyncio.create_task(self._process_episode_queue(group_id))
+        # Start workers for this queue if they aren't already running
+        self._start_workers(group_id)
 
         return self._episode_queues[group_id].qsize()
 
+    def _retry_delay(self, attempts: int) -> float:
+        """Backoff before the attempt following ``attempts`` failed ones."""
+        return min(self.max_retry_backoff, self.retry_backoff * 2 ** max(0, attempts - 1))
+
     async def _process_episode_queue(self, group_id: str) -> None:
-        """Process episodes for a specific group_id sequentially.
+        """Process episodes for a specific group_id.
 
         This function runs as a long-lived task that processes episodes
-        from the queue one at a time.
+        from the queue one at a time; ``workers_per_group`` of them share
+        each queue.
         """
         logger.info(f'Starting episode queue worker for group_id: {group_id}')
-        self._queue_workers[group_id] = True
+        queue = self._episode_queues[group_id]
+        metrics = self._metrics[group_id]
 
         try:
             while True:
-                # Get the next episode processing function from the queue
+                # Get the next episode from the queue
                 # This will wait if the queue is empty
-                process_func = await self._episode_queues[group_id].get()
+                episode: _QueuedEpisode = await queue.get()
+                metrics.queue_waits.append(time.monotonic() - episode.enqueued_at)
+                metrics.in_flight += 1
+                stored = self._store is not None and episode.store_id is not None
+                # None means cancelled mid-episode: its row stays pending for the next start
+                outcome = None
+                error = ''
 
                 try:
-                    # Process the episode
-                    await process_func()
-                except Exception as e:
-                    logger.error(
-                        f'Error processing queued episode for group_id {group_id}: {str(e)}'
-                    )
+                    # Retry in place so the group's later episodes keep their order
+                    while outcome is None:
+                        episode.attempts += 1
+                        started = time.monotonic()
+                        try:
+                            if stored:
+                                self._store.mark_attempt(episode.store_id)
+                            # Process the episode
+                            await episode.process_func()
+                            metrics.processed_total += 1
+                            outcome = 'done'
+                        except Exception as e:
+                            metrics.failed_total += 1
+                            error = str(e)
+                            logger.error(
+                                f'Error processing queued episode for group_id {group_id} '
+                                f'(attempt {episode.attempts}/{self.max_attempts}): {error}'
+                            )
+                            if episode.attempts >= self.max_attempts:
+                                outcome = 'failed'
+                        finally:
+                            metrics.latencies.append(time.monotonic() - started)
+                        if outcome is None:
+                            metrics.retried_total += 1
+                            await asyncio.sleep(self._retry_delay(episode.attempts))
                 finally:
+                    metrics.in_flight -= 1
+                    if outcome == 'done' and stored:
+                        self._store.delete(episode.store_id)
+                    elif outcome == 'failed' and stored:
+                        self._store.mark_failed(episode.store_id, error)
+                    if episode.holds_slot:
+                        self._capacity[group_id].release()
                     # Mark the task as done regardless of success/failure
-                    self._episode_queues[group_id].task_done()
+                    queue.task_done()
         except asyncio.CancelledError:
             logger.info(f'Episode queue worker for group_id {group_id} was cancelled')
         except Exception as e:
             logger.error(f'Unexpected error in queue worker for group_id {group_id}: {str(e)}')
         finally:
-            self._queue_workers[group_id] = False
             logger.info(f'Stopped episode queue worker for group_id: {group_id}')
 
     def get_queue_size(self, group_id: str) -> int:
@@ -87,18 +387,145 @@ class QueueService:
 
     def is_worker_running(self, group_id: str) -> bool:
         """Check if a worker is running for a group_id."""
-        return self._queue_workers.get(group_id, False)
+        return bool(self._queue_workers.get(group_id))
 
-    async def initialize(self, graphiti_client: Any) -> None:
+    def get_metrics(self, group_id: str | None = None) -> dict[str, Any]:
+        """Get queue metrics per group_id.
+
+        Args:
+            group_id: Restrict to one group (all groups when None)
+
+        Returns:
+            Mapping of group_id to depth, in-flight count, totals, enqueue
+            rate per minute, and processing/queue-wait latency percentiles
+        """
+        now = time.monotonic()
+        groups = [group_id] if group_id is not None else sorted(self._metrics)
+        report: dict[str, Any] = {}
+        for group in groups:
+            metrics = self._metrics.get(group)
+            if metrics is None:
+                continue
+            latencies = list(metrics.latencies)
+            waits = list(metrics.queue_waits)
+            report[group] = {
+                'depth': self.get_queue_size(group),
+                'in_flight': metrics.in_flight,
+                'capacity': self.max_queue_size,
+                'workers': len(self._queue_workers.get(group, ())),
+                'enqueued_total': metrics.enqueued_total,
+                'processed_total': metrics.processed_total,
+                'failed_total': metrics.failed_total,
+                'rejected_total': metrics.rejected_total,
+                'recovered_total': metrics.recovered_total,
+                'retried_total': metrics.retried_total,
+                'enqueue_rate_per_minute': round(metrics.enqueue_rate_per_minute(now), 2),
+                'processing_latency_p50_s': round(_percentile(latencies, 50), 3),
+                'processing_latency_p95_s': round(_percentile(latencies, 95), 3),
+                'queue_wait_p95_s': round(_percentile(waits, 95), 3),
+            }
+        return report
+
+    async def initialize(self, graphiti_client: Any, entity_types: Any = None) -> None:
         """Initialize the queue service with a graphiti client.
 
+        Episodes left in the persistent store by a previous process are
+        re-queued ahead of any new work.
+
         Args:
             graphiti_client: The graphiti client instance to use for processing episodes
+            entity_types: Entity types used for recovered episodes
         """
         self._graphiti_client = graphiti_client
+        self._entity_types = entity_types
         logger.info('Queue service initialized with graphiti client')
+        if self._store is not None:
+            await self._recover_pending()
 
-    async def add_episode(
+    async def _recover_pending(self) -> None:
+        recovered = 0
+        for store_id, group_id, payload, attempts in self._store.pending():
+            if attempts >= self.max_attempts:
+                logger.error(
+                    f'Keeping episode {payload.get("uuid")} for group {group_id} as failed '
+                    f'after {attempts} attempts'
+                )
+                self._store.mark_failed(store_id, f'interrupted after {attempts} attempts')
+                continue
+            self._requeue_stored(store_id, group_id, payload, attempts)
+            self._metrics[group_id].recovered_total += 1
+            recovered += 1
+        if recovered:
+            logger.info(f'Recovered {recovered} queued episodes from {self._store.path}')
+
+    def _requeue_stored(
+        self, store_id: int, group_id: str, payload: dict[str, Any], attempts: int
+    ) -> None:
+        self._ensure_group(group_id)
+        now = time.monotonic()
+        # Replayed work does not take a capacity slot so it can never
+        # block new enqueues behind a backlog larger than the bound
+        self._episode_queues[group_id].put_nowait(
+            _QueuedEpisode(
+                process_func=self._make_process_func(
+                    group_id=group_id,
+                    entity_types=self._entity_types,
+                    **payload,
+                ),
+                enqueued_at=now,
+                store_id=store_id,
+                holds_slot=False,
+                attempts=attempts,
+            )
+        )
+        self._metrics[group_id].record_enqueue(now)
+        self._start_workers(group_id)
+
+    def get_failed_episodes(self, group_id: str | None = None) -> list[dict[str, Any]]:
+        """List persisted episodes that exhausted their attempts.
+
+        Args:
+            group_id: Restrict to one group (all groups when None)
+
+        Returns:
+            One dict per failed episode with its store id, group_id, payload,
+            enqueue time, attempt count and last error (empty when not persistent)
+        """
+        if self._store is None:
+            return []
+        return self._store.failed(group_id)
+
+    def retry_failed_episodes(self, group_id: str | None = None) -> int:
+        """Re-queue persisted failed episodes with a fresh attempt budget.
+
+        Args:
+            group_id: Restrict to one group (all groups when None)
+
+        Returns:
+            Number of episodes re-queued
+        """
+        if self._graphiti_client is None:
+            raise RuntimeError('Queue service not initialized. Call initialize() first.')
+        failed = self.get_failed_episodes(group_id)
+        for row in failed:
+            self._store.reset_failed(row['id'])
+            self._requeue_stored(row['id'], row['group_id'], row['payload'], attempts=0)
+        if failed:
+            logger.info(f'Re-queued {len(failed)} failed episodes')
+        return len(failed)
+
+    async def shutdown(self) -> None:
+        """Cancel workers and close the persistent store; pending rows remain for the next start."""
+        tasks = [task for workers in self._queue_workers.values() for task in workers]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    def _make_process_func(
         self,
         group_id: str,
         name: str,
@@ -107,23 +534,9 @@ class QueueService:
         episode_type: Any,
         entity_types: Any,
         uuid: str | None,
-    ) -> int:
-        """Add an episode for processing.
-
-        Args:
-            group_id: The group ID for the episode
-            name: Name of the episode
-            content: Episode content
-            source_description: Description of the episode source
-            episode_type: Type of the episode
-            entity_types: Entity types for extraction
-            uuid: Episode UUID
-
-        Returns:
-            The position in the queue
-        """
-        if self._graphiti_client is None:
-            raise RuntimeError('Queue service not initialized. Call initialize() first.')
+    ) -> Callable[[], Awaitable[None]]:
+        if isinstance(episode_type, str):
+            episode_type = _restore_episode_type(episode_type)
 
         async def process_episode():
             """Process the episode using the graphiti client."""
@@ -148,5 +561,80 @@ class QueueService:
                 logger.error(f'Failed to process episode {uuid} for group {group_id}: {str(e)}')
                 raise
 
+        return process_episode
+
+    async def add_episode(
+        self,
+        group_id: str,
+        name: str,
+        content: str,
+        source_description: str,
+        episode_type: Any,
+        entity_types: Any,
+        uuid: str | None,
+    ) -> int:
+        """Add an episode for processing.
+
+        Args:
+            group_id: The group ID for the episode
+            name: Name of the episode
+            content: Episode content
+            source_description: Description of the episode source
+            episode_type: Type of the episode
+            entity_types: Entity types for extraction
+            uuid: Episode UUID
+
+        Returns:
+            The position in the queue
+
+        Raises:
+            QueueFullError: If the group stays at capacity for enqueue_timeout
+        """
+        if self._graphiti_client is None:
+            raise RuntimeError('Queue service not initialized. Call initialize() first.')
+
+        self._ensure_group(group_id)
+        # Take the slot before persisting so rejected episodes leave no row behind
+        await self._acquire_slot(group_id)
+
+        store_id = None
+        if self._store is not None:
+            try:
+                store_id = self._store.insert(
+                    group_id,
+                    {
+                        'name': name,
+                        'content': content,
+                        'source_description': source_description,
+                        'episode_type': getattr(episode_type, 'value', episode_type),
+                        'uuid': uuid,
+                    },
+                )
+            except Exception:
+                self._capacity[group_id].release()
+                raise
+
+        process_episode = self._make_process_func(
+            group_id=group_id,
+            name=name,
+            content=content,
+            source_description=source_description,
+            episode_type=episode_type,
+            entity_types=entity_types,
+            uuid=uuid,
+        )
+
         # Use the existing add_episode_task method to queue the processing
-        return await self.add_episode_task(group_id, process_episode)
+        return await self.add_episode_task(
+            group_id, process_episode, _store_id=store_id, _slot_acquired=True
+        )
+
+
+def _restore_episode_type(value: str) -> Any:
+    """Map a persisted episode type value back to graphiti's EpisodeType."""
+    try:
+        from graphiti_core.nodes import EpisodeType
+
+        return EpisodeType(value)
+    except (ImportError, ValueError):
+        return value
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""Unit tests for the bounded, persistent episode queue."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from services.queue_service import QueueFullError, QueueService  # noqa: E402
+
+
+class FakeGraphitiClient:
+    """Records add_episode calls; optionally blocks until released."""
+
+    def __init__(self, gate: asyncio.Event | None = None):
+        self.gate = gate
+        self.processed: list[str] = []
+
+    async def add_episode(self, **kwargs):
+        if self.gate is not None:
+            await self.gate.wait()
+        self.processed.append(kwargs['name'])
+
+
+async def _add(service: QueueService, name: str, group_id: str = 'rfps') -> int:
+    return await service.add_episode(
+        group_id=group_id,
+        name=name,
+        content=f'body of {name}',
+        source_description='test',
+        episode_type='text',
+        entity_types=None,
+        uuid=None,
+    )
+
+
+async def _drain(service: QueueService, group_id: str = 'rfps') -> None:
+    await asyncio.wait_for(service._episode_queues[group_id].join(), timeout=2)
+
+
+async def test_rejects_when_group_is_at_capacity():
+    gate = asyncio.Event()
+    service = QueueService(max_queue_size=2, enqueue_timeout=0.05)
+    await service.initialize(FakeGraphitiClient(gate))
+
+    await _add(service, 'one')
+    await _add(service, 'two')
+    with pytest.raises(QueueFullError) as excinfo:
+        await _add(service, 'three')
+    assert excinfo.value.capacity == 2
+
+    # Other groups have their own capacity
+    await _add(service, 'other', group_id='news')
+
+    gate.set()
+    await _drain(service)
+    await _add(service, 'three')
+    await _drain(service)
+
+    metrics = service.get_metrics('rfps')['rfps']
+    assert metrics['rejected_total'] == 1
+    assert metrics['processed_total'] == 3
+    assert metrics['depth'] == 0
+    await service.shutdown()
+
+
+async def test_single_worker_preserves_order_and_multiple_workers_overlap():
+    ordered = QueueService()
+    client = FakeGraphitiClient()
+    await ordered.initialize(client)
+    for index in range(5):
+        await _add(ordered, f'ep-{index}')
+    await _drain(ordered)
+    assert client.processed == [f'ep-{index}' for index in range(5)]
+    await ordered.shutdown()
+
+    in_flight = 0
+    peak = 0
+
+    async def slow_episode():
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+
+    parallel = QueueService(workers_per_group=3)
+    for _ in range(6):
+        await parallel.add_episode_task('bulk', slow_episode)
+    await asyncio.wait_for(parallel._episode_queues['bulk'].join(), timeout=2)
+    assert peak == 3
+    await parallel.shutdown()
+
+
+async def test_pending_episodes_survive_restart(tmp_path):
+    db_path = tmp_path / 'queue.sqlite'
+    first = QueueService(persistence_path=str(db_path))
+    await first.initialize(FakeGraphitiClient(asyncio.Event()))
+    await _add(first, 'historical-1')
+    await _add(first, 'historical-2')
+    await asyncio.sleep(0)
+    # Simulate a crash with one episode in flight and one queued
+    await first.shutdown()
+
+    client = FakeGraphitiClient()
+    second = QueueService(persistence_path=str(db_path))
+    await second.initialize(client)
+    await _drain(second)
+
+    assert client.processed == ['historical-1', 'historical-2']
+    assert second.get_metrics()['rfps']['recovered_total'] == 2
+    await second.shutdown()
+
+    third = QueueService(persistence_path=str(db_path))
+    await third.initialize(FakeGraphitiClient())
+    assert third.get_metrics() == {}
+    await third.shutdown()
+
+
+class FlakyGraphitiClient(FakeGraphitiClient):
+    """Fails each named episode the given number of times before succeeding."""
+
+    def __init__(self, failures: dict[str, int]):
+        super().__init__()
+        self.failures = dict(failures)
+
+    async def add_episode(self, **kwargs):
+        name = kwargs['name']
+        if self.failures.get(name, 0) > 0:
+            self.failures[name] -= 1
+            raise RuntimeError(f'llm unavailable for {name}')
+        await super().add_episode(**kwargs)
+
+
+async def test_failed_episodes_are_retried_then_kept_for_inspection(tmp_path):
+    db_path = tmp_path / 'queue.sqlite'
+    service = QueueService(persistence_path=str(db_path), max_attempts=2, retry_backoff=0)
+    client = FlakyGraphitiClient({'flaky': 1, 'doomed': 5})
+    await service.initialize(client)
+
+    await _add(service, 'flaky')
+    await _add(service, 'doomed')
+    await _drain(service)
+
+    assert client.processed == ['flaky']
+    metrics = service.get_metrics('rfps')['rfps']
+    assert metrics['failed_total'] == 3
+    assert metrics['retried_total'] == 2
+    [failed] = service.get_failed_episodes()
+    assert failed['payload']['name'] == 'doomed'
+    assert failed['attempts'] == 2
+    assert failed['last_error'] == 'llm unavailable for doomed'
+    await service.shutdown()
+
+    # Failed episodes are not replayed on restart, but survive it
+    restarted = QueueService(persistence_path=str(db_path), max_attempts=2)
+    recovered_client = FakeGraphitiClient()
+    await restarted.initialize(recovered_client)
+    assert restarted.get_metrics() == {}
+    assert [row['payload']['name'] for row in restarted.get_failed_episodes('rfps')] == ['doomed']
+
+    assert restarted.retry_failed_episodes('rfps') == 1
+    await _drain(restarted)
+    assert recovered_client.processed == ['doomed']
+    assert restarted.get_failed_episodes() == []
+    await restarted.shutdown()
+
+
+async def test_failed_episode_is_retried_in_place_with_bounded_backoff(monkeypatch):
+    service = QueueService(max_attempts=4, retry_backoff=0.5, max_retry_backoff=1.0)
+    client = FlakyGraphitiClient({'flaky': 3})
+    await service.initialize(client)
+    delays: list[float] = []
+    real_sleep = asyncio.sleep
+
+    async def record_sleep(delay, *args, **kwargs):
+        delays.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr('services.queue_service.asyncio.sleep', record_sleep)
+
+    await _add(service, 'flaky')
+    await _add(service, 'next')
+    await _drain(service)
+
+    # The group's next episode waits for the retried one instead of overtaking it
+    assert client.processed == ['flaky', 'next']
+    assert delays == [0.5, 1.0, 1.0]
+    assert service.get_metrics('rfps')['rfps']['retried_total'] == 3
+    await service.shutdown()
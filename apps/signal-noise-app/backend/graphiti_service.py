@@ -35,6 +35,10 @@ try:
     from dossier_publication_quality import apply_publication_quality_gates
 except ImportError:  # pragma: no cover - package import fallback
     from backend.dossier_publication_quality import apply_publication_quality_gates
+try:
+    from multi_pass_context import invalidate_cached_graph_context
+except ImportError:
+    from backend.multi_pass_context import invalidate_cached_graph_context
 try:
     from post_dossier_graphiti_trigger import notify_post_dossier_graphiti_opportunity_trigger
 except ImportError:  # pragma: no cover - package import fallback
@@ -329,9 +333,8 @@ class GraphitiService:
             Created episode data
         """
         if self.use_supabase and self.supabase_client:
-            return await self._add_rfp_episode_supabase(rfp_data)
-
-        if not self.driver:
+            result = await self._add_rfp_episode_supabase(rfp_data)
+        elif not self.driver:
             logger.warning("⚠️ No temporal backend available - RFP episode not stored")
             return {
                 'episode_id': 'temp',
@@ -339,9 +342,13 @@ class GraphitiService:
                 'timestamp': datetime.now(timezone.utc).isoformat(),
                 'status': 'not_stored'
             }
+        else:
+            # Fallback to FalkorDB implementation
+            result = await self._add_rfp_episode_falkordb(rfp_data)
 
-        # Fallback to FalkorDB implementation
-        return await self._add_rfp_episode_falkordb(rfp_data)
+        organization = rfp_data.get('organization') or ''
+        invalidate_cached_graph_context(rfp_data.get('entity_id'), organization.lower().replace(' ', '-'))
+        return result
 
     async def _add_rfp_episode_supabase(self, rfp_data: Dict) -> Dict[str, Any]:
         """Add RFP episode using Supabase"""
@@ -1496,6 +1503,7 @@ class GraphitiService:
             self.supabase_client.table('temporal_episodes').insert(episode_data).execute()
 
             logger.info(f"✅ Created discovery episode: {episode_type} for {entity_name} (evidence_date: {episode_timestamp[:10]}, discovery_date: {discovery_date[:10]})")
+            invalidate_cached_graph_context(entity_id, episode_data['entity_id'])
 
             return {
                 'episode_id': f"{entity_id}_{episode_type}_{int(datetime.now(timezone.utc).timestamp())}",
@@ -1575,6 +1583,7 @@ class GraphitiService:
             })
 
             logger.info(f"✅ Created discovery episode: {episode_type} for {entity_name} (FalkorDB)")
+            invalidate_cached_graph_context(entity_id)
 
             return {
                 'episode_id': episode_id,
@@ -2776,6 +2785,7 @@ class GraphitiService:
             result = self.supabase_client.table('entities').upsert(entity_data).execute()
 
             logger.info(f"✅ Upserted entity: {entity.id} (Supabase)")
+            invalidate_cached_graph_context(entity.id)
             return {'entity_id': entity.id, 'source': 'supabase', 'status': 'upserted'}
 
         # Fallback to FalkorDB
@@ -2801,6 +2811,7 @@ class GraphitiService:
             })
 
             logger.info(f"✅ Upserted entity: {entity.id} (FalkorDB)")
+            invalidate_cached_graph_context(entity.id)
             return {'entity_id': entity.id, 'source': 'falkordb', 'status': 'upserted'}
 
     async def get_entity(self, entity_id: str) -> Dict[str, Any]:
@@ -3036,6 +3047,7 @@ class GraphitiService:
             result = self.supabase_client.table('relationships').insert(rel_data).execute()
 
             logger.info(f"✅ Created relationship: {relationship.id} (Supabase)")
+            invalidate_cached_graph_context(relationship.from_entity, relationship.to_entity)
             return {'relationship_id': relationship.id, 'source': 'supabase', 'status': 'created'}
 
         # Fallback to FalkorDB
@@ -3067,6 +3079,7 @@ class GraphitiService:
             })
 
             logger.info(f"✅ Created relationship: {relationship.id} (FalkorDB)")
+            invalidate_cached_graph_context(relationship.from_entity, relationship.to_entity)
             return {'relationship_id': relationship.id, 'source': 'falkordb', 'status': 'created'}
 
     async def get_subgraph(self, entity_id: str, depth: int = 2) -> Dict[str, Any]:
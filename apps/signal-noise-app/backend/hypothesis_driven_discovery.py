@@ -283,6 +283,12 @@ DiscoveryUrlPolicy = _load_backend_attr(
     "DiscoveryUrlPolicy",
     None,
 )
+url_features = _load_backend_attr("url_features", "url_features")
+strip_www = _load_backend_attr("url_features", "strip_www")
+get_batch_broker = _load_backend_attr("llm_batch_broker", "get_batch_broker")
+scan_json = _load_backend_attr("json_scanner", "scan_json")
+context_packing_enabled = _load_backend_attr("context_packer", "context_packing_enabled", lambda: False)
+pack_context = _load_backend_attr("context_packer", "pack_context")
 
 
 def _load_backend_attr(module_name: str, attr_name: str, default: Any = None):
@@ -466,6 +472,34 @@ HIGH_VALUE_HOPS = {
     HopType.DOCUMENT,
 }
 
+# URL scoring vocabulary for HypothesisDrivenDiscovery._url_scorer.
+_URL_SCORE_TRUSTED_DOMAIN_MARKERS = (".gov", ".org", "tenders", "procurement", "contracts")
+_URL_SCORE_LOW_QUALITY_DOMAINS = (
+    "youtube.com", "youtu.be", "reddit.com", "tiktok.com",
+    "facebook.com", "instagram.com", "x.com", "twitter.com",
+)
+_URL_SCORE_MAINSTREAM_PRESS_DOMAINS = ("bbc.", "skysports.", "espn.", "goal.com")
+_URL_SCORE_ENCYCLOPEDIA_DOMAINS = ("wikipedia.org", "wikidata.org", "britannica.com")
+_URL_SCORE_JOB_AGGREGATOR_DOMAINS = (
+    "indeed.", "glassdoor.", "totaljobs.", "reed.co.uk", "ziprecruiter.",
+    "monster.", "simplyhired.", "jobsora.", "jobrapido.", "adzuna.",
+)
+_URL_SCORE_LEGAL_TOKENS = ("privacy", "cookie", "cookies", "terms", "policy")
+_URL_SCORE_COMMERCE_TOKENS = ("store", "shop", "ticket", "tickets", "merch", "ecommerce")
+_URL_SCORE_WEAK_OFFICIAL_DOMAINS = ("wikipedia.org", "espn.", "bbc.", "skysports.", "goal.com")
+_URL_SCORE_PROCUREMENT_KEYWORDS = ("rfp", "request for proposal", "procurement", "tender", "vendor", "supplier")
+_URL_SCORE_AVOID_PATHS = ("/news/", "/blog/", "/about/", "/contact/", "/events/", "/media/")
+_URL_SCORE_WEAK_DOMAINS = ("linkedin.com", "facebook.com", "instagram.com", "x.com", "twitter.com")
+_URL_SCORE_GOOD_PATHS = ("/procurement/", "/vendors/", "/suppliers/", "/rfp/", "/tenders/")
+_URL_SCORE_PROCUREMENT_SEARCH_HOPS = frozenset({HopType.RFP_PAGE, HopType.TENDERS_PAGE, HopType.PROCUREMENT_PAGE})
+_URL_SCORE_PROCUREMENT_HOPS = _URL_SCORE_PROCUREMENT_SEARCH_HOPS | {HopType.DOCUMENT}
+_URL_SCORE_STRICT_SOURCE_HOPS = _URL_SCORE_PROCUREMENT_HOPS | {HopType.OFFICIAL_SITE}
+_URL_SCORE_HOP_KEYWORDS = {
+    HopType.RFP_PAGE: {"rfp": 0.5, "procurement": 0.3, "tender": 0.3, "vendor": 0.2, "supplier": 0.2},
+    HopType.TENDERS_PAGE: {"tender": 0.4, "procurement": 0.3, "vendor": 0.2, "supplier": 0.2, "opportunities": 0.1},
+    HopType.PROCUREMENT_PAGE: {"procurement": 0.4, "purchasing": 0.3, "vendor": 0.2, "supplier": 0.2},
+}
+
 # Engine preferences by hop type (primary, fallback)
 ENGINE_PREFERENCES = {
     HopType.RFP_PAGE: ['google'],
@@ -1664,43 +1698,6 @@ class HypothesisDrivenDiscovery:
             "parse_path": "text_no_progress_recovered",
         }
 
-    def _recover_strict_from_truncated_json_prefix(self, response_text: str) -> Optional[Dict[str, Any]]:
-        text = str(response_text or "").strip()
-        if not text:
-            return None
-        if not text.lstrip().startswith("{"):
-            return None
-
-        decision_match = re.search(
-            r'(?is)"?decision"?\s*:\s*"?(ACCEPT|WEAK_ACCEPT|REJECT|NO_PROGRESS)',
-            text,
-        )
-        if not decision_match:
-            return None
-        decision = decision_match.group(1).upper()
-        if decision not in {"ACCEPT", "WEAK_ACCEPT", "REJECT", "NO_PROGRESS"}:
-            return None
-
-        confidence_delta = 0.0
-        confidence_match = re.search(r'(?is)"?confidence_delta"?\s*:\s*(-?\d+(?:\.\d+)?)', text)
-        if confidence_match:
-            try:
-                confidence_delta = float(confidence_match.group(1))
-            except Exception:  # noqa: BLE001
-                confidence_delta = 0.0
-        elif decision == "ACCEPT":
-            confidence_delta = 0.06
-
-        return {
-            "decision": decision,
-            "confidence_delta": confidence_delta,
-            "justification": "Recovered decision from truncated JSON prefix",
-            "evidence_found": "",
-            "evidence_type": "strict_truncated_json_recovery",
-            "temporal_score": "unknown",
-            "parse_path": "json_truncated_recovered",
-        }
-
     def _extract_deterministic_trusted_signal(
         self,
         *,
@@ -1905,50 +1902,6 @@ class HypothesisDrivenDiscovery:
         normalized["parse_path"] = normalized.get("parse_path") or "structured_output"
         return normalized
 
-    @staticmethod
-    def _extract_balanced_json_object(text: str, *, required_key: str = "decision") -> Optional[Dict[str, Any]]:
-        """Extract and parse the first balanced JSON object containing required_key."""
-        if not isinstance(text, str) or not text:
-            return None
-
-        key_token = f'"{required_key}"'
-        starts = [idx for idx, ch in enumerate(text) if ch == "{"] if "{" in text else []
-        for start in starts:
-            depth = 0
-            in_string = False
-            escape = False
-            for idx in range(start, len(text)):
-                ch = text[idx]
-                if in_string:
-                    if escape:
-                        escape = False
-                    elif ch == "\\":
-                        escape = True
-                    elif ch == '"':
-                        in_string = False
-                    continue
-
-                if ch == '"':
-                    in_string = True
-                    continue
-                if ch == "{":
-                    depth += 1
-                    continue
-                if ch == "}":
-                    depth -= 1
-                    if depth == 0:
-                        candidate = text[start : idx + 1]
-                        if key_token not in candidate:
-                            break
-                        try:
-                            parsed = json.loads(candidate)
-                        except Exception:  # noqa: BLE001
-                            break
-                        if isinstance(parsed, dict) and required_key in parsed:
-                            return parsed
-                        break
-        return None
-
     @staticmethod
     def _normalize_evaluator_payload(payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         if not isinstance(payload, dict):
@@ -1973,66 +1926,30 @@ class HypothesisDrivenDiscovery:
             "temporal_score": str(payload.get("temporal_score") or "").strip() or "unknown",
         }
 
-    def _salvage_almost_json_object(self, response_text: str) -> Optional[Dict[str, Any]]:
-        if not isinstance(response_text, str) or not response_text.strip():
-            return None
-
-        start_index = response_text.find("{")
-        if start_index < 0:
-            return None
-
-        candidate = response_text[start_index:]
-        last_close_index = candidate.rfind("}")
-        if last_close_index >= 0:
-            candidate = candidate[: last_close_index + 1]
-
-        # Repair common LLM issues: dangling commas and missing closing braces.
-        candidate = re.sub(r",(\s*[}\]])", r"\1", candidate)
-        open_count = candidate.count("{")
-        close_count = candidate.count("}")
-        if open_count > close_count:
-            candidate = f"{candidate}{'}' * (open_count - close_count)}"
-        candidate = re.sub(r",(\s*[}\]])", r"\1", candidate)
-
-        direct = self._extract_balanced_json_object(candidate, required_key="decision")
-        normalized = self._normalize_evaluator_payload(direct) if direct else None
-        if normalized:
-            return normalized
-
-        try:
-            loaded = json.loads(candidate)
-        except Exception:  # noqa: BLE001
-            return None
-        return self._normalize_evaluator_payload(loaded)
-
     def _parse_evaluation_response_json(self, response_text: str) -> Optional[Dict[str, Any]]:
         """Parse evaluator JSON from plain text, fenced blocks, or mixed responses."""
         self._last_parse_path = None
         if not isinstance(response_text, str):
             return None
 
-        direct = self._extract_balanced_json_object(response_text, required_key="decision")
+        # One scan covers direct, fenced, truncated and salvaged payloads. The
+        # key:value reading stays a separate line pass: that format has no
+        # braces, so the scanner never sees it.
+        scanner = scan_json(response_text)
+        direct = scanner.find_object(("decision",), repair=False)
         normalized_direct = self._normalize_evaluator_payload(direct) if direct else None
         if normalized_direct:
             self._last_parse_path = "json_direct"
             return normalized_direct
 
-        import re
-
-        fenced_blocks = re.findall(r"```(?:json)?\s*([\s\S]*?)```", response_text, flags=re.IGNORECASE)
-        for block in fenced_blocks:
-            parsed = self._extract_balanced_json_object(block, required_key="decision")
-            normalized_fenced = self._normalize_evaluator_payload(parsed) if parsed else None
-            if normalized_fenced:
-                self._last_parse_path = "json_fenced"
-                return normalized_fenced
-
         key_value_payload = self._extract_evaluation_key_value_payload(response_text)
         if key_value_payload:
             self._last_parse_path = "key_value_recovered"
             return key_value_payload
 
-        salvaged_payload = self._salvage_almost_json_object(response_text)
+        # A confidence cut mid-number is dropped rather than trusted.
+        salvaged = scanner.find_object(("decision",), repair=True, numeric_keys=("confidence_delta",))
+        salvaged_payload = self._normalize_evaluator_payload(salvaged) if salvaged else None
         if salvaged_payload:
             self._last_parse_path = "json_salvaged"
             return salvaged_payload
@@ -2129,200 +2046,197 @@ class HypothesisDrivenDiscovery:
         Returns:
             Relevance score (0.0 to 1.0+)
         """
-        score = 0.0
-        url_lower = url.lower()
-        title_lower = title.lower()
-        snippet_lower = snippet.lower()
-        from urllib.parse import urlparse
-        parsed = urlparse(url_lower)
+        return self._url_scorer(hop_type, entity_name)(url, title, snippet)
 
-        # Domain authority signals
-        if '.gov.' in url or '.org.' in url:
-            score += 0.3
-
-        # Reject search-engine redirect wrappers; they are not target evidence pages.
-        if "google." in parsed.netloc and parsed.path in {"/url", "/goto"}:
-            return 0.0
-
-        # Entity name match in domain
-        entity_slug = entity_name.lower().replace(' ', '').replace('-', '')
-        if entity_slug in url_lower:
-            score += 0.2
-        # Also support initialism-style club domains (e.g., Coventry City FC -> ccfc.co.uk).
-        initials = ''.join([part[0] for part in entity_name.lower().replace('-', ' ').split() if part])
-        if len(initials) >= 3 and initials in url_lower:
-            score += 0.2
-
-        # Source-quality adjustment by domain/content type
-        host = parsed.netloc.lower()
-        trusted_domain_markers = {
-            ".gov", ".org", "tenders", "procurement", "contracts",
-        }
-        low_quality_domains = {
-            "youtube.com", "youtu.be", "reddit.com", "tiktok.com",
-            "facebook.com", "instagram.com", "x.com", "twitter.com",
-        }
-        mainstream_press_domains = {
-            "bbc.", "skysports.", "espn.", "goal.com",
-        }
-        encyclopedia_domains = {
-            "wikipedia.org", "wikidata.org", "britannica.com",
-        }
-        job_aggregator_domains = {
-            "indeed.", "glassdoor.", "totaljobs.", "reed.co.uk", "ziprecruiter.",
-            "monster.", "simplyhired.", "jobsora.", "jobrapido.", "adzuna.",
-        }
+    def _score_urls(self, results: List[Dict[str, Any]], hop_type: HopType, entity_name: str) -> List[float]:
+        """
+        Score a whole search result set for one hop.
 
-        if any(marker in host for marker in trusted_domain_markers):
-            score += 0.2
-        if any(domain in host for domain in low_quality_domains):
-            score -= 0.5
+        Entity and official-site lookups are resolved once for the batch and
+        each URL is parsed through the shared feature cache.
 
-        # Source-priority shaping for discovery quality:
-        # prefer entity/official/procurement sources over encyclopedic and aggregator pages.
-        if any(domain in host for domain in encyclopedia_domains):
-            if hop_type in {HopType.RFP_PAGE, HopType.TENDERS_PAGE, HopType.PROCUREMENT_PAGE, HopType.OFFICIAL_SITE, HopType.DOCUMENT}:
-                score -= 0.8
-            else:
-                score -= 0.35
+        Args:
+            results: Search results with url/title/snippet keys
+            hop_type: Type of hop being executed
+            entity_name: Name of entity being searched
 
-        if any(domain in host for domain in job_aggregator_domains):
-            if hop_type == HopType.CAREERS_PAGE:
-                score -= 0.2
-            elif hop_type in {HopType.RFP_PAGE, HopType.TENDERS_PAGE, HopType.PROCUREMENT_PAGE, HopType.DOCUMENT, HopType.OFFICIAL_SITE}:
-                score -= 0.9
-            else:
-                score -= 0.5
+        Returns:
+            One relevance score per result, in input order
+        """
+        scorer = self._url_scorer(hop_type, entity_name)
+        return [
+            scorer(str(item.get('url') or ''), str(item.get('title') or ''), str(item.get('snippet') or ''))
+            for item in results
+        ]
 
-        if hop_type in {HopType.RFP_PAGE, HopType.TENDERS_PAGE, HopType.PROCUREMENT_PAGE}:
-            if any(domain in host for domain in mainstream_press_domains):
-                score -= 0.15
-
-            # Entity grounding in title/snippet boosts relevance for procurement hops.
-            text_blob = f"{title_lower} {snippet_lower}"
-            entity_tokens = [t for t in entity_name.lower().replace('-', ' ').split() if len(t) > 2]
-            grounded = any(tok in text_blob for tok in entity_tokens)
-            if grounded:
-                score += 0.15
-            else:
-                score -= 0.2
+    def _url_scorer(self, hop_type: HopType, entity_name: str) -> Callable[[str, str, str], float]:
+        """Build a URL scorer with the hop/entity invariants hoisted out of the per-URL path."""
+        entity_lower = entity_name.lower()
+        entity_slug = entity_lower.replace(' ', '').replace('-', '')
+        # Also support initialism-style club domains (e.g., Coventry City FC -> ccfc.co.uk).
+        initials = ''.join([part[0] for part in entity_lower.replace('-', ' ').split() if part])
+        use_initials = len(initials) >= 3
+        entity_tokens = [t for t in entity_lower.replace('-', ' ').split() if len(t) > 2]
+        is_procurement_search_hop = hop_type in _URL_SCORE_PROCUREMENT_SEARCH_HOPS
+        is_procurement_hop = hop_type in _URL_SCORE_PROCUREMENT_HOPS
+        if hop_type in _URL_SCORE_STRICT_SOURCE_HOPS:
+            encyclopedia_penalty = 0.8
+        else:
+            encyclopedia_penalty = 0.35
+        if hop_type == HopType.CAREERS_PAGE:
+            job_aggregator_penalty = 0.2
+        elif hop_type in _URL_SCORE_STRICT_SOURCE_HOPS:
+            job_aggregator_penalty = 0.9
+        else:
+            job_aggregator_penalty = 0.5
+        hop_keywords = _URL_SCORE_HOP_KEYWORDS.get(hop_type, {})
 
-        # Official-site specific ranking to avoid store/merch domains becoming canonical.
+        official_host = ""
         if hop_type == HopType.OFFICIAL_SITE:
             official_site_url = self._normalize_http_url(getattr(self, "current_official_site_url", None))
             if not official_site_url:
                 official_site_url = self._get_cached_official_site_url(entity_name)
             if not official_site_url:
                 official_site_url = self._get_mapped_official_site_url(entity_name)
-            official_host = (urlparse(official_site_url).netloc or "").lower().lstrip("www.") if official_site_url else ""
-            host_norm = host.lstrip("www.")
+            official_host = strip_www(url_features(official_site_url).netloc) if official_site_url else ""
+        procurement_official_host = ""
+        if is_procurement_hop:
+            official_site_url = self._normalize_http_url(getattr(self, "current_official_site_url", None))
+            if official_site_url:
+                procurement_official_host = strip_www(url_features(official_site_url).netloc)
+
+        def score_url(url: str, title: str = "", snippet: str = "") -> float:
+            score = 0.0
+            features = url_features(url)
+            url_lower = features.url_lower
+            title_lower = title.lower()
+            snippet_lower = snippet.lower()
+            host = features.netloc
+            path = features.path
+
+            # Domain authority signals
+            if '.gov.' in url or '.org.' in url:
+                score += 0.3
+
+            # Reject search-engine redirect wrappers; they are not target evidence pages.
+            if "google." in host and path in {"/url", "/goto"}:
+                return 0.0
+
+            # Entity name match in domain
+            if entity_slug in url_lower:
+                score += 0.2
+            if use_initials and initials in url_lower:
+                score += 0.2
 
-            # If we already know official host, strongly prefer it and demote everything else.
-            if official_host:
-                if host_norm == official_host or host_norm.endswith(f".{official_host}"):
-                    score += 1.2
-                else:
-                    score -= 1.0
-
-            # Homepages on the entity domain are preferred.
-            parsed_url = parsed
-            if entity_slug in url_lower and (parsed_url.path in {"", "/"}):
-                score += 0.35
-            if len(initials) >= 3 and initials in url_lower and (parsed_url.path in {"", "/"}):
-                score += 0.25
-
-            # Legal/policy pages are usually low-yield for discovery signals.
-            legal_tokens = {"privacy", "cookie", "cookies", "terms", "policy"}
-            if any(token in parsed_url.path for token in legal_tokens):
-                score -= 0.9
-            if any(token in parsed_url.path for token in ("news", "press", "about", "club")):
+            # Source-quality adjustment by domain/content type
+            if any(marker in host for marker in _URL_SCORE_TRUSTED_DOMAIN_MARKERS):
                 score += 0.2
+            if any(domain in host for domain in _URL_SCORE_LOW_QUALITY_DOMAINS):
+                score -= 0.5
 
-            # Demote commercial storefronts; they are often adjacent but not canonical.
-            commerce_tokens = {"store", "shop", "ticket", "tickets", "merch", "ecommerce"}
-            if any(token in url_lower for token in commerce_tokens):
-                score -= 0.7
+            # Source-priority shaping for discovery quality:
+            # prefer entity/official/procurement sources over encyclopedic and aggregator pages.
+            if any(domain in host for domain in _URL_SCORE_ENCYCLOPEDIA_DOMAINS):
+                score -= encyclopedia_penalty
+            if any(domain in host for domain in _URL_SCORE_JOB_AGGREGATOR_DOMAINS):
+                score -= job_aggregator_penalty
+
+            if is_procurement_search_hop:
+                if any(domain in host for domain in _URL_SCORE_MAINSTREAM_PRESS_DOMAINS):
+                    score -= 0.15
+
+                # Entity grounding in title/snippet boosts relevance for procurement hops.
+                text_blob = f"{title_lower} {snippet_lower}"
+                if any(tok in text_blob for tok in entity_tokens):
+                    score += 0.15
+                else:
+                    score -= 0.2
 
-            # Demote encyclopedic/news mirrors for official-site discovery.
-            weak_official_domains = {"wikipedia.org", "espn.", "bbc.", "skysports.", "goal.com"}
-            if any(domain in url_lower for domain in weak_official_domains):
-                score -= 0.5
+            # Official-site specific ranking to avoid store/merch domains becoming canonical.
+            if hop_type == HopType.OFFICIAL_SITE:
+                host_norm = strip_www(host)
 
-        procurement_keywords = {'rfp', 'request for proposal', 'procurement', 'tender', 'vendor', 'supplier'}
-        procurement_hops = {HopType.RFP_PAGE, HopType.TENDERS_PAGE, HopType.PROCUREMENT_PAGE, HopType.DOCUMENT}
+                # If we already know official host, strongly prefer it and demote everything else.
+                if official_host:
+                    if host_norm == official_host or host_norm.endswith(f".{official_host}"):
+                        score += 1.2
+                    else:
+                        score -= 1.0
 
-        # LinkedIn can surface real opportunities, but treat it as weak evidence unless
-        # the result explicitly reads like a procurement announcement.
-        if hop_type in [HopType.RFP_PAGE, HopType.TENDERS_PAGE, HopType.PROCUREMENT_PAGE]:
-            if 'linkedin.com' in url_lower:
+                # Homepages on the entity domain are preferred.
+                is_homepage = path in {"", "/"}
+                if entity_slug in url_lower and is_homepage:
+                    score += 0.35
+                if use_initials and initials in url_lower and is_homepage:
+                    score += 0.25
+
+                # Legal/policy pages are usually low-yield for discovery signals.
+                if any(token in path for token in _URL_SCORE_LEGAL_TOKENS):
+                    score -= 0.9
+                if any(token in path for token in ("news", "press", "about", "club")):
+                    score += 0.2
+
+                # Demote commercial storefronts; they are often adjacent but not canonical.
+                if any(token in url_lower for token in _URL_SCORE_COMMERCE_TOKENS):
+                    score -= 0.7
+
+                # Demote encyclopedic/news mirrors for official-site discovery.
+                if any(domain in url_lower for domain in _URL_SCORE_WEAK_OFFICIAL_DOMAINS):
+                    score -= 0.5
+
+            # LinkedIn can surface real opportunities, but treat it as weak evidence unless
+            # the result explicitly reads like a procurement announcement.
+            if is_procurement_search_hop and 'linkedin.com' in url_lower:
                 if '/posts/' in url_lower or '/activity/' in url_lower:
                     procurement_language = (
-                        any(kw in title_lower for kw in procurement_keywords) or
-                        any(kw in snippet_lower for kw in procurement_keywords)
+                        any(kw in title_lower for kw in _URL_SCORE_PROCUREMENT_KEYWORDS) or
+                        any(kw in snippet_lower for kw in _URL_SCORE_PROCUREMENT_KEYWORDS)
                     )
                     if procurement_language:
                         score += 0.15
                     else:
                         score -= 0.35
 
-        # Hop-type-specific scoring
-        if hop_type == HopType.RFP_PAGE:
-            keywords = {'rfp': 0.5, 'procurement': 0.3, 'tender': 0.3, 'vendor': 0.2, 'supplier': 0.2}
-            for kw, weight in keywords.items():
-                if kw in url_lower:
-                    score += weight
-
-        elif hop_type == HopType.TENDERS_PAGE:
-            keywords = {'tender': 0.4, 'procurement': 0.3, 'vendor': 0.2, 'supplier': 0.2, 'opportunities': 0.1}
-            for kw, weight in keywords.items():
-                if kw in url_lower:
-                    score += weight
-
-        elif hop_type == HopType.PROCUREMENT_PAGE:
-            keywords = {'procurement': 0.4, 'purchasing': 0.3, 'vendor': 0.2, 'supplier': 0.2}
-            for kw, weight in keywords.items():
+            # Hop-type-specific scoring
+            for kw, weight in hop_keywords.items():
                 if kw in url_lower:
                     score += weight
-        elif hop_type == HopType.PRESS_RELEASE:
-            # Press/news hops should favor article/newsroom paths, not domain roots.
-            if any(token in url_lower for token in ("/news", "/press", "/media", "/article", "/stories")):
-                score += 0.45
-            if parsed.path in {"", "/"}:
-                score -= 0.35
-
-        # Title and snippet relevance
-        if hop_type in procurement_hops:
-            if 'procurement' in title_lower or 'rfp' in title_lower:
-                score += 0.2
-            if 'procurement' in snippet_lower or 'vendor' in snippet_lower:
-                score += 0.1
-            if not any(kw in f"{title_lower} {snippet_lower}" for kw in procurement_keywords):
-                score -= 0.2
-            official_site_url = self._normalize_http_url(getattr(self, "current_official_site_url", None))
-            if official_site_url:
-                official_host = (urlparse(official_site_url).netloc or "").lower().lstrip("www.")
-                if official_host and host.lstrip("www.") == official_host:
+            if hop_type == HopType.PRESS_RELEASE:
+                # Press/news hops should favor article/newsroom paths, not domain roots.
+                if any(token in url_lower for token in ("/news", "/press", "/media", "/article", "/stories")):
+                    score += 0.45
+                if path in {"", "/"}:
+                    score -= 0.35
+
+            # Title and snippet relevance
+            if is_procurement_hop:
+                if 'procurement' in title_lower or 'rfp' in title_lower:
+                    score += 0.2
+                if 'procurement' in snippet_lower or 'vendor' in snippet_lower:
+                    score += 0.1
+                if not any(kw in f"{title_lower} {snippet_lower}" for kw in _URL_SCORE_PROCUREMENT_KEYWORDS):
+                    score -= 0.2
+                if procurement_official_host and strip_www(host) == procurement_official_host:
                     score += 0.25
 
-        # Penalty for generic/low-value paths in procurement/document hops
-        # (news/blog pages are useful for PRESS_RELEASE and can carry strong signals).
-        if 'linkedin.com' not in url_lower and hop_type in procurement_hops:
-            avoid_paths = {'/news/', '/blog/', '/about/', '/contact/', '/events/', '/media/'}
-            if any(path in url_lower for path in avoid_paths):
-                score -= 0.5
+            # Penalty for generic/low-value paths in procurement/document hops
+            # (news/blog pages are useful for PRESS_RELEASE and can carry strong signals).
+            if 'linkedin.com' not in url_lower and is_procurement_hop:
+                if any(avoid in url_lower for avoid in _URL_SCORE_AVOID_PATHS):
+                    score -= 0.5
 
-        # Social and generic press/news results are too noisy for procurement discovery.
-        weak_domains = {'linkedin.com', 'facebook.com', 'instagram.com', 'x.com', 'twitter.com'}
-        if hop_type in procurement_hops and any(domain in url_lower for domain in weak_domains):
-            if not any(kw in f"{title_lower} {snippet_lower}" for kw in procurement_keywords):
-                score -= 0.25
+            # Social and generic press/news results are too noisy for procurement discovery.
+            if is_procurement_hop and any(domain in url_lower for domain in _URL_SCORE_WEAK_DOMAINS):
+                if not any(kw in f"{title_lower} {snippet_lower}" for kw in _URL_SCORE_PROCUREMENT_KEYWORDS):
+                    score -= 0.25
 
-        # Bonus for corporate/official paths
-        good_paths = {'/procurement/', '/vendors/', '/suppliers/', '/rfp/', '/tenders/'}
-        if any(path in url_lower for path in good_paths):
-            score += 0.3
+            # Bonus for corporate/official paths
+            if any(good in url_lower for good in _URL_SCORE_GOOD_PATHS):
+                score += 0.3
 
-        return max(0.0, score)  # Ensure non-negative
+            return max(0.0, score)  # Ensure non-negative
+
+        return score_url
 
     def _apply_entity_type_hop_bias(self, hop_type: HopType, depth: int) -> float:
         entity_type = str(getattr(self, "current_entity_type", "") or "").upper()
@@ -4921,25 +4835,17 @@ class HypothesisDrivenDiscovery:
                 logger.warning("Could not find official site for site-specific search")
                 return None
 
-            official_results = official_site_result.get('results', [])[:5]
+            official_results = [
+                result for result in official_site_result.get('results', [])[:5]
+                if result.get('url', '')
+            ]
             official_url = None
-            scored_candidates = []
-            for result in official_results:
-                candidate_url = result.get('url', '')
-                if not candidate_url:
-                    continue
-                scored_candidates.append(
-                    (
-                        self._score_url(
-                            url=candidate_url,
-                            hop_type=HopType.OFFICIAL_SITE,
-                            entity_name=entity_name,
-                            title=result.get('title', ''),
-                            snippet=result.get('snippet', ''),
-                        ),
-                        candidate_url,
-                    )
+            scored_candidates = list(
+                zip(
+                    self._score_urls(official_results, HopType.OFFICIAL_SITE, entity_name),
+                    [result.get('url', '') for result in official_results],
                 )
+            )
             if scored_candidates:
                 scored_candidates.sort(key=lambda item: item[0], reverse=True)
                 official_url = scored_candidates[0][1]
@@ -4995,20 +4901,8 @@ class HypothesisDrivenDiscovery:
                 if search_result.get('status') == 'success' and search_result.get('results'):
                     results = search_result['results']
 
-                    # Score each result
-                    for result in results:
-                        url = result.get('url', '')
-                        title = result.get('title', '')
-                        snippet = result.get('snippet', '')
-
-                        score = self._score_url(
-                            url=url,
-                            hop_type=hop_type,
-                            entity_name=entity_name,
-                            title=title,
-                            snippet=snippet
-                        )
-
+                    # Score the result set in one batch
+                    for result, score in zip(results, self._score_urls(results, hop_type, entity_name)):
                         result['_url_score'] = score
 
                     # Sort by score
@@ -5709,6 +5603,22 @@ class HypothesisDrivenDiscovery:
         salvaged["salvage_hits"] = hits[:6]
         return salvaged
 
+    def _evaluator_content_excerpt(self, content: str, context: EvaluationContext, *, max_chars: int) -> str:
+        """Page content for the evaluator prompt: a head cut, or relevance-packed when enabled."""
+        text = str(content or "")
+        if len(text) <= max_chars or pack_context is None or not context_packing_enabled():
+            return text[:max_chars]
+        question = " ".join(
+            [
+                str(context.entity_name or ""),
+                str(context.hypothesis_statement or ""),
+                " ".join(context.keywords or []),
+                " ".join(str(indicator) for indicator in (context.early_indicators or [])),
+            ]
+        )
+        packed = pack_context(question, {"content": text}, max(1, max_chars // 4))
+        return packed.text or text[:max_chars]
+
     def _extract_evidence_pack(
         self,
         content: str,
@@ -6068,6 +5978,18 @@ class HypothesisDrivenDiscovery:
                 ) from timeout_error
 
         async def _invoke_once() -> Dict[str, Any]:
+            broker = get_batch_broker(getattr(self, "claude_client", None)) if json_mode else None
+            if broker is not None:
+                # The broker scales the per-attempt budget by batch size
+                return await broker.submit(
+                    family="hop_evaluation",
+                    prompt=prompt,
+                    model=current_model,
+                    max_tokens=max_tokens,
+                    system_prompt=system_prompt,
+                    stream=False,
+                    timeout_seconds=timeout_seconds,
+                )
             try:
                 query_coro = query_fn(
                     prompt=prompt,
@@ -6321,7 +6243,7 @@ Keywords: {', '.join(context.keywords) if context.keywords else 'None'}
 
 Content:
 ```markdown
-{content[:1200]}
+{self._evaluator_content_excerpt(content, context, max_chars=1200)}
 ```
 
 Return strict JSON only:
@@ -6363,7 +6285,7 @@ Last Decision: {context.last_decision if context.last_decision else 'N/A'}
 
 ## Content to Evaluate
 ```markdown
-{content[:2000]}
+{self._evaluator_content_excerpt(content, context, max_chars=2000)}
 ```
 
 ## MCP Pattern Insights
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Single-pass tolerant JSON scanner for model responses.
+
+Evaluator, planner and dossier responses arrive as JSON wrapped in prose,
+markdown fences, trailing commas or a truncated tail. Parsing them used to
+cascade through several full-text scans (balanced-brace search per ``{``,
+fenced-block regexes, salvage rewrites, truncated-prefix regexes) before an
+LLM repair round trip. ``JsonScanner`` walks the text once, character by
+character, and records:
+
+- spans of complete top-level JSON values, with trailing commas marked for
+  removal;
+- the open container stack, so a truncated value can be closed exactly;
+- top-level scalar fields of the current object as soon as each one is
+  complete, so streamed responses can act on ``decision`` before the tail.
+
+The scanner is incremental: ``feed`` may be called with streamed chunks and
+only scans the new characters.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+_OPENERS = {"{": "}", "[": "]"}
+_CLOSERS = {"}": "{", "]": "["}
+_WHITESPACE = " \t\r\n"
+
+
+class _Frame:
+    __slots__ = ("opener", "start", "state", "key", "scalar_start", "string_is_key")
+
+    def __init__(self, opener: str, start: int):
+        self.opener = opener
+        self.start = start
+        # Objects: key -> colon -> value -> after; arrays: value -> after.
+        self.state = "key" if opener == "{" else "value"
+        self.key: Optional[str] = None
+        self.scalar_start = -1
+        self.string_is_key = False
+
+
+class JsonScanner:
+    """Incremental, tolerant scanner over one model response."""
+
+    def __init__(self, text: str = ""):
+        self._text = ""
+        self._pos = 0
+        self._stack: List[_Frame] = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = -1
+        self._last_sig_char = ""
+        self._last_sig_index = -1
+        self._drop: List[int] = []
+        self._spans: List[Tuple[int, int]] = []
+        self._nested_spans: List[Tuple[int, int]] = []
+        self._parsed: Dict[Tuple[int, int], Any] = {}
+        self.fields: Dict[str, Any] = {}
+        self.last_match_start = -1
+        if text:
+            self.feed(text)
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    @property
+    def complete(self) -> bool:
+        """True when at least one top-level value closed and nothing is left open."""
+        return bool(self._spans) and not self._stack
+
+    def feed(self, chunk: str) -> "JsonScanner":
+        if not chunk:
+            return self
+        self._text += chunk
+        text = self._text
+        for idx in range(self._pos, len(text)):
+            self._step(text, idx, text[idx])
+        self._pos = len(text)
+        return self
+
+    def _step(self, text: str, idx: int, ch: str) -> None:
+        stack = self._stack
+        if not stack:
+            # Prose between values: quotes here are not JSON strings.
+            if ch in _OPENERS:
+                self._push(ch, idx)
+            return
+
+        frame = stack[-1]
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+            elif ch == "\\":
+                self._escape = True
+            elif ch == '"':
+                self._in_string = False
+                self._close_string(text, idx, frame)
+            return
+
+        if frame.state == "scalar":
+            if ch in _WHITESPACE or ch == "," or ch in _CLOSERS:
+                self._finish_scalar(text[frame.scalar_start:idx], frame)
+            else:
+                return
+
+        if ch in _WHITESPACE:
+            return
+        if ch == '"':
+            self._in_string = True
+            self._string_start = idx
+            frame.string_is_key = frame.opener == "{" and frame.state == "key"
+        elif ch in _OPENERS:
+            frame.state = "after"
+            self._push(ch, idx)
+        elif ch in _CLOSERS:
+            self._close_container(idx, ch)
+        elif ch == ":":
+            if frame.opener == "{":
+                frame.state = "value"
+        elif ch == ",":
+            frame.state = "key" if frame.opener == "{" else "value"
+        elif frame.state == "value":
+            frame.state = "scalar"
+            frame.scalar_start = idx
+        self._last_sig_char = ch
+        self._last_sig_index = idx
+
+    def _push(self, opener: str, idx: int) -> None:
+        if not self._stack:
+            self.fields = {}
+        self._stack.append(_Frame(opener, idx))
+        self._last_sig_char = opener
+        self._last_sig_index = idx
+
+    def _close_string(self, text: str, idx: int, frame: _Frame) -> None:
+        raw = text[self._string_start : idx + 1]
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            value = raw[1:-1]
+        if frame.string_is_key:
+            frame.key = str(value)
+            frame.state = "colon"
+        else:
+            self._set_field(frame, value)
+            frame.state = "after"
+        self._last_sig_char = '"'
+        self._last_sig_index = idx
+
+    def _finish_scalar(self, token: str, frame: _Frame) -> None:
+        try:
+            value: Any = json.loads(token)
+        except ValueError:
+            value = token
+        self._set_field(frame, value)
+        frame.state = "after"
+
+    def _set_field(self, frame: _Frame, value: Any) -> None:
+        if len(self._stack) == 1 and frame.opener == "{" and frame.key is not None:
+            self.fields[frame.key] = value
+
+    def _close_container(self, idx: int, closer: str) -> None:
+        opener = _CLOSERS[closer]
+        if not any(frame.opener == opener for frame in self._stack):
+            return
+        if self._last_sig_char == ",":
+            self._drop.append(self._last_sig_index)
+        # A mismatched closer also closes any inner containers left open.
+        while self._stack:
+            frame = self._stack.pop()
+            if frame.opener == opener:
+                break
+        self._last_sig_char = closer
+        self._last_sig_index = idx
+        if self._stack:
+            self._nested_spans.append((frame.start, idx + 1))
+        else:
+            self._spans.append((frame.start, idx + 1))
+
+    def field(self, key: str, default: Any = None) -> Any:
+        """Top-level scalar of the current object, available as soon as it is complete."""
+        return self.fields.get(key, default)
+
+    def _render(self, start: int, end: int) -> str:
+        pieces: List[str] = []
+        cursor = start
+        for drop in self._drop:
+            if start <= drop < end:
+                pieces.append(self._text[cursor:drop])
+                cursor = drop + 1
+        pieces.append(self._text[cursor:end])
+        return "".join(pieces)
+
+    def _parse_span(self, span: Tuple[int, int]) -> Any:
+        if span not in self._parsed:
+            try:
+                self._parsed[span] = json.loads(self._render(*span))
+            except ValueError:
+                self._parsed[span] = None
+        return self._parsed[span]
+
+    def values(self) -> Iterator[Tuple[int, Any]]:
+        """Yield ``(start, value)`` for each complete top-level value that parses."""
+        for span in list(self._spans):
+            value = self._parse_span(span)
+            if value is not None:
+                yield span[0], value
+
+    def repaired(self, numeric_keys: Sequence[str] = ()) -> Any:
+        """Close a truncated trailing value and parse it, or None when nothing is open.
+
+        A value cut mid-way becomes null when closing it could yield a wrong
+        number: any bare number, and a quoted value of a ``numeric_keys`` field.
+        """
+        if not self._stack:
+            return None
+        body = self._render(self._stack[0].start, len(self._text))
+        frame = self._stack[-1]
+        if self._in_string:
+            if not frame.string_is_key and frame.opener == "{" and frame.key in numeric_keys:
+                body = body[: len(body) - (len(self._text) - self._string_start)] + "null"
+            else:
+                if self._escape:
+                    body = body[:-1]
+                body += '": null' if frame.string_is_key else '"'
+        elif frame.state == "scalar":
+            token = self._text[frame.scalar_start :]
+            if not _scalar_is_complete(token):
+                body = body[: len(body) - len(token)] + "null"
+        elif frame.state == "colon":
+            body += ": null"
+        elif frame.state == "value" and frame.opener == "{":
+            body += " null"
+        elif self._last_sig_char == ",":
+            body = body.rstrip(_WHITESPACE)[:-1]
+        body += "".join(_OPENERS[open_frame.opener] for open_frame in reversed(self._stack))
+        try:
+            return json.loads(body)
+        except ValueError:
+            return None
+
+    def find_object(
+        self,
+        required_keys: Sequence[str] = (),
+        *,
+        repair: bool = True,
+        numeric_keys: Sequence[str] = (),
+    ) -> Optional[Dict[str, Any]]:
+        """First object (top-level or nested) holding every required key."""
+        scanner, offset = self, 0
+        while True:
+            match = scanner._find_object_once(required_keys, repair, numeric_keys)
+            if match is not None:
+                self.last_match_start = offset + scanner.last_match_start
+                return match
+            # A stray "{" (e.g. quoted in prose) swallowed what followed: rescan from the next one.
+            restart = scanner._first_failed_start()
+            if restart is None:
+                return None
+            offset += restart + 1
+            scanner = JsonScanner(self._text[offset:])
+
+    def _first_failed_start(self) -> Optional[int]:
+        failed = [span[0] for span in self._spans if self._parse_span(span) is None]
+        if self._stack:
+            failed.append(self._stack[0].start)
+        return min(failed) if failed else None
+
+    def _find_object_once(
+        self,
+        required_keys: Sequence[str],
+        repair: bool,
+        numeric_keys: Sequence[str],
+    ) -> Optional[Dict[str, Any]]:
+        for start, value in self.values():
+            match = _find_dict(value, required_keys)
+            if match is not None:
+                self.last_match_start = start
+                return match
+        if repair and self._stack:
+            match = _find_dict(self.repaired(numeric_keys), required_keys)
+            if match is not None:
+                self.last_match_start = self._stack[0].start
+                return match
+        # Objects nested in an unparseable outer value, e.g. prose with a stray "{".
+        parsed_ranges = [span for span in self._spans if self._parse_span(span) is not None]
+        for span in sorted(self._nested_spans):
+            if any(start <= span[0] and span[1] <= end for start, end in parsed_ranges):
+                continue
+            match = _find_dict(self._parse_span(span), required_keys)
+            if match is not None:
+                self.last_match_start = span[0]
+                return match
+        return None
+
+
+def _scalar_is_complete(token: str) -> bool:
+    # true/false/null are complete once they parse; a number may have lost digits.
+    try:
+        value = json.loads(token)
+    except ValueError:
+        return False
+    return isinstance(value, bool) or not isinstance(value, (int, float))
+
+
+def _find_dict(value: Any, required_keys: Sequence[str]) -> Optional[Dict[str, Any]]:
+    pending: List[Any] = [value]
+    while pending:
+        node = pending.pop(0)
+        if isinstance(node, dict):
+            if all(key in node for key in required_keys):
+                return node
+            pending.extend(node.values())
+        elif isinstance(node, list):
+            pending.extend(node)
+    return None
+
+
+def scan_json(text: Any) -> JsonScanner:
+    return JsonScanner(text if isinstance(text, str) else "")
+
+
+def extract_json_object(
+    text: Any,
+    required_keys: Iterable[str] = (),
+    *,
+    repair: bool = True,
+    numeric_keys: Sequence[str] = (),
+) -> Optional[Dict[str, Any]]:
+    """First JSON object in ``text`` holding ``required_keys``, repairing a truncated tail if allowed."""
+    return scan_json(text).find_object(tuple(required_keys), repair=repair, numeric_keys=numeric_keys)
+
+
+def extract_last_json_value(text: Any, *, repair: bool = True, numeric_keys: Sequence[str] = ()) -> Any:
+    """Last complete JSON object (else array) in ``text``, or the repaired truncated tail."""
+    scanner = scan_json(text)
+    last_dict = None
+    last_list = None
+    for _, value in scanner.values():
+        if isinstance(value, dict):
+            last_dict = value
+        elif isinstance(value, list):
+            last_list = value
+    if last_dict is not None:
+        return last_dict
+    if last_list is not None:
+        return last_list
+    return scanner.repaired(numeric_keys) if repair else None
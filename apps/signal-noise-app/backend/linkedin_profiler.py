@@ -15,13 +15,22 @@ Extracts:
 - Company posts (opportunity detection)
 - Skills and endorsements
 - Activity patterns
+
+Outreach intelligence lookups (mutual connections, recent posts) fan out
+concurrently under a shared BrightData limit and are cached per profile URL
+in a persistent TTL cache, so repeated team member/contact pairs across
+entities are not re-scraped.
 """
 
 import asyncio
+import json
 import logging
+import os
 import re
+import time
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Any
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Any
 from dataclasses import dataclass
 
 from schemas import LinkedInProfile, LinkedInEpisodeType, EntityProfile
@@ -89,6 +98,104 @@ class OutreachIntelligence:
     generated_at: datetime
 
 
+class LinkedInLookupCache:
+    """
+    Persistent TTL cache for LinkedIn outreach lookups.
+
+    Entries are keyed by lookup kind plus the normalized profile URLs (or
+    names) involved, e.g. ``mutual|linkedin.com/in/a|linkedin.com/in/b``.
+    The cache is loaded once from a JSON file and written back atomically
+    by `flush()` when it has unsaved entries.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl_seconds: Optional[float] = None):
+        self.path = Path(path or os.getenv("LINKEDIN_LOOKUP_CACHE_PATH", "data/linkedin_lookup_cache.json"))
+        if ttl_seconds is None:
+            ttl_seconds = float(os.getenv("LINKEDIN_LOOKUP_CACHE_TTL_HOURS", "24")) * 3600.0
+        self.ttl_seconds = max(0.0, ttl_seconds)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    @staticmethod
+    def normalize_profile_key(value: str) -> str:
+        """Normalize a LinkedIn profile URL or plain name into a cache key part"""
+        text = str(value or "").strip().lower()
+        text = re.sub(r"^https?://", "", text)
+        text = re.sub(r"^(www\.|[a-z]{2}\.)(?=linkedin\.com)", "", text)
+        text = text.split("?", 1)[0].split("#", 1)[0]
+        return text.rstrip("/")
+
+    @classmethod
+    def make_key(cls, kind: str, *parts: Any) -> str:
+        return "|".join([kind] + [cls.normalize_profile_key(str(part)) for part in parts])
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            entries = data.get("entries", {}) if isinstance(data, dict) else {}
+            now = time.time()
+            self._entries = {
+                key: entry
+                for key, entry in entries.items()
+                if isinstance(entry, dict) and now - float(entry.get("stored_at", 0)) <= self.ttl_seconds
+            }
+            logger.info(f"Loaded {len(self._entries)} LinkedIn lookup cache entries from {self.path}")
+        except Exception as e:
+            logger.warning(f"Could not load LinkedIn lookup cache {self.path}: {e}")
+            self._entries = {}
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if time.time() - float(entry.get("stored_at", 0)) > self.ttl_seconds:
+            del self._entries[key]
+            self._dirty = True
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry.get("value")
+
+    def set(self, key: str, value: Any):
+        self._entries[key] = {"value": value, "stored_at": time.time()}
+        self._dirty = True
+
+    def flush(self):
+        """Write the cache to disk if it changed (atomic replace)"""
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"entries": self._entries}, f, default=str)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except Exception as e:
+            logger.warning(f"Could not persist LinkedIn lookup cache {self.path}: {e}")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_shared_lookup_cache: Optional[LinkedInLookupCache] = None
+
+
+def get_shared_lookup_cache() -> LinkedInLookupCache:
+    """Process-wide lookup cache shared by every LinkedInProfiler"""
+    global _shared_lookup_cache
+    if _shared_lookup_cache is None:
+        _shared_lookup_cache = LinkedInLookupCache()
+    return _shared_lookup_cache
+
+
 class LinkedInProfiler:
     """
     Multi-pass LinkedIn profiling system
@@ -99,14 +206,27 @@ class LinkedInProfiler:
     - Pass 3+: Hybrid with cache warming
     """
 
-    def __init__(self, brightdata_client: BrightDataSDKClient):
+    def __init__(
+        self,
+        brightdata_client: BrightDataSDKClient,
+        lookup_cache: Optional[LinkedInLookupCache] = None,
+        max_concurrent_lookups: Optional[int] = None
+    ):
         """
         Initialize LinkedIn profiler
 
         Args:
             brightdata_client: BrightData SDK client for scraping
+            lookup_cache: Outreach lookup cache (defaults to the shared process cache)
+            max_concurrent_lookups: Concurrent BrightData calls during outreach fan-out
         """
         self.brightdata = brightdata_client
+        self.lookup_cache = lookup_cache if lookup_cache is not None else get_shared_lookup_cache()
+        if max_concurrent_lookups is None:
+            max_concurrent_lookups = int(os.getenv("LINKEDIN_OUTREACH_CONCURRENCY", "4"))
+        self.max_concurrent_lookups = max(1, max_concurrent_lookups)
+        self._brightdata_semaphore = asyncio.Semaphore(self.max_concurrent_lookups)
+        self._inflight_lookups: Dict[str, "asyncio.Future"] = {}
 
         # Executive role keywords
         self.executive_keywords = [
@@ -451,12 +571,34 @@ class LinkedInProfiler:
         current_providers = []
         communication_patterns = []
 
-        # Analyze each target contact
-        for contact in target_contacts[:10]:  # Limit to 10 for cost control
+        contacts = target_contacts[:10]  # Limit to 10 for cost control
+        team = yp_team_members[:5]  # Limit YP team to 5
+
+        # Fan out every lookup at once; the BrightData semaphore bounds the
+        # real request rate and duplicate pairs share one in-flight lookup.
+        pair_keys = [(yp_member, contact) for contact in contacts for yp_member in team]
+        lookups = await asyncio.gather(
+            asyncio.gather(
+                *[self._find_mutual_connections(yp_member, contact) for yp_member, contact in pair_keys],
+                return_exceptions=True
+            ),
+            asyncio.gather(
+                *[self._get_recent_posts(contact, days_to_lookback) for contact in contacts],
+                return_exceptions=True
+            )
+        )
+        mutuals_by_pair = dict(zip(pair_keys, lookups[0]))
+        posts_by_contact = dict(zip(contacts, lookups[1]))
+        self.lookup_cache.flush()
+
+        # Assemble in the original contact/team order so output is deterministic
+        for contact in contacts:
             try:
-                # 1. Find mutual connections with YP team
-                for yp_member in yp_team_members[:5]:  # Limit YP team to 5
-                    mutuals = await self._find_mutual_connections(yp_member, contact)
+                # 1. Mutual connections with YP team
+                for yp_member in team:
+                    mutuals = mutuals_by_pair[(yp_member, contact)]
+                    if isinstance(mutuals, Exception):
+                        raise mutuals
                     if mutuals:
                         path_strength = self._calculate_path_strength(mutuals)
                         connection_type = 'direct' if len(mutuals) > 3 else 'one_hop' if len(mutuals) > 0 else 'two_hop'
@@ -469,8 +611,10 @@ class LinkedInProfiler:
                             connection_type=connection_type
                         ))
 
-                # 2. Extract recent posts
-                recent_posts = await self._get_recent_posts(contact, days_to_lookback)
+                # 2. Recent posts
+                recent_posts = posts_by_contact[contact]
+                if isinstance(recent_posts, Exception):
+                    raise recent_posts
                 for post in recent_posts[:5]:  # Top 5 posts per contact
                     if self._is_post_relevant(post, entity_name):
                         relevance_score = self._score_post_relevance(post)
@@ -520,14 +664,69 @@ class LinkedInProfiler:
         )
 
         logger.info(f"Extracted outreach intelligence: {len(mutual_paths)} paths, "
-                   f"{len(conversation_starters)} starters, {len(current_providers)} providers")
+                   f"{len(conversation_starters)} starters, {len(current_providers)} providers "
+                   f"(lookup cache: {self.lookup_cache.hits} hits, {self.lookup_cache.misses} misses)")
 
         return intelligence
 
+    async def _brightdata_call(self, fn: Callable[..., Awaitable[Dict[str, Any]]], *args, **kwargs) -> Dict[str, Any]:
+        """
+        Run one BrightData request under the profiler's concurrency limit.
+
+        Waits out any rate-limit cooldown the client has recorded before
+        issuing the request, so a 429 on one lookup pauses the whole fan-out.
+        """
+        async with self._brightdata_semaphore:
+            wait_for_cooldown = getattr(self.brightdata, "_wait_for_rate_limit_cooldown", None)
+            if wait_for_cooldown is not None:
+                await wait_for_cooldown()
+            return await fn(*args, **kwargs)
+
+    async def _cached_lookup(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Optional[Any]]],
+        default: Any
+    ) -> Any:
+        """
+        Serve a lookup from the TTL cache, coalescing concurrent duplicates.
+
+        `fetch` returns None when the result should not be cached (e.g. a
+        failed search); callers then get `default`.
+        """
+        cached = self.lookup_cache.get(key)
+        if cached is not None:
+            return cached
+
+        inflight = self._inflight_lookups.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight_lookups[key] = future
+        try:
+            value = await fetch()
+            if value is None:
+                value = default
+            else:
+                self.lookup_cache.set(key, value)
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_result(default)
+            if isinstance(e, Exception):
+                logger.error(f"LinkedIn lookup failed for {key}: {e}")
+                return default
+            raise
+        finally:
+            self._inflight_lookups.pop(key, None)
+
     async def _find_mutual_connections(self, yp_member: str, contact: str) -> List[str]:
         """
         Find mutual connections between YP team member and target contact
 
+        Results are cached per (team member, contact) profile pair.
+
         Args:
             yp_member: YP team member LinkedIn URL or name
             contact: Target contact LinkedIn URL or name
@@ -535,34 +734,42 @@ class LinkedInProfiler:
         Returns:
             List of mutual connection names/URLs
         """
-        try:
-            # Search for mutual connections
-            search_query = f'"{yp_member}" "{contact}" mutual connections site:linkedin.com'
-            results = await self.brightdata.search_engine(
-                query=search_query,
-                engine='google',
-                num_results=5
-            )
+        key = LinkedInLookupCache.make_key("mutual", yp_member, contact)
+        return await self._cached_lookup(
+            key,
+            lambda: self._search_mutual_connections(yp_member, contact),
+            default=[]
+        )
 
-            mutuals = []
-            if results.get('status') == 'success':
-                for result in results.get('results', []):
-                    # Extract mutual connection names from snippets
-                    snippet = result.get('snippet', '')
-                    # Simple extraction - in production would use proper parsing
-                    if 'mutual' in snippet.lower():
-                        mutuals.append(result.get('title', 'Unknown Connection'))
+    async def _search_mutual_connections(self, yp_member: str, contact: str) -> Optional[List[str]]:
+        """Uncached mutual-connection search (None when the search failed)"""
+        search_query = f'"{yp_member}" "{contact}" mutual connections site:linkedin.com'
+        results = await self._brightdata_call(
+            self.brightdata.search_engine,
+            query=search_query,
+            engine='google',
+            num_results=5
+        )
 
-            return mutuals[:5]  # Limit to 5 mutual connections
+        if results.get('status') != 'success':
+            return None
 
-        except Exception as e:
-            logger.error(f"Error finding mutual connections: {e}")
-            return []
+        mutuals = []
+        for result in results.get('results', []):
+            # Extract mutual connection names from snippets
+            snippet = result.get('snippet', '')
+            # Simple extraction - in production would use proper parsing
+            if 'mutual' in snippet.lower():
+                mutuals.append(result.get('title', 'Unknown Connection'))
+
+        return mutuals[:5]  # Limit to 5 mutual connections
 
     async def _get_recent_posts(self, contact: str, days: int) -> List[Dict]:
         """
         Get recent posts from a contact
 
+        Results are cached per contact profile and lookback window.
+
         Args:
             contact: Contact LinkedIn URL or name
             days: Number of days to look back
@@ -570,34 +777,50 @@ class LinkedInProfiler:
         Returns:
             List of posts with metadata
         """
-        try:
-            # Search for recent posts
-            date_filter = f"after:{datetime.now(timezone.utc) - timedelta(days=days)}"
-            search_query = f'"{contact}" posts site:linkedin.com {date_filter}'
-            results = await self.brightdata.search_engine(
-                query=search_query,
-                engine='google',
-                num_results=10
-            )
+        key = LinkedInLookupCache.make_key("posts", contact, days)
+        return await self._cached_lookup(
+            key,
+            lambda: self._fetch_recent_posts(contact, days),
+            default=[]
+        )
 
-            posts = []
-            if results.get('status') == 'success':
-                for result in results.get('results', []):
-                    # Scrape the post content
-                    content = await self.brightdata.scrape_as_markdown(result.get('url'))
-                    posts.append({
-                        'content': content.get('content', ''),
-                        'url': result.get('url'),
-                        'date': result.get('date', datetime.now(timezone.utc).isoformat()),
-                        'author': contact,
-                        'snippet': result.get('snippet', '')
-                    })
+    async def _fetch_recent_posts(self, contact: str, days: int) -> Optional[List[Dict]]:
+        """Uncached recent-post search; result pages are scraped concurrently"""
+        date_filter = f"after:{datetime.now(timezone.utc) - timedelta(days=days)}"
+        search_query = f'"{contact}" posts site:linkedin.com {date_filter}'
+        results = await self._brightdata_call(
+            self.brightdata.search_engine,
+            query=search_query,
+            engine='google',
+            num_results=10
+        )
 
-            return posts
+        if results.get('status') != 'success':
+            return None
 
-        except Exception as e:
-            logger.error(f"Error getting recent posts: {e}")
-            return []
+        search_results = results.get('results', [])
+        scraped = await asyncio.gather(
+            *[
+                self._brightdata_call(self.brightdata.scrape_as_markdown, result.get('url'))
+                for result in search_results
+            ],
+            return_exceptions=True
+        )
+
+        posts = []
+        for result, content in zip(search_results, scraped):
+            if isinstance(content, Exception):
+                logger.warning(f"Could not scrape post {result.get('url')}: {content}")
+                content = {}
+            posts.append({
+                'content': content.get('content', ''),
+                'url': result.get('url'),
+                'date': result.get('date', datetime.now(timezone.utc).isoformat()),
+                'author': contact,
+                'snippet': result.get('snippet', '')
+            })
+
+        return posts
 
     def _is_post_relevant(self, post: Dict, entity_name: str) -> bool:
         """
@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Micro-batching broker for small structured LLM classifications.
+
+Hop evaluation, dossier field extraction and Ralph pass-2 validation each send
+short JSON prompts one at a time. With several entities in flight every call
+pays request overhead and the client's rate-limit pacing separately. The broker
+collects compatible requests (same family, model, system prompt and schema)
+for a short window, sends them as one indexed multi-task prompt, and hands each
+caller back only its own result in the usual ``ClaudeClient.query`` shape.
+
+Anything the batch response does not answer cleanly (a failed call, an
+unparseable payload, a missing or malformed item) is re-sent as the caller's
+original individual request, so batching never changes what a caller can get.
+
+A caller's ``timeout_seconds`` is a per-item budget. A packed batch gets the
+largest budget among its items, since every output arrives in the one response;
+if it runs out, each unanswered item is re-sent individually with its own
+budget, so a caller never waits much more than twice its budget.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import weakref
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_PER_ITEM_FRAMING_TOKENS = 24
+
+
+def _parse_bool(value: Optional[str], default: bool) -> bool:
+    if value is None:
+        return default
+    normalized = value.strip().lower()
+    if normalized in {"1", "true", "yes", "on"}:
+        return True
+    if normalized in {"0", "false", "no", "off"}:
+        return False
+    return default
+
+
+@dataclass
+class LLMBatchBrokerStats:
+    submitted: int = 0
+    batches: int = 0
+    batched_items: int = 0
+    single_calls: int = 0
+    fallback_items: int = 0
+    batch_failures: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        payload = asdict(self)
+        payload["avg_batch_size"] = round(self.batched_items / self.batches, 3) if self.batches else 0.0
+        return payload
+
+
+@dataclass
+class _BatchItem:
+    prompt: str
+    max_tokens: int
+    query_kwargs: Dict[str, Any]
+    required_keys: Tuple[str, ...]
+    future: asyncio.Future
+    timeout_seconds: Optional[float] = None
+
+
+@dataclass
+class _PendingBatch:
+    items: List[_BatchItem] = field(default_factory=list)
+    token_budget: int = 0
+    timer: Optional[asyncio.TimerHandle] = None
+
+
+class LLMBatchBroker:
+    """Collects compatible JSON requests and dispatches them as packed prompts."""
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        max_batch_size: Optional[int] = None,
+        max_wait_seconds: Optional[float] = None,
+        max_batch_tokens: Optional[int] = None,
+    ):
+        self.client = client
+        self.max_batch_size = max(
+            1, int(max_batch_size if max_batch_size is not None else os.getenv("LLM_BATCH_MAX_SIZE", "8"))
+        )
+        self.max_wait_seconds = max(
+            0.0,
+            float(
+                max_wait_seconds
+                if max_wait_seconds is not None
+                else float(os.getenv("LLM_BATCH_MAX_WAIT_MS", "40")) / 1000.0
+            ),
+        )
+        self.max_batch_tokens = max(
+            64, int(max_batch_tokens if max_batch_tokens is not None else os.getenv("LLM_BATCH_MAX_TOKENS", "3000"))
+        )
+        self.stats = LLMBatchBrokerStats()
+        self._pending: Dict[Tuple[str, ...], _PendingBatch] = {}
+        self._tasks: set = set()
+
+    @staticmethod
+    def _batch_key(
+        *, family: str, model: str, system_prompt: Optional[str], json_schema: Optional[Dict[str, Any]]
+    ) -> Tuple[str, ...]:
+        schema_fingerprint = ""
+        if json_schema:
+            schema_fingerprint = hashlib.sha1(
+                json.dumps(json_schema, sort_keys=True, default=str).encode("utf-8")
+            ).hexdigest()
+        return (str(family), str(model or "haiku").strip().lower(), system_prompt or "", schema_fingerprint)
+
+    async def submit(
+        self,
+        *,
+        family: str,
+        prompt: str,
+        model: str = "haiku",
+        max_tokens: int = 220,
+        system_prompt: Optional[str] = None,
+        json_schema: Optional[Dict[str, Any]] = None,
+        required_keys: Tuple[str, ...] = (),
+        timeout_seconds: Optional[float] = None,
+        **query_kwargs: Any,
+    ) -> Dict[str, Any]:
+        """
+        Queue one JSON request and wait for its result.
+
+        Args:
+            family: Schema family; only requests of the same family share a batch.
+            prompt: The caller's standalone prompt.
+            required_keys: Keys a batched output must carry to be accepted;
+                defaults to the schema's ``required`` list.
+            timeout_seconds: Time budget for this item. A packed batch gets the
+                largest budget in it and unanswered items are then re-sent
+                individually; raises ``TimeoutError`` when the individual
+                attempt exceeds it too.
+            **query_kwargs: Extra ``query`` arguments used for the individual
+                fallback call (retry overrides, fast-fail flags, ...).
+
+        Returns:
+            A ``query``-shaped response for this request alone.
+        """
+        loop = asyncio.get_running_loop()
+        individual_kwargs = {
+            "prompt": prompt,
+            "model": model,
+            "max_tokens": max_tokens,
+            "system_prompt": system_prompt,
+            "json_mode": True,
+            **query_kwargs,
+        }
+        if json_schema is not None:
+            individual_kwargs["json_schema"] = json_schema
+        if not required_keys and isinstance(json_schema, dict):
+            required_keys = tuple(str(key) for key in (json_schema.get("required") or ()))
+        item = _BatchItem(
+            prompt=prompt,
+            max_tokens=max(1, int(max_tokens)),
+            query_kwargs=individual_kwargs,
+            required_keys=tuple(required_keys),
+            future=loop.create_future(),
+            timeout_seconds=float(timeout_seconds) if timeout_seconds else None,
+        )
+        self.stats.submitted += 1
+
+        key = self._batch_key(family=family, model=model, system_prompt=system_prompt, json_schema=json_schema)
+        batch = self._pending.get(key)
+        item_tokens = item.max_tokens + _PER_ITEM_FRAMING_TOKENS
+        if batch is not None and batch.token_budget + item_tokens > self.max_batch_tokens:
+            self._dispatch(key, batch)
+            batch = None
+        if batch is None:
+            batch = _PendingBatch()
+            self._pending[key] = batch
+            batch.timer = loop.call_later(self.max_wait_seconds, self._dispatch, key, batch)
+        batch.items.append(item)
+        batch.token_budget += item_tokens
+        if len(batch.items) >= self.max_batch_size:
+            self._dispatch(key, batch)
+        return await item.future
+
+    def _dispatch(self, key: Tuple[str, ...], batch: _PendingBatch) -> None:
+        if self._pending.get(key) is not batch:
+            return
+        del self._pending[key]
+        if batch.timer is not None:
+            batch.timer.cancel()
+        items = [item for item in batch.items if not item.future.done()]
+        if not items:
+            return
+        task = asyncio.ensure_future(self._run_batch(key, items))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    @staticmethod
+    async def _query_within(coro: Any, timeout_seconds: Optional[float], label: str) -> Any:
+        if timeout_seconds is None:
+            return await coro
+        try:
+            return await asyncio.wait_for(coro, timeout=timeout_seconds)
+        except asyncio.TimeoutError as timeout_error:
+            raise TimeoutError(f"{label} timed out after {timeout_seconds:.2f}s") from timeout_error
+
+    async def _run_individual(self, item: _BatchItem) -> None:
+        try:
+            result = await self._query_within(
+                self.client.query(**item.query_kwargs), item.timeout_seconds, "LLM request"
+            )
+        except Exception as error:  # noqa: BLE001
+            if not item.future.done():
+                item.future.set_exception(error)
+            return
+        if not item.future.done():
+            item.future.set_result(result)
+
+    def _build_packed_prompt(self, items: List[_BatchItem]) -> str:
+        sections = [
+            f"You are answering {len(items)} independent JSON tasks in one response.",
+            "Treat every task in isolation; never let one task's content influence another.",
+            'Return one JSON object only: {"results": [{"index": <task index>, "output": <the JSON object the task asks for>}]}',
+            "with exactly one entry per task index. No markdown, no prose.",
+        ]
+        for index, item in enumerate(items):
+            sections.append(f"\n### Task {index}\n{item.prompt}")
+        return "\n".join(sections)
+
+    @staticmethod
+    def _extract_payload(response: Any) -> Optional[Dict[str, Any]]:
+        if not isinstance(response, dict):
+            return None
+        structured = response.get("structured_output")
+        if isinstance(structured, dict):
+            return structured
+        content = str(response.get("content") or "")
+        start, end = content.find("{"), content.rfind("}")
+        if start < 0 or end <= start:
+            return None
+        try:
+            parsed = json.loads(content[start : end + 1])
+        except ValueError:
+            return None
+        return parsed if isinstance(parsed, dict) else None
+
+    @staticmethod
+    def _split_results(payload: Dict[str, Any], size: int) -> Dict[int, Dict[str, Any]]:
+        outputs: Dict[int, Dict[str, Any]] = {}
+        results = payload.get("results")
+        if isinstance(results, dict):
+            results = [{"index": key, "output": value} for key, value in results.items()]
+        if not isinstance(results, list):
+            return outputs
+        for entry in results:
+            if not isinstance(entry, dict):
+                continue
+            try:
+                index = int(entry.get("index"))
+            except (TypeError, ValueError):
+                continue
+            output = entry.get("output")
+            if 0 <= index < size and isinstance(output, dict) and index not in outputs:
+                outputs[index] = output
+        return outputs
+
+    async def _run_batch(self, key: Tuple[str, ...], items: List[_BatchItem]) -> None:
+        if len(items) == 1:
+            self.stats.single_calls += 1
+            await self._run_individual(items[0])
+            return
+
+        family, model, system_prompt, _ = key
+        first_kwargs = items[0].query_kwargs
+        packed_kwargs: Dict[str, Any] = {
+            "prompt": self._build_packed_prompt(items),
+            "model": first_kwargs.get("model", model),
+            "max_tokens": min(
+                self.max_batch_tokens,
+                sum(item.max_tokens + _PER_ITEM_FRAMING_TOKENS for item in items),
+            ),
+            "system_prompt": system_prompt or None,
+            "json_mode": True,
+            "stream": False,
+        }
+        budgets = [item.timeout_seconds for item in items if item.timeout_seconds is not None]
+        # Not scaled by batch size: a slow batch falls back to individual calls
+        # instead of holding every caller for n budgets
+        batch_timeout = max(budgets) if budgets else None
+        try:
+            response = await self._query_within(
+                self.client.query(**packed_kwargs), batch_timeout, f"LLM batch of {len(items)}"
+            )
+            payload = self._extract_payload(response)
+        except Exception as error:  # noqa: BLE001
+            logger.warning("LLM batch (%s, %d items) failed, sending individually: %s", family, len(items), error)
+            response, payload = None, None
+
+        outputs = self._split_results(payload, len(items)) if payload is not None else {}
+        if not outputs:
+            self.stats.batch_failures += 1
+
+        self.stats.batches += 1
+        self.stats.batched_items += len(items)
+        tokens_used = (response or {}).get("tokens_used") if isinstance(response, dict) else None
+        fallbacks: List[_BatchItem] = []
+        for index, item in enumerate(items):
+            output = outputs.get(index)
+            if output is None or any(required not in output for required in item.required_keys):
+                fallbacks.append(item)
+                continue
+            if item.future.done():
+                continue
+            item.future.set_result(
+                {
+                    "content": json.dumps(output),
+                    "structured_output": output,
+                    "model_used": response.get("model_used"),
+                    "requested_model": response.get("requested_model", model),
+                    "provider": response.get("provider"),
+                    "stop_reason": response.get("stop_reason"),
+                    "tokens_used": self._apportion_tokens(tokens_used, len(items)),
+                    "llm_batch": {"family": family, "size": len(items), "index": index},
+                }
+            )
+
+        if fallbacks:
+            self.stats.fallback_items += len(fallbacks)
+            await asyncio.gather(*(self._run_individual(item) for item in fallbacks))
+
+    @staticmethod
+    def _apportion_tokens(tokens_used: Any, size: int) -> Dict[str, Optional[int]]:
+        if not isinstance(tokens_used, dict) or size <= 0:
+            return {}
+        apportioned: Dict[str, Optional[int]] = {}
+        for name, value in tokens_used.items():
+            try:
+                apportioned[name] = int(value) // size
+            except (TypeError, ValueError):
+                apportioned[name] = None
+        return apportioned
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            **self.stats.to_dict(),
+            "max_batch_size": self.max_batch_size,
+            "max_wait_seconds": self.max_wait_seconds,
+            "max_batch_tokens": self.max_batch_tokens,
+        }
+
+
+_BROKERS: "weakref.WeakKeyDictionary[Any, LLMBatchBroker]" = weakref.WeakKeyDictionary()
+
+
+def get_batch_broker(client: Any) -> Optional[LLMBatchBroker]:
+    """Return the shared broker for ``client``, or None when batching is disabled."""
+    if client is None or not callable(getattr(client, "query", None)):
+        return None
+    if not _parse_bool(os.getenv("LLM_BATCH_BROKER_ENABLED"), False):
+        return None
+    try:
+        broker = _BROKERS.get(client)
+        if broker is None:
+            broker = LLMBatchBroker(client)
+            _BROKERS[client] = broker
+    except TypeError:
+        # Clients that cannot be weak-referenced are not shared.
+        return None
+    return broker
+
+
+async def query_json(
+    client: Any,
+    *,
+    family: str,
+    prompt: str,
+    model: str = "haiku",
+    max_tokens: int = 220,
+    system_prompt: Optional[str] = None,
+    json_schema: Optional[Dict[str, Any]] = None,
+    required_keys: Tuple[str, ...] = (),
+    timeout_seconds: Optional[float] = None,
+    **query_kwargs: Any,
+) -> Dict[str, Any]:
+    """Send a small JSON request through the broker when enabled, else directly."""
+    broker = get_batch_broker(client)
+    if broker is not None:
+        return await broker.submit(
+            family=family,
+            prompt=prompt,
+            model=model,
+            max_tokens=max_tokens,
+            system_prompt=system_prompt,
+            json_schema=json_schema,
+            required_keys=required_keys,
+            timeout_seconds=timeout_seconds,
+            **query_kwargs,
+        )
+    request: Dict[str, Any] = {
+        "prompt": prompt,
+        "model": model,
+        "max_tokens": max_tokens,
+        "json_mode": True,
+        **query_kwargs,
+    }
+    if system_prompt is not None:
+        request["system_prompt"] = system_prompt
+    if json_schema is not None:
+        request["json_schema"] = json_schema
+    return await LLMBatchBroker._query_within(client.query(**request), timeout_seconds, "LLM request")
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache for LLM responses.
+
+Evaluator, section and planner prompts are frequently re-sent verbatim: retries
+of a whole entity run, force-refreshed dossier sections, and discovery loops
+re-reading unchanged pages. ``LLMResponseCache`` stores successful responses in
+a local SQLite file keyed by a hash of everything that determines the request
+(provider, model, system prompt, prompt, schema, max_tokens), so a replay is a
+local lookup instead of a provider round trip.
+
+Entries expire after a TTL and the store is trimmed to ``max_entries`` by
+least-recent access. The cache is deliberately synchronous: lookups are a
+single indexed read on a local file and run well under the latency of the
+request they replace.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_VERSION = 1
+
+
+@dataclass
+class LLMResponseCacheStats:
+    """Counters reported alongside the client's runtime diagnostics."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    expired: int = 0
+    evictions: int = 0
+    errors: int = 0
+    saved_input_tokens: int = 0
+    saved_output_tokens: int = 0
+    saved_latency_seconds: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        payload = asdict(self)
+        payload["hit_rate"] = round(self.hit_rate, 4)
+        payload["saved_latency_seconds"] = round(self.saved_latency_seconds, 3)
+        return payload
+
+
+def _token_count(value: Any) -> int:
+    try:
+        return max(0, int(value or 0))
+    except (TypeError, ValueError):
+        return 0
+
+
+class LLMResponseCache:
+    """
+    Persistent, TTL- and size-bounded store of LLM responses.
+
+    ``path`` may be ``":memory:"`` for a process-local cache. The connection is
+    opened lazily so constructing a client never touches the filesystem.
+    """
+
+    def __init__(self, *, path: str, ttl_seconds: float, max_entries: int):
+        self.path = str(path or ":memory:")
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self.max_entries = max(1, int(max_entries))
+        self.stats = LLMResponseCacheStats()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._entry_count: Optional[int] = None
+
+    @staticmethod
+    def build_key(**parts: Any) -> str:
+        """Hash the request parts into a stable cache key."""
+        canonical = json.dumps(
+            {"v": CACHE_KEY_VERSION, **parts},
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            if self.path != ":memory:":
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_response_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    response_json TEXT NOT NULL,
+                    model TEXT,
+                    input_tokens INTEGER DEFAULT 0,
+                    output_tokens INTEGER DEFAULT 0,
+                    latency_seconds REAL DEFAULT 0,
+                    created_at REAL NOT NULL,
+                    last_access_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_llm_response_cache_last_access "
+                "ON llm_response_cache(last_access_at)"
+            )
+            conn.commit()
+            self._conn = conn
+            self._entry_count = conn.execute("SELECT COUNT(*) FROM llm_response_cache").fetchone()[0]
+        return self._conn
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a fresh copy of the cached response, or None on miss/expiry."""
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connection()
+                row = conn.execute(
+                    "SELECT response_json, input_tokens, output_tokens, latency_seconds, created_at "
+                    "FROM llm_response_cache WHERE cache_key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    self.stats.misses += 1
+                    return None
+                response_json, input_tokens, output_tokens, latency_seconds, created_at = row
+                if self.ttl_seconds and now - float(created_at) > self.ttl_seconds:
+                    conn.execute("DELETE FROM llm_response_cache WHERE cache_key = ?", (key,))
+                    conn.commit()
+                    self._entry_count = max(0, (self._entry_count or 1) - 1)
+                    self.stats.expired += 1
+                    self.stats.misses += 1
+                    return None
+                conn.execute(
+                    "UPDATE llm_response_cache SET last_access_at = ? WHERE cache_key = ?",
+                    (now, key),
+                )
+                conn.commit()
+                self.stats.hits += 1
+                self.stats.saved_input_tokens += _token_count(input_tokens)
+                self.stats.saved_output_tokens += _token_count(output_tokens)
+                self.stats.saved_latency_seconds += float(latency_seconds or 0.0)
+        except sqlite3.Error as error:
+            self.stats.errors += 1
+            logger.warning("LLM response cache read failed: %s", error)
+            return None
+
+        response = json.loads(response_json)
+        response["response_cache"] = {
+            "hit": True,
+            "key": key[:16],
+            "age_seconds": round(max(0.0, now - float(created_at)), 3),
+        }
+        return response
+
+    def put(self, key: str, response: Dict[str, Any], *, latency_seconds: float = 0.0) -> bool:
+        """Store ``response`` under ``key``; returns False if it cannot be serialized or written."""
+        try:
+            response_json = json.dumps(response, default=str)
+        except (TypeError, ValueError) as error:
+            self.stats.errors += 1
+            logger.debug("LLM response not cacheable: %s", error)
+            return False
+        tokens = response.get("tokens_used") if isinstance(response.get("tokens_used"), dict) else {}
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connection()
+                existed = conn.execute(
+                    "SELECT 1 FROM llm_response_cache WHERE cache_key = ?", (key,)
+                ).fetchone() is not None
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_response_cache "
+                    "(cache_key, response_json, model, input_tokens, output_tokens, latency_seconds, created_at, last_access_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        response_json,
+                        str(response.get("model_used") or ""),
+                        _token_count(tokens.get("input_tokens")),
+                        _token_count(tokens.get("output_tokens")),
+                        max(0.0, float(latency_seconds or 0.0)),
+                        now,
+                        now,
+                    ),
+                )
+                if not existed:
+                    self._entry_count = (self._entry_count or 0) + 1
+                self._evict_locked(conn, now)
+                conn.commit()
+                self.stats.stores += 1
+        except sqlite3.Error as error:
+            self.stats.errors += 1
+            logger.warning("LLM response cache write failed: %s", error)
+            return False
+        return True
+
+    def _evict_locked(self, conn: sqlite3.Connection, now: float) -> None:
+        if (self._entry_count or 0) <= self.max_entries:
+            return
+        if self.ttl_seconds:
+            expired = conn.execute(
+                "DELETE FROM llm_response_cache WHERE created_at < ?",
+                (now - self.ttl_seconds,),
+            ).rowcount
+            self.stats.expired += max(0, expired)
+            self._entry_count = max(0, (self._entry_count or 0) - max(0, expired))
+        overflow = (self._entry_count or 0) - self.max_entries
+        if overflow > 0:
+            evicted = conn.execute(
+                "DELETE FROM llm_response_cache WHERE cache_key IN ("
+                "SELECT cache_key FROM llm_response_cache ORDER BY last_access_at ASC LIMIT ?)",
+                (overflow,),
+            ).rowcount
+            self.stats.evictions += max(0, evicted)
+            self._entry_count = max(0, (self._entry_count or 0) - max(0, evicted))
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM llm_response_cache")
+            conn.commit()
+            self._entry_count = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            **self.stats.to_dict(),
+            "entries": self._entry_count or 0,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+Process-wide, priority-aware scheduler for LLM provider requests.
+
+Every ``ClaudeClient`` paces itself, but the chat/outreach APIs, the dossier
+batch generator, exploration cycles and pipeline runs each hold their own
+client, so a nightly batch can fill the provider's rate budget and push
+interactive requests into the same 429 cooldowns. ``LLMScheduler`` sits in
+front of every provider attempt in the process:
+
+- a token bucket models the provider's sustained request rate and burst, and a
+  concurrency cap (with slots reserved for interactive traffic) models its
+  parallel-request limit;
+- waiting requests are served by priority class (interactive, standard, bulk)
+  and, within a class, by start-time fair queueing across tenants weighted by
+  ``LLM_SCHEDULER_TENANT_WEIGHTS``;
+- while a client reports a rate-limit cooldown, bulk requests are deferred to
+  the end of the cooldown, or shed with ``LLMAdmissionRejected`` once the
+  deferred bulk queue is full;
+- queue-wait samples are kept per class for diagnostics.
+
+Callers tag work with ``llm_priority(...)``, which sets a context variable
+that the client reads when it asks for a slot.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import heapq
+import itertools
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_STANDARD = "standard"
+PRIORITY_BULK = "bulk"
+PRIORITY_CLASSES: Tuple[str, ...] = (PRIORITY_INTERACTIVE, PRIORITY_STANDARD, PRIORITY_BULK)
+
+DEFAULT_TENANT = "default"
+
+_current_priority: contextvars.ContextVar[Tuple[str, str]] = contextvars.ContextVar(
+    "llm_priority",
+    default=(PRIORITY_STANDARD, DEFAULT_TENANT),
+)
+
+
+class LLMAdmissionRejected(RuntimeError):
+    """Raised when bulk work is shed during a provider rate-limit cooldown."""
+
+
+def _normalize_priority(priority_class: Optional[str]) -> str:
+    normalized = str(priority_class or PRIORITY_STANDARD).strip().lower()
+    return normalized if normalized in PRIORITY_CLASSES else PRIORITY_STANDARD
+
+
+class llm_priority:
+    """
+    Tag LLM work issued inside a block or coroutine with a priority class.
+
+    Usable as ``with llm_priority(PRIORITY_BULK, tenant="batch_dossier"):`` or
+    as a decorator on ``async def`` functions. Tasks created inside inherit
+    the tag through the copied context.
+    """
+
+    def __init__(self, priority_class: str, tenant: str = DEFAULT_TENANT):
+        self.value = (_normalize_priority(priority_class), str(tenant or DEFAULT_TENANT))
+        self._tokens: List[contextvars.Token] = []
+
+    def __enter__(self) -> "llm_priority":
+        self._tokens.append(_current_priority.set(self.value))
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        _current_priority.reset(self._tokens.pop())
+
+    def __call__(self, func: Callable) -> Callable:
+        value = self.value
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            token = _current_priority.set(value)
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                _current_priority.reset(token)
+
+        return wrapper
+
+
+def current_llm_priority() -> Tuple[str, str]:
+    return _current_priority.get()
+
+
+class TokenBucket:
+    """Request-rate model: ``rate_per_second`` refill up to ``capacity`` tokens."""
+
+    def __init__(self, rate_per_second: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        self.rate_per_second = max(0.0, float(rate_per_second))
+        self.capacity = max(1.0, float(capacity))
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        if self.rate_per_second > 0:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_per_second)
+        self._updated = now
+
+    def seconds_until_available(self) -> float:
+        if self.rate_per_second <= 0:
+            return 0.0
+        self._refill()
+        if self._tokens >= 1.0:
+            return 0.0
+        return (1.0 - self._tokens) / self.rate_per_second
+
+    def take(self) -> None:
+        if self.rate_per_second <= 0:
+            return
+        self._refill()
+        self._tokens -= 1.0
+
+
+@dataclass
+class _Waiter:
+    priority: str
+    tenant: str
+    start_tag: float
+    finish_tag: float
+    enqueued_at: float
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future
+    granted: bool = False
+    cancelled: bool = False
+
+
+@dataclass
+class _ClassMetrics:
+    admitted: int = 0
+    shed: int = 0
+    deferred: int = 0
+    max_wait_seconds: float = 0.0
+    total_wait_seconds: float = 0.0
+    waits: Deque[float] = field(default_factory=lambda: deque(maxlen=512))
+
+    def record_wait(self, seconds: float) -> None:
+        self.admitted += 1
+        self.total_wait_seconds += seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+        self.waits.append(seconds)
+
+    def to_dict(self, queued: int) -> Dict[str, Any]:
+        ordered = sorted(self.waits)
+
+        def _pct(q: float) -> float:
+            if not ordered:
+                return 0.0
+            return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 4)
+
+        return {
+            "admitted": self.admitted,
+            "shed": self.shed,
+            "deferred": self.deferred,
+            "queued": queued,
+            "avg_wait_seconds": round(self.total_wait_seconds / self.admitted, 4) if self.admitted else 0.0,
+            "p50_wait_seconds": _pct(0.5),
+            "p95_wait_seconds": _pct(0.95),
+            "max_wait_seconds": round(self.max_wait_seconds, 4),
+        }
+
+
+def _parse_tenant_weights(raw: str) -> Dict[str, float]:
+    weights: Dict[str, float] = {}
+    for part in str(raw or "").split(","):
+        name, _, value = part.partition(":")
+        name = name.strip()
+        if not name:
+            continue
+        try:
+            weights[name] = max(0.01, float(value))
+        except ValueError:
+            continue
+    return weights
+
+
+class LLMScheduler:
+    """Admission control and fair queueing for provider requests."""
+
+    def __init__(
+        self,
+        *,
+        rate_per_second: float = 2.0,
+        burst: float = 4.0,
+        max_concurrency: int = 4,
+        interactive_reserved: int = 1,
+        tenant_weights: Optional[Dict[str, float]] = None,
+        bulk_max_deferred: int = 64,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.interactive_reserved = min(max(0, int(interactive_reserved)), self.max_concurrency - 1)
+        self.tenant_weights = dict(tenant_weights or {})
+        self.bulk_max_deferred = max(0, int(bulk_max_deferred))
+        self._clock = clock
+        self._bucket = TokenBucket(rate_per_second, burst, clock=clock)
+        self._lock = threading.Lock()
+        self._sequence = itertools.count()
+        self._queues: Dict[str, List[Tuple[float, int, _Waiter]]] = {name: [] for name in PRIORITY_CLASSES}
+        self._queued: Dict[str, int] = {name: 0 for name in PRIORITY_CLASSES}
+        self._virtual_time: Dict[str, float] = {name: 0.0 for name in PRIORITY_CLASSES}
+        self._tenant_finish: Dict[Tuple[str, str], float] = {}
+        self._metrics: Dict[str, _ClassMetrics] = {name: _ClassMetrics() for name in PRIORITY_CLASSES}
+        self._in_flight = 0
+        self._cooldown_until = 0.0
+        self._wakeup_at: Optional[float] = None
+
+    @classmethod
+    def from_env(cls) -> "LLMScheduler":
+        return cls(
+            rate_per_second=float(os.getenv("LLM_SCHEDULER_RATE_PER_SECOND", "2.0")),
+            burst=float(os.getenv("LLM_SCHEDULER_BURST", "4")),
+            max_concurrency=max(1, int(os.getenv("LLM_SCHEDULER_MAX_CONCURRENCY", "4"))),
+            interactive_reserved=max(0, int(os.getenv("LLM_SCHEDULER_INTERACTIVE_RESERVED", "1"))),
+            tenant_weights=_parse_tenant_weights(
+                os.getenv("LLM_SCHEDULER_TENANT_WEIGHTS", "chat:4,outreach:4,dossiers:2,pipeline:1,batch_dossier:1,exploration:1")
+            ),
+            bulk_max_deferred=max(0, int(os.getenv("LLM_SCHEDULER_BULK_MAX_DEFERRED", "64"))),
+        )
+
+    # -- admission -------------------------------------------------------
+
+    def note_cooldown(self, seconds: float) -> None:
+        """Record a provider rate-limit cooldown reported by any client."""
+        if seconds <= 0:
+            return
+        with self._lock:
+            self._cooldown_until = max(self._cooldown_until, self._clock() + float(seconds))
+
+    def cooldown_remaining(self) -> float:
+        return max(0.0, self._cooldown_until - self._clock())
+
+    async def acquire(self, priority_class: Optional[str] = None, tenant: Optional[str] = None) -> None:
+        """Wait for a provider slot; pair with ``release()``."""
+        if priority_class is None or tenant is None:
+            context_priority, context_tenant = current_llm_priority()
+            priority_class = priority_class or context_priority
+            tenant = tenant or context_tenant
+        priority = _normalize_priority(priority_class)
+        tenant = str(tenant or DEFAULT_TENANT)
+        loop = asyncio.get_running_loop()
+
+        with self._lock:
+            now = self._clock()
+            if priority == PRIORITY_BULK and self._cooldown_until > now:
+                if self._queued[PRIORITY_BULK] >= self.bulk_max_deferred:
+                    self._metrics[PRIORITY_BULK].shed += 1
+                    raise LLMAdmissionRejected(
+                        f"bulk LLM request shed during provider cooldown ({self._cooldown_until - now:.1f}s remaining)"
+                    )
+                self._metrics[PRIORITY_BULK].deferred += 1
+            weight = self.tenant_weights.get(tenant, 1.0)
+            start_tag = max(self._virtual_time[priority], self._tenant_finish.get((priority, tenant), 0.0))
+            finish_tag = start_tag + 1.0 / weight
+            self._tenant_finish[(priority, tenant)] = finish_tag
+            waiter = _Waiter(
+                priority=priority,
+                tenant=tenant,
+                start_tag=start_tag,
+                finish_tag=finish_tag,
+                enqueued_at=now,
+                loop=loop,
+                future=loop.create_future(),
+            )
+            heapq.heappush(self._queues[priority], (finish_tag, next(self._sequence), waiter))
+            self._queued[priority] += 1
+            self._dispatch_locked()
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter.granted:
+                    # Granted just as the caller gave up; hand the slot back.
+                    self._in_flight = max(0, self._in_flight - 1)
+                elif not waiter.cancelled:
+                    waiter.cancelled = True
+                    self._queued[priority] -= 1
+                self._dispatch_locked()
+            raise
+
+    def release(self) -> None:
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._dispatch_locked()
+
+    @asynccontextmanager
+    async def slot(self, priority_class: Optional[str] = None, tenant: Optional[str] = None):
+        await self.acquire(priority_class, tenant)
+        try:
+            yield
+        finally:
+            self.release()
+
+    # -- dispatch --------------------------------------------------------
+
+    def _eligible_head(self, priority: str, now: float) -> Optional[_Waiter]:
+        queue = self._queues[priority]
+        while queue and queue[0][2].cancelled:
+            heapq.heappop(queue)
+        if not queue:
+            return None
+        if priority == PRIORITY_BULK and self._cooldown_until > now:
+            return None
+        if priority != PRIORITY_INTERACTIVE and self._in_flight >= self.max_concurrency - self.interactive_reserved:
+            return None
+        return queue[0][2]
+
+    def _dispatch_locked(self) -> None:
+        while self._in_flight < self.max_concurrency:
+            now = self._clock()
+            waiter = None
+            for priority in PRIORITY_CLASSES:
+                waiter = self._eligible_head(priority, now)
+                if waiter is not None:
+                    break
+            if waiter is None:
+                if self._queued[PRIORITY_BULK] and self._cooldown_until > now:
+                    self._schedule_wakeup(self._cooldown_until - now)
+                return
+            wait_for_token = self._bucket.seconds_until_available()
+            if wait_for_token > 0:
+                self._schedule_wakeup(wait_for_token)
+                return
+            self._bucket.take()
+            heapq.heappop(self._queues[waiter.priority])
+            self._queued[waiter.priority] -= 1
+            self._virtual_time[waiter.priority] = max(self._virtual_time[waiter.priority], waiter.start_tag)
+            self._in_flight += 1
+            waiter.granted = True
+            self._metrics[waiter.priority].record_wait(max(0.0, now - waiter.enqueued_at))
+            waiter.loop.call_soon_threadsafe(self._grant, waiter.future)
+
+    @staticmethod
+    def _grant(future: asyncio.Future) -> None:
+        if not future.done():
+            future.set_result(None)
+
+    def _schedule_wakeup(self, delay: float) -> None:
+        now = self._clock()
+        due = now + delay
+        # A wakeup already due in the past never fired (its loop went away).
+        if self._wakeup_at is not None and now < self._wakeup_at <= due:
+            return
+        loop = next(
+            (
+                entry[2].loop
+                for queue in self._queues.values()
+                for entry in queue
+                if not entry[2].cancelled and not entry[2].loop.is_closed()
+            ),
+            None,
+        )
+        if loop is None:
+            return
+        self._wakeup_at = due
+        loop.call_soon_threadsafe(loop.call_later, max(0.0, delay), self._on_wakeup)
+
+    def _on_wakeup(self) -> None:
+        with self._lock:
+            self._wakeup_at = None
+            self._dispatch_locked()
+
+    # -- diagnostics -----------------------------------------------------
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "in_flight": self._in_flight,
+                "max_concurrency": self.max_concurrency,
+                "interactive_reserved": self.interactive_reserved,
+                "cooldown_remaining_seconds": round(self.cooldown_remaining(), 3),
+                "classes": {
+                    name: self._metrics[name].to_dict(self._queued[name]) for name in PRIORITY_CLASSES
+                },
+            }
+
+
+_scheduler: Optional[LLMScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_llm_scheduler() -> Optional[LLMScheduler]:
+    """Return the process-wide scheduler, or None when LLM_SCHEDULER_ENABLED is off."""
+    global _scheduler
+    if str(os.getenv("LLM_SCHEDULER_ENABLED", "false")).strip().lower() not in {"1", "true", "yes", "on"}:
+        return None
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = LLMScheduler.from_env()
+        return _scheduler
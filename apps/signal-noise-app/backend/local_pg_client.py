@@ -508,6 +508,29 @@ class LocalPgRpc:
                 rows = cur.fetchall()
         return LocalPgResponse(_serialize_rows(rows))
 
+    def _execute_compare_and_swap_pipeline_control_state(self) -> LocalPgResponse:
+        row_id = str(self.params.get("row_id") or "")
+        expected_version = int(self.params.get("expected_version") or 0)
+        state = self.params.get("state") if isinstance(self.params.get("state"), dict) else {}
+        updated_at = self.params.get("updated_at") or datetime.now().astimezone().isoformat()
+        with self.client._connect() as conn:
+            with conn.cursor() as cur:
+                # Version 0 means "no row yet": the insert wins, any existing row is a conflict.
+                cur.execute(
+                    """
+                    INSERT INTO pipeline_control_state (id, state, updated_at)
+                    VALUES (%s, %s, %s::timestamptz)
+                    ON CONFLICT (id) DO UPDATE
+                    SET state = EXCLUDED.state,
+                        updated_at = EXCLUDED.updated_at
+                    WHERE pipeline_control_state.version = %s
+                    RETURNING id, version, updated_at
+                    """,
+                    [row_id, Jsonb(state), updated_at, expected_version],
+                )
+                rows = cur.fetchall()
+        return LocalPgResponse(_serialize_rows(rows))
+
     def _execute_fail_entity_pipeline_run(self) -> LocalPgResponse:
         batch_id = str(self.params.get("batch_id") or "")
         entity_id = str(self.params.get("entity_id") or "")
@@ -74,6 +74,10 @@ try:
     from backend.legacy_llm_disabled_client import LegacyLLMDisabledClient
 except ImportError:
     from legacy_llm_disabled_client import LegacyLLMDisabledClient
+try:
+    from backend.llm_scheduler import PRIORITY_BULK, PRIORITY_INTERACTIVE, PRIORITY_STANDARD, llm_priority
+except ImportError:
+    from llm_scheduler import PRIORITY_BULK, PRIORITY_INTERACTIVE, PRIORITY_STANDARD, llm_priority
 
 PipelinePhaseCallback = Callable[[str, Dict[str, Any]], Awaitable[None]]
 _pipeline_phase_callback_ctx: ContextVar[Optional[PipelinePhaseCallback]] = ContextVar(
@@ -145,6 +149,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Route prefix -> (LLM priority class, scheduler tenant) for provider calls made while serving it.
+LLM_ROUTE_PRIORITIES = (
+    ("/api/chat", PRIORITY_INTERACTIVE, "chat"),
+    ("/api/dossier-outreach-intelligence", PRIORITY_INTERACTIVE, "outreach"),
+    ("/api/dossiers/generate", PRIORITY_STANDARD, "dossiers"),
+    ("/api/pipeline/run-entity", PRIORITY_BULK, "pipeline"),
+)
+
+
+@app.middleware("http")
+async def llm_priority_middleware(request: Request, call_next):
+    path = request.url.path
+    for prefix, priority_class, tenant in LLM_ROUTE_PRIORITIES:
+        if path.startswith(prefix):
+            with llm_priority(priority_class, tenant=tenant):
+                return await call_next(request)
+    return await call_next(request)
+
 # Mount BrightData FastMCP service on /mcp so OpenCode can connect
 try:
     from backend.brightdata_fastmcp_service import mcp as brightdata_mcp
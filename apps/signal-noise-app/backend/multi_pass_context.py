@@ -21,14 +21,49 @@ Usage:
     )
 """
 
+import asyncio
 import logging
+import os
+import time
+import weakref
+from collections import OrderedDict
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+GRAPH_CONTEXT_CACHE_MAX_ENTRIES = int(os.getenv("MULTI_PASS_GRAPH_CACHE_MAX_ENTRIES", "512"))
+GRAPH_CONTEXT_CACHE_TTL_SECONDS = float(os.getenv("MULTI_PASS_GRAPH_CACHE_TTL_SECONDS", "900"))
+GRAPH_CONTEXT_BATCH_SIZE = int(os.getenv("MULTI_PASS_GRAPH_BATCH_SIZE", "50"))
+GRAPH_CONTEXT_NEIGHBOUR_LIMIT = 20
+
+# One round trip per cohort: partners (with their tech, for network
+# hypotheses), competitors and technology stack, matched on the indexed
+# Entity.id property instead of an unlabeled scan.
+GRAPH_CONTEXT_BATCH_QUERY = """
+    UNWIND $entity_ids AS entity_id
+    MATCH (e {id: entity_id})
+    OPTIONAL MATCH (e)-[:PARTNER_OF]-(partner:Entity)
+    OPTIONAL MATCH (partner)-[:USES]->(partner_tech:Technology)
+    WITH e, partner, collect(DISTINCT partner_tech.name) AS partner_stack
+    WITH e, collect({id: partner.id, name: partner.name, technology_stack: partner_stack})[..$limit] AS partners
+    OPTIONAL MATCH (e)-[:COMPETES_WITH]-(competitor:Entity)
+    WITH e, partners, collect(DISTINCT {id: competitor.id, name: competitor.name})[..$limit] AS competitors
+    OPTIONAL MATCH (e)-[:USES]->(tech:Technology)
+    RETURN e.id AS entity_id,
+           partners,
+           competitors,
+           collect(DISTINCT tech.name)[..$limit] AS technology_stack
+"""
+
+ENTITY_ID_INDEX_QUERY = "CREATE INDEX FOR (e:Entity) ON (e.id)"
+
+# Every live cache, so graph write paths can invalidate without holding a
+# reference to each MultiPassContext
+_graph_context_caches: "weakref.WeakSet[GraphContextCache]" = weakref.WeakSet()
+
 
 class HopType(str, Enum):
     """Types of hops in discovery"""
@@ -94,6 +129,101 @@ class PassResult:
     iteration_count: int = 0
 
 
+class GraphContextCache:
+    """
+    Size- and TTL-bounded LRU cache of NetworkContext by entity id.
+
+    Invalidating an entity also drops any cached neighbour whose context
+    references it, since relationship edges are shared by both endpoints.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = GRAPH_CONTEXT_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = GRAPH_CONTEXT_CACHE_TTL_SECONDS,
+    ):
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = float(ttl_seconds)
+        self._entries: "OrderedDict[str, Tuple[NetworkContext, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        _graph_context_caches.add(self)
+
+    def get(self, entity_id: str) -> Optional[NetworkContext]:
+        entry = self._entries.get(entity_id)
+        if entry is None:
+            self.misses += 1
+            return None
+        context, stored_at = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[entity_id]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(entity_id)
+        self.hits += 1
+        return context
+
+    def set(self, entity_id: str, context: NetworkContext) -> None:
+        self._entries[entity_id] = (context, time.monotonic())
+        self._entries.move_to_end(entity_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, entity_id: str) -> int:
+        """Drop an entity and every cached context that links to it."""
+        stale = [entity_id] if entity_id in self._entries else []
+        for cached_id, (context, _) in self._entries.items():
+            if cached_id == entity_id:
+                continue
+            neighbours = context.partners + context.competitors + context.suppliers
+            if any(neighbour.get('id') == entity_id for neighbour in neighbours):
+                stale.append(cached_id)
+        for cached_id in stale:
+            del self._entries[cached_id]
+        return len(stale)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __contains__(self, entity_id: str) -> bool:
+        return self.get(entity_id) is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl_seconds,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+
+def invalidate_cached_graph_context(*entity_ids: str) -> int:
+    """
+    Drop cached graph context for entities whose relationships changed
+
+    Called from the graph write paths (relationship, entity and episode
+    writes) and applied to every live GraphContextCache.
+
+    Returns:
+        Number of cached contexts dropped
+    """
+    dropped = 0
+    for cache in list(_graph_context_caches):
+        for entity_id in entity_ids:
+            if entity_id:
+                dropped += cache.invalidate(entity_id)
+    return dropped
+
+
 class MultiPassContext:
     """
     Manages context and strategy across multiple discovery passes
@@ -109,11 +239,13 @@ class MultiPassContext:
         """Initialize context manager"""
         self.pass_history: Dict[int, PassResult] = {}
         self.temporal_patterns: Dict[str, TemporalPatterns] = {}
-        self.graph_context: Dict[str, NetworkContext] = {}
+        self.graph_context = GraphContextCache()
 
         # Initialize services (lazy loading)
         self._graphiti_service = None
         self._falkordb_client = None
+        self._falkordb_init_lock = asyncio.Lock()
+        self._entity_index_ensured = False
 
         logger.info("🔄 MultiPassContext initialized")
 
@@ -448,85 +580,115 @@ class MultiPassContext:
         Returns:
             Network context for the entity
         """
-        # Check cache first
-        if entity_id in self.graph_context:
-            return self.graph_context[entity_id]
-
-        context = NetworkContext()
-
-        try:
-            # Initialize FalkorDB client
-            if not self._falkordb_client:
-                from falkordb_client import FalkorDBClient
-                self._falkordb_client = FalkorDBClient()
-                await self._falkordb_client.initialize()
-
-            # Get partners
-            context.partners = await self._get_partners(entity_id)
-
-            # Get competitors
-            context.competitors = await self._get_competitors(entity_id)
+        contexts = await self.get_graph_contexts([entity_id])
+        return contexts[entity_id]
 
-            # Get technology stack
-            context.technology_stack = await self._get_technology_stack(entity_id)
+    async def get_graph_contexts(self, entity_ids: Iterable[str]) -> Dict[str, NetworkContext]:
+        """
+        Get graph relationships for a cohort of entities
 
-            # Generate network hypotheses
-            context.network_hypotheses = await self._generate_network_hypotheses(
-                entity_id,
-                context
-            )
+        Cached contexts are served directly; the remainder is loaded in
+        chunks of GRAPH_CONTEXT_BATCH_SIZE, one query per chunk, with the
+        chunks running concurrently.
 
-            logger.info(f"🕸️ Loaded graph context: {len(context.partners)} partners, "
-                       f"{len(context.competitors)} competitors for {entity_id}")
+        Args:
+            entity_ids: Entity identifiers
 
-        except Exception as e:
-            logger.warning(f"⚠️ Could not load graph context: {e}")
+        Returns:
+            Network context per requested entity id
+        """
+        requested = list(dict.fromkeys(entity_ids))
+        contexts: Dict[str, NetworkContext] = {}
+        missing: List[str] = []
+        for entity_id in requested:
+            cached = self.graph_context.get(entity_id)
+            if cached is not None:
+                contexts[entity_id] = cached
+            else:
+                missing.append(entity_id)
+
+        if missing:
+            chunks = [
+                missing[start:start + GRAPH_CONTEXT_BATCH_SIZE]
+                for start in range(0, len(missing), GRAPH_CONTEXT_BATCH_SIZE)
+            ]
+            loaded = await asyncio.gather(*(self._load_graph_context_chunk(chunk) for chunk in chunks))
+            for chunk_contexts in loaded:
+                contexts.update(chunk_contexts)
 
-        # Cache and return
-        self.graph_context[entity_id] = context
-        return context
+        return {entity_id: contexts[entity_id] for entity_id in requested}
 
-    async def _get_partners(self, entity_id: str) -> List[Dict]:
-        """Get partner entities"""
-        if not self._falkordb_client:
-            return []
+    def invalidate_graph_context(self, entity_id: str) -> None:
+        """Forget cached graph context after an entity's relationships change"""
+        dropped = self.graph_context.invalidate(entity_id)
+        if dropped:
+            logger.debug(f"🕸️ Invalidated {dropped} cached graph context(s) for {entity_id}")
 
-        try:
-            # Query for PARTNER_OF relationships
-            query = """
-                MATCH (e {id: $entity_id})-[:PARTNER_OF]-(partner:Entity)
-                RETURN partner
-                LIMIT 20
-            """
+    async def _get_falkordb_client(self):
+        """Initialize the FalkorDB client once and make sure Entity.id is indexed"""
+        if self._falkordb_client and self._entity_index_ensured:
+            return self._falkordb_client
 
-            results = await self._falkordb_client.execute_query(query, {'entity_id': entity_id})
+        async with self._falkordb_init_lock:
+            if not self._falkordb_client:
+                from falkordb_client import FalkorDBClient
+                client = FalkorDBClient()
+                await client.initialize()
+                self._falkordb_client = client
 
-            return [{'name': r.get('name'), 'id': r.get('id')} for r in results]
+            if not self._entity_index_ensured:
+                try:
+                    await self._falkordb_client.execute_query(ENTITY_ID_INDEX_QUERY, {})
+                except Exception as e:
+                    # Already indexed (or index DDL unsupported) - lookups still work
+                    logger.debug(f"Entity.id index not created: {e}")
+                self._entity_index_ensured = True
 
-        except Exception as e:
-            logger.warning(f"⚠️ Could not get partners: {e}")
-            return []
+        return self._falkordb_client
 
-    async def _get_competitors(self, entity_id: str) -> List[Dict]:
-        """Get competitor entities"""
-        if not self._falkordb_client:
-            return []
+    async def _load_graph_context_chunk(self, entity_ids: List[str]) -> Dict[str, NetworkContext]:
+        """Load and cache graph context for one chunk of entities in a single query"""
+        contexts = {entity_id: NetworkContext() for entity_id in entity_ids}
 
         try:
-            # Query for COMPETES_WITH relationships
-            query = """
-                MATCH (e {id: $entity_id})-[:COMPETES_WITH]-(competitor:Entity)
-                RETURN competitor
-                LIMIT 20
-            """
-
-            results = await self._falkordb_client.execute_query(query, {'entity_id': entity_id})
+            client = await self._get_falkordb_client()
+            rows = await client.execute_query(
+                GRAPH_CONTEXT_BATCH_QUERY,
+                {'entity_ids': entity_ids, 'limit': GRAPH_CONTEXT_NEIGHBOUR_LIMIT},
+            )
+        except Exception as e:
+            # Not cached: a transient outage should not pin empty context for the TTL
+            logger.warning(f"⚠️ Could not load graph context: {e}")
+            return contexts
+
+        for row in rows or []:
+            entity_id = row.get('entity_id')
+            if entity_id not in contexts:
+                continue
+            context = contexts[entity_id]
+            context.partners = [
+                {
+                    'name': partner.get('name'),
+                    'id': partner.get('id'),
+                    'technology_stack': [tech for tech in partner.get('technology_stack') or [] if tech],
+                }
+                for partner in row.get('partners') or []
+                if partner and partner.get('id')
+            ]
+            context.competitors = [
+                {'name': competitor.get('name'), 'id': competitor.get('id')}
+                for competitor in row.get('competitors') or []
+                if competitor and competitor.get('id')
+            ]
+            context.technology_stack = [tech for tech in row.get('technology_stack') or [] if tech]
 
-            return [{'name': r.get('name'), 'id': r.get('id')} for r in results]
+        for entity_id, context in contexts.items():
+            context.network_hypotheses = await self._generate_network_hypotheses(entity_id, context)
+            self.graph_context.set(entity_id, context)
+            logger.info(f"🕸️ Loaded graph context: {len(context.partners)} partners, "
+                       f"{len(context.competitors)} competitors for {entity_id}")
 
-        except Exception as e:
-            logger.warning(f"⚠️ Could not get competitors: {e}")
-            return []
+        return contexts
 
     async def _get_technology_stack(self, entity_id: str) -> List[str]:
         """Get entity's technology stack"""
@@ -572,7 +734,9 @@ class MultiPassContext:
 
         # Technology diffusion from partners
         for partner in context.partners:
-            partner_tech = await self._get_technology_stack(partner.get('id'))
+            partner_tech = partner.get('technology_stack')
+            if partner_tech is None:
+                partner_tech = await self._get_technology_stack(partner.get('id'))
 
             for tech in partner_tech:
                 if 'react' in tech.lower() and 'react' not in str(context.technology_stack).lower():
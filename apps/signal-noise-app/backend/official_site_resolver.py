@@ -4,8 +4,13 @@
 from __future__ import annotations
 
 import re
-import urllib.parse
-from typing import Any, Dict, List, Sequence
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Sequence
+
+try:
+    from backend.url_features import url_features
+except ImportError:
+    from url_features import url_features
 
 
 _STOPWORDS = {
@@ -69,7 +74,8 @@ def _tokenize(value: str) -> List[str]:
     return [token for token in re.split(r"[^a-z0-9]+", value.lower()) if token]
 
 
-def _entity_aliases(entity_name: str) -> tuple[set[str], set[str], bool]:
+@lru_cache(maxsize=1024)
+def _entity_aliases(entity_name: str) -> tuple[FrozenSet[str], FrozenSet[str], bool]:
     tokens = _tokenize(entity_name)
     informative = [token for token in tokens if token not in _STOPWORDS and token not in _SUFFIX_TOKENS and len(token) >= 3]
     aliases: set[str] = set()
@@ -93,7 +99,7 @@ def _entity_aliases(entity_name: str) -> tuple[set[str], set[str], bool]:
         aliases.add(all_initials)
 
     entity_has_subbrand_terms = any(token in _SUBBRAND_TERMS for token in tokens)
-    return aliases, set(informative), entity_has_subbrand_terms
+    return frozenset(aliases), frozenset(informative), entity_has_subbrand_terms
 
 
 def _score_candidate(entity_name: str, candidate: Dict[str, Any], index: int) -> tuple[float, List[str]]:
@@ -101,23 +107,21 @@ def _score_candidate(entity_name: str, candidate: Dict[str, Any], index: int) ->
     if not url:
         return float("-inf"), ["missing_url"]
 
-    parsed = urllib.parse.urlparse(url)
-    host = (parsed.netloc or "").lower().strip()
-    if host.startswith("www."):
-        host = host[4:]
-    path = (parsed.path or "").strip("/")
-    domain_labels = [label for label in host.split(".") if label]
+    features = url_features(url)
+    host = features.host
+    path = features.path.strip("/")
+    domain_labels = features.labels
     domain_core = domain_labels[-2] if len(domain_labels) >= 2 else host
 
     title = str(candidate.get("title") or "").lower()
     snippet = str(candidate.get("snippet") or "").lower()
-    text = f"{url.lower()} {title} {snippet}"
+    text = f"{features.url_lower} {title} {snippet}"
     host_tokens = set(_tokenize(host))
 
-    aliases, informative_tokens, entity_has_subbrand_terms = _entity_aliases(entity_name)
+    aliases, informative_tokens, entity_has_subbrand_terms = _entity_aliases(str(entity_name or ""))
     host_compact = _to_alnum(host)
     domain_core_compact = _to_alnum(domain_core)
-    url_compact = _to_alnum(url)
+    url_compact = features.compact
     candidate_has_subbrand_terms = any(token in text for token in _SUBBRAND_TERMS)
 
     score = 0.0
@@ -161,7 +165,7 @@ def _score_candidate(entity_name: str, candidate: Dict[str, Any], index: int) ->
         score -= 10.0
         reasons.append("blocked_domain")
 
-    if path.lower().endswith(_BINARY_DOCUMENT_SUFFIXES):
+    if path.endswith(_BINARY_DOCUMENT_SUFFIXES):
         score -= 12.0
         reasons.append("binary_document")
 
@@ -184,10 +188,10 @@ def _score_candidate(entity_name: str, candidate: Dict[str, Any], index: int) ->
         score += 1.5
         reasons.append("root_path")
     else:
-        segments = [segment for segment in path.split("/") if segment]
+        segments = features.path_segments
         score -= min(len(segments), 4) * 0.6
         first_segment = segments[0] if segments else ""
-        path_tokens = set(_tokenize(path))
+        path_tokens = features.path_tokens
         if first_segment in {"news", "blog", "press", "updates", "fixtures", "results"}:
             score -= 1.5
             reasons.append("content_subpath")
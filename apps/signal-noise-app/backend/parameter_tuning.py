@@ -8,6 +8,8 @@ Features:
 - Configurable parameter dataclass
 - Grid search optimization
 - Bayesian optimization (optional)
+- Successive-halving search that prunes weak configs on a data fraction
+- Process-pool evaluation with NumPy-vectorized scoring over samples
 - Hold-out validation
 - Objective function with configurable rewards
 
@@ -17,10 +19,14 @@ Part of Phase 6: Production Rollout
 import logging
 import itertools
 import json
-from typing import Dict, List, Optional, Tuple, Any
+import math
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
-from copy import deepcopy
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -153,6 +159,146 @@ class TuningResult:
     iterations_completed: int = 0
 
 
+# Per-iteration cost used by the discovery simulation
+SIMULATED_ITERATION_COST_USD = 0.03
+
+
+@dataclass
+class SampleArrays:
+    """Validation samples in columnar form for vectorized scoring"""
+    has_signal: np.ndarray
+    actual_actionable: np.ndarray
+    actual_cost_usd: np.ndarray
+
+    @classmethod
+    def from_samples(cls, samples: List[Dict]) -> 'SampleArrays':
+        return cls(
+            has_signal=np.array([bool(s.get("has_signal", False)) for s in samples], dtype=bool),
+            actual_actionable=np.array([bool(s.get("actual_actionable", False)) for s in samples], dtype=bool),
+            actual_cost_usd=np.array([float(s.get("actual_cost_usd", 1.0)) for s in samples], dtype=float),
+        )
+
+    def __len__(self) -> int:
+        return int(self.has_signal.shape[0])
+
+    def head(self, n: int) -> 'SampleArrays':
+        return SampleArrays(self.has_signal[:n], self.actual_actionable[:n], self.actual_cost_usd[:n])
+
+
+def _iteration_limit(max_iterations: Any) -> int:
+    """
+    Number of iterations `_simulate_discovery` runs for a max_iterations value.
+
+    The loop runs while `iterations < max_iterations`, so a fractional limit
+    (e.g. from a continuous search space) allows ceil(max_iterations) iterations.
+    """
+    limit = float(max_iterations)
+    if not math.isfinite(limit):
+        raise ValueError(f"max_iterations must be finite, got {max_iterations!r}")
+    return max(0, math.ceil(limit))
+
+
+def _simulate_trajectory(config: ParameterConfig, has_signal: bool) -> Tuple[bool, float, float, int]:
+    """
+    Closed-form outcome of `ParameterTuner._simulate_discovery` for one class
+    of sample (with or without signal).
+
+    Running costs and confidences are accumulated sequentially like the
+    iterative simulation, so scores equal it within floating-point tolerance
+    (the final averaging sums in a different order).
+
+    Returns:
+        (actionable, cost_usd, confidence, iterations)
+    """
+    max_iterations = _iteration_limit(config.max_iterations)
+    if max_iterations == 0:
+        return False, 0.0, 0.0, 0
+
+    costs = np.add.accumulate(np.full(max_iterations, SIMULATED_ITERATION_COST_USD))
+    # Iteration i runs while the cost spent before it is under budget
+    cost_before = np.concatenate(([0.0], costs[:-1]))
+    allowed = np.nonzero(cost_before >= config.max_cost_per_entity_usd)[0]
+    budget_iterations = int(allowed[0]) if allowed.size else max_iterations
+    if budget_iterations == 0:
+        return False, 0.0, 0.0, 0
+
+    iteration_numbers = np.arange(1, budget_iterations + 1)
+    if has_signal:
+        accepts = iteration_numbers // 3
+        confidences = np.concatenate(
+            ([0.0], np.add.accumulate(np.full(int(accepts[-1]), config.accept_delta)))
+        )[accepts]
+        categories = (accepts >= 1).astype(int)
+    else:
+        accepts = np.zeros(budget_iterations, dtype=int)
+        confidences = np.zeros(budget_iterations)
+        categories = np.zeros(budget_iterations, dtype=int)
+
+    actionable_mask = (
+        (accepts >= config.actionable_min_accepts)
+        & (categories >= config.actionable_min_categories)
+        & (confidences >= 0.8)
+    )
+    hits = np.nonzero(actionable_mask)[0]
+    stop = int(hits[0]) if hits.size else budget_iterations - 1
+
+    return bool(actionable_mask[stop]), float(costs[stop]), float(confidences[stop]), stop + 1
+
+
+def score_config_vectorized(config: ParameterConfig, samples: SampleArrays) -> float:
+    """
+    Average reward of a config over samples, vectorized with NumPy.
+
+    Same reward schedule as `ParameterTuner._calculate_score`.
+    """
+    n = len(samples)
+    if n == 0:
+        return 0.0
+
+    signal_outcome = _simulate_trajectory(config, True)
+    quiet_outcome = _simulate_trajectory(config, False)
+
+    predicted_actionable = np.where(samples.has_signal, signal_outcome[0], quiet_outcome[0])
+    predicted_cost = np.where(samples.has_signal, signal_outcome[1], quiet_outcome[1])
+
+    correct = predicted_actionable == samples.actual_actionable
+    reward = np.where(correct, np.where(samples.actual_actionable, 10.0, 5.0), -5.0)
+
+    cost_diff = samples.actual_cost_usd - predicted_cost
+    reward = reward + np.where(cost_diff > 0, cost_diff * 500, cost_diff * 1000)
+
+    return float(reward.sum()) / n
+
+
+def _score_config_chunk(
+    base_config: Dict[str, Any],
+    param_names: List[str],
+    combinations: List[Tuple[Any, ...]],
+    samples: SampleArrays
+) -> List[Optional[Tuple[Dict[str, Any], float]]]:
+    """Score a chunk of grid combinations (runs in a pool worker)"""
+    scored: List[Optional[Tuple[Dict[str, Any], float]]] = []
+    for combination in combinations:
+        config_dict = dict(base_config)
+        config_dict.update(zip(param_names, combination))
+        config = ParameterConfig.from_dict(config_dict)
+        if not config.validate():
+            scored.append(None)
+            continue
+        scored.append((config_dict, score_config_vectorized(config, samples)))
+    return scored
+
+
+def _range_values(min_val: float, max_val: float, step: float) -> List[float]:
+    """Expand a (min, max, step) range the same way grid_search always has"""
+    values = []
+    current = min_val
+    while current <= max_val:
+        values.append(current)
+        current += step
+    return values
+
+
 class ParameterTuner:
     """
     Automated parameter tuning for hypothesis-driven discovery.
@@ -177,15 +323,22 @@ class ParameterTuner:
         self,
         param_ranges: Dict[str, Tuple[float, float, float]],
         n_samples: int = 10,
-        validation_split: float = 0.8
+        validation_split: float = 0.8,
+        max_workers: Optional[int] = None,
+        chunk_size: int = 256
     ) -> TuningResult:
         """
         Exhaustive grid search over parameter space.
 
+        Combinations are generated lazily and scored in chunks, across a
+        process pool when `max_workers` > 1.
+
         Args:
             param_ranges: Dict mapping parameter names to (min, max, step) tuples
             n_samples: Number of samples per parameter
             validation_split: Fraction of data to use for validation (rest for training)
+            max_workers: Worker processes for scoring (None/1 = in-process)
+            chunk_size: Combinations per scoring task
 
         Returns:
             TuningResult with best configuration
@@ -195,43 +348,28 @@ class ParameterTuner:
 
         # Split data into train/validation
         split_idx = int(len(self.validation_data) * validation_split)
-        train_data = self.validation_data[:split_idx]
         validation_data = self.validation_data[split_idx:]
+        samples = SampleArrays.from_samples(validation_data)
 
-        # Generate parameter combinations
         param_names = list(param_ranges.keys())
-        param_values = []
+        total = self.count_grid_combinations(param_ranges)
 
-        for param_name, (min_val, max_val, step) in param_ranges.items():
-            values = []
-            current = min_val
-            while current <= max_val:
-                values.append(current)
-                current += step
-            param_values.append(values)
-
-        # Cartesian product of all parameter combinations
-        combinations = list(itertools.product(*param_values))
-
-        logger.info(f"Testing {len(combinations)} parameter combinations")
+        logger.info(f"Testing {total} parameter combinations")
 
         best_score = float('-inf')
         best_config = None
         all_results = []
 
-        for i, combination in enumerate(combinations):
-            # Create config from combination
-            config_dict = self.current_config.to_dict()
-            for param_name, value in zip(param_names, combination):
-                config_dict[param_name] = value
-            config = ParameterConfig.from_dict(config_dict)
-
-            # Validate config
-            if not config.validate():
+        for i, scored in enumerate(self._score_grid(
+            param_names,
+            self._iter_param_grid(param_ranges),
+            samples,
+            max_workers=max_workers,
+            chunk_size=chunk_size
+        )):
+            if scored is None:
                 continue
-
-            # Calculate score on validation data
-            score = self._calculate_score(config, validation_data, train_data)
+            config_dict, score = scored
 
             all_results.append({
                 "config": config_dict,
@@ -241,7 +379,7 @@ class ParameterTuner:
             # Track best
             if score > best_score:
                 best_score = score
-                best_config = config
+                best_config = ParameterConfig.from_dict(config_dict)
                 logger.info(f"New best score: {score:.4f} at iteration {i+1}")
 
         duration = (datetime.now() - start_time).total_seconds()
@@ -251,21 +389,160 @@ class ParameterTuner:
             best_score=best_score,
             all_results=all_results,
             tuning_duration_seconds=duration,
-            iterations_completed=len(combinations)
+            iterations_completed=total
         )
 
         logger.info(
             f"Grid search completed: best_score={best_score:.4f}, "
-            f"iterations={len(combinations)}, duration={duration:.2f}s"
+            f"iterations={total}, duration={duration:.2f}s"
         )
 
         return result
 
+    def successive_halving_search(
+        self,
+        param_ranges: Dict[str, Tuple[float, float, float]],
+        eta: int = 3,
+        min_fraction: Optional[float] = None,
+        validation_split: float = 0.8,
+        max_workers: Optional[int] = None,
+        chunk_size: int = 256
+    ) -> TuningResult:
+        """
+        Grid search with successive-halving pruning.
+
+        Every combination is first scored on a small prefix of the
+        validation set; only the top 1/eta survive to the next rung, which
+        uses eta times more data, until the survivors see the full set.
+
+        Args:
+            param_ranges: Dict mapping parameter names to (min, max, step) tuples
+            eta: Pruning factor between rungs (keep top 1/eta)
+            min_fraction: Data fraction for the first rung (default 1/eta^2)
+            validation_split: Fraction of data to use for validation
+            max_workers: Worker processes for scoring (None/1 = in-process)
+            chunk_size: Combinations per scoring task
+
+        Returns:
+            TuningResult with best configuration; all_results holds the final rung
+        """
+        logger.info("Starting successive-halving parameter tuning")
+        start_time = datetime.now()
+        eta = max(2, int(eta))
+        if min_fraction is None:
+            min_fraction = 1.0 / (eta ** 2)
+        min_fraction = min(1.0, max(0.0, min_fraction))
+
+        split_idx = int(len(self.validation_data) * validation_split)
+        samples = SampleArrays.from_samples(self.validation_data[split_idx:])
+        n_total = len(samples)
+
+        param_names = list(param_ranges.keys())
+        total = self.count_grid_combinations(param_ranges)
+        logger.info(f"Testing {total} parameter combinations with eta={eta}")
+
+        fraction = min_fraction
+        candidates: Optional[List[Tuple[Any, ...]]] = None
+        evaluations = 0
+        ranked: List[Tuple[float, int, Tuple[Any, ...]]] = []
+
+        while True:
+            n_rung = n_total if fraction >= 1.0 else max(1, min(n_total, int(math.ceil(n_total * fraction))))
+            rung_samples = samples.head(n_rung)
+            source = self._iter_param_grid(param_ranges) if candidates is None else iter(candidates)
+            source, combos = itertools.tee(source)
+
+            ranked = []
+            for index, (combination, scored) in enumerate(zip(
+                combos,
+                self._score_grid(param_names, source, rung_samples, max_workers=max_workers, chunk_size=chunk_size)
+            )):
+                evaluations += 1
+                if scored is not None:
+                    ranked.append((scored[1], index, combination))
+
+            # Highest score first; earlier combinations win ties like grid_search
+            ranked.sort(key=lambda item: (-item[0], item[1]))
+            logger.info(f"Rung on {n_rung}/{n_total} samples: {len(ranked)} configs scored")
+
+            if n_rung >= n_total or len(ranked) <= 1:
+                break
+            keep = max(1, len(ranked) // eta)
+            candidates = [item[2] for item in ranked[:keep]]
+            fraction *= eta
+
+        duration = (datetime.now() - start_time).total_seconds()
+        base_config = self.current_config.to_dict()
+        final_results = [
+            {"config": {**base_config, **dict(zip(param_names, item[2]))}, "score": item[0]}
+            for item in ranked
+        ]
+        best = final_results[0] if final_results else None
+
+        result = TuningResult(
+            best_config=ParameterConfig.from_dict(best["config"]) if best else None,
+            best_score=best["score"] if best else float('-inf'),
+            all_results=final_results,
+            tuning_duration_seconds=duration,
+            iterations_completed=evaluations
+        )
+
+        logger.info(
+            f"Successive halving completed: best_score={result.best_score:.4f}, "
+            f"evaluations={evaluations} (grid={total}), duration={duration:.2f}s"
+        )
+
+        return result
+
+    @staticmethod
+    def count_grid_combinations(param_ranges: Dict[str, Tuple[float, float, float]]) -> int:
+        """Number of combinations a grid expands to, without materializing it"""
+        return math.prod(len(_range_values(*bounds)) for bounds in param_ranges.values())
+
+    @staticmethod
+    def _iter_param_grid(param_ranges: Dict[str, Tuple[float, float, float]]) -> Iterator[Tuple[Any, ...]]:
+        """Lazily yield the cartesian product of all parameter values"""
+        return itertools.product(*[_range_values(*bounds) for bounds in param_ranges.values()])
+
+    def _score_grid(
+        self,
+        param_names: List[str],
+        combinations: Iterator[Tuple[Any, ...]],
+        samples: SampleArrays,
+        max_workers: Optional[int] = None,
+        chunk_size: int = 256
+    ) -> Iterator[Optional[Tuple[Dict[str, Any], float]]]:
+        """
+        Score combinations in input order, yielding (config_dict, score) or
+        None for combinations that fail validation.
+
+        With a process pool, at most 2 * max_workers chunks are in flight so
+        a huge grid is never materialized.
+        """
+        base_config = self.current_config.to_dict()
+        chunk_size = max(1, int(chunk_size))
+        chunks = iter(lambda: list(itertools.islice(combinations, chunk_size)), [])
+
+        if not max_workers or max_workers <= 1:
+            for chunk in chunks:
+                yield from _score_config_chunk(base_config, param_names, chunk, samples)
+            return
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(executor.submit(_score_config_chunk, base_config, param_names, chunk, samples))
+                if len(pending) >= 2 * max_workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
     def bayesian_optimization(
         self,
         param_ranges: Dict[str, Tuple[float, float]],
         n_iterations: int = 50,
-        validation_split: float = 0.8
+        validation_split: float = 0.8,
+        n_jobs: int = 1
     ) -> TuningResult:
         """
         Smart Bayesian optimization (requires scikit-optimize).
@@ -274,13 +551,14 @@ class ParameterTuner:
             param_ranges: Dict mapping parameter names to (min, max) tuples
             n_iterations: Number of optimization iterations
             validation_split: Fraction of data for validation
+            n_jobs: Parallel jobs for the acquisition optimizer (-1 = all cores)
 
         Returns:
             TuningResult with best configuration
         """
         try:
             from skopt import gp_minimize
-            from skopt.space import Real
+            from skopt.space import Integer, Real
         except ImportError:
             logger.warning("scikit-optimize not installed, falling back to grid search")
             # Convert to grid search format
@@ -288,21 +566,31 @@ class ParameterTuner:
             for param_name, (min_val, max_val) in param_ranges.items():
                 step = (max_val - min_val) / 10  # 10 steps
                 grid_ranges[param_name] = (min_val, max_val, step)
-            return self.grid_search(grid_ranges, n_samples=10, validation_split=validation_split)
+            return self.grid_search(
+                grid_ranges,
+                n_samples=10,
+                validation_split=validation_split,
+                max_workers=n_jobs if n_jobs and n_jobs > 1 else None
+            )
 
         logger.info("Starting Bayesian optimization parameter tuning")
         start_time = datetime.now()
 
         # Split data
         split_idx = int(len(self.validation_data) * validation_split)
-        train_data = self.validation_data[:split_idx]
-        validation_data = self.validation_data[split_idx:]
+        samples = SampleArrays.from_samples(self.validation_data[split_idx:])
 
         # Define search space
         dimensions = []
         param_names = []
         for param_name, (min_val, max_val) in param_ranges.items():
-            dimensions.append(Real(min_val, max_val, name=param_name))
+            # Integer-valued parameters (max_iterations, ...) are searched as integers
+            if isinstance(getattr(self.current_config, param_name, None), int) and all(
+                isinstance(bound, int) for bound in (min_val, max_val)
+            ):
+                dimensions.append(Integer(min_val, max_val, name=param_name))
+            else:
+                dimensions.append(Real(min_val, max_val, name=param_name))
             param_names.append(param_name)
 
         # Define objective function (negative because we minimize)
@@ -315,7 +603,7 @@ class ParameterTuner:
             if not config.validate():
                 return 1e6  # Penalize invalid configs
 
-            score = self._calculate_score(config, validation_data, train_data)
+            score = score_config_vectorized(config, samples)
             return -score  # Minimize negative score = maximize score
 
         # Run optimization
@@ -323,7 +611,8 @@ class ParameterTuner:
             objective,
             dimensions,
             n_calls=n_iterations,
-            random_state=42
+            random_state=42,
+            n_jobs=n_jobs
         )
 
         # Extract best config
@@ -362,44 +651,11 @@ class ParameterTuner:
         - Correct non-actionable prediction: +5
         - Cost savings: +5 per $0.01 saved
         - Cost overspend: -10 per $0.01 overspent
-        """
-        total_score = 0.0
-
-        for sample in validation_data:
-            # Simulate discovery with config
-            simulated = self._simulate_discovery(sample, config)
-
-            # Calculate reward
-            reward = 0.0
-
-            # Accuracy rewards
-            actual_actionable = sample.get("actual_actionable", False)
-            predicted_actionable = simulated.get("actionable", False)
 
-            if predicted_actionable == actual_actionable:
-                if actual_actionable:
-                    reward += 10  # Correct actionable
-                else:
-                    reward += 5  # Correct non-actionable
-            else:
-                reward -= 5  # Incorrect prediction
-
-            # Cost rewards
-            actual_cost = sample.get("actual_cost_usd", 1.0)
-            predicted_cost = simulated.get("cost_usd", 1.0)
-            cost_diff = actual_cost - predicted_cost
-
-            if cost_diff > 0:
-                reward += cost_diff * 500  # Savings: $0.01 saved = +0.05 reward
-            else:
-                reward += cost_diff * 1000  # Overspend: $0.01 overspent = -0.10 reward
-
-            total_score += reward
-
-        # Average score
-        avg_score = total_score / len(validation_data) if validation_data else 0.0
-
-        return avg_score
+        Evaluated with `score_config_vectorized`, which reproduces
+        `_simulate_discovery` sample by sample.
+        """
+        return score_config_vectorized(config, SampleArrays.from_samples(validation_data))
 
     def _simulate_discovery(
         self,
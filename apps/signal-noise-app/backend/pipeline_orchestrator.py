@@ -68,6 +68,124 @@ class PipelineArtifacts:
     scores: Dict[str, Any]
 
 
+_STREAM_END = object()
+
+
+class _StreamingSignalPipeline:
+    """Validate and persist discovery signals while discovery is still running.
+
+    Discovery offers raw signals as it finds them. A single consumer drains the
+    channel into Ralph micro-batches (Ralph keeps per-call state, so batches are
+    validated one at a time) and hands each validated batch straight to
+    persistence, so writes overlap with the remaining discovery and validation.
+    """
+
+    def __init__(
+        self,
+        *,
+        validate_batch: Callable[[List[Dict[str, Any]]], Awaitable[Dict[str, Any]]],
+        persist_batch: Callable[[Dict[str, Any]], Awaitable[List[Dict[str, Any]]]],
+        signal_key: Callable[[Dict[str, Any]], str],
+        batch_size: int,
+        on_batch: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None,
+    ):
+        self._validate_batch = validate_batch
+        self._persist_batch = persist_batch
+        self._signal_key = signal_key
+        self.batch_size = max(1, int(batch_size))
+        self._on_batch = on_batch
+        self._channel: asyncio.Queue = asyncio.Queue()
+        self._seen: set[str] = set()
+        self._consumer: Optional[asyncio.Task] = None
+        self._persist_tasks: List[asyncio.Task] = []
+        self.ralph_results: List[Dict[str, Any]] = []
+        self.offered_count = 0
+        self.streamed_count = 0
+        self.batches_completed = 0
+
+    def start(self) -> None:
+        if self._consumer is None:
+            self._consumer = asyncio.create_task(self._consume())
+
+    def offer(self, signals: List[Dict[str, Any]], *, streamed: bool = True) -> int:
+        """Queue raw signals that have not been offered yet; returns how many were new."""
+        added = 0
+        for signal in signals or []:
+            if not isinstance(signal, dict):
+                continue
+            key = self._signal_key(signal)
+            if key in self._seen:
+                continue
+            self._seen.add(key)
+            self._channel.put_nowait(signal)
+            added += 1
+        self.offered_count += added
+        if streamed:
+            self.streamed_count += added
+        return added
+
+    async def finish(self, remaining_signals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Flush signals discovery did not stream and wait for validation to drain."""
+        self.offer(remaining_signals, streamed=False)
+        self.start()
+        self._channel.put_nowait(_STREAM_END)
+        await self._consumer
+        return self.ralph_results
+
+    def persist(self, ralph_result: Dict[str, Any]) -> None:
+        self._persist_tasks.append(asyncio.create_task(self._persist_batch(ralph_result)))
+
+    async def persisted_episodes(self) -> List[Dict[str, Any]]:
+        """Wait for every scheduled write; episodes come back in batch order."""
+        try:
+            batches = await asyncio.gather(*self._persist_tasks)
+        except BaseException:
+            for task in self._persist_tasks:
+                task.cancel()
+            await asyncio.gather(*self._persist_tasks, return_exceptions=True)
+            raise
+        return [episode for batch in batches for episode in batch]
+
+    async def aclose(self) -> None:
+        """Stop validating and let writes already in flight settle."""
+        if self._consumer is not None and not self._consumer.done():
+            self._consumer.cancel()
+        if self._consumer is not None:
+            await asyncio.gather(self._consumer, return_exceptions=True)
+        await asyncio.gather(*self._persist_tasks, return_exceptions=True)
+
+    async def _consume(self) -> None:
+        finished = False
+        while not finished:
+            item = await self._channel.get()
+            if item is _STREAM_END:
+                return
+            batch = [item]
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._channel.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if item is _STREAM_END:
+                    finished = True
+                    break
+                batch.append(item)
+            ralph_result = await self._validate_batch(batch)
+            self.ralph_results.append(ralph_result)
+            self.batches_completed += 1
+            self.persist(ralph_result)
+            if self._on_batch is not None:
+                await self._on_batch(
+                    {
+                        "micro_batches_completed": self.batches_completed,
+                        "signals_validated": sum(
+                            len(result.get("validated_signals") or []) for result in self.ralph_results
+                        ),
+                        "signals_received": self.offered_count,
+                    }
+                )
+
+
 class PipelineOrchestrator:
     def __init__(
         self,
@@ -96,6 +214,12 @@ class PipelineOrchestrator:
         self.acceptance_min_signals = int(os.getenv("PIPELINE_ACCEPTANCE_MIN_SIGNALS", "2"))
         self.run_profile = os.getenv("PIPELINE_RUN_PROFILE", "bounded_production")
         self.require_dual_write = os.getenv("PIPELINE_REQUIRE_DUAL_WRITE", "true").lower() in {"1", "true", "yes"}
+        self.streaming_enabled = os.getenv("PIPELINE_STREAMING_ENABLED", "false").lower() in {"1", "true", "yes"}
+        self.streaming_ralph_batch_size = max(1, int(os.getenv("PIPELINE_STREAMING_RALPH_BATCH_SIZE", "8")))
+        self.persistence_concurrency = max(
+            1,
+            int(os.getenv("PIPELINE_PERSISTENCE_CONCURRENCY", "4" if self.streaming_enabled else "1")),
+        )
         self.question_first_enabled = os.getenv("PIPELINE_QUESTION_FIRST_ENABLED", "false").lower() in {"1", "true", "yes"}
         self.question_first_persist_reports = os.getenv("PIPELINE_QUESTION_FIRST_PERSIST_REPORTS", "true").lower() in {"1", "true", "yes"}
         self.question_first_output_dir = os.getenv("PIPELINE_QUESTION_FIRST_OUTPUT_DIR", "backend/data/question_first_dossiers")
@@ -874,120 +998,151 @@ class PipelineOrchestrator:
             request_metadata=request_metadata,
         )
 
-        try:
-            logger.warning("🚦 Pipeline boundary: discovery:start")
-            await self._emit_phase_update(phase_callback, "discovery", {"status": "running", "current_substep": "discovery_running"})
-            if use_question_first_downstream_fallback:
-                discovery_result = self._build_question_first_discovery_result(
-                    entity_id=entity_id,
-                    dossier=dossier,
-                )
-            else:
-                discovery_result = await self._run_discovery(
-                    entity_id=entity_id,
-                    entity_name=entity_name,
-                    entity_type=entity_type,
-                    dossier=dossier,
-                    phase_callback=phase_callback,
-                    run_objective=phase_objectives["discovery"],
-                )
-            discovery_budget = getattr(self, "_last_discovery_budget", {})
-            raw_signals = self._extract_raw_signals(discovery_result)
-            phase_results["discovery"] = {
-                "status": "completed",
-                "signals_discovered": len(raw_signals),
-                "final_confidence": getattr(discovery_result, "final_confidence", None),
-                **discovery_budget,
-            }
-            step_artifacts.extend(self._build_discovery_step_artifacts(discovery_result=discovery_result))
-            await self._emit_phase_update(phase_callback, "discovery", phase_results["discovery"])
-            logger.warning("🚦 Pipeline boundary: discovery:complete")
-        except Exception as exc:
-            error_message = "Discovery timed out" if isinstance(exc, TimeoutError) else str(exc)
-            logger.exception("Discovery phase failed for %s: %s", entity_id, error_message)
-            phase_results["discovery"] = {"status": "failed", "error": error_message, "current_substep": "discovery_failed"}
-            phase_results["ralph_validation"] = {"status": "skipped", "reason": "discovery_failed"}
-            phase_results["temporal_persistence"] = {"status": "skipped", "reason": "discovery_failed"}
-            await self._emit_phase_update(phase_callback, "discovery", phase_results["discovery"])
-            await self._emit_phase_update(phase_callback, "ralph_validation", phase_results["ralph_validation"])
-            await self._emit_phase_update(phase_callback, "temporal_persistence", phase_results["temporal_persistence"])
+        timeline_pending = False
+        if self.streaming_enabled and not use_question_first_downstream_fallback:
+            streamed = await self._run_streaming_signal_phases(
+                entity_id=entity_id,
+                entity_name=entity_name,
+                entity_type=entity_type,
+                dossier=dossier,
+                run_objective=phase_objectives["discovery"],
+                phase_results=phase_results,
+                step_artifacts=step_artifacts,
+                phase_callback=phase_callback,
+            )
+            discovery_result = streamed["discovery_result"]
+            raw_signals = streamed["raw_signals"]
+            ralph_result = streamed["ralph_result"]
+            validated_signals = streamed["validated_signals"]
+            capability_signals = streamed["capability_signals"]
+            validated_rfps = streamed["validated_rfps"]
+            episodes = streamed["episodes"]
+            timeline_pending = streamed["timeline_pending"]
         else:
             try:
-                await self._emit_phase_update(phase_callback, "ralph_validation", {"status": "running", "current_substep": "ralph_validation_running"})
+                logger.warning("🚦 Pipeline boundary: discovery:start")
+                await self._emit_phase_update(phase_callback, "discovery", {"status": "running", "current_substep": "discovery_running"})
                 if use_question_first_downstream_fallback:
-                    raw_ralph_result = self._build_question_first_ralph_result(
+                    discovery_result = self._build_question_first_discovery_result(
                         entity_id=entity_id,
-                        raw_signals=raw_signals,
+                        dossier=dossier,
                     )
                 else:
-                    raw_ralph_result = await self._run_ralph_validation(
+                    discovery_result = await self._run_discovery(
                         entity_id=entity_id,
-                        raw_signals=raw_signals,
-                    )
-                ralph_result = self._coerce_ralph_result(raw_ralph_result)
-                validated_signals = self._normalize_validated_signals(ralph_result.get("validated_signals", []))
-                capability_signals = self._normalize_validated_signals(ralph_result.get("capability_signals", []))
-                question_first_scoring_signals = self._build_question_first_scoring_signals(
-                    entity_id=entity_id,
-                    dossier=dossier,
-                )
-                if question_first_scoring_signals:
-                    validated_signals = self._merge_signal_lists(validated_signals, question_first_scoring_signals)
-                    capability_signals = self._merge_signal_lists(
-                        capability_signals,
-                        [
-                            signal
-                            for signal in question_first_scoring_signals
-                            if not self._is_rfp_signal(signal)
-                        ],
+                        entity_name=entity_name,
+                        entity_type=entity_type,
+                        dossier=dossier,
+                        phase_callback=phase_callback,
+                        run_objective=phase_objectives["discovery"],
                     )
-                validated_rfps = [signal for signal in validated_signals if self._is_rfp_signal(signal)]
-                phase_results["ralph_validation"] = {
+                discovery_budget = getattr(self, "_last_discovery_budget", {})
+                raw_signals = self._extract_raw_signals(discovery_result)
+                phase_results["discovery"] = {
                     "status": "completed",
-                    "current_substep": "ralph_validation_completed",
-                    "validated_signal_count": len(validated_signals),
-                    "capability_signal_count": len(capability_signals),
-                    "rfp_count": len(validated_rfps),
+                    "signals_discovered": len(raw_signals),
+                    "final_confidence": getattr(discovery_result, "final_confidence", None),
+                    **discovery_budget,
                 }
-                step_artifacts.extend(self._build_ralph_step_artifacts(ralph_result=ralph_result))
-                await self._emit_phase_update(phase_callback, "ralph_validation", phase_results["ralph_validation"])
+                step_artifacts.extend(self._build_discovery_step_artifacts(discovery_result=discovery_result))
+                await self._emit_phase_update(phase_callback, "discovery", phase_results["discovery"])
+                logger.warning("🚦 Pipeline boundary: discovery:complete")
             except Exception as exc:
-                error_message = "Ralph validation timed out" if isinstance(exc, TimeoutError) else str(exc)
-                logger.exception("Ralph validation failed for %s: %s", entity_id, error_message)
-                phase_results["ralph_validation"] = {"status": "failed", "error": error_message, "current_substep": "ralph_validation_failed"}
-                phase_results["temporal_persistence"] = {"status": "skipped", "reason": "ralph_validation_failed"}
+                error_message = "Discovery timed out" if isinstance(exc, TimeoutError) else str(exc)
+                logger.exception("Discovery phase failed for %s: %s", entity_id, error_message)
+                phase_results["discovery"] = {"status": "failed", "error": error_message, "current_substep": "discovery_failed"}
+                phase_results["ralph_validation"] = {"status": "skipped", "reason": "discovery_failed"}
+                phase_results["temporal_persistence"] = {"status": "skipped", "reason": "discovery_failed"}
+                await self._emit_phase_update(phase_callback, "discovery", phase_results["discovery"])
                 await self._emit_phase_update(phase_callback, "ralph_validation", phase_results["ralph_validation"])
                 await self._emit_phase_update(phase_callback, "temporal_persistence", phase_results["temporal_persistence"])
             else:
                 try:
-                    await self._emit_phase_update(phase_callback, "temporal_persistence", {"status": "running", "current_substep": "temporal_persistence_running"})
-                    episodes = await self._run_temporal_persistence(
+                    await self._emit_phase_update(phase_callback, "ralph_validation", {"status": "running", "current_substep": "ralph_validation_running"})
+                    if use_question_first_downstream_fallback:
+                        raw_ralph_result = self._build_question_first_ralph_result(
+                            entity_id=entity_id,
+                            raw_signals=raw_signals,
+                        )
+                    else:
+                        raw_ralph_result = await self._run_ralph_validation(
+                            entity_id=entity_id,
+                            raw_signals=raw_signals,
+                        )
+                    ralph_result = self._coerce_ralph_result(raw_ralph_result)
+                    validated_signals = self._normalize_validated_signals(ralph_result.get("validated_signals", []))
+                    capability_signals = self._normalize_validated_signals(ralph_result.get("capability_signals", []))
+                    question_first_scoring_signals = self._build_question_first_scoring_signals(
                         entity_id=entity_id,
-                        entity_name=entity_name,
-                        validated_signals=validated_signals,
+                        dossier=dossier,
                     )
-                    phase_results["temporal_persistence"] = {
+                    if question_first_scoring_signals:
+                        validated_signals = self._merge_signal_lists(validated_signals, question_first_scoring_signals)
+                        capability_signals = self._merge_signal_lists(
+                            capability_signals,
+                            [
+                                signal
+                                for signal in question_first_scoring_signals
+                                if not self._is_rfp_signal(signal)
+                            ],
+                        )
+                    validated_rfps = [signal for signal in validated_signals if self._is_rfp_signal(signal)]
+                    phase_results["ralph_validation"] = {
                         "status": "completed",
-                        "current_substep": "temporal_persistence_completed",
-                        "episode_count": len(episodes),
+                        "current_substep": "ralph_validation_completed",
+                        "validated_signal_count": len(validated_signals),
+                        "capability_signal_count": len(capability_signals),
+                        "rfp_count": len(validated_rfps),
                     }
-                    await self._emit_phase_update(phase_callback, "temporal_persistence", phase_results["temporal_persistence"])
+                    step_artifacts.extend(self._build_ralph_step_artifacts(ralph_result=ralph_result))
+                    await self._emit_phase_update(phase_callback, "ralph_validation", phase_results["ralph_validation"])
                 except Exception as exc:
-                    error_message = "Temporal persistence timed out" if isinstance(exc, TimeoutError) else str(exc)
-                    logger.exception("Temporal persistence failed for %s: %s", entity_id, error_message)
-                    phase_results["temporal_persistence"] = {"status": "failed", "error": error_message, "current_substep": "temporal_persistence_failed"}
+                    error_message = "Ralph validation timed out" if isinstance(exc, TimeoutError) else str(exc)
+                    logger.exception("Ralph validation failed for %s: %s", entity_id, error_message)
+                    phase_results["ralph_validation"] = {"status": "failed", "error": error_message, "current_substep": "ralph_validation_failed"}
+                    phase_results["temporal_persistence"] = {"status": "skipped", "reason": "ralph_validation_failed"}
+                    await self._emit_phase_update(phase_callback, "ralph_validation", phase_results["ralph_validation"])
                     await self._emit_phase_update(phase_callback, "temporal_persistence", phase_results["temporal_persistence"])
+                else:
+                    try:
+                        await self._emit_phase_update(phase_callback, "temporal_persistence", {"status": "running", "current_substep": "temporal_persistence_running"})
+                        episodes = await self._run_temporal_persistence(
+                            entity_id=entity_id,
+                            entity_name=entity_name,
+                            validated_signals=validated_signals,
+                        )
+                        phase_results["temporal_persistence"] = {
+                            "status": "completed",
+                            "current_substep": "temporal_persistence_completed",
+                            "episode_count": len(episodes),
+                        }
+                        await self._emit_phase_update(phase_callback, "temporal_persistence", phase_results["temporal_persistence"])
+                    except Exception as exc:
+                        error_message = "Temporal persistence timed out" if isinstance(exc, TimeoutError) else str(exc)
+                        logger.exception("Temporal persistence failed for %s: %s", entity_id, error_message)
+                        phase_results["temporal_persistence"] = {"status": "failed", "error": error_message, "current_substep": "temporal_persistence_failed"}
+                        await self._emit_phase_update(phase_callback, "temporal_persistence", phase_results["temporal_persistence"])
 
         await self._emit_phase_update(phase_callback, "dashboard_scoring", {"status": "running", "current_substep": "dashboard_scoring_running"})
         logger.warning("🚦 Pipeline boundary: dashboard_scoring:start")
-        scores = await self._run_dashboard_scoring(
-            entity_id=entity_id,
-            entity_name=entity_name,
-            discovery_result=discovery_result,
-            validated_signals=validated_signals,
-            validated_rfps=validated_rfps,
-            episodes=episodes,
-        )
+        if timeline_pending:
+            scores, episodes = await self._score_while_materializing_timeline(
+                entity_id=entity_id,
+                entity_name=entity_name,
+                discovery_result=discovery_result,
+                validated_signals=validated_signals,
+                validated_rfps=validated_rfps,
+                episodes=episodes,
+            )
+        else:
+            scores = await self._run_dashboard_scoring(
+                entity_id=entity_id,
+                entity_name=entity_name,
+                discovery_result=discovery_result,
+                validated_signals=validated_signals,
+                validated_rfps=validated_rfps,
+                episodes=episodes,
+            )
         await self._emit_phase_update(
             phase_callback,
             "dashboard_scoring",
@@ -1319,10 +1474,15 @@ class PipelineOrchestrator:
         dossier: Dict[str, Any],
         run_objective: str,
         phase_callback: Optional[Callable[[str, Dict[str, Any]], Awaitable[None]]] = None,
+        signal_sink: Optional[Callable[[List[Dict[str, Any]]], Any]] = None,
     ):
         started_at = time.perf_counter()
 
         async def emit_discovery_progress(payload: Dict[str, Any]) -> None:
+            payload = dict(payload or {})
+            new_signals = payload.pop("new_signals", None)
+            if signal_sink is not None and isinstance(new_signals, list) and new_signals:
+                signal_sink(new_signals)
             await self._emit_phase_update(phase_callback, "discovery", payload)
 
         discovery_coro = self.discovery.run_discovery_with_dossier_context(
@@ -1351,6 +1511,238 @@ class PipelineOrchestrator:
 
         return result
 
+    async def _run_streaming_signal_phases(
+        self,
+        *,
+        entity_id: str,
+        entity_name: str,
+        entity_type: str,
+        dossier: Dict[str, Any],
+        run_objective: str,
+        phase_results: Dict[str, Dict[str, Any]],
+        step_artifacts: List[Dict[str, Any]],
+        phase_callback: Optional[Callable[[str, Dict[str, Any]], Awaitable[None]]] = None,
+    ) -> Dict[str, Any]:
+        """Run discovery, Ralph validation and temporal persistence as overlapping stages.
+
+        Produces the same phase results, callbacks and failure semantics as the
+        sequential path. Writes that already landed before a later phase fails are
+        not rolled back. The timeline re-read is left to the caller so it can run
+        alongside dashboard scoring.
+        """
+        outcome: Dict[str, Any] = {
+            "discovery_result": {"signals_discovered": [], "hypotheses": []},
+            "raw_signals": [],
+            "ralph_result": self._coerce_ralph_result([]),
+            "validated_signals": [],
+            "capability_signals": [],
+            "validated_rfps": [],
+            "episodes": [],
+            "timeline_pending": False,
+        }
+        persisted_keys: set[str] = set()
+
+        def persist_signals(signals: List[Dict[str, Any]]) -> Awaitable[List[Dict[str, Any]]]:
+            # Claim keys before the write is scheduled so a signal is never written twice.
+            fresh: List[Dict[str, Any]] = []
+            for signal in signals:
+                key = self._signal_identity(signal)
+                if key in persisted_keys:
+                    continue
+                persisted_keys.add(key)
+                fresh.append(signal)
+            return self._persist_validated_signals(
+                entity_id=entity_id,
+                entity_name=entity_name,
+                validated_signals=fresh,
+            )
+
+        def persist_batch(ralph_result: Dict[str, Any]) -> Awaitable[List[Dict[str, Any]]]:
+            return persist_signals(self._normalize_validated_signals(ralph_result.get("validated_signals", [])))
+
+        # Signals accepted by earlier micro-batches, so Ralph's Pass 3 collapses
+        # duplicates across batches as it would within a single call.
+        accepted_signals: List[Any] = []
+
+        async def validate_batch(batch: List[Dict[str, Any]]) -> Dict[str, Any]:
+            result = self._coerce_ralph_result(
+                await self._run_ralph_validation(
+                    entity_id=entity_id,
+                    raw_signals=batch,
+                    prior_signals=list(accepted_signals),
+                )
+            )
+            accepted_signals.extend(result.get("validated_signals") or [])
+            accepted_signals.extend(result.get("capability_signals") or [])
+            return result
+
+        async def emit_batch_progress(progress: Dict[str, Any]) -> None:
+            await self._emit_phase_update(
+                phase_callback,
+                "ralph_validation",
+                {"status": "running", "current_substep": "ralph_validation_running", **progress},
+            )
+
+        pipeline = _StreamingSignalPipeline(
+            validate_batch=validate_batch,
+            persist_batch=persist_batch,
+            signal_key=self._signal_identity,
+            batch_size=self.streaming_ralph_batch_size,
+            on_batch=emit_batch_progress,
+        )
+
+        try:
+            logger.warning("🚦 Pipeline boundary: discovery:start")
+            await self._emit_phase_update(phase_callback, "discovery", {"status": "running", "current_substep": "discovery_running"})
+            await self._emit_phase_update(phase_callback, "ralph_validation", {"status": "running", "current_substep": "ralph_validation_running"})
+            await self._emit_phase_update(phase_callback, "temporal_persistence", {"status": "running", "current_substep": "temporal_persistence_running"})
+            pipeline.start()
+            discovery_result = await self._run_discovery(
+                entity_id=entity_id,
+                entity_name=entity_name,
+                entity_type=entity_type,
+                dossier=dossier,
+                phase_callback=phase_callback,
+                run_objective=run_objective,
+                signal_sink=pipeline.offer,
+            )
+            outcome["discovery_result"] = discovery_result
+            raw_signals = self._extract_raw_signals(discovery_result)
+            outcome["raw_signals"] = raw_signals
+            phase_results["discovery"] = {
+                "status": "completed",
+                "signals_discovered": len(raw_signals),
+                "signals_streamed": pipeline.streamed_count,
+                "final_confidence": getattr(discovery_result, "final_confidence", None),
+                **getattr(self, "_last_discovery_budget", {}),
+            }
+            step_artifacts.extend(self._build_discovery_step_artifacts(discovery_result=discovery_result))
+            await self._emit_phase_update(phase_callback, "discovery", phase_results["discovery"])
+            logger.warning("🚦 Pipeline boundary: discovery:complete")
+        except Exception as exc:
+            await pipeline.aclose()
+            error_message = "Discovery timed out" if isinstance(exc, TimeoutError) else str(exc)
+            logger.exception("Discovery phase failed for %s: %s", entity_id, error_message)
+            phase_results["discovery"] = {"status": "failed", "error": error_message, "current_substep": "discovery_failed"}
+            phase_results["ralph_validation"] = {"status": "skipped", "reason": "discovery_failed"}
+            phase_results["temporal_persistence"] = {"status": "skipped", "reason": "discovery_failed"}
+            await self._emit_phase_update(phase_callback, "discovery", phase_results["discovery"])
+            await self._emit_phase_update(phase_callback, "ralph_validation", phase_results["ralph_validation"])
+            await self._emit_phase_update(phase_callback, "temporal_persistence", phase_results["temporal_persistence"])
+            return outcome
+
+        try:
+            ralph_batches = await pipeline.finish(raw_signals)
+            if not ralph_batches:
+                ralph_batches = [await validate_batch([])]
+                pipeline.persist(ralph_batches[0])
+            ralph_result = self._merge_ralph_results(ralph_batches)
+            if len(ralph_batches) > 1:
+                ralph_result["hypothesis_states"] = self._recalculate_hypothesis_states(
+                    entity_id=entity_id,
+                    ralph_result=ralph_result,
+                )
+            validated_signals = self._merge_signal_lists(
+                self._normalize_validated_signals(ralph_result.get("validated_signals", []))
+            )
+            capability_signals = self._merge_signal_lists(
+                self._normalize_validated_signals(ralph_result.get("capability_signals", []))
+            )
+            question_first_scoring_signals = self._build_question_first_scoring_signals(
+                entity_id=entity_id,
+                dossier=dossier,
+            )
+            if question_first_scoring_signals:
+                validated_signals = self._merge_signal_lists(validated_signals, question_first_scoring_signals)
+                capability_signals = self._merge_signal_lists(
+                    capability_signals,
+                    [
+                        signal
+                        for signal in question_first_scoring_signals
+                        if not self._is_rfp_signal(signal)
+                    ],
+                )
+            validated_rfps = [signal for signal in validated_signals if self._is_rfp_signal(signal)]
+            outcome.update(
+                ralph_result=ralph_result,
+                validated_signals=validated_signals,
+                capability_signals=capability_signals,
+                validated_rfps=validated_rfps,
+            )
+            phase_results["ralph_validation"] = {
+                "status": "completed",
+                "current_substep": "ralph_validation_completed",
+                "validated_signal_count": len(validated_signals),
+                "capability_signal_count": len(capability_signals),
+                "rfp_count": len(validated_rfps),
+                "micro_batch_count": len(ralph_batches),
+            }
+            step_artifacts.extend(self._build_ralph_step_artifacts(ralph_result=ralph_result))
+            await self._emit_phase_update(phase_callback, "ralph_validation", phase_results["ralph_validation"])
+        except Exception as exc:
+            await pipeline.aclose()
+            error_message = "Ralph validation timed out" if isinstance(exc, TimeoutError) else str(exc)
+            logger.exception("Ralph validation failed for %s: %s", entity_id, error_message)
+            phase_results["ralph_validation"] = {"status": "failed", "error": error_message, "current_substep": "ralph_validation_failed"}
+            phase_results["temporal_persistence"] = {"status": "skipped", "reason": "ralph_validation_failed"}
+            await self._emit_phase_update(phase_callback, "ralph_validation", phase_results["ralph_validation"])
+            await self._emit_phase_update(phase_callback, "temporal_persistence", phase_results["temporal_persistence"])
+            return outcome
+
+        try:
+            # Signals added after Ralph (question-first scoring) still need writing.
+            pipeline.persist({"validated_signals": validated_signals})
+            episodes = await pipeline.persisted_episodes()
+            if not validated_signals and hasattr(self.graphiti_service, "add_discovery_episode"):
+                episodes.insert(0, await self._persist_no_signal_episode(entity_id=entity_id, entity_name=entity_name))
+            outcome["episodes"] = episodes
+            outcome["timeline_pending"] = True
+            phase_results["temporal_persistence"] = {
+                "status": "completed",
+                "current_substep": "temporal_persistence_completed",
+                "episode_count": len(episodes),
+            }
+            await self._emit_phase_update(phase_callback, "temporal_persistence", phase_results["temporal_persistence"])
+        except Exception as exc:
+            await pipeline.aclose()
+            error_message = "Temporal persistence timed out" if isinstance(exc, TimeoutError) else str(exc)
+            logger.exception("Temporal persistence failed for %s: %s", entity_id, error_message)
+            phase_results["temporal_persistence"] = {"status": "failed", "error": error_message, "current_substep": "temporal_persistence_failed"}
+            await self._emit_phase_update(phase_callback, "temporal_persistence", phase_results["temporal_persistence"])
+        return outcome
+
+    async def _score_while_materializing_timeline(
+        self,
+        *,
+        entity_id: str,
+        entity_name: str,
+        discovery_result: Any,
+        validated_signals: List[Dict[str, Any]],
+        validated_rfps: List[Dict[str, Any]],
+        episodes: List[Dict[str, Any]],
+    ):
+        """Score the final validated set while the persisted timeline is re-read."""
+
+        async def materialize() -> List[Dict[str, Any]]:
+            try:
+                return await self._materialize_entity_timeline(entity_id=entity_id, episodes=episodes)
+            except Exception as exc:
+                logger.warning("⚠️ Timeline materialization failed for %s: %s", entity_id, exc)
+                return episodes
+
+        scores, timeline = await asyncio.gather(
+            self._run_dashboard_scoring(
+                entity_id=entity_id,
+                entity_name=entity_name,
+                discovery_result=discovery_result,
+                validated_signals=validated_signals,
+                validated_rfps=validated_rfps,
+                episodes=episodes,
+            ),
+            materialize(),
+        )
+        return scores, timeline
+
     def _extract_llm_efficiency_metrics(self, discovery_result: Any) -> Dict[str, int]:
         summary = (
             getattr(discovery_result, "performance_summary", None)
@@ -1375,8 +1767,33 @@ class PipelineOrchestrator:
         self,
         entity_id: str,
         raw_signals: List[Dict[str, Any]],
+        prior_signals: Optional[List[Any]] = None,
     ) -> Dict[str, Any]:
-        return await self.ralph_validator.validate_signals(raw_signals, entity_id)
+        validate = self.ralph_validator.validate_signals
+        if prior_signals:
+            try:
+                accepts_prior = "prior_signals" in inspect.signature(validate).parameters
+            except (TypeError, ValueError):
+                accepts_prior = False
+            if accepts_prior:
+                return await validate(raw_signals, entity_id, prior_signals=prior_signals)
+        return await validate(raw_signals, entity_id)
+
+    def _recalculate_hypothesis_states(
+        self,
+        *,
+        entity_id: str,
+        ralph_result: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Hypothesis states over every micro-batch's signals, as one Ralph call would compute them."""
+        recalculate = getattr(self.ralph_validator, "recalculate_hypothesis_states", None)
+        if not callable(recalculate):
+            return ralph_result.get("hypothesis_states") or {}
+        return recalculate(
+            entity_id,
+            list(ralph_result.get("validated_signals") or []),
+            list(ralph_result.get("capability_signals") or []),
+        )
 
     async def _run_temporal_persistence(
         self,
@@ -1387,67 +1804,133 @@ class PipelineOrchestrator:
         episodes: List[Dict[str, Any]] = []
 
         if not validated_signals and hasattr(self.graphiti_service, "add_discovery_episode"):
-            no_signal_episode = await self.graphiti_service.add_discovery_episode(
+            episodes.append(await self._persist_no_signal_episode(entity_id=entity_id, entity_name=entity_name))
+
+        episodes.extend(
+            await self._persist_validated_signals(
+                entity_id=entity_id,
+                entity_name=entity_name,
+                validated_signals=validated_signals,
+            )
+        )
+        return await self._materialize_entity_timeline(entity_id=entity_id, episodes=episodes)
+
+    async def _persist_no_signal_episode(self, *, entity_id: str, entity_name: str) -> Dict[str, Any]:
+        return await self.graphiti_service.add_discovery_episode(
+            entity_id=entity_id,
+            entity_name=entity_name,
+            entity_type="Entity",
+            episode_type="NO_SIGNAL_FOUND",
+            description="No validated signals remained after Ralph validation",
+            source="pipeline_orchestrator",
+            confidence=0.0,
+            url=None,
+            metadata={
+                "entity_id": entity_id,
+                "signal_type": "NO_SIGNAL_FOUND",
+                "reason_code": "post_ralph_no_validated_signals",
+            },
+        )
+
+    async def _persist_validated_signals(
+        self,
+        *,
+        entity_id: str,
+        entity_name: str,
+        validated_signals: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Write one episode per validated signal, up to ``persistence_concurrency`` at a time.
+
+        Episodes are returned in signal order regardless of completion order. The
+        first failed write cancels the writes that have not finished yet.
+        """
+        if self.persistence_concurrency <= 1 or len(validated_signals) <= 1:
+            episodes: List[Dict[str, Any]] = []
+            for signal in validated_signals:
+                episode = await self._persist_validated_signal(
+                    entity_id=entity_id,
+                    entity_name=entity_name,
+                    signal=signal,
+                )
+                if episode is not None:
+                    episodes.append(episode)
+            return episodes
+
+        semaphore = asyncio.Semaphore(self.persistence_concurrency)
+
+        async def persist_one(signal: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await self._persist_validated_signal(
+                    entity_id=entity_id,
+                    entity_name=entity_name,
+                    signal=signal,
+                )
+
+        tasks = [asyncio.create_task(persist_one(signal)) for signal in validated_signals]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return [episode for episode in results if episode is not None]
+
+    async def _persist_validated_signal(
+        self,
+        *,
+        entity_id: str,
+        entity_name: str,
+        signal: Dict[str, Any],
+    ) -> Optional[Dict[str, Any]]:
+        if self._is_rfp_signal(signal):
+            episode = await self.graphiti_service.add_rfp_episode({
+                "rfp_id": signal.get("id") or f"{entity_id}-rfp",
+                "organization": entity_name,
+                "entity_type": "Entity",
+                "title": signal.get("statement") or signal.get("text") or "Validated RFP signal",
+                "url": signal.get("url"),
+                "confidence_score": signal.get("confidence"),
+                "metadata": {
+                    "entity_id": entity_id,
+                    "signal_type": signal.get("type"),
+                },
+            })
+            if hasattr(self.graphiti_service, "persist_unified_rfp"):
+                await self.graphiti_service.persist_unified_rfp(
+                    self._build_unified_rfp_record(
+                        entity_id=entity_id,
+                        entity_name=entity_name,
+                        signal=signal,
+                        episode=episode,
+                    )
+                )
+            return episode
+        if hasattr(self.graphiti_service, "add_discovery_episode"):
+            return await self.graphiti_service.add_discovery_episode(
                 entity_id=entity_id,
                 entity_name=entity_name,
                 entity_type="Entity",
-                episode_type="NO_SIGNAL_FOUND",
-                description="No validated signals remained after Ralph validation",
+                episode_type=signal.get("type", "DISCOVERY_SIGNAL"),
+                description=signal.get("statement") or signal.get("text") or "Validated discovery signal",
                 source="pipeline_orchestrator",
-                confidence=0.0,
-                url=None,
+                confidence=signal.get("confidence"),
+                url=signal.get("url"),
                 metadata={
                     "entity_id": entity_id,
-                    "signal_type": "NO_SIGNAL_FOUND",
-                    "reason_code": "post_ralph_no_validated_signals",
+                    "signal_type": signal.get("type"),
                 },
             )
-            episodes.append(no_signal_episode)
-
-        for signal in validated_signals:
-            if self._is_rfp_signal(signal):
-                episode = await self.graphiti_service.add_rfp_episode({
-                    "rfp_id": signal.get("id") or f"{entity_id}-rfp",
-                    "organization": entity_name,
-                    "entity_type": "Entity",
-                    "title": signal.get("statement") or signal.get("text") or "Validated RFP signal",
-                    "url": signal.get("url"),
-                    "confidence_score": signal.get("confidence"),
-                    "metadata": {
-                        "entity_id": entity_id,
-                        "signal_type": signal.get("type"),
-                    },
-                })
-                episodes.append(episode)
-                if hasattr(self.graphiti_service, "persist_unified_rfp"):
-                    await self.graphiti_service.persist_unified_rfp(
-                        self._build_unified_rfp_record(
-                            entity_id=entity_id,
-                            entity_name=entity_name,
-                            signal=signal,
-                            episode=episode,
-                        )
-                    )
-            elif hasattr(self.graphiti_service, "add_discovery_episode"):
-                episode = await self.graphiti_service.add_discovery_episode(
-                    entity_id=entity_id,
-                    entity_name=entity_name,
-                    entity_type="Entity",
-                    episode_type=signal.get("type", "DISCOVERY_SIGNAL"),
-                    description=signal.get("statement") or signal.get("text") or "Validated discovery signal",
-                    source="pipeline_orchestrator",
-                    confidence=signal.get("confidence"),
-                    url=signal.get("url"),
-                    metadata={
-                        "entity_id": entity_id,
-                        "signal_type": signal.get("type"),
-                    },
-                )
-                episodes.append(episode)
+        return None
 
+    async def _materialize_entity_timeline(
+        self,
+        *,
+        entity_id: str,
+        episodes: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
         if hasattr(self.graphiti_service, "get_entity_timeline"):
             return await self.graphiti_service.get_entity_timeline(entity_id, limit=50)
-
         return episodes
 
     async def _run_dashboard_scoring(
@@ -1831,6 +2314,46 @@ class PipelineOrchestrator:
             "hypothesis_states": {},
         }
 
+    @classmethod
+    def _merge_ralph_results(cls, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Fold Ralph micro-batch results into one result shaped like a single call."""
+        merged: Dict[str, Any] = {
+            "validated_signals": [],
+            "capability_signals": [],
+            "hypothesis_states": {},
+        }
+        for result in results:
+            for key, value in (result or {}).items():
+                if isinstance(value, list):
+                    existing = merged.get(key)
+                    merged[key] = (list(existing) if isinstance(existing, list) else []) + list(value)
+                elif isinstance(value, dict):
+                    merged[key] = cls._merge_ralph_summary(merged.get(key), value)
+                else:
+                    merged[key] = value
+        return merged
+
+    @classmethod
+    def _merge_ralph_summary(cls, existing: Any, update: Dict[str, Any]) -> Dict[str, Any]:
+        """Sum counters and concatenate lists shared by both summaries; later batches win for anything else."""
+        merged = dict(existing) if isinstance(existing, dict) else {}
+        for key, value in update.items():
+            current = merged.get(key)
+            if isinstance(value, dict):
+                merged[key] = cls._merge_ralph_summary(current, value)
+            elif isinstance(value, list):
+                merged[key] = (list(current) if isinstance(current, list) else []) + list(value)
+            elif (
+                isinstance(value, (int, float))
+                and isinstance(current, (int, float))
+                and not isinstance(value, bool)
+                and not isinstance(current, bool)
+            ):
+                merged[key] = current + value
+            else:
+                merged[key] = value
+        return merged
+
     def _coerce_dossier_payload(self, dossier: Any) -> Dict[str, Any]:
         if isinstance(dossier, dict):
             payload = dict(dossier)
@@ -2136,6 +2659,21 @@ class PipelineOrchestrator:
             )
         return signals
 
+    @staticmethod
+    def _signal_identity(signal: Dict[str, Any]) -> str:
+        """Dedupe key shared by the raw signal stream and streamed persistence."""
+        signal_id = str(signal.get("id") or "").strip()
+        if signal_id:
+            return signal_id
+        return ":".join(
+            [
+                str(signal.get("entity_id") or ""),
+                str(signal.get("type") or signal.get("signal_type") or ""),
+                str(signal.get("url") or ""),
+                str(signal.get("statement") or signal.get("text") or signal.get("evidence_found") or "")[:120],
+            ]
+        )
+
     @staticmethod
     def _merge_signal_lists(*signal_lists: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         merged: List[Dict[str, Any]] = []
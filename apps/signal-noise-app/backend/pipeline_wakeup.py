@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Wakeup channel for idle entity pipeline workers.
+
+Idle workers used to sleep a fixed poll interval between claim attempts, so a
+freshly queued batch waited up to a full interval and an idle fleet kept
+querying the queue. ``PipelineWakeup`` lets a worker block until something
+worth claiming happens, with the poll interval kept only as a safety net:
+
+- Postgres: a background thread ``LISTEN``s on ``entity_pipeline_wakeup``.
+  Triggers (see ``20260514_add_entity_pipeline_wakeup_notify.sql``) notify on
+  run inserts, batches re-entering ``queued`` and control-state resumes or
+  cooldown changes, whichever process made them.
+- Local/file mode: the waiter watches the pipeline control state file (written
+  by the dashboard on resume; only requested-state and cooldown changes count)
+  and a dedicated wakeup file touched by ``notify_pipeline_wakeup``.
+- In-process: ``notify_pipeline_wakeup`` also wakes waiters in the calling
+  process directly.
+
+Wakeups are opt-in via ``ENTITY_PIPELINE_WAKEUP_ENABLED``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PIPELINE_WAKEUP_CHANNEL = "entity_pipeline_wakeup"
+PIPELINE_WAKEUP_PATH = Path(__file__).resolve().parents[1] / "tmp" / "pipeline-wakeup"
+
+_active_waiters: "weakref.WeakSet[PipelineWakeup]" = weakref.WeakSet()
+_active_waiters_lock = threading.Lock()
+
+
+def pipeline_wakeup_enabled() -> bool:
+    return str(os.getenv("ENTITY_PIPELINE_WAKEUP_ENABLED", "false")).strip().lower() in {"1", "true", "yes", "on"}
+
+
+def pipeline_idle_poll_seconds(default: int = 120) -> int:
+    """Safety-net poll interval used while wakeups are active."""
+    try:
+        return max(1, int(os.getenv("ENTITY_PIPELINE_WORKER_IDLE_POLL_SECONDS", str(default))))
+    except ValueError:
+        return default
+
+
+def _file_marker(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _control_state_signature(path: Path) -> Tuple[Any, ...]:
+    # Only resume/cooldown changes matter; the worker's own cursor writes must not wake it.
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return (None, None)
+    if not isinstance(payload, dict):
+        return (None, None)
+    return (payload.get("requested_state"), payload.get("provider_cooldown_until"))
+
+
+class PipelineWakeup:
+    """Blocks an idle worker until a wakeup arrives or the safety-net timeout passes."""
+
+    def __init__(
+        self,
+        *,
+        database_url: Optional[str] = None,
+        watch_paths: Iterable[Path] = (),
+        control_state_path: Optional[Path] = None,
+        file_poll_seconds: float = 0.5,
+    ):
+        self.database_url = database_url or None
+        self.file_poll_seconds = max(0.05, float(file_poll_seconds))
+        self._event = threading.Event()
+        self._reasons: Deque[str] = deque(maxlen=64)
+        self._lock = threading.Lock()
+        self._watch_markers: Dict[Path, Optional[int]] = {Path(path): _file_marker(Path(path)) for path in watch_paths}
+        self._control_state_path = Path(control_state_path) if control_state_path else None
+        self._control_state_marker: Optional[int] = None
+        self._control_state_signature: Tuple[Any, ...] = (None, None)
+        if self._control_state_path is not None:
+            self._control_state_marker = _file_marker(self._control_state_path)
+            self._control_state_signature = _control_state_signature(self._control_state_path)
+        self._stop = threading.Event()
+        self._listener: Optional[threading.Thread] = None
+        self.wakeups = 0
+        self.timeouts = 0
+
+    def start(self) -> "PipelineWakeup":
+        with _active_waiters_lock:
+            _active_waiters.add(self)
+        if self.database_url and self._listener is None:
+            self._listener = threading.Thread(
+                target=self._listen_loop,
+                name="entity-pipeline-wakeup-listener",
+                daemon=True,
+            )
+            self._listener.start()
+        return self
+
+    def close(self) -> None:
+        self._stop.set()
+        self._event.set()
+        with _active_waiters_lock:
+            _active_waiters.discard(self)
+
+    def notify(self, reason: str = "notify") -> None:
+        with self._lock:
+            self._reasons.append(str(reason or "notify"))
+        self._event.set()
+
+    def _drain(self) -> str:
+        with self._lock:
+            reasons: List[str] = list(self._reasons)
+            self._reasons.clear()
+            self._event.clear()
+        return reasons[0] if reasons else "notify"
+
+    def _changed_watch_path(self) -> Optional[Path]:
+        for path, previous in self._watch_markers.items():
+            current = _file_marker(path)
+            if current != previous:
+                self._watch_markers[path] = current
+                if current is not None:
+                    return path
+        path = self._control_state_path
+        if path is not None:
+            current = _file_marker(path)
+            if current != self._control_state_marker:
+                self._control_state_marker = current
+                signature = _control_state_signature(path)
+                if signature != self._control_state_signature:
+                    self._control_state_signature = signature
+                    return path
+        return None
+
+    def wait(self, timeout: float) -> Optional[str]:
+        """Return the first wakeup reason, or None once ``timeout`` seconds pass quietly."""
+        deadline = time.monotonic() + max(0.0, float(timeout))
+        while not self._stop.is_set():
+            if self._event.is_set():
+                self.wakeups += 1
+                return self._drain()
+            changed = self._changed_watch_path()
+            if changed is not None:
+                self.wakeups += 1
+                return f"file:{changed.name}"
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.timeouts += 1
+                return None
+            watching = bool(self._watch_markers) or self._control_state_path is not None
+            self._event.wait(min(remaining, self.file_poll_seconds) if watching else remaining)
+        return None
+
+    def _listen_loop(self) -> None:
+        import psycopg
+
+        backoff = 1.0
+        while not self._stop.is_set():
+            try:
+                with psycopg.connect(self.database_url, autocommit=True) as conn:
+                    conn.execute(f"LISTEN {PIPELINE_WAKEUP_CHANNEL}")
+                    if backoff > 1.0:
+                        # Anything sent while disconnected was missed; let the worker re-check.
+                        self.notify("listener_reconnected")
+                    backoff = 1.0
+                    while not self._stop.is_set():
+                        for notification in conn.notifies(timeout=1.0):
+                            self.notify(notification.payload or PIPELINE_WAKEUP_CHANNEL)
+            except Exception as error:
+                if self._stop.is_set():
+                    return
+                logger.warning("Pipeline wakeup listener disconnected: %s", error)
+                self._stop.wait(backoff)
+                backoff = min(30.0, backoff * 2)
+
+
+def notify_pipeline_wakeup(reason: str, *, touch_file: bool = True) -> None:
+    """Wake idle workers in this process and, outside Postgres mode, on this host.
+
+    In Postgres mode the database triggers already notify other processes, so
+    only in-process waiters are signalled here.
+    """
+    with _active_waiters_lock:
+        waiters = list(_active_waiters)
+    for waiter in waiters:
+        waiter.notify(reason)
+    if not touch_file:
+        return
+    try:
+        PIPELINE_WAKEUP_PATH.parent.mkdir(parents=True, exist_ok=True)
+        PIPELINE_WAKEUP_PATH.write_text(f"{reason}\n", encoding="utf-8")
+    except OSError as error:
+        logger.warning("Failed to touch pipeline wakeup file: %s", error)
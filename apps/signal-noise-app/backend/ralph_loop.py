@@ -77,6 +77,11 @@ try:
 except ImportError:  # pragma: no cover - exercised in non-package runtime contexts
     from schemas import RalphDecisionType, SignalClass, HypothesisState
 
+try:
+    from backend.llm_batch_broker import query_json as batched_query_json
+except ImportError:  # pragma: no cover - exercised in non-package runtime contexts
+    from llm_batch_broker import query_json as batched_query_json
+
 # FastAPI imports
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
@@ -1177,7 +1182,8 @@ class RalphLoop:
     async def validate_signals(
         self,
         raw_signals: List[Dict[str, Any]],
-        entity_id: str
+        entity_id: str,
+        prior_signals: Optional[List['Signal']] = None
     ) -> Dict[str, Any]:
         """
         Ralph Loop validation pipeline with signal classification
@@ -1185,6 +1191,8 @@ class RalphLoop:
         Args:
             raw_signals: List of raw signal data from scrapers
             entity_id: Entity identifier for validation context
+            prior_signals: Signals already accepted for this entity by earlier
+                micro-batches; Pass 3 collapses new duplicates of them
 
         Returns:
             Dict with:
@@ -1261,7 +1269,9 @@ class RalphLoop:
 
         # Pass 3: Final confirmation
         logger.info(f"🔁 Pass 3/3: Final confirmation for {entity_id}")
-        pass3_candidates = await self._pass3_final_confirmation(pass2_candidates, entity_id)
+        pass3_candidates = await self._pass3_final_confirmation(
+            pass2_candidates, entity_id, prior_signals=prior_signals
+        )
         pass_results[3] = pass3_candidates
 
         logger.info(f"   ✅ Pass 3: {len(pass3_candidates)}/{len(pass2_candidates)} signals survived")
@@ -1333,6 +1343,47 @@ class RalphLoop:
                 logger.error(f"   ❌ Failed to write signal {signal.id}: {e}")
 
         # NEW: Recalculate hypothesis states by category
+        hypothesis_states = self.recalculate_hypothesis_states(
+            entity_id, validated_signals, capability_signals
+        )
+
+        logger.info(f"✅ Ralph Loop complete: {len(validated_signals)} validated, {len(capability_signals)} capability signals")
+        signal_validations = self._finalize_signal_validations(
+            pass1_candidates=pass1_candidates,
+            pass2_candidates=pass2_candidates,
+            pass3_candidates=pass3_candidates,
+        )
+        aggregation_summary = self._build_aggregation_summary(
+            pass1_candidates=pass1_candidates,
+            pass2_candidates=pass2_candidates,
+            pass3_candidates=pass3_candidates,
+        )
+        self._last_signal_validations = signal_validations
+        self._last_aggregation_summary = aggregation_summary
+
+        return {
+            "validated_signals": validated_signals,
+            "capability_signals": capability_signals,
+            "hypothesis_states": hypothesis_states,
+            "signal_validations": signal_validations,
+            "aggregation_summary": aggregation_summary,
+        }
+
+    def recalculate_hypothesis_states(
+        self,
+        entity_id: str,
+        validated_signals: List['Signal'],
+        capability_signals: List['Signal']
+    ) -> Dict[str, HypothesisState]:
+        """
+        Hypothesis state per category over a full set of classified signals.
+
+        Used at the end of `validate_signals`, and by callers that validate in
+        micro-batches to recompute states over the merged signals.
+        """
+        procurement_indicators = [s for s in validated_signals if getattr(s, 'signal_class', None) != "VALIDATED_RFP"]
+        validated_rfps = [s for s in validated_signals if getattr(s, 'signal_class', None) == "VALIDATED_RFP"]
+
         hypothesis_states = {}
         categories = set(s.subtype for s in validated_signals if hasattr(s, 'subtype'))
 
@@ -1356,27 +1407,7 @@ class RalphLoop:
                        f"activity={hypothesis_states[category].activity_score:.2f}, "
                        f"state={hypothesis_states[category].state}")
 
-        logger.info(f"✅ Ralph Loop complete: {len(validated_signals)} validated, {len(capability_signals)} capability signals")
-        signal_validations = self._finalize_signal_validations(
-            pass1_candidates=pass1_candidates,
-            pass2_candidates=pass2_candidates,
-            pass3_candidates=pass3_candidates,
-        )
-        aggregation_summary = self._build_aggregation_summary(
-            pass1_candidates=pass1_candidates,
-            pass2_candidates=pass2_candidates,
-            pass3_candidates=pass3_candidates,
-        )
-        self._last_signal_validations = signal_validations
-        self._last_aggregation_summary = aggregation_summary
-
-        return {
-            "validated_signals": validated_signals,
-            "capability_signals": capability_signals,
-            "hypothesis_states": hypothesis_states,
-            "signal_validations": signal_validations,
-            "aggregation_summary": aggregation_summary,
-        }
+        return hypothesis_states
 
     async def _pass1_filter(self, raw_signals: List[Dict]) -> List['Signal']:
         """
@@ -1615,10 +1646,12 @@ class RalphLoop:
         max_tokens = 520 if len(batch) == 1 else 760
         try:
             async with semaphore:
-                response = await self.claude_client.query(
+                response = await batched_query_json(
+                    self.claude_client,
+                    family="ralph_pass2_validation",
                     prompt=prompt,
                     max_tokens=max_tokens,
-                    json_mode=True,
+                    required_keys=("validated", "rejected"),
                     max_retries_override=1,
                     empty_retries_before_fallback_override=1,
                 )
@@ -2094,7 +2127,12 @@ Return JSON only:
         if isinstance(response, dict):
             if "validated" in response and "rejected" in response:
                 return response
-            return None
+            structured_output = response.get("structured_output")
+            if isinstance(structured_output, dict):
+                return self._extract_validation_json(structured_output)
+            if not isinstance(response.get("content"), str):
+                return None
+            response = response["content"]
 
         text = response if isinstance(response, str) else str(response)
         text = text.strip()
@@ -2127,19 +2165,22 @@ Return JSON only:
     async def _pass3_final_confirmation(
         self,
         candidates: List['Signal'],
-        entity_id: str
+        entity_id: str,
+        prior_signals: Optional[List['Signal']] = None
     ) -> List['Signal']:
         """
         Pass 3: Final confirmation
 
         Performs:
         - Final confidence scoring
-        - Duplicate detection via embedding similarity
+        - Duplicate detection via embedding similarity (also against
+          `prior_signals` confirmed by earlier micro-batches)
         - Quality assessment
         """
         # For now, this is a simple pass that checks final confidence
         # In production, this could use embeddings for duplicate detection
 
+        prior = list(prior_signals or [])
         confirmed = []
 
         for signal in candidates:
@@ -2148,7 +2189,7 @@ Return JSON only:
                 # Check for near-duplicates in confirmed
                 is_duplicate = False
 
-                for confirmed_signal in confirmed:
+                for confirmed_signal in prior + confirmed:
                     if self._are_signals_duplicate(signal, confirmed_signal):
                         is_duplicate = True
                         logger.debug(f"❌ Pass 3: Duplicate detected: {signal.id} ~ {confirmed_signal.id}")
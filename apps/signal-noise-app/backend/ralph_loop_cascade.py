@@ -181,10 +181,10 @@ class RalphLoopCascade:
     def cluster_intelligence(self):
         """Lazy load cluster intelligence"""
         if self._cluster_intelligence is None:
-            from backend.cluster_intelligence import ClusterIntelligence
-            self._cluster_intelligence = ClusterIntelligence(
-                binding_cache=self._binding_cache
-            )
+            from backend.cluster_intelligence import get_shared_cluster_intelligence
+            # The cascade's binding cache is the default one, so it shares
+            # the default instance rather than keying a second one
+            self._cluster_intelligence = get_shared_cluster_intelligence()
             logger.info("🧠 Cluster intelligence initialized")
         return self._cluster_intelligence
 
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Hedged requests for provider calls with heavy latency tails.
+
+A few stuck Chutes completions or BrightData SERP/scrape calls dominate batch
+p99 latency because each waits for its full timeout before any retry starts.
+``RequestHedger.run`` starts the primary attempt and, if it is still running
+after the endpoint's learned latency percentile, starts one backup attempt
+(same request or an alternate model/zone). The first successful response wins
+and the other attempt is cancelled.
+
+Hedge delays come from per-endpoint ``LatencyHistogram`` windows of recent
+successful latencies, and hedges are limited by a budget (by default 5% of
+primary requests) so hedging cannot amplify load when the provider is slow
+across the board.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import logging
+import math
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Log-spaced bucket upper bounds from 50ms to ~10 minutes.
+_BUCKET_BOUNDS: List[float] = [round(0.05 * (1.25 ** index), 4) for index in range(43)]
+
+
+class LatencyHistogram:
+    """Bucketed latency histogram over a sliding window of recent samples."""
+
+    def __init__(self, window: int = 512):
+        self.window = max(1, int(window))
+        self._samples: Deque[int] = deque()
+        self._counts = [0] * (len(_BUCKET_BOUNDS) + 1)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        bucket = bisect.bisect_left(_BUCKET_BOUNDS, max(0.0, float(seconds)))
+        self._samples.append(bucket)
+        self._counts[bucket] += 1
+        if len(self._samples) > self.window:
+            self._counts[self._samples.popleft()] -= 1
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the ``q`` quantile, or None when empty."""
+        total = len(self._samples)
+        if total == 0:
+            return None
+        rank = max(1, math.ceil(min(1.0, max(0.0, q)) * total))
+        seen = 0
+        for bucket, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                return _BUCKET_BOUNDS[bucket] if bucket < len(_BUCKET_BOUNDS) else _BUCKET_BOUNDS[-1] * 1.25
+        return _BUCKET_BOUNDS[-1]
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "samples": len(self._samples),
+            "p50_seconds": self.percentile(0.5),
+            "p90_seconds": self.percentile(0.9),
+            "p99_seconds": self.percentile(0.99),
+        }
+
+
+@dataclass
+class HedgeStats:
+    primaries: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    budget_denied: int = 0
+
+
+class RequestHedger:
+    """Issues at most one hedge per request once it exceeds the endpoint's latency percentile."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        percentile: float = 0.95,
+        budget_ratio: float = 0.05,
+        min_samples: int = 20,
+        min_delay_seconds: float = 0.25,
+        window: int = 512,
+        max_budget_tokens: float = 5.0,
+    ):
+        self.name = name
+        self.percentile = min(0.999, max(0.5, float(percentile)))
+        self.budget_ratio = max(0.0, float(budget_ratio))
+        self.min_samples = max(1, int(min_samples))
+        self.min_delay_seconds = max(0.0, float(min_delay_seconds))
+        self.window = max(1, int(window))
+        self.max_budget_tokens = max(1.0, float(max_budget_tokens))
+        self.stats = HedgeStats()
+        self._budget_tokens = 0.0
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, name: str) -> "RequestHedger":
+        return cls(
+            name,
+            percentile=float(os.getenv("REQUEST_HEDGE_PERCENTILE", "0.95")),
+            budget_ratio=float(os.getenv("REQUEST_HEDGE_BUDGET_RATIO", "0.05")),
+            min_samples=int(os.getenv("REQUEST_HEDGE_MIN_SAMPLES", "20")),
+            min_delay_seconds=float(os.getenv("REQUEST_HEDGE_MIN_DELAY_SECONDS", "0.25")),
+            window=int(os.getenv("REQUEST_HEDGE_WINDOW", "512")),
+        )
+
+    def histogram(self, endpoint: str) -> LatencyHistogram:
+        with self._lock:
+            histogram = self._histograms.get(endpoint)
+            if histogram is None:
+                histogram = LatencyHistogram(self.window)
+                self._histograms[endpoint] = histogram
+            return histogram
+
+    def record_latency(self, endpoint: str, seconds: float) -> None:
+        histogram = self.histogram(endpoint)
+        with self._lock:
+            histogram.record(seconds)
+
+    def hedge_delay(self, endpoint: str) -> Optional[float]:
+        """Seconds to wait before hedging, or None while the endpoint has too few samples."""
+        histogram = self.histogram(endpoint)
+        with self._lock:
+            if len(histogram) < self.min_samples:
+                return None
+            threshold = histogram.percentile(self.percentile)
+        if threshold is None:
+            return None
+        return max(self.min_delay_seconds, threshold)
+
+    def _note_primary(self) -> None:
+        with self._lock:
+            self.stats.primaries += 1
+            self._budget_tokens = min(self.max_budget_tokens, self._budget_tokens + self.budget_ratio)
+
+    def _try_spend_budget(self) -> bool:
+        with self._lock:
+            if self._budget_tokens >= 1.0:
+                self._budget_tokens -= 1.0
+                self.stats.hedges += 1
+                return True
+            self.stats.budget_denied += 1
+            return False
+
+    async def run(
+        self,
+        endpoint: str,
+        primary: Callable[[], Awaitable[T]],
+        hedge: Optional[Callable[[], Awaitable[T]]] = None,
+        *,
+        is_success: Callable[[Any], bool] = lambda _result: True,
+        hedge_endpoint: Optional[str] = None,
+    ) -> T:
+        """
+        Run ``primary`` and hedge it with ``hedge`` (default: ``primary`` again).
+
+        Returns the first successful result. When neither attempt succeeds the
+        primary's outcome (result or exception) is returned/raised, so callers'
+        existing retry and fallback handling is unchanged. A winning hedge's
+        latency is recorded under ``hedge_endpoint`` (default ``endpoint``), so
+        an alternate model does not skew the primary's delay estimate. Attempts
+        still running when this returns or is cancelled are cancelled.
+        """
+        self._note_primary()
+        delay = self.hedge_delay(endpoint)
+        started = time.monotonic()
+        primary_task = asyncio.ensure_future(primary())
+        tasks = [primary_task]
+        try:
+            if delay is None:
+                result = await primary_task
+                if is_success(result):
+                    self.record_latency(endpoint, time.monotonic() - started)
+                return result
+
+            done, _ = await asyncio.wait({primary_task}, timeout=delay)
+            if done or not self._try_spend_budget():
+                result = await primary_task
+                if is_success(result):
+                    self.record_latency(endpoint, time.monotonic() - started)
+                return result
+
+            logger.info("Hedging %s request after %.2fs", endpoint, delay)
+            hedge_started = time.monotonic()
+            hedge_task = asyncio.ensure_future((hedge or primary)())
+            tasks.append(hedge_task)
+            started_at = {primary_task: (endpoint, started), hedge_task: (hedge_endpoint or endpoint, hedge_started)}
+            pending = {primary_task, hedge_task}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.cancelled() or task.exception() is not None:
+                        continue
+                    result = task.result()
+                    if not is_success(result):
+                        continue
+                    task_endpoint, task_started = started_at[task]
+                    self.record_latency(task_endpoint, time.monotonic() - task_started)
+                    if task is hedge_task:
+                        with self._lock:
+                            self.stats.hedge_wins += 1
+                    return result
+            # Neither attempt succeeded: surface the primary's outcome.
+            return primary_task.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            # Retrieve exceptions so the losing attempt never logs "never retrieved".
+            for task in tasks:
+                if task.done() and not task.cancelled():
+                    task.exception()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            histograms = {endpoint: histogram.snapshot() for endpoint, histogram in self._histograms.items()}
+            stats = asdict(self.stats)
+        return {"name": self.name, **stats, "endpoints": histograms}
+
+
+_hedgers: Dict[str, RequestHedger] = {}
+_hedgers_lock = threading.Lock()
+
+
+def get_request_hedger(name: str) -> RequestHedger:
+    """Process-wide hedger for ``name`` so latency histograms are shared across clients."""
+    with _hedgers_lock:
+        hedger = _hedgers.get(name)
+        if hedger is None:
+            hedger = RequestHedger.from_env(name)
+            _hedgers[name] = hedger
+        return hedger
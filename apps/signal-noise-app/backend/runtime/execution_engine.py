@@ -17,6 +17,7 @@ from datetime import datetime
 
 from backend.template_runtime_binding import RuntimeBinding, RuntimeBindingCache
 from backend.brightdata_sdk_client import BrightDataSDKClient
+from backend.cluster_intelligence import get_shared_cluster_intelligence
 
 logger = logging.getLogger(__name__)
 
@@ -62,7 +63,8 @@ class ExecutionEngine:
     def __init__(
         self,
         binding_cache: Optional[RuntimeBindingCache] = None,
-        brightdata_client: Optional[BrightDataSDKClient] = None
+        brightdata_client: Optional[BrightDataSDKClient] = None,
+        cluster_intelligence=None
     ):
         """
         Initialize execution engine
@@ -70,9 +72,13 @@ class ExecutionEngine:
         Args:
             binding_cache: Optional binding cache (creates default if not provided)
             brightdata_client: Optional BrightData client (creates default if not provided)
+            cluster_intelligence: ClusterIntelligence to receive usage updates
+                (defaults to the process-wide shared instance)
         """
         self.binding_cache = binding_cache or RuntimeBindingCache()
         self.brightdata_client = brightdata_client or BrightDataSDKClient()
+        # Engines on the default binding cache share the default instance
+        self.cluster_intelligence = cluster_intelligence or get_shared_cluster_intelligence(binding_cache)
 
         logger.info("⚙️ ExecutionEngine initialized (deterministic mode)")
 
@@ -124,6 +130,7 @@ class ExecutionEngine:
         # Update binding performance
         binding.mark_used(success=result.success)
         self.binding_cache.set_binding(binding)
+        self.cluster_intelligence.apply_binding_update(binding)
 
         # Add execution time
         result.execution_time_seconds = (datetime.now() - start_time).total_seconds()
@@ -1258,6 +1258,11 @@ class EntityProfile:
     outstanding_questions: List[DossierQuestion] = field(default_factory=list)
     answered_questions: List[DossierQuestion] = field(default_factory=list)
 
+    # Incremental regeneration: last generated dossier sections and the
+    # fingerprint of the inputs each was generated from
+    dossier_sections: List["DossierSection"] = field(default_factory=list)
+    section_fingerprints: Dict[str, str] = field(default_factory=dict)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
         return {
@@ -1284,7 +1289,9 @@ class EntityProfile:
             'mutual_connections': self.mutual_connections,
             'opportunities_detected': self.opportunities_detected,
             'outstanding_questions': [q.to_dict() for q in self.outstanding_questions],
-            'answered_questions': [q.to_dict() for q in self.answered_questions]
+            'answered_questions': [q.to_dict() for q in self.answered_questions],
+            'dossier_sections': [section.to_dict() for section in self.dossier_sections],
+            'section_fingerprints': self.section_fingerprints
         }
 
 
@@ -1299,6 +1306,7 @@ class ProfileChangeType(str, Enum):
     NEW_TECHNOLOGY_DETECTED = "NEW_TECHNOLOGY_DETECTED"
     PARTNERSHIP_CHANGE = "PARTNERSHIP_CHANGE"
     EXECUTIVE_CHANGE = "EXECUTIVE_CHANGE"
+    SECTION_UPDATED = "SECTION_UPDATED"
 
 
 @dataclass
@@ -12,17 +12,21 @@ Schedule:
 
 Each pass:
 1. Executes sweep with configured data sources
-2. Generates/updates entity profile
+2. Generates/updates entity profile (only sections whose inputs changed)
 3. Tracks changes from previous version
-4. Answers high-priority questions
+4. Answers high-priority questions concurrently
 5. Returns sweep results with metrics
+
+execute_sweeps runs one pass for many entities under a shared concurrency
+limit and cost budget.
 """
 
 import asyncio
 import logging
+import os
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from schemas import (
     EntityProfile, ProfileChange, ProfileChangeType,
@@ -43,6 +47,31 @@ except ImportError:  # pragma: no cover - direct backend path execution
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class SweepBudget:
+    """
+    Cost budget shared by the sweeps of a multi-entity run
+
+    Each sweep reserves its config's max_cost_usd before it starts and
+    settles with what it actually spent; sweeps that no longer fit are
+    skipped. Only touched from the event loop, so no locking is needed.
+    """
+    max_cost_usd: Optional[float] = None
+    spent_usd: float = 0.0
+    reserved_usd: float = 0.0
+    skipped: List[str] = field(default_factory=list)
+
+    def try_reserve(self, amount: float) -> bool:
+        if self.max_cost_usd is not None and self.spent_usd + self.reserved_usd + amount > self.max_cost_usd:
+            return False
+        self.reserved_usd += amount
+        return True
+
+    def settle(self, reserved: float, actual: float) -> None:
+        self.reserved_usd -= reserved
+        self.spent_usd += actual
+
+
 class TemporalSweepScheduler:
     """
     Schedule and execute multi-pass temporal sweeps
@@ -78,6 +107,14 @@ class TemporalSweepScheduler:
         self.question_extractor = DossierQuestionExtractor(claude_client)
         self.discovery = HypothesisDrivenDiscovery(claude_client, self.brightdata)
 
+        # Reuse dossier sections whose inputs are unchanged since the previous pass
+        self.incremental_sections = (
+            str(os.getenv("TEMPORAL_SWEEP_INCREMENTAL_SECTIONS", "true")).strip().lower()
+            in {"1", "true", "yes", "on"}
+        )
+        self.question_concurrency = max(1, int(os.getenv("TEMPORAL_SWEEP_QUESTION_CONCURRENCY", "5")))
+        self.entity_concurrency = max(1, int(os.getenv("TEMPORAL_SWEEP_ENTITY_CONCURRENCY", "4")))
+
         # Default sweep schedules (can be customized per entity)
         self.default_sweep_schedule = {
             1: SweepConfig(
@@ -194,24 +231,36 @@ class TemporalSweepScheduler:
         questions_answered = 0
         questions_generated = 0
 
-        # Step 1: Generate dossier sections
+        # Step 1: Generate dossier sections, reusing those whose inputs are unchanged
         logger.info(f"Generating {len(config.sections_to_generate)} sections for pass {pass_number}")
+        incremental = bool(previous_profile and self.incremental_sections)
         dossier = await self.dossier_generator.generate_dossier(
             entity_id=entity_id,
             entity_name=entity_name,
             entity_type=entity_type,
-            priority_score=priority_score
+            priority_score=priority_score,
+            section_ids=config.sections_to_generate,
+            previous_sections=previous_profile.dossier_sections if incremental else None,
+            previous_section_fingerprints=previous_profile.section_fingerprints if incremental else None
         )
         total_cost += dossier.total_cost_usd
-
-        # Step 2: Extract questions from dossier
-        logger.info("Extracting questions from dossier")
-        question_extractor = DossierQuestionExtractor(self.claude)
-        new_questions = await question_extractor.extract_questions_from_dossier(
-            dossier.sections,
-            entity_name,
-            max_per_section=3
-        )
+        reused_sections = set(dossier.metadata.get('reused_sections') or [])
+        regenerated_sections = [s for s in dossier.sections if s.id not in reused_sections]
+
+        # Step 2: Extract questions from regenerated sections (the generator
+        # already does this unless question extraction is disabled there)
+        question_extractor = self.question_extractor
+        if dossier.questions:
+            new_questions = dossier.questions
+        elif regenerated_sections:
+            logger.info("Extracting questions from dossier")
+            new_questions = await question_extractor.extract_questions_from_dossier(
+                regenerated_sections,
+                entity_name,
+                max_per_section=3
+            )
+        else:
+            new_questions = []
         questions_generated = len(new_questions)
 
         # Merge with previous questions
@@ -256,19 +305,19 @@ class TemporalSweepScheduler:
             )
             profile.decision_makers = decision_makers
 
-            # Step 4a: Scrape LinkedIn posts for signals
-            logger.info("Scraping LinkedIn posts for signal detection")
-            linkedin_posts = await self.linkedin_profiler.scrape_linkedin_posts(
-                entity_name,
-                max_posts=20
+            # Step 4a/4b: Scrape LinkedIn posts for signals and company posts
+            # for opportunities (independent, so run together)
+            logger.info("Scraping LinkedIn and company posts for signals and opportunities")
+            linkedin_posts, opportunities = await asyncio.gather(
+                self.linkedin_profiler.scrape_linkedin_posts(
+                    entity_name,
+                    max_posts=20
+                ),
+                self.linkedin_profiler.scrape_company_posts_for_opportunities(
+                    entity_name
+                )
             )
             profile.linkedin_posts = linkedin_posts
-
-            # Step 4b: Scrape company posts for opportunities
-            logger.info("Scraping company posts for opportunities")
-            opportunities = await self.linkedin_profiler.scrape_company_posts_for_opportunities(
-                entity_name
-            )
             profile.opportunities_detected = opportunities
 
             # Step 4c: Find mutual connections (if Yellow Panther profile available)
@@ -283,6 +332,13 @@ class TemporalSweepScheduler:
                 profile.mutual_connections = mutuals
 
         # Step 5: Update profile with discoveries
+        sections_by_id = {s.id: s for s in (previous_profile.dossier_sections if previous_profile else [])}
+        sections_by_id.update((s.id, s) for s in dossier.sections)
+        profile.dossier_sections = list(sections_by_id.values())
+        profile.section_fingerprints = {
+            **(previous_profile.section_fingerprints if previous_profile else {}),
+            **(dossier.metadata.get('section_fingerprints') or {})
+        }
         profile.outstanding_questions = [q for q in all_questions if q.status == DossierQuestionStatus.PENDING]
         profile.answered_questions = [q for q in all_questions if q.status == DossierQuestionStatus.ANSWERED]
         profile.questions_total = len(all_questions)
@@ -365,6 +421,81 @@ class TemporalSweepScheduler:
         logger.info(f"Completed {len(results)} sweep passes for {entity_name}")
         return results
 
+    async def execute_sweeps(
+        self,
+        entities: List[Dict[str, Any]],
+        pass_number: int = 4,
+        previous_profiles: Optional[Dict[str, EntityProfile]] = None,
+        max_concurrency: Optional[int] = None,
+        max_total_cost_usd: Optional[float] = None,
+        budget: Optional[SweepBudget] = None
+    ) -> Dict[str, SweepResult]:
+        """
+        Execute one sweep pass for many entities concurrently
+
+        Sweeps share a concurrency limit and a cost budget. Entities whose
+        sweep no longer fits in the budget are skipped and recorded on it.
+
+        Args:
+            entities: Dicts with entity_id, entity_name and optional entity_type / priority_score
+            pass_number: Which sweep pass to run for every entity
+            previous_profiles: Profiles from the previous pass, by entity id
+            max_concurrency: Concurrent sweeps (default TEMPORAL_SWEEP_ENTITY_CONCURRENCY)
+            max_total_cost_usd: Cost budget across all sweeps (unbounded if None)
+            budget: Existing budget to draw from, e.g. across several calls
+
+        Returns:
+            SweepResult per completed entity id
+        """
+        previous_profiles = previous_profiles or {}
+        budget = budget or SweepBudget(max_cost_usd=max_total_cost_usd)
+        semaphore = asyncio.Semaphore(max(1, int(max_concurrency or self.entity_concurrency)))
+        config = self.default_sweep_schedule.get(pass_number, self.default_sweep_schedule[4])
+        reservation = config.max_cost_usd
+
+        logger.info(f"Scheduling pass {pass_number} sweeps for {len(entities)} entities")
+
+        async def _sweep(entity: Dict[str, Any]) -> Optional[SweepResult]:
+            entity_id = entity['entity_id']
+            async with semaphore:
+                if not budget.try_reserve(reservation):
+                    budget.skipped.append(entity_id)
+                    return None
+                previous_profile = previous_profiles.get(entity_id)
+                spent = 0.0
+                try:
+                    result = await self.execute_sweep(
+                        entity_id=entity_id,
+                        entity_name=entity.get('entity_name') or entity_id,
+                        entity_type=entity.get('entity_type', 'CLUB'),
+                        priority_score=entity.get('priority_score', 50),
+                        pass_number=pass_number,
+                        previous_profile=previous_profile,
+                        previous_questions=(
+                            previous_profile.outstanding_questions + previous_profile.answered_questions
+                            if previous_profile else None
+                        )
+                    )
+                    spent = result.cost_usd
+                    return result
+                finally:
+                    budget.settle(reservation, spent)
+
+        outcomes = await asyncio.gather(*(_sweep(entity) for entity in entities), return_exceptions=True)
+
+        results: Dict[str, SweepResult] = {}
+        for entity, outcome in zip(entities, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Sweep pass {pass_number} failed for {entity['entity_id']}: {outcome}")
+            elif outcome is not None:
+                results[entity['entity_id']] = outcome
+
+        logger.info(
+            f"Completed {len(results)}/{len(entities)} pass {pass_number} sweeps, "
+            f"${budget.spent_usd:.4f} spent, {len(budget.skipped)} skipped for budget"
+        )
+        return results
+
     def _merge_questions(
         self,
         previous_questions: List[DossierQuestion],
@@ -422,8 +553,9 @@ class TemporalSweepScheduler:
 
         answers = {}
         confidences = {}
+        semaphore = asyncio.Semaphore(self.question_concurrency)
 
-        for question in questions:
+        async def _answer(question: DossierQuestion) -> None:
             # Use question's search strategy
             search_strategy = question.search_strategy
 
@@ -431,7 +563,8 @@ class TemporalSweepScheduler:
             try:
                 if search_strategy.get('search_queries'):
                     query = search_strategy['search_queries'][0]
-                    results = await self.brightdata.search_engine(query, engine='google', num_results=3)
+                    async with semaphore:
+                        results = await self.brightdata.search_engine(query, engine='google', num_results=3)
 
                     if results.get('status') == 'success':
                         # Extract answer from results
@@ -445,6 +578,8 @@ class TemporalSweepScheduler:
             except Exception as e:
                 logger.error(f"Error answering question {question.question_id}: {e}")
 
+        await asyncio.gather(*(_answer(question) for question in questions))
+
         return {
             'answers': answers,
             'confidences': confidences,
@@ -514,6 +649,26 @@ class TemporalSweepScheduler:
                 confidence_delta=0.05 * new_decision_makers
             ))
 
+        # Sections whose inputs changed (fingerprints carry over for sections
+        # a pass did not regenerate, so those never register as changes)
+        for section_id, fingerprint in new_profile.section_fingerprints.items():
+            previous_fingerprint = old_profile.section_fingerprints.get(section_id)
+            if previous_fingerprint == fingerprint:
+                continue
+            changes.append(ProfileChange(
+                change_id=f"section_{section_id}_{new_profile.entity_id}_{new_profile.profile_version}",
+                entity_id=new_profile.entity_id,
+                from_version=old_profile.profile_version,
+                to_version=new_profile.profile_version,
+                change_type=ProfileChangeType.SECTION_UPDATED,
+                description=(
+                    f"Section {section_id} regenerated (inputs changed)"
+                    if previous_fingerprint else f"Section {section_id} generated"
+                ),
+                previous_value=previous_fingerprint,
+                new_value=fingerprint
+            ))
+
         # Signals detected
         new_signals = new_profile.signals_detected - old_profile.signals_detected
         if new_signals > 0:
@@ -0,0 +1,154 @@
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from backend.batch_dossier_generator import (
+    BatchDossierGenerator,
+    BatchProgress,
+    CompletionLedger,
+    DossierOutput,
+    EntityRecord,
+)
+
+
+class _FakeUniversalGenerator:
+    def __init__(self, delays, fail_ids=()):
+        self.delays = delays
+        self.fail_ids = set(fail_ids)
+        self.started = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate_universal_dossier(self, entity_id, entity_name, entity_type, priority_score):
+        self.started.append(entity_id)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(entity_id, 0.0))
+            if entity_id in self.fail_ids:
+                raise RuntimeError(f"boom {entity_id}")
+            return {"entity_id": entity_id, "entity_name": entity_name}
+        finally:
+            self.in_flight -= 1
+
+
+def _make_generator(tmp_path, fake, max_concurrent=2):
+    generator = BatchDossierGenerator(
+        claude_client=object(),
+        max_concurrent=max_concurrent,
+        output_dir=str(tmp_path),
+    )
+    generator.generator = fake
+    return generator
+
+
+def _output(entity_id):
+    return DossierOutput(entity_id=entity_id, entity_name=entity_id.title(), tier="PREMIUM", success=True)
+
+
+def _entities(*ids):
+    return [EntityRecord(entity_id=entity_id, entity_name=entity_id.title(), priority_score=60) for entity_id in ids]
+
+
+@pytest.mark.asyncio
+async def test_sliding_window_starts_next_entity_when_any_slot_frees(tmp_path):
+    # "slow" holds one slot; the other slot should drain the rest meanwhile
+    fake = _FakeUniversalGenerator({"slow": 0.2, "a": 0.01, "b": 0.01, "c": 0.01})
+    generator = _make_generator(tmp_path, fake, max_concurrent=2)
+
+    outputs, progress = await generator.generate_batch(_entities("slow", "a", "b", "c"), force_refresh=True)
+
+    assert fake.started[:4] == ["slow", "a", "b", "c"]
+    assert fake.max_in_flight == 2
+    assert [output.entity_id for output in outputs] == ["slow", "a", "b", "c"]
+    assert progress.completed == 4
+    assert progress.pending_by_tier == {"PREMIUM": 0}
+
+
+@pytest.mark.asyncio
+async def test_resume_skips_entities_completed_in_ledger(tmp_path):
+    fake = _FakeUniversalGenerator({}, fail_ids={"b"})
+    generator = _make_generator(tmp_path, fake)
+
+    _, first = await generator.generate_batch(_entities("a", "b", "c"), force_refresh=True)
+    assert first.completed == 2
+    assert first.failed == 1
+
+    ledger_lines = (tmp_path / "_completion_ledger.jsonl").read_text().strip().splitlines()
+    assert len(ledger_lines) == 3
+
+    fake.fail_ids.clear()
+    fake.started.clear()
+    outputs, second = await generator.generate_batch(_entities("a", "b", "c"), force_refresh=True, resume=True)
+
+    assert fake.started == ["b"]
+    assert second.resumed == 2
+    assert second.completed == 1
+
+    # Entities finished by the first run are merged back in input order
+    assert [output.entity_id for output in outputs] == ["a", "b", "c"]
+    assert all(output.success for output in outputs)
+    assert outputs[0].dossier_data == {"entity_id": "a", "entity_name": "A"}
+    summaries = sorted(tmp_path.glob("_batch_summary_*.json"))
+    summary = json.loads(summaries[-1].read_text())
+    assert [output["entity_id"] for output in summary["outputs"]] == ["a", "b", "c"]
+
+
+def test_ledger_ignores_torn_trailing_line(tmp_path):
+    path = tmp_path / "ledger.jsonl"
+    path.write_text(
+        json.dumps({"entity_id": "a", "tier": "PREMIUM", "success": True}) + "\n"
+        + '{"entity_id": "b", "tier": "PREM'
+    )
+
+    ledger = CompletionLedger(path)
+
+    assert ledger.is_completed("a", "PREMIUM")
+    assert not ledger.is_completed("a", "BASIC")
+    assert not ledger.is_completed("b")
+
+
+def test_ledger_truncates_torn_line_before_next_append(tmp_path):
+    path = tmp_path / "ledger.jsonl"
+    path.write_text(
+        json.dumps({"entity_id": "a", "tier": "PREMIUM", "success": True}) + "\n"
+        + '{"entity_id": "b", "tier": "PREM'
+    )
+
+    CompletionLedger(path).record(_output("c"))
+
+    reloaded = CompletionLedger(path)
+    assert reloaded.is_completed("a")
+    assert reloaded.is_completed("c")
+    assert len(path.read_text().splitlines()) == 2
+
+
+@pytest.mark.asyncio
+async def test_same_entity_object_listed_twice_keeps_both_positions(tmp_path):
+    fake = _FakeUniversalGenerator({})
+    generator = _make_generator(tmp_path, fake)
+    a, b = _entities("a", "b")
+
+    outputs, progress = await generator.generate_batch([a, b, a], force_refresh=True)
+
+    assert [output.entity_id for output in outputs] == ["a", "b", "a"]
+    assert progress.completed == 3
+
+
+def test_eta_uses_per_tier_median_latency_over_worker_pool():
+    progress = BatchProgress(total_entities=6, concurrency=2)
+    progress.pending_by_tier = {"BASIC": 3, "PREMIUM": 3}
+    for latency in (1.0, 2.0, 30.0):
+        progress.record_result("BASIC", latency)
+    progress.record_result("PREMIUM", 40.0)
+
+    # BASIC: 0 pending left; PREMIUM: 2 pending at a 40s median, over 2 slots
+    assert progress.pending_by_tier == {"BASIC": 0, "PREMIUM": 2}
+    assert progress.estimate_remaining_seconds() == pytest.approx(40.0)
+    assert progress.get_latency_percentiles()["BASIC"]["p50"] == 2.0
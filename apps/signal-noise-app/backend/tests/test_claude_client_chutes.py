@@ -3,6 +3,7 @@
 Tests for ClaudeClient provider selection and Chutes transport support.
 """
 
+import json
 import sys
 from pathlib import Path
 import pytest
@@ -1601,3 +1602,195 @@ async def test_claude_client_waits_for_threshold_before_fallback_on_retryable_er
     assert request_models[5] == "moonshotai/Kimi-K2.5-TEE"
     assert result["content"] == "Fallback after threshold"
     assert result["model_used"] == "moonshotai/Kimi-K2.5-TEE"
+
+
+def _counting_json_transport(monkeypatch, contents):
+    requests = []
+
+    class FakeResponse:
+        def __init__(self, content):
+            self.content = content
+
+        def raise_for_status(self):
+            return None
+
+        def json(self):
+            return {
+                "choices": [{"message": {"content": self.content}, "finish_reason": "stop"}],
+                "usage": {"prompt_tokens": 40, "completion_tokens": 12, "total_tokens": 52},
+            }
+
+    class FakeAsyncClient:
+        def __init__(self, timeout):
+            self.timeout = timeout
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):
+            return False
+
+        async def post(self, url, headers=None, json=None):
+            requests.append(json)
+            return FakeResponse(contents[min(len(requests), len(contents)) - 1])
+
+    monkeypatch.setattr(claude_client_module.httpx, "AsyncClient", FakeAsyncClient)
+    return requests
+
+
+@pytest.mark.asyncio
+async def test_response_cache_replays_identical_json_prompts(monkeypatch, tmp_path):
+    monkeypatch.setenv("LLM_PROVIDER", ClaudeClient.PROVIDER_CHUTES_OPENAI)
+    monkeypatch.setenv("CHUTES_API_KEY", "test-chutes-key")
+    monkeypatch.setenv("LLM_RESPONSE_CACHE_ENABLED", "true")
+    cache_path = tmp_path / "llm_cache.sqlite3"
+    monkeypatch.setenv("LLM_RESPONSE_CACHE_PATH", str(cache_path))
+    requests = _counting_json_transport(monkeypatch, ['{"decision": "ACCEPT"}'])
+
+    client = ClaudeClient()
+    kwargs = {"prompt": "evaluate page", "model": "haiku", "max_tokens": 120, "json_mode": True}
+    first = await client.query(**kwargs)
+    second = await client.query(**kwargs)
+
+    assert len(requests) == 1
+    assert "response_cache" not in first
+    assert second["response_cache"]["hit"] is True
+    assert second["content"] == first["content"]
+    assert client.get_runtime_diagnostics()["llm_last_status"] == "cache_hit"
+
+    # Any change to the request shape is a different key; opt-out always goes to the provider.
+    await client.query(**{**kwargs, "max_tokens": 121})
+    await client.query(**kwargs, cache=False)
+    assert len(requests) == 3
+
+    # Tools are part of the key: different tools miss, the same tools replay.
+    tools = [{"name": "lookup", "input_schema": {"type": "object"}}]
+    await client.query(**kwargs, tools=tools)
+    await client.query(**kwargs, tools=[{**tools[0], "name": "search"}])
+    assert len(requests) == 5
+    await client.query(**kwargs, tools=tools)
+    assert len(requests) == 5
+
+    # The store survives a new client (a re-run of the same entity).
+    await client.close()
+    rerun = ClaudeClient()
+    replayed = await rerun.query(**kwargs)
+    assert len(requests) == 5
+    assert replayed["response_cache"]["hit"] is True
+    stats = rerun.get_response_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["saved_input_tokens"] == 40
+    assert stats["saved_output_tokens"] == 12
+
+
+@pytest.mark.asyncio
+async def test_response_cache_skips_free_text_and_unparseable_json(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", ClaudeClient.PROVIDER_CHUTES_OPENAI)
+    monkeypatch.setenv("CHUTES_API_KEY", "test-chutes-key")
+    monkeypatch.setenv("LLM_RESPONSE_CACHE_ENABLED", "true")
+    monkeypatch.setenv("LLM_RESPONSE_CACHE_PATH", ":memory:")
+    requests = _counting_json_transport(monkeypatch, ["not json", '{"ok": true}'])
+
+    client = ClaudeClient()
+    await client.query(prompt="repair me", model="haiku", max_tokens=64, json_mode=True)
+    repaired = await client.query(prompt="repair me", model="haiku", max_tokens=64, json_mode=True)
+    assert repaired["content"] == '{"ok": true}'
+    assert len(requests) == 2
+
+    await client.query(prompt="write prose", model="haiku", max_tokens=64)
+    await client.query(prompt="write prose", model="haiku", max_tokens=64)
+    assert len(requests) == 4
+
+
+def test_response_cache_evicts_least_recently_used_and_expired(monkeypatch):
+    from llm_response_cache import LLMResponseCache
+
+    cache = LLMResponseCache(path=":memory:", ttl_seconds=60, max_entries=2)
+    cache.put("a", {"content": "A"})
+    cache.put("b", {"content": "B"})
+    assert cache.get("a")["content"] == "A"
+    cache.put("c", {"content": "C"})
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats.evictions == 1
+
+    clock = {"now": claude_client_module.time.time() + 120}
+    monkeypatch.setattr("llm_response_cache.time.time", lambda: clock["now"])
+    assert cache.get("c") is None
+    assert cache.stats.expired == 1
+
+
+@pytest.mark.asyncio
+async def test_claude_client_json_stream_stops_once_object_is_complete(monkeypatch):
+    monkeypatch.setenv("CHUTES_STREAM_ENABLED", "true")
+    monkeypatch.setenv("CHUTES_STREAM_JSON_EARLY_STOP", "true")
+    monkeypatch.setenv("LLM_PROVIDER", ClaudeClient.PROVIDER_CHUTES_OPENAI)
+    monkeypatch.setenv("CHUTES_API_KEY", "test-chutes-key")
+    monkeypatch.setenv("CHUTES_MODEL", "zai-org/GLM-5-TEE")
+    consumed = []
+
+    class FakeStreamResponse:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):
+            return False
+
+        def raise_for_status(self):
+            return None
+
+        async def aiter_lines(self):
+            for piece in ['{"decision": "ACC', 'EPT", "confidence_delta": 0.1}', "\\n\\nExplanation: the page", " mentions"]:
+                consumed.append(piece)
+                yield "data: " + json.dumps({"choices": [{"delta": {"content": piece}, "finish_reason": None}]})
+            yield "data: [DONE]"
+
+    class FakeAsyncClient:
+        def __init__(self, timeout):
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):
+            return False
+
+        def stream(self, method, url, headers=None, json=None):
+            return FakeStreamResponse()
+
+    monkeypatch.setattr(claude_client_module.httpx, "AsyncClient", FakeAsyncClient)
+
+    client = ClaudeClient()
+    result = await client.query(prompt="evaluate", model="haiku", max_tokens=64, json_mode=True)
+
+    assert len(consumed) == 2
+    assert json.loads(result["content"]) == {"decision": "ACCEPT", "confidence_delta": 0.1}
+
+
+@pytest.mark.asyncio
+async def test_claude_client_does_not_retry_requests_shed_by_scheduler(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", ClaudeClient.PROVIDER_CHUTES_OPENAI)
+    monkeypatch.setenv("CHUTES_API_KEY", "test-chutes-key")
+    monkeypatch.setenv("CHUTES_BASE_URL", "https://llm.chutes.ai/v1")
+    monkeypatch.setenv("CHUTES_MODEL", "zai-org/GLM-5-TEE")
+    monkeypatch.setenv("CHUTES_MAX_RETRIES", "3")
+
+    attempts = {"count": 0}
+
+    class SheddingScheduler:
+        def slot(self):
+            attempts["count"] += 1
+            raise claude_client_module.LLMAdmissionRejected("bulk LLM request shed during provider cooldown")
+
+    async def fake_sleep(seconds):
+        return None
+
+    monkeypatch.setattr(claude_client_module.asyncio, "sleep", fake_sleep)
+
+    client = ClaudeClient()
+    client._llm_scheduler = SheddingScheduler()
+    with pytest.raises(claude_client_module.LLMAdmissionRejected):
+        await client.query(prompt="shed me", model="haiku", max_tokens=64)
+
+    assert attempts["count"] == 1
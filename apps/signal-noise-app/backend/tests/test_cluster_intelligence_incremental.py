@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental cluster intelligence rollups.
+"""
+
+import asyncio
+import json
+import random
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+try:
+    import template_runtime_binding  # noqa: F401
+except ImportError:
+    # Binding model is not in this tree; these tests inject their own cache
+    _stub = types.ModuleType("template_runtime_binding")
+    _stub.RuntimeBinding = type("RuntimeBinding", (), {})
+    _stub.RuntimeBindingCache = type("RuntimeBindingCache", (), {"list_bindings": lambda self, template_id=None: []})
+    sys.modules["template_runtime_binding"] = _stub
+
+import binding_feedback_processor
+import cluster_intelligence as cluster_module
+from binding_feedback_processor import BindingFeedbackProcessor
+from cluster_intelligence import ClusterIntelligence
+
+CLUSTER = "tier_1_club_centralized_procurement"
+CHANNELS = ["jobs_board", "official_site", "press", "linkedin"]
+SIGNALS = ["Strategic Hire", "Digital Transformation", "Partnership"]
+
+
+class _FakeBindingCache:
+    def __init__(self, bindings=()):
+        self.bindings = {binding["entity_id"]: binding for binding in bindings}
+        self.list_calls = 0
+
+    def list_bindings(self, template_id=None):
+        self.list_calls += 1
+        return [
+            binding for binding in self.bindings.values()
+            if template_id is None or binding["template_id"] == template_id
+        ]
+
+
+def _binding(entity_id, rng, cluster_id=CLUSTER, state="PROMOTED"):
+    return {
+        "template_id": cluster_id,
+        "entity_id": entity_id,
+        "usage_count": rng.randint(0, 10),
+        "success_rate": round(rng.random(), 3),
+        "confidence_adjustment": round(rng.uniform(-0.2, 0.2), 3),
+        "discovered_channels": {channel: [f"https://{channel}"] for channel in rng.sample(CHANNELS, rng.randint(1, 3))},
+        "enriched_patterns": {signal: [signal] if rng.random() > 0.3 else [] for signal in rng.sample(SIGNALS, 2)},
+        "state": state,
+    }
+
+
+def _intelligence(tmp_path, bindings=()):
+    cache = _FakeBindingCache(bindings)
+    return ClusterIntelligence(binding_cache=cache, cache_path=str(tmp_path / "cluster_intelligence.json")), cache
+
+
+def _assert_same_stats(actual, expected):
+    assert actual.total_bindings == expected.total_bindings
+    assert actual.discovery_shortcuts == expected.discovery_shortcuts
+    assert actual.channel_effectiveness == pytest.approx(expected.channel_effectiveness)
+    assert actual.signal_reliability == pytest.approx(expected.signal_reliability)
+    assert actual.metadata == pytest.approx(expected.metadata)
+
+
+def test_deltas_match_a_full_rollup(tmp_path):
+    rng = random.Random(3)
+    intelligence, cache = _intelligence(tmp_path, [_binding(f"e{index}", rng) for index in range(20)])
+    intelligence.rollup_cluster_data(CLUSTER)
+
+    for step in range(200):
+        entity_id = f"e{rng.randint(0, 29)}"
+        if rng.random() < 0.1 and entity_id in cache.bindings:
+            del cache.bindings[entity_id]
+            intelligence.remove_binding(CLUSTER, entity_id)
+            continue
+        binding = _binding(entity_id, rng, state="PROMOTED" if rng.random() > 0.25 else "RETIRED")
+        cache.bindings[entity_id] = binding
+        intelligence.apply_binding_update(binding)
+
+    incremental = intelligence.get_cluster_stats(CLUSTER)
+    list_calls = cache.list_calls
+    reference, _ = _intelligence(tmp_path / "reference", cache.bindings.values())
+
+    _assert_same_stats(incremental, reference.rollup_cluster_data(CLUSTER))
+    assert list_calls == 1
+
+
+def test_priorities_are_cached_lookups(tmp_path):
+    rng = random.Random(5)
+    intelligence, cache = _intelligence(tmp_path, [_binding("e0", rng)])
+
+    assert intelligence.get_channel_priorities("empty_cluster") == []
+    assert intelligence.get_channel_priorities("empty_cluster") == []
+    first = intelligence.get_channel_priorities(CLUSTER)
+    assert intelligence.get_channel_priorities(CLUSTER) == first
+    assert cache.list_calls == 2
+
+    # A newly promoted binding reorders shortcuts without another rollup
+    intelligence.apply_binding_update({
+        "template_id": CLUSTER,
+        "entity_id": "e1",
+        "usage_count": 100,
+        "success_rate": 1.0,
+        "confidence_adjustment": 0.0,
+        "discovered_channels": {"rss": ["https://feed"]},
+        "enriched_patterns": {},
+        "state": "PROMOTED",
+    })
+    assert intelligence.get_channel_priorities(CLUSTER)[0] == "rss"
+    assert cache.list_calls == 2
+
+
+def test_persistence_is_batched_atomic_and_reloadable(tmp_path, monkeypatch):
+    monkeypatch.setattr(cluster_module, "CLUSTER_INTELLIGENCE_SAVE_BATCH_SIZE", 3)
+    monkeypatch.setattr(cluster_module, "CLUSTER_INTELLIGENCE_SAVE_INTERVAL_SECONDS", 3600.0)
+    rng = random.Random(11)
+    intelligence, cache = _intelligence(tmp_path)
+    saves = []
+    original_save = intelligence._save_cache
+    monkeypatch.setattr(intelligence, "_save_cache", lambda: (saves.append(1), original_save()))
+
+    for index in range(3):
+        intelligence.apply_binding_update(_binding(f"e{index}", rng, cluster_id=f"cluster_{index}"))
+    assert len(saves) == 1
+
+    with intelligence.batch_updates():
+        for index in range(10):
+            intelligence.apply_binding_update(_binding(f"e{index}", rng, cluster_id=f"cluster_{index % 5}"))
+    assert len(saves) == 2
+
+    intelligence.apply_binding_update(_binding("late", rng, cluster_id="cluster_0"))
+    assert len(saves) == 2
+    intelligence.flush()
+    assert len(saves) == 3
+    assert [path.name for path in tmp_path.iterdir()] == ["cluster_intelligence.json"]
+
+    reloaded, reloaded_cache = _intelligence(tmp_path)
+    for cluster_id, stats in intelligence.get_all_cluster_stats().items():
+        _assert_same_stats(reloaded.get_all_cluster_stats()[cluster_id], stats)
+
+    # Reloaded aggregates keep applying deltas without a rebuild
+    reloaded.apply_binding_update(_binding("e0", rng, cluster_id="cluster_0", state="RETIRED"))
+    assert reloaded_cache.list_calls == 0
+    assert "e0" not in reloaded._aggregates["cluster_0"].members
+
+
+def test_stats_loaded_from_disk_or_past_max_age_are_rolled_up(tmp_path, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(cluster_module.time, "monotonic", lambda: clock[0])
+    rng = random.Random(17)
+    intelligence, _ = _intelligence(tmp_path, [_binding("e0", rng)])
+    intelligence.rollup_cluster_data(CLUSTER)
+
+    # Another process promotes a binding this one never saw
+    reloaded, cache = _intelligence(tmp_path, [_binding("e0", rng), _binding("e1", rng)])
+    assert reloaded.get_all_cluster_stats()[CLUSTER].total_bindings == 1
+    assert reloaded.get_cluster_stats(CLUSTER).total_bindings == 2
+    assert cache.list_calls == 1
+
+    reloaded.get_channel_priorities(CLUSTER)
+    assert cache.list_calls == 1
+
+    cache.bindings["e2"] = _binding("e2", rng)
+    clock[0] += cluster_module.CLUSTER_INTELLIGENCE_MAX_AGE_SECONDS + 1
+    reloaded.get_channel_priorities(CLUSTER)
+    assert cache.list_calls == 2
+    assert reloaded.get_all_cluster_stats()[CLUSTER].total_bindings == 3
+
+
+def test_refresh_all_clusters_lists_bindings_once_and_saves_once(tmp_path, monkeypatch):
+    rng = random.Random(13)
+    bindings = [_binding(f"e{index}", rng, cluster_id=f"cluster_{index % 4}") for index in range(40)]
+    intelligence, cache = _intelligence(tmp_path, bindings)
+    saves = []
+    original_save = intelligence._save_cache
+    monkeypatch.setattr(intelligence, "_save_cache", lambda: (saves.append(1), original_save()))
+
+    intelligence.refresh_all_clusters()
+
+    assert cache.list_calls == 1
+    assert len(saves) == 1
+    assert set(intelligence.get_all_cluster_stats()) == {f"cluster_{index}" for index in range(4)}
+
+
+def test_feedback_processor_defaults_to_shared_intelligence(tmp_path, monkeypatch):
+    intelligence, _ = _intelligence(tmp_path)
+    monkeypatch.setattr(cluster_module, "_shared_intelligence", intelligence)
+
+    processor = binding_feedback_processor.BindingFeedbackProcessor(
+        bindings_dir=tmp_path / "bindings",
+        feedback_log_path=tmp_path / "feedback.jsonl",
+        rediscovery_queue_dir=tmp_path / "rediscovery",
+    )
+
+    assert processor.cluster_intelligence is intelligence
+    assert cluster_module.get_shared_cluster_intelligence() is intelligence
+
+
+def test_shared_intelligence_is_keyed_by_binding_cache(tmp_path, monkeypatch):
+    default, _ = _intelligence(tmp_path)
+    monkeypatch.setattr(cluster_module, "_shared_intelligence", default)
+    monkeypatch.setattr(cluster_module, "_shared_intelligence_by_cache", {})
+    monkeypatch.chdir(tmp_path)
+    first_cache, second_cache = _FakeBindingCache(), _FakeBindingCache()
+
+    first = cluster_module.get_shared_cluster_intelligence(first_cache)
+    second = cluster_module.get_shared_cluster_intelligence(second_cache)
+
+    assert cluster_module.get_shared_cluster_intelligence() is default
+    assert first.binding_cache is first_cache
+    assert second.binding_cache is second_cache
+    assert cluster_module.get_shared_cluster_intelligence(first_cache) is first
+
+    flushed = []
+    for intelligence in (default, first, second):
+        monkeypatch.setattr(intelligence, "flush", lambda name=id(intelligence): flushed.append(name))
+    cluster_module._flush_shared_cluster_intelligence()
+    assert sorted(flushed) == sorted([id(default), id(first), id(second)])
+
+
+def test_feedback_processor_applies_promotion_to_cluster(tmp_path):
+    intelligence, cache = _intelligence(tmp_path)
+    bindings_dir = tmp_path / "bindings"
+    processor = BindingFeedbackProcessor(
+        bindings_dir=bindings_dir,
+        feedback_log_path=tmp_path / "feedback.jsonl",
+        rediscovery_queue_dir=tmp_path / "rediscovery",
+        cluster_intelligence=intelligence,
+    )
+    binding = {
+        "template_id": CLUSTER,
+        "entity_id": "arsenal",
+        "usage_count": 2,
+        "success_rate": 0.7,
+        "confidence_adjustment": 0.5,
+        "discovered_channels": {"press": ["https://arsenal.com/news"]},
+        "enriched_patterns": {"Partnership": ["New CRM partner"]},
+        "state": "EXPLORING",
+    }
+    (bindings_dir / "arsenal.json").write_text(json.dumps(binding))
+
+    result = asyncio.run(processor.process_ralph_loop_feedback(
+        entity_id="arsenal",
+        signal_id="signal-1",
+        pattern_id="Partnership",
+        validation_result="validated",
+        confidence=0.9,
+    ))
+
+    assert result.lifecycle_transition == "PROMOTED"
+    stats = intelligence.get_cluster_stats(CLUSTER)
+    assert stats.total_bindings == 1
+    assert stats.discovery_shortcuts == ["press"]
+    assert stats.metadata["avg_usage_count"] == 3
@@ -470,5 +470,23 @@ def test_confidence_validation_to_dict():
     assert 'validation_timestamp' in result
 
 
+
+@pytest.mark.asyncio
+async def test_pass3_collapses_duplicates_of_prior_batches(ralph_loop):
+    """Signals accepted by an earlier micro-batch count as already confirmed"""
+    now = datetime.now(timezone.utc)
+
+    def signal(signal_id, signal_type, confidence=0.8):
+        return Signal(id=signal_id, type=signal_type, confidence=confidence, entity_id="test-entity", first_seen=now)
+
+    prior = [signal("earlier", SignalType.RFP_DETECTED)]
+    candidates = [signal("duplicate", SignalType.RFP_DETECTED, 0.85), signal("fresh", SignalType.EXECUTIVE_CHANGE)]
+
+    confirmed = await ralph_loop._pass3_final_confirmation(candidates, "test-entity", prior_signals=prior)
+
+    assert [s.id for s in confirmed] == ["fresh"]
+    assert [s.id for s in await ralph_loop._pass3_final_confirmation(candidates, "test-entity")] == ["duplicate", "fresh"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
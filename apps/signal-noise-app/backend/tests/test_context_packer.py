@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests for token-budgeted context packing.
+"""
+
+import sys
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from context_packer import estimate_tokens, model_token_budget, pack_context, split_passages, truncate_to_tokens
+
+
+FILLER = "The club shop opens at nine and sells scarves, shirts and matchday programmes."
+
+
+def test_relevant_passages_win_and_budget_is_never_exceeded():
+    page = " ".join(
+        [FILLER] * 6
+        + ["Arsenal issued a procurement tender for a new CRM platform supplier."]
+        + [FILLER] * 6
+    )
+    packed = pack_context("Arsenal CRM procurement tender", {"page": page}, budget_tokens=30)
+
+    assert "procurement tender" in packed.sections["page"]
+    assert packed.packed_tokens <= 30
+    assert packed.saved_tokens == packed.input_tokens - packed.packed_tokens > 0
+
+
+def test_near_duplicates_across_sources_are_packed_once():
+    story = "Arsenal appointed Jane Doe as Chief Digital Officer to lead the data platform rollout."
+    packed = pack_context(
+        "Arsenal digital leadership",
+        {"press": story, "linkedin": story + " ", "site": "Arsenal fixtures are listed online."},
+        budget_tokens=200,
+    )
+
+    assert packed.dropped_duplicates == 1
+    assert sum(1 for text in packed.sections.values() if "Chief Digital Officer" in text) == 1
+    assert packed.sections["site"]
+
+
+def test_source_caps_and_document_order():
+    text = "Alpha procurement note. Beta unrelated note. Gamma procurement note."
+    packed = pack_context(
+        "procurement",
+        {"a": text, "b": "procurement " * 50},
+        budget_tokens=500,
+        source_caps={"b": 10},
+        max_passage_tokens=5,
+    )
+
+    assert packed.sections["a"].index("Alpha") < packed.sections["a"].index("Gamma")
+    assert estimate_tokens(packed.sections["b"]) <= 10
+
+
+def test_token_helpers():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("hello, world") == 3
+    assert estimate_tokens(truncate_to_tokens("one two three four", 2)) == 2
+    assert all(estimate_tokens(chunk) <= 8 for chunk in split_passages("word " * 40, max_passage_tokens=8))
+    assert model_token_budget("sonnet") > model_token_budget("haiku")
+    assert model_token_budget("unknown", default=123) == 123
@@ -181,6 +181,69 @@ def test_question_first_direct_source_backed_signal_can_monitor():
     asyncio.run(check_question_first_direct_source_backed_signal_can_monitor())
 
 
+async def check_batch_scoring_matches_per_entity_scores():
+    now = datetime.now(timezone.utc)
+    entities = [{"entity_id": f"club-{index}", "entity_name": f"Club {index}"} for index in range(6)]
+    signals_map = {
+        "club-0": [
+            {"type": "RFP", "title": "CRM procurement tender", "timestamp": (now - timedelta(days=3)).isoformat().replace("+00:00", "Z")},
+            {"type": "PARTNERSHIP", "summary": "New data platform partner", "created_at": "not-a-date"},
+            {"type": "HIRING", "title": "Head of Digital appointment", "date": "2026-01-01T00:00:00"},
+        ],
+        "club-1": [
+            {"type": "DIGITAL_CAPABILITY_GAP", "validation_state": "no_signal"},
+            {"signal_type": "LAUNCH", "description": "App launch with vendor migration"},
+        ],
+        "club-3": [
+            {
+                "type": "COMMERCIAL_NEWS_SIGNAL",
+                "summary": "Ticketing supplier contract",
+                "metadata": {"source": "question_first", "question_id": "q7_procurement_signal", "evidence_urls": ["https://example.com/a"]},
+                "timestamp": (now - timedelta(days=40)).isoformat(),
+            },
+        ],
+    }
+    episodes_map = {
+        "club-0": [
+            {"episode_type": "DIGITAL_TRANSFORMATION", "timestamp": (now - timedelta(days=10)).isoformat()},
+            {"episode_type": "PROCUREMENT", "timestamp": (now - timedelta(days=400)).isoformat()},
+        ],
+        "club-2": [
+            {"episode_type": "TENDER", "description": "Stadium CMS bid", "timestamp": (now - timedelta(days=20)).isoformat()},
+            {"episode_type": "C_SUITE_HIRING", "timestamp": "2026-02-01T00:00:00"},
+            {"episode_type": "PARTNERSHIP"},
+        ],
+        "club-4": [{"episode_type": "GENERIC_NOTE", "timestamp": now.isoformat()}],
+    }
+    hypotheses_map = {
+        "club-2": [{"status": "ACTIVE", "confidence": 0.82}, {"status": "RETIRED", "confidence": 0.1}],
+        "club-4": ["digital transformation"],
+        "club-5": [{"status": "PROMOTED", "confidence": 0.9}],
+    }
+
+    batch = await score_entities_batch(entities, hypotheses_map, signals_map, episodes_map)
+
+    scorer = DashboardScorer()
+    assert [result["entity_id"] for result in batch] == [entity["entity_id"] for entity in entities]
+    for entity, batch_scores in zip(entities, batch):
+        entity_id = entity["entity_id"]
+        expected = await scorer.calculate_entity_scores(
+            entity_id=entity_id,
+            entity_name=entity["entity_name"],
+            hypotheses=hypotheses_map.get(entity_id),
+            signals=signals_map.get(entity_id),
+            episodes=episodes_map.get(entity_id),
+        )
+        expected.pop("calculated_at")
+        batch_scores = dict(batch_scores)
+        batch_scores.pop("calculated_at")
+        assert batch_scores == expected, entity_id
+
+
+def test_batch_scoring_matches_per_entity_scores():
+    asyncio.run(check_batch_scoring_matches_per_entity_scores())
+
+
 async def test_sales_readiness_levels():
     """Test Sales Readiness Level determination"""
     print("\n" + "=" * 70)
@@ -858,6 +858,64 @@ async def test_rejected_low_signal_url_not_retried_across_lanes():
     assert brightdata.scrape_calls == 1
 
 
+class _SlowScrapeBrightData(_FakeBrightData):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.scraped_urls = []
+
+    async def scrape_as_markdown(self, url):
+        self.scraped_urls.append(url)
+        await asyncio.sleep(0.01)
+        return await super().scrape_as_markdown(url)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lanes_do_not_fetch_overlapping_urls_twice():
+    brightdata = _SlowScrapeBrightData(
+        content="Arsenal partnership and commercial transformation update with sufficient detail " * 15,
+    )
+    runtime = DiscoveryRuntimeV2(_FakeClaude(), brightdata)
+    runtime.max_evals_per_hop = 3
+    runtime.max_same_domain_revisits = 2
+    overlapping = [
+        {"url": f"https://www.arsenal.com/press/update-{index}", "title": "Arsenal update", "snippet": "Arsenal", "candidate_origin": "search"}
+        for index in range(3)
+    ]
+
+    async def _fake_candidates(**_kwargs):
+        return [dict(candidate) for candidate in overlapping]
+
+    runtime._discover_candidates = _fake_candidates
+    state = {
+        "visited_urls": set(),
+        "visited_hashes": set(),
+        "accepted_signatures": set(),
+        "rejected_urls": set(),
+        "domain_visits": {},
+        "lane_failures": {},
+        "lane_exhausted": set(),
+        "trusted_corroboration_tokens": set(),
+        "iterations_completed": 0,
+    }
+
+    await asyncio.gather(
+        *[
+            runtime._run_lane(
+                lane=lane,
+                entity_name="Arsenal FC",
+                dossier={},
+                official_domain="arsenal.com",
+                state=state,
+            )
+            for lane in ("press_release", "official_site")
+        ]
+    )
+
+    assert len(brightdata.scraped_urls) == len(set(brightdata.scraped_urls))
+    assert len(brightdata.scraped_urls) <= 2
+    assert state["domain_visits"]["www.arsenal.com"] <= 2
+
+
 @pytest.mark.asyncio
 async def test_rfp_pdf_objective_uses_pdf_first_lane_order():
     brightdata = _FakeBrightData(
@@ -2348,3 +2406,100 @@ def test_extract_evidence_normalizes_collapsed_spacing_and_truncates_cleanly():
     assert len(statement) <= (len("Coventry City FC: ") + 363)
     if statement.endswith("..."):
         assert not statement.endswith(" ...")
+
+
+def _scheduled_lane_runtime(monkeypatch, *, lanes, delays, hits=None, concurrency=3, early_stop=0.0):
+    runtime = DiscoveryRuntimeV2(_FakeClaude(), _FakeBrightData())
+    runtime.lane_concurrency = concurrency
+    runtime.lane_early_stop_confidence = early_stop
+    runtime.dynamic_hop_credits_enabled = False
+    tracker = {"in_flight": 0, "peak": 0, "started": [], "finished": []}
+    hits = hits or {}
+
+    async def _choose(**kwargs):
+        return list(lanes) if kwargs.get("pass_name") == "A" else []
+
+    async def _fake_run_lane(*, lane, **_kwargs):
+        tracker["started"].append(lane)
+        tracker["in_flight"] += 1
+        tracker["peak"] = max(tracker["peak"], tracker["in_flight"])
+        try:
+            await asyncio.sleep(delays.get(lane, 0.0))
+        finally:
+            tracker["in_flight"] -= 1
+        tracker["finished"].append(lane)
+        signal = None
+        if lane in hits:
+            signal = {"id": f"sig-{lane}", "validation_state": "validated", "confidence": hits[lane]}
+        return {
+            "hop": {"hop_type": lane, "duration_ms": 0, "parse_path": "discovery_v2_evidence_first"},
+            "signal": signal,
+            "diagnostic": None,
+            "candidate_evaluations": [],
+        }
+
+    monkeypatch.setattr(runtime, "_choose_lane_order_with_llm", _choose)
+    monkeypatch.setattr(runtime, "_run_lane", _fake_run_lane)
+    return runtime, tracker
+
+
+@pytest.mark.asyncio
+async def test_lane_scheduler_runs_lanes_concurrently_in_deterministic_order(monkeypatch):
+    lanes = ["press_release", "careers", "annual_report", "trusted_news"]
+    runtime, tracker = _scheduled_lane_runtime(
+        monkeypatch,
+        lanes=lanes,
+        delays={"press_release": 0.05, "careers": 0.03, "annual_report": 0.01, "trusted_news": 0.0},
+    )
+
+    result = await runtime.run_discovery_with_dossier_context(
+        entity_id="arsenal-fc",
+        entity_name="Arsenal FC",
+        dossier={},
+        max_iterations=4,
+    )
+
+    assert tracker["peak"] == 3
+    assert tracker["finished"][0] != "press_release"
+    assert [hop["hop_type"] for hop in result.performance_summary["hop_timings"]] == lanes
+    assert result.iterations_completed == 4
+    assert result.performance_summary["lane_scheduler"]["max_in_flight"] == 3
+
+
+@pytest.mark.asyncio
+async def test_lane_scheduler_never_launches_beyond_hop_budget(monkeypatch):
+    lanes = ["press_release", "careers", "annual_report", "trusted_news"]
+    runtime, tracker = _scheduled_lane_runtime(monkeypatch, lanes=lanes, delays={}, concurrency=4)
+
+    result = await runtime.run_discovery_with_dossier_context(
+        entity_id="arsenal-fc",
+        entity_name="Arsenal FC",
+        dossier={},
+        max_iterations=2,
+    )
+
+    assert tracker["started"] == ["press_release", "careers"]
+    assert result.iterations_completed == 2
+
+
+@pytest.mark.asyncio
+async def test_lane_scheduler_early_hit_cancels_lower_ranked_pending_lanes(monkeypatch):
+    lanes = ["press_release", "careers", "annual_report", "trusted_news"]
+    runtime, tracker = _scheduled_lane_runtime(
+        monkeypatch,
+        lanes=lanes,
+        delays={"press_release": 0.05, "careers": 0.0, "annual_report": 0.2, "trusted_news": 0.2},
+        hits={"careers": 0.9},
+        early_stop=0.8,
+    )
+
+    result = await runtime.run_discovery_with_dossier_context(
+        entity_id="arsenal-fc",
+        entity_name="Arsenal FC",
+        dossier={},
+        max_iterations=4,
+    )
+
+    assert [hop["hop_type"] for hop in result.performance_summary["hop_timings"]] == ["press_release", "careers"]
+    assert result.performance_summary["lane_scheduler"]["cancelled_lanes"] == ["annual_report", "trusted_news"]
+    assert "annual_report" not in tracker["finished"]
@@ -0,0 +1,116 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from backend.discovery_trace import (
+    DiscoveryTrace,
+    RecordingBrightDataClient,
+    RecordingClaudeClient,
+    ReplayBrightDataClient,
+    ReplayClaudeClient,
+    ReplayedCallError,
+    TraceMissError,
+    TraceRecorder,
+)
+
+
+class _FakeBrightData:
+    def __init__(self):
+        self.search_calls = 0
+        self._rate_limit_cooldown_until_epoch = 42.0
+
+    async def search_engine(self, query, engine="google", **kwargs):
+        self.search_calls += 1
+        return {"status": "success", "query": query, "results": [{"url": f"https://example.com/{self.search_calls}"}]}
+
+    async def scrape_as_markdown(self, url):
+        if "broken" in url:
+            raise ConnectionError("socket closed")
+        return {"status": "success", "url": url, "content": f"# {url}"}
+
+
+class _FakeClaude:
+    provider = "chutes"
+
+    async def query(self, prompt, model="haiku", max_tokens=2000, **kwargs):
+        return {
+            "content": f"answer:{prompt}",
+            "model_used": model,
+            "tokens_used": {"input_tokens": 10, "output_tokens": 5, "total_tokens": 15},
+        }
+
+
+async def _record(path):
+    brightdata = _FakeBrightData()
+    with TraceRecorder(str(path), metadata={"llm_provider": "chutes"}) as recorder:
+        recording_bd = RecordingBrightDataClient(brightdata, recorder)
+        recording_llm = RecordingClaudeClient(_FakeClaude(), recorder)
+
+        assert recording_bd._rate_limit_cooldown_until_epoch == 42.0
+        assert recording_llm.provider == "chutes"
+
+        await recording_bd.search_engine("arsenal tender", num_results=5)
+        await recording_bd.search_engine("arsenal tender", num_results=5)
+        await recording_bd.scrape_as_markdown("https://arsenal.com")
+        with pytest.raises(ConnectionError):
+            await recording_bd.scrape_as_markdown("https://broken.example")
+        await recording_llm.query("classify", model="haiku", max_tokens=100, stream=False)
+    return brightdata
+
+
+@pytest.mark.asyncio
+async def test_replay_serves_recorded_responses_in_order(tmp_path):
+    path = tmp_path / "trace.jsonl.gz"
+    await _record(path)
+
+    trace = DiscoveryTrace.load(str(path))
+    assert trace.summary()["by_kind"] == {"search": 2, "scrape": 2, "llm": 1}
+
+    brightdata = ReplayBrightDataClient(trace, latency_scale=0.0)
+    claude = ReplayClaudeClient(trace, latency_scale=0.0)
+
+    first = await brightdata.search_engine("arsenal tender", num_results=5)
+    second = await brightdata.search_engine("arsenal tender", num_results=5)
+    third = await brightdata.search_engine("arsenal tender", num_results=5)
+    assert first["results"][0]["url"].endswith("/1")
+    assert second["results"][0]["url"].endswith("/2")
+    assert third == second
+
+    scrape = await brightdata.scrape_as_markdown("https://arsenal.com")
+    assert scrape["content"] == "# https://arsenal.com"
+    with pytest.raises(ReplayedCallError):
+        await brightdata.scrape_as_markdown("https://broken.example")
+
+    # stream/retry knobs do not affect the request key
+    response = await claude.query("classify", model="haiku", max_tokens=100)
+    assert response["content"] == "answer:classify"
+    assert claude.provider == "chutes"
+    assert trace.stats.input_tokens == 10
+    assert trace.stats.output_tokens == 5
+
+
+@pytest.mark.asyncio
+async def test_replay_miss_handling_and_reset(tmp_path):
+    path = tmp_path / "trace.jsonl"
+    await _record(path)
+    trace = DiscoveryTrace.load(str(path))
+
+    lenient = ReplayBrightDataClient(trace, latency_scale=0.0)
+    miss = await lenient.search_engine("unknown query")
+    assert miss["status"] == "error"
+    assert trace.stats.misses["search"] == 1
+
+    with pytest.raises(TraceMissError):
+        await ReplayBrightDataClient(trace, latency_scale=0.0, strict=True).scrape_as_markdown("https://nope")
+    with pytest.raises(TraceMissError):
+        await ReplayClaudeClient(trace, latency_scale=0.0).query("never asked")
+
+    await lenient.search_engine("arsenal tender", num_results=5)
+    trace.reset()
+    replayed = await lenient.search_engine("arsenal tender", num_results=5)
+    assert replayed["results"][0]["url"].endswith("/1")
+    assert trace.stats.misses == {}
@@ -411,3 +411,73 @@ async def test_scrape_field_specific_handles_empty_results_without_exception_war
     monkeypatch.setattr(collector_logger, "warning", _guard_warning)
     result = await collector._scrape_field_specific("Coventry City FC", "stadium")
     assert result == {}
+
+
+@pytest.mark.asyncio
+async def test_resolve_missing_fields_scrapes_shared_page_once_with_one_extraction(monkeypatch):
+    calls = {"search": [], "scrape": [], "prompts": []}
+
+    class _FakeBrightData:
+        async def search_engine(self, query, **_kwargs):
+            calls["search"].append(query)
+            return {"status": "success", "results": [{"url": "https://en.wikipedia.org/wiki/Arsenal_F.C.#History"}]}
+
+        async def scrape_as_markdown(self, url):
+            calls["scrape"].append(url)
+            return {"status": "success", "content": "Arsenal was founded in 1886 and plays at the Emirates Stadium."}
+
+    collector = DossierDataCollector(brightdata_client=_FakeBrightData())
+
+    async def _fake_query_json_strict(*, prompt, **_kwargs):
+        calls["prompts"].append(prompt)
+        return {"founded": {"value": "Founded 1886", "confidence": 0.9}, "stadium": {"value": "Emirates Stadium", "confidence": 1.4}}
+
+    async def _unexpected_single_field(*_args, **_kwargs):
+        raise AssertionError("shared page should use one structured extraction")
+
+    monkeypatch.setattr(collector, "_query_json_strict", _fake_query_json_strict)
+    monkeypatch.setattr(collector, "_extract_single_field", _unexpected_single_field)
+
+    result = await collector._resolve_missing_fields("Arsenal FC", ["founded", "stadium"])
+
+    assert len(calls["search"]) == 2
+    assert calls["scrape"] == ["https://en.wikipedia.org/wiki/Arsenal_F.C.#History"]
+    assert len(calls["prompts"]) == 1
+    assert result["founded"] == "1886"
+    assert result["stadium"] == "Emirates Stadium"
+    assert result["field_provenance"]["stadium"] == {
+        "confidence": 1.0,
+        "method": "multi_field",
+        "url": "https://en.wikipedia.org/wiki/Arsenal_F.C.#History",
+    }
+
+
+@pytest.mark.asyncio
+async def test_resolve_missing_fields_fetches_distinct_pages_concurrently(monkeypatch):
+    in_flight = {"now": 0, "peak": 0}
+
+    class _FakeBrightData:
+        async def search_engine(self, query, **_kwargs):
+            slug = "history" if "founded" in query else "ground"
+            return {"status": "success", "results": [{"url": f"https://example.com/{slug}"}]}
+
+        async def scrape_as_markdown(self, url):
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await asyncio.sleep(0.02)
+            in_flight["now"] -= 1
+            return {"status": "success", "content": url}
+
+    collector = DossierDataCollector(brightdata_client=_FakeBrightData())
+
+    async def _fake_single_field(content, _entity_name, field_name):
+        return {field_name: f"{field_name}@{content}"}
+
+    monkeypatch.setattr(collector, "_extract_single_field", _fake_single_field)
+
+    result = await collector._resolve_missing_fields("Arsenal FC", ["founded", "stadium"])
+
+    assert in_flight["peak"] == 2
+    assert result["founded"] == "founded@https://example.com/history"
+    assert result["field_provenance"]["stadium"]["method"] == "single_field"
+    assert result["field_provenance"]["stadium"]["url"] == "https://example.com/ground"
@@ -838,6 +838,183 @@ def test_write_pipeline_control_state_persists_cursor_to_postgres_singleton_row(
     assert state["current_entity_name"] == "Entity New"
 
 
+def test_cached_pipeline_control_state_serves_reads_from_memory_and_mirrors_file(tmp_path, monkeypatch):
+    control_path = tmp_path / "pipeline-control-state.json"
+    file_reads = []
+    original_read_file = worker_module._read_pipeline_control_state_from_file
+    monkeypatch.setenv("PIPELINE_CONTROL_STATE_CACHE_ENABLED", "true")
+    monkeypatch.setenv("PIPELINE_CONTROL_STATE_REVALIDATE_SECONDS", "60")
+    monkeypatch.setattr("entity_pipeline_worker.should_use_local_pg", lambda: False)
+    monkeypatch.setattr("entity_pipeline_worker.PIPELINE_CONTROL_STATE_PATH", control_path)
+    monkeypatch.setattr(
+        "entity_pipeline_worker._read_pipeline_control_state_from_file",
+        lambda: file_reads.append(1) or original_read_file(),
+    )
+    worker_module.invalidate_pipeline_control_state_cache()
+
+    try:
+        assert read_pipeline_control_state()["is_paused"] is False
+        write_pipeline_control_state({"current_batch_id": "batch-1", "cursor_source": "queued_claim"})
+        state = write_pipeline_control_state({"requested_state": "paused", "pause_reason": "operator"})
+        for _ in range(5):
+            read_pipeline_control_state()
+
+        assert len(file_reads) == 1
+        assert state["current_batch_id"] == "batch-1"
+        assert state["is_paused"] is True
+        assert worker_module.flush_pipeline_control_state_mirror(timeout=2.0)
+        mirrored = json.loads(control_path.read_text(encoding="utf-8"))
+        assert mirrored["pause_reason"] == "operator"
+
+        # Our own mirror write is not mistaken for an external edit.
+        monkeypatch.setenv("PIPELINE_CONTROL_STATE_REVALIDATE_SECONDS", "0")
+        assert read_pipeline_control_state()["current_batch_id"] == "batch-1"
+        assert len(file_reads) == 1
+
+        time.sleep(0.01)
+        control_path.write_text(json.dumps({**mirrored, "requested_state": "running", "is_paused": False}), encoding="utf-8")
+        assert read_pipeline_control_state()["requested_state"] == "running"
+        assert len(file_reads) == 2
+    finally:
+        worker_module.flush_pipeline_control_state_mirror(timeout=2.0)
+        worker_module.invalidate_pipeline_control_state_cache()
+
+
+def test_cached_pipeline_control_state_cas_remerges_after_concurrent_writer(tmp_path, monkeypatch):
+    row = {"state": {"current_batch_id": "batch-1", "requested_state": "running"}, "version": 3}
+    cas_calls = []
+
+    class _FakeQuery:
+        def __init__(self):
+            self.columns = "*"
+
+        def select(self, columns="*"):
+            self.columns = columns
+            return self
+
+        def eq(self, *_args, **_kwargs):
+            return self
+
+        def maybe_single(self):
+            if self.columns == "version":
+                return SimpleNamespace(data={"version": row["version"]})
+            return SimpleNamespace(data=dict(row))
+
+    class _FakeRpc:
+        def __init__(self, params):
+            self.params = params
+
+        def execute(self):
+            cas_calls.append(self.params["expected_version"])
+            if len(cas_calls) == 1:
+                # Another process (the API) paused the pipeline between our read and write.
+                row["state"] = {**row["state"], "requested_state": "paused", "pause_reason": "operator"}
+                row["version"] += 1
+            if self.params["expected_version"] != row["version"]:
+                return SimpleNamespace(data=[])
+            row["state"] = self.params["state"]
+            row["version"] += 1
+            return SimpleNamespace(data=[{"id": "pipeline", "version": row["version"]}])
+
+    class _FakeClient:
+        def table(self, _name):
+            return _FakeQuery()
+
+        def rpc(self, _name, params):
+            return _FakeRpc(params)
+
+    monkeypatch.setenv("PIPELINE_CONTROL_STATE_CACHE_ENABLED", "true")
+    monkeypatch.setattr("entity_pipeline_worker.should_use_local_pg", lambda: True)
+    monkeypatch.setattr("entity_pipeline_worker.create_local_pg_client", lambda: _FakeClient())
+    monkeypatch.setattr("entity_pipeline_worker.PIPELINE_CONTROL_STATE_PATH", tmp_path / "pipeline-control-state.json")
+    worker_module.invalidate_pipeline_control_state_cache()
+
+    try:
+        state = write_pipeline_control_state({"current_entity_id": "entity-2"})
+
+        assert cas_calls == [3, 4]
+        assert row["version"] == 5
+        assert state["requested_state"] == "paused"
+        assert state["pause_reason"] == "operator"
+        assert state["current_entity_id"] == "entity-2"
+        assert read_pipeline_control_state()["current_entity_id"] == "entity-2"
+    finally:
+        worker_module.flush_pipeline_control_state_mirror(timeout=2.0)
+        worker_module.invalidate_pipeline_control_state_cache()
+
+
+def test_cached_pipeline_control_state_marks_failed_postgres_write_unsynced_and_replays_it(tmp_path, monkeypatch):
+    row = {"state": {"current_batch_id": "batch-1", "requested_state": "running"}, "version": 3}
+    store = {"down": True}
+
+    class _FakeQuery:
+        def __init__(self):
+            self.columns = "*"
+
+        def select(self, columns="*"):
+            self.columns = columns
+            return self
+
+        def eq(self, *_args, **_kwargs):
+            return self
+
+        def maybe_single(self):
+            if self.columns == "version":
+                return SimpleNamespace(data={"version": row["version"]})
+            return SimpleNamespace(data=dict(row))
+
+    class _FakeRpc:
+        def __init__(self, params):
+            self.params = params
+
+        def execute(self):
+            if store["down"]:
+                raise ConnectionError("postgres unavailable")
+            if self.params["expected_version"] != row["version"]:
+                return SimpleNamespace(data=[])
+            row["state"] = self.params["state"]
+            row["version"] += 1
+            return SimpleNamespace(data=[{"id": "pipeline", "version": row["version"]}])
+
+    class _FakeClient:
+        def table(self, _name):
+            return _FakeQuery()
+
+        def rpc(self, _name, params):
+            return _FakeRpc(params)
+
+    monkeypatch.setenv("PIPELINE_CONTROL_STATE_CACHE_ENABLED", "true")
+    monkeypatch.setenv("PIPELINE_CONTROL_STATE_REVALIDATE_SECONDS", "60")
+    monkeypatch.setattr("entity_pipeline_worker.should_use_local_pg", lambda: True)
+    monkeypatch.setattr("entity_pipeline_worker.create_local_pg_client", lambda: _FakeClient())
+    monkeypatch.setattr("entity_pipeline_worker.PIPELINE_CONTROL_STATE_PATH", tmp_path / "pipeline-control-state.json")
+    worker_module.invalidate_pipeline_control_state_cache()
+
+    try:
+        state = write_pipeline_control_state({"current_entity_id": "entity-2"})
+
+        assert state["current_entity_id"] == "entity-2"
+        assert row["version"] == 3
+        assert worker_module._pipeline_control_state_record.unsynced_patch == {"current_entity_id": "entity-2"}
+
+        # Another process moves the row on; revalidation replays the patch on top of it.
+        row["state"] = {**row["state"], "requested_state": "paused", "pause_reason": "operator"}
+        row["version"] = 4
+        store["down"] = False
+        monkeypatch.setenv("PIPELINE_CONTROL_STATE_REVALIDATE_SECONDS", "0")
+        state = read_pipeline_control_state()
+
+        assert row["version"] == 5
+        assert row["state"]["current_entity_id"] == "entity-2"
+        assert row["state"]["pause_reason"] == "operator"
+        assert state["current_entity_id"] == "entity-2"
+        assert state["requested_state"] == "paused"
+        assert worker_module._pipeline_control_state_record.unsynced_patch is None
+    finally:
+        worker_module.flush_pipeline_control_state_mirror(timeout=2.0)
+        worker_module.invalidate_pipeline_control_state_cache()
+
+
 def test_persist_pipeline_cursor_state_prefers_live_question_first_checkpoint_over_stale_batch_metadata(monkeypatch):
     worker = EntityPipelineWorker.__new__(EntityPipelineWorker)
     writes = []
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Tests for search fingerprints and entity search in the FalkorDB MCP server.
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+pytest.importorskip("falkordb")
+pytest.importorskip("mcp.server.fastmcp")
+
+import falkordb_mcp_server_fastmcp as server
+
+
+class _FakeGraph:
+    def __init__(self, fulltext_rows=None, keyword_rows=(), fail_fulltext=False):
+        self.fulltext_rows = fulltext_rows or {}
+        self.keyword_rows = list(keyword_rows)
+        self.fail_fulltext = fail_fulltext
+        self.queries = []
+
+    def query(self, cypher, params=None):
+        self.queries.append((cypher, params or {}))
+        if "queryNodes" in cypher:
+            if self.fail_fulltext:
+                raise RuntimeError("connection reset")
+            label = cypher.split("queryNodes('")[1].split("'")[0]
+            return SimpleNamespace(result_set=list(self.fulltext_rows.get(label, [])))
+        if "createNodeIndex" in cypher or "CREATE INDEX" in cypher:
+            return SimpleNamespace(result_set=[])
+        return SimpleNamespace(result_set=list(self.keyword_rows))
+
+
+def _row(label, name, score=None):
+    return [label, name, None, None, None, None, 0, score]
+
+
+@pytest.fixture(autouse=True)
+def _reset_fulltext(monkeypatch):
+    monkeypatch.setattr(server, "_fulltext_retry_at", 0.0)
+
+
+def test_fingerprint_covers_every_parameter():
+    long_query = "premier league digital transformation crm platform tender " * 3
+    base = server._search_fingerprint("entities", long_query, "Entity", 10)
+
+    assert server._search_fingerprint("entities", long_query, "Entity", 11) != base
+    assert server._search_fingerprint("entities", long_query + "extra", "Entity", 10) != base
+    assert server._search_fingerprint("rfps", "crm", "Football", "Tender", 10) != server._search_fingerprint(
+        "rfps", "crm", "Football", "Tender", 20
+    )
+    assert server._search_fingerprint("entities", long_query, "Entity", 10) == base
+
+    cursor = server.encode_cursor(10, base)
+    with pytest.raises(ValueError):
+        server.decode_cursor(cursor, server._search_fingerprint("entities", long_query, "Entity", 11))
+
+
+def test_unfiltered_entity_search_includes_unindexed_labels():
+    graph = _FakeGraph(
+        fulltext_rows={"Entity": [_row("Entity", "Arsenal FC", score=2.0)], "RFP": [_row("RFP", "Arsenal CRM", score=3.0)]},
+        keyword_rows=[_row("SportsClub", "Arsenal Women", None), _row("Person", "Arsenal Director", None)],
+    )
+
+    rows = server._query_entities(graph, "arsenal", None, 10)
+
+    assert [row[1] for row in rows] == ["Arsenal CRM", "Arsenal FC", "Arsenal Women", "Arsenal Director"]
+    keyword_cypher, keyword_params = graph.queries[-1]
+    assert "MATCH (n)" in keyword_cypher
+    assert keyword_params["indexed_labels"] == list(server.FULLTEXT_INDEXES)
+
+
+def test_entity_type_filter_uses_index_only_for_indexed_labels():
+    graph = _FakeGraph(fulltext_rows={"Entity": [_row("Entity", "Arsenal FC", score=1.0)]})
+    assert [row[1] for row in server._query_entities(graph, "arsenal", "Entity", 10)] == ["Arsenal FC"]
+    assert all("MATCH" not in cypher for cypher, _ in graph.queries)
+
+    graph = _FakeGraph(keyword_rows=[_row("SportsClub", "Arsenal Women")])
+    assert [row[1] for row in server._query_entities(graph, "arsenal", "SportsClub", 10)] == ["Arsenal Women"]
+    assert "MATCH (n:SportsClub)" in graph.queries[-1][0]
+
+
+def test_fulltext_failure_falls_back_for_the_call_and_is_retried(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(server.time, "monotonic", lambda: clock[0])
+    graph = _FakeGraph(keyword_rows=[_row("SportsClub", "Arsenal Women")], fail_fulltext=True)
+
+    assert [row[1] for row in server._query_entities(graph, "arsenal", None, 10)] == ["Arsenal Women"]
+    assert server._fulltext_retry_at > clock[0]
+
+    # Within the back-off window the index is not tried again
+    graph.queries.clear()
+    server._query_entities(graph, "arsenal", None, 10)
+    assert not any("queryNodes" in cypher for cypher, _ in graph.queries)
+
+    # Afterwards indexes are re-ensured and full-text is used again
+    graph.fail_fulltext = False
+    graph.fulltext_rows = {"Entity": [_row("Entity", "Arsenal FC", score=1.0)]}
+    clock[0] += server.FULLTEXT_RETRY_SECONDS + 1
+    rows = server._query_entities(graph, "arsenal", None, 10)
+    assert [row[1] for row in rows] == ["Arsenal FC", "Arsenal Women"]
+    assert server._fulltext_retry_at == 0.0
+
+
+@pytest.fixture
+def _empty_cache(monkeypatch):
+    monkeypatch.setattr(server, "_search_cache", server.OrderedDict())
+    clock = [1000.0]
+    monkeypatch.setattr(server.time, "monotonic", lambda: clock[0])
+    return clock
+
+
+def test_cached_search_serves_hits_until_ttl_expires(_empty_cache):
+    clock = _empty_cache
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return f"result {len(calls)}"
+
+    assert server.cached_search(("search_entities", "a", 0), compute) == "result 1"
+    clock[0] += server.SEARCH_CACHE_TTL_SECONDS - 1
+    assert server.cached_search(("search_entities", "a", 0), compute) == "result 1"
+
+    clock[0] += 2
+    assert server.cached_search(("search_entities", "a", 0), compute) == "result 2"
+    assert len(calls) == 2
+
+
+def test_cached_search_evicts_least_recent_and_skips_errors(_empty_cache, monkeypatch):
+    monkeypatch.setattr(server, "SEARCH_CACHE_SIZE", 2)
+
+    server.cached_search(("a",), lambda: "a")
+    server.cached_search(("b",), lambda: "b")
+    server.cached_search(("a",), lambda: "stale")
+    server.cached_search(("c",), lambda: "c")
+    assert list(server._search_cache) == [("a",), ("c",)]
+
+    assert server.cached_search(("d",), lambda: "❌ boom") == "❌ boom"
+    assert ("d",) not in server._search_cache
+
+    server.invalidate_search_cache()
+    assert not server._search_cache
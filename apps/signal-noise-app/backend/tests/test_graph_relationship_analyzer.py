@@ -0,0 +1,181 @@
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from graph_relationship_analyzer import (
+    GraphRelationshipAnalyzer,
+    NetworkContextCache,
+    TechnologyStack,
+)
+
+
+class _FakeFalkorDB:
+    def __init__(self, rows_by_entity):
+        self.rows_by_entity = rows_by_entity
+        self.queries = []
+
+    async def execute_query(self, query, params):
+        self.queries.append((query, params))
+        if "UNWIND" not in query:
+            return []
+        return [self.rows_by_entity[entity_id] for entity_id in params["entity_ids"] if entity_id in self.rows_by_entity]
+
+    def batch_queries(self):
+        return [params for query, params in self.queries]
+
+
+def _tech(name, category):
+    return {"name": name, "category": category}
+
+
+def _neighbour(entity_id, name, tech=()):
+    return {"id": entity_id, "name": name, "type": "ORG", "technology_stack": list(tech)}
+
+
+def _row(entity_id, name=None, partners=(), competitors=(), tech=()):
+    empty = {"id": None, "name": None, "type": None, "technology_stack": [{"name": None, "category": None}]}
+    return {
+        "entity_id": entity_id,
+        "name": name,
+        "partners": list(partners) or [empty],
+        "competitors": list(competitors) or [empty],
+        "technology_stack": list(tech) or [{"name": None, "category": None}],
+    }
+
+
+def _analyzer_with(fake):
+    analyzer = GraphRelationshipAnalyzer()
+    analyzer._falkordb_client = fake
+    return analyzer
+
+
+@pytest.mark.asyncio
+async def test_network_context_loads_neighbourhood_in_one_query_and_is_cached():
+    fake = _FakeFalkorDB({
+        "arsenal": _row(
+            "arsenal",
+            name="Arsenal",
+            partners=[_neighbour("emirates", "Emirates", [_tech("React", "frontend")])],
+            competitors=[
+                _neighbour("chelsea", "Chelsea", [_tech("Salesforce", "analytics")]),
+                _neighbour("spurs", "Spurs", [_tech("Salesforce", "analytics")]),
+            ],
+            tech=[_tech("Python", "backend")],
+        ),
+    })
+    analyzer = _analyzer_with(fake)
+
+    context = await analyzer.analyze_network_context("arsenal")
+
+    assert len(fake.batch_queries()) == 1
+    # Root entity matched by id without a label, as the per-entity lookups did
+    assert "MATCH (e {id: entity_id})" in fake.queries[0][0]
+    assert context.entity_name == "Arsenal"
+    assert [partner["id"] for partner in context.partners] == ["emirates"]
+    assert context.partners[0]["technology_stack"].frontend == ["React"]
+    assert context.competitor_count == 2
+    assert context.technology_stack.backend == ["Python"]
+    source_types = {hypothesis["source_type"] for hypothesis in context.network_hypotheses}
+    assert {"partner_inference", "competitor_pressure", "technology_gap"} <= source_types
+    assert context.technology_diffusion["react"] == ["emirates"]
+
+    assert await analyzer.analyze_network_context("arsenal") is context
+    assert len(fake.batch_queries()) == 1
+
+    # Editing a neighbour's edges drops every cached context linked to it
+    analyzer.invalidate_network_context("chelsea")
+    await analyzer.analyze_network_context("arsenal")
+    assert len(fake.batch_queries()) == 2
+
+
+@pytest.mark.asyncio
+async def test_cohort_is_chunked_and_unknown_entities_fall_back_to_their_id(monkeypatch):
+    import graph_relationship_analyzer
+
+    monkeypatch.setattr(graph_relationship_analyzer, "NETWORK_CONTEXT_BATCH_SIZE", 2)
+    fake = _FakeFalkorDB({"a": _row("a", name="A"), "b": _row("b", name="B"), "c": _row("c", name="C")})
+    analyzer = _analyzer_with(fake)
+
+    contexts = await analyzer.analyze_network_contexts(["a", "b", "c", "ghost"])
+
+    assert [params["entity_ids"] for params in fake.batch_queries()] == [["a", "b"], ["c", "ghost"]]
+    assert contexts["ghost"].entity_name == "ghost"
+    assert contexts["ghost"].partners == [] and contexts["ghost"].competitors == []
+    assert contexts["a"].partners == []
+
+
+def test_network_context_cache_is_bounded_and_expires(monkeypatch):
+    import graph_relationship_analyzer
+
+    clock = [100.0]
+    monkeypatch.setattr(graph_relationship_analyzer.time, "monotonic", lambda: clock[0])
+    cache = NetworkContextCache(max_entries=2, ttl_seconds=10)
+    for entity_id in ("a", "b", "c"):
+        cache.set(entity_id, graph_relationship_analyzer.NetworkContext(entity_id=entity_id, entity_name=entity_id))
+
+    assert "a" not in cache and len(cache) == 2
+    clock[0] += 11
+    assert cache.get("c") is None
+    assert cache.get_statistics()["evictions"] == 1
+
+
+def _reference_clusters(analyzer, entity_ids, stacks, threshold):
+    clusters = {}
+    for entity_id in entity_ids:
+        best_cluster, best_similarity = None, 0.0
+        for cluster_id, members in clusters.items():
+            similarity = analyzer._calculate_tech_similarity(stacks[entity_id], stacks[members[0]])
+            if similarity > best_similarity:
+                best_similarity, best_cluster = similarity, cluster_id
+        if best_cluster and best_similarity >= threshold:
+            clusters[best_cluster].append(entity_id)
+        else:
+            clusters[f"cluster_{len(clusters)}"] = [entity_id]
+    return clusters
+
+
+@pytest.mark.asyncio
+async def test_technology_clusters_match_pairwise_jaccard_with_batched_stacks():
+    rng = random.Random(7)
+    vocabulary = [
+        ("React", "frontend"), ("Vue", "frontend"), ("Python", "backend"), ("Java", "backend"),
+        ("Flutter", "mobile"), ("AWS", "infrastructure"), ("Snowflake", "analytics"), ("Shopify", "ecommerce"),
+    ]
+    rows = {}
+    for index in range(120):
+        entity_id = f"entity-{index}"
+        picked = rng.sample(vocabulary, rng.randint(0, 4))
+        rows[entity_id] = _row(entity_id, tech=[_tech(name, category) for name, category in picked])
+    fake = _FakeFalkorDB(rows)
+    analyzer = _analyzer_with(fake)
+    entity_ids = list(rows)
+
+    stacks = await analyzer.get_technology_stacks(entity_ids)
+    similarity = analyzer._tech_similarity_matrix([stacks[entity_id] for entity_id in entity_ids])
+    for i, j in [(0, 1), (5, 5), (17, 90), (3, 44)]:
+        expected = analyzer._calculate_tech_similarity(stacks[entity_ids[i]], stacks[entity_ids[j]])
+        assert similarity[i, j] == pytest.approx(expected)
+
+    for threshold in (0.3, 0.6):
+        fake.queries.clear()
+        clusters = await analyzer.detect_technology_clusters(entity_ids, cluster_threshold=threshold)
+        assert clusters == _reference_clusters(analyzer, entity_ids, stacks, threshold)
+        assert len(fake.batch_queries()) == 3
+
+
+def test_similarity_matrix_handles_empty_stacks():
+    analyzer = GraphRelationshipAnalyzer()
+    stack = TechnologyStack()
+    stack.add_tech("frontend", "React")
+
+    similarity = analyzer._tech_similarity_matrix([TechnologyStack(), TechnologyStack(), stack])
+
+    assert similarity[0, 1] == 1.0
+    assert similarity[0, 2] == 0.0
+    assert similarity[2, 2] == 1.0
+    assert analyzer._tech_similarity_matrix([]).shape == (0, 0)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Tests for the single-pass tolerant JSON scanner.
+"""
+
+import sys
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from json_scanner import JsonScanner, extract_json_object, extract_last_json_value
+
+
+def test_finds_object_in_prose_and_fences_and_drops_trailing_commas():
+    text = 'Sure, here it is:\n```json\n{"decision": "ACCEPT", "tags": ["a", "b",], "confidence_delta": 0.1,}\n```'
+    assert extract_json_object(text, ("decision",)) == {
+        "decision": "ACCEPT",
+        "tags": ["a", "b"],
+        "confidence_delta": 0.1,
+    }
+    assert extract_json_object('{"result": {"decision": "REJECT"}}', ("decision",)) == {"decision": "REJECT"}
+    assert extract_json_object('I think { roughly: {"decision": "NO_PROGRESS"} done', ("decision",)) == {
+        "decision": "NO_PROGRESS"
+    }
+    assert extract_json_object('{"other": 1}', ("decision",)) is None
+
+
+def test_stray_brace_in_quoted_prose_restarts_at_next_brace():
+    text = 'He said "{" then {"decision": "ACCEPT"}'
+    assert extract_json_object(text, ("decision",), repair=False) == {"decision": "ACCEPT"}
+    assert extract_json_object(text, ("decision",)) == {"decision": "ACCEPT"}
+    scanner = JsonScanner(text)
+    assert scanner.find_object(("decision",), repair=False) == {"decision": "ACCEPT"}
+    assert text[scanner.last_match_start:].startswith('{"decision"')
+    assert extract_json_object('a { b { c {"decision": "REJECT"} d', ("decision",), repair=False) == {
+        "decision": "REJECT"
+    }
+
+
+def test_repairs_truncated_tail_at_each_token_boundary():
+    cases = {
+        '{"decision": "ACCEPT", "justification": "cut mid str': "cut mid str",
+        '{"decision": "ACCEPT", "justification": ': None,
+        '{"decision": "ACCEPT", "justification"': None,
+        '{"decision": "ACCEPT", "justific': None,
+    }
+    for text, justification in cases.items():
+        repaired = extract_json_object(text, ("decision",))
+        assert repaired["decision"] == "ACCEPT", text
+        assert repaired.get("justification") == justification, text
+
+    assert extract_json_object('{"decision": "ACCEPT", "confidence_delta": 0.', ("decision",)) == {
+        "decision": "ACCEPT",
+        "confidence_delta": None,
+    }
+    assert extract_json_object('{"decision": "ACCEPT", "items": [1, 2,', ("decision",)) == {
+        "decision": "ACCEPT",
+        "items": [1, 2],
+    }
+    assert extract_json_object('{"decision": "ACCEPT", "x": "tail', ("decision",), repair=False) is None
+
+
+def test_repair_never_keeps_a_number_cut_mid_value():
+    # "0.0" may be the start of 0.05; a closed literal is kept.
+    assert extract_json_object('{"decision": "ACCEPT", "confidence_delta": 0.0', ("decision",)) == {
+        "decision": "ACCEPT",
+        "confidence_delta": None,
+    }
+    assert extract_json_object('{"decision": "ACCEPT", "final": true', ("decision",)) == {
+        "decision": "ACCEPT",
+        "final": True,
+    }
+
+    quoted = '{"decision": "ACCEPT", "confidence": "0.8'
+    assert extract_json_object(quoted, ("decision",))["confidence"] == "0.8"
+    assert extract_json_object(quoted, ("decision",), numeric_keys=("confidence",))["confidence"] is None
+    assert extract_last_json_value('{"content": ["a"], "confidence": "0.', numeric_keys=("confidence",)) == {
+        "content": ["a"],
+        "confidence": None,
+    }
+    # Other fields cut inside their quotes are still closed.
+    assert extract_json_object(
+        '{"decision": "ACCEPT", "justification": "cut', ("decision",), numeric_keys=("confidence",)
+    )["justification"] == "cut"
+
+
+def test_streamed_fields_are_available_before_object_closes():
+    scanner = JsonScanner()
+    scanner.feed('{"decis').feed('ion": "ACC')
+    assert scanner.field("decision") is None
+    scanner.feed('EPT", "confidence_delta": 0.0')
+    assert scanner.field("decision") == "ACCEPT"
+    assert scanner.field("confidence_delta") is None
+    scanner.feed('5, "justification": "long')
+    assert scanner.field("confidence_delta") == 0.05
+    assert not scanner.complete
+    scanner.feed(' text"} trailing prose')
+    assert scanner.complete
+    assert scanner.find_object(("decision", "justification"))["justification"] == "long text"
+
+
+def test_last_value_prefers_objects_and_falls_back_to_repair():
+    assert extract_last_json_value('see [1] {"a": 1} then {"b": 2}') == {"b": 2}
+    assert extract_last_json_value('list: [{"a": 1}]') == [{"a": 1}]
+    assert extract_last_json_value('{"content": ["one", "tw') == {"content": ["one", "tw"]}
+    assert extract_last_json_value("no json here") is None
@@ -0,0 +1,104 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from linkedin_profiler import LinkedInLookupCache, LinkedInProfiler
+
+
+class _FakeBrightData:
+    def __init__(self):
+        self.search_queries = []
+        self.scraped_urls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _track(self):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+    async def search_engine(self, query, engine="google", num_results=10):
+        self.search_queries.append(query)
+        await self._track()
+        if "mutual connections" in query:
+            return {"status": "success", "results": [{"title": "Jane Bridge", "snippet": "2 mutual connections"}]}
+        return {
+            "status": "success",
+            "results": [{"url": f"https://linkedin.com/posts/{len(self.search_queries)}", "snippet": "digital crm"}],
+        }
+
+    async def scrape_as_markdown(self, url):
+        self.scraped_urls.append(url)
+        await self._track()
+        return {"content": "Our digital transformation with salesforce"}
+
+
+@pytest.mark.asyncio
+async def test_outreach_fan_out_is_concurrent_and_bounded(tmp_path):
+    brightdata = _FakeBrightData()
+    cache = LinkedInLookupCache(path=str(tmp_path / "cache.json"), ttl_seconds=3600)
+    profiler = LinkedInProfiler(brightdata, lookup_cache=cache, max_concurrent_lookups=3)
+
+    intelligence = await profiler.extract_outreach_intelligence(
+        entity_name="Arsenal FC",
+        target_contacts=["https://linkedin.com/in/cto", "https://linkedin.com/in/cio"],
+        yp_team_members=["https://linkedin.com/in/yp-a", "https://linkedin.com/in/yp-b"],
+    )
+
+    assert brightdata.max_in_flight == 3
+    assert [(p.yp_member, p.target_contact) for p in intelligence.mutual_paths] == [
+        ("https://linkedin.com/in/yp-a", "https://linkedin.com/in/cto"),
+        ("https://linkedin.com/in/yp-b", "https://linkedin.com/in/cto"),
+        ("https://linkedin.com/in/yp-a", "https://linkedin.com/in/cio"),
+        ("https://linkedin.com/in/yp-b", "https://linkedin.com/in/cio"),
+    ]
+    assert [p.provider_name for p in intelligence.current_providers] == ["salesforce"]
+    assert (tmp_path / "cache.json").exists()
+
+
+@pytest.mark.asyncio
+async def test_duplicate_pairs_coalesce_and_cache_persists_across_profilers(tmp_path):
+    brightdata = _FakeBrightData()
+    cache_path = str(tmp_path / "cache.json")
+    profiler = LinkedInProfiler(
+        brightdata,
+        lookup_cache=LinkedInLookupCache(path=cache_path, ttl_seconds=3600),
+    )
+
+    await profiler.extract_outreach_intelligence(
+        entity_name="Arsenal FC",
+        target_contacts=["https://www.linkedin.com/in/cto/", "https://linkedin.com/in/cto"],
+        yp_team_members=["https://linkedin.com/in/yp-a"],
+    )
+    # One mutual search and one posts search: the duplicate contact coalesced
+    assert len(brightdata.search_queries) == 2
+
+    fresh = _FakeBrightData()
+    reloaded = LinkedInProfiler(fresh, lookup_cache=LinkedInLookupCache(path=cache_path, ttl_seconds=3600))
+    mutuals = await reloaded._find_mutual_connections("https://linkedin.com/in/yp-a", "https://linkedin.com/in/cto")
+
+    assert mutuals == ["Jane Bridge"]
+    assert fresh.search_queries == []
+
+
+@pytest.mark.asyncio
+async def test_failed_searches_are_not_cached(tmp_path):
+    class _FailingBrightData(_FakeBrightData):
+        async def search_engine(self, query, engine="google", num_results=10):
+            self.search_queries.append(query)
+            return {"status": "error", "error": "zone cooldown"}
+
+    brightdata = _FailingBrightData()
+    cache = LinkedInLookupCache(path=str(tmp_path / "cache.json"), ttl_seconds=3600)
+    profiler = LinkedInProfiler(brightdata, lookup_cache=cache)
+
+    assert await profiler._find_mutual_connections("yp", "contact") == []
+    assert await profiler._find_mutual_connections("yp", "contact") == []
+    assert len(brightdata.search_queries) == 2
+    assert len(cache) == 0
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Tests for the cross-entity LLM micro-batching broker.
+"""
+
+import asyncio
+import json
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from llm_batch_broker import LLMBatchBroker, get_batch_broker, query_json
+
+
+class PackedClient:
+    """Answers packed prompts with one output per task; individual prompts directly."""
+
+    def __init__(self, drop_indexes=(), broken=False):
+        self.calls = []
+        self.drop_indexes = set(drop_indexes)
+        self.broken = broken
+
+    async def query(self, **kwargs):
+        self.calls.append(kwargs)
+        prompt = kwargs["prompt"]
+        tasks = re.findall(r"### Task (\d+)\n(.*)", prompt)
+        if not tasks:
+            return {"content": json.dumps({"label": prompt.upper(), "individual": True}), "model_used": "m"}
+        if self.broken:
+            return {"content": "sorry, I cannot do that", "model_used": "m"}
+        results = [
+            {"index": int(index), "output": {"label": body.upper()}}
+            for index, body in tasks
+            if int(index) not in self.drop_indexes
+        ]
+        return {
+            "content": json.dumps({"results": results}),
+            "model_used": "m",
+            "tokens_used": {"input_tokens": 90, "output_tokens": 30},
+        }
+
+
+def _output(result):
+    return result.get("structured_output") or json.loads(result["content"])
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_packed_call():
+    client = PackedClient()
+    broker = LLMBatchBroker(client, max_batch_size=3, max_wait_seconds=0.05)
+
+    results = await asyncio.gather(
+        *(broker.submit(family="hop_evaluation", prompt=f"page {idx}", max_tokens=100) for idx in range(3))
+    )
+
+    assert len(client.calls) == 1
+    assert client.calls[0]["json_mode"] is True
+    assert client.calls[0]["max_tokens"] >= 300
+    assert [result["structured_output"]["label"] for result in results] == ["PAGE 0", "PAGE 1", "PAGE 2"]
+    assert [result["llm_batch"]["index"] for result in results] == [0, 1, 2]
+    assert results[0]["tokens_used"] == {"input_tokens": 30, "output_tokens": 10}
+    assert broker.snapshot()["avg_batch_size"] == 3
+
+
+@pytest.mark.asyncio
+async def test_incompatible_families_are_not_mixed_and_window_flushes_partial_batches():
+    client = PackedClient()
+    broker = LLMBatchBroker(client, max_batch_size=8, max_wait_seconds=0.01)
+
+    first, second = await asyncio.gather(
+        broker.submit(family="hop_evaluation", prompt="a"),
+        broker.submit(family="dossier_field_extraction", prompt="b"),
+    )
+
+    assert len(client.calls) == 2
+    assert _output(first)["individual"] is True
+    assert _output(second)["individual"] is True
+    assert broker.stats.single_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_missing_or_invalid_items_fall_back_to_individual_calls():
+    client = PackedClient(drop_indexes={1})
+    broker = LLMBatchBroker(client, max_batch_size=2, max_wait_seconds=0.05)
+
+    results = await asyncio.gather(
+        broker.submit(family="ralph_pass2_validation", prompt="x"),
+        broker.submit(family="ralph_pass2_validation", prompt="y", max_retries_override=1),
+    )
+
+    assert results[0]["llm_batch"]["size"] == 2
+    assert _output(results[1]) == {"label": "Y", "individual": True}
+    assert client.calls[-1]["max_retries_override"] == 1
+    assert broker.stats.fallback_items == 1
+
+    broken = PackedClient(broken=True)
+    broker = LLMBatchBroker(broken, max_batch_size=2, max_wait_seconds=0.05)
+    results = await asyncio.gather(
+        broker.submit(family="f", prompt="p", required_keys=("label",)),
+        broker.submit(family="f", prompt="q", required_keys=("label",)),
+    )
+    assert [_output(result)["individual"] for result in results] == [True, True]
+    assert len(broken.calls) == 3
+    assert broker.stats.batch_failures == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_timeout_stays_near_item_budget_and_falls_back_individually():
+    class SlowClient(PackedClient):
+        def __init__(self, packed_delay, individual_delay):
+            super().__init__()
+            self.packed_delay = packed_delay
+            self.individual_delay = individual_delay
+
+        async def query(self, **kwargs):
+            packed = "### Task" in kwargs["prompt"]
+            await asyncio.sleep(self.packed_delay if packed else self.individual_delay)
+            return await super().query(**kwargs)
+
+    # A batch answering within the per-item budget is used as is
+    client = SlowClient(packed_delay=0.02, individual_delay=0.0)
+    broker = LLMBatchBroker(client, max_batch_size=4, max_wait_seconds=0.05)
+    results = await asyncio.gather(
+        *(broker.submit(family="hop_evaluation", prompt=f"p{idx}", timeout_seconds=0.1) for idx in range(4))
+    )
+    assert [_output(result)["label"] for result in results] == ["P0", "P1", "P2", "P3"]
+    assert len(client.calls) == 1
+
+    # A slow batch is cut off at the item budget, not 4x it, and each item is re-sent
+    client = SlowClient(packed_delay=1.0, individual_delay=0.0)
+    broker = LLMBatchBroker(client, max_batch_size=4, max_wait_seconds=0.0)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    results = await asyncio.gather(
+        *(broker.submit(family="hop_evaluation", prompt=f"p{idx}", timeout_seconds=0.1) for idx in range(4))
+    )
+    assert loop.time() - started < 0.3
+    assert [_output(result) for result in results] == [
+        {"label": f"P{idx}", "individual": True} for idx in range(4)
+    ]
+    # The cut-off packed call never completes; only the resends reach the client
+    assert [call["prompt"] for call in client.calls] == ["p0", "p1", "p2", "p3"]
+    assert broker.stats.fallback_items == 4
+    assert broker.stats.batch_failures == 1
+
+    # The individual resend keeps the caller's own budget
+    client = SlowClient(packed_delay=1.0, individual_delay=1.0)
+    broker = LLMBatchBroker(client, max_batch_size=2, max_wait_seconds=0.0)
+    results = await asyncio.gather(
+        *(broker.submit(family="hop_evaluation", prompt=f"p{idx}", timeout_seconds=0.05) for idx in range(2)),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, TimeoutError) for result in results)
+
+    # A lone item keeps its own budget
+    with pytest.raises(TimeoutError):
+        await LLMBatchBroker(SlowClient(packed_delay=0.0, individual_delay=0.2), max_wait_seconds=0.0).submit(
+            family="hop_evaluation", prompt="alone", timeout_seconds=0.05
+        )
+
+
+@pytest.mark.asyncio
+async def test_query_json_goes_direct_unless_broker_enabled(monkeypatch):
+    client = PackedClient()
+    monkeypatch.delenv("LLM_BATCH_BROKER_ENABLED", raising=False)
+
+    assert get_batch_broker(client) is None
+    result = await query_json(client, family="f", prompt="solo", max_tokens=50, fast_fail_on_length=True)
+    assert _output(result)["label"] == "SOLO"
+    assert client.calls[0] == {
+        "prompt": "solo",
+        "model": "haiku",
+        "max_tokens": 50,
+        "json_mode": True,
+        "fast_fail_on_length": True,
+    }
+
+    monkeypatch.setenv("LLM_BATCH_BROKER_ENABLED", "true")
+    assert get_batch_broker(client) is get_batch_broker(client)
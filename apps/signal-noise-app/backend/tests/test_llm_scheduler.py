@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Tests for the process-wide LLM priority scheduler.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from llm_scheduler import (
+    PRIORITY_BULK,
+    PRIORITY_INTERACTIVE,
+    LLMAdmissionRejected,
+    LLMScheduler,
+    TokenBucket,
+    current_llm_priority,
+    llm_priority,
+)
+
+
+async def _hold_all_slots(scheduler, count):
+    for _ in range(count):
+        await scheduler.acquire(PRIORITY_BULK, "holder")
+
+
+async def _record_grant(scheduler, order, label, priority, tenant):
+    await scheduler.acquire(priority, tenant)
+    order.append(label)
+
+
+@pytest.mark.asyncio
+async def test_interactive_jumps_queued_bulk_and_uses_reserved_slot():
+    scheduler = LLMScheduler(rate_per_second=0, max_concurrency=2, interactive_reserved=1)
+    await _hold_all_slots(scheduler, 1)
+    order = []
+
+    bulk = [asyncio.create_task(_record_grant(scheduler, order, f"bulk-{i}", PRIORITY_BULK, "batch")) for i in range(3)]
+    await asyncio.sleep(0)
+    chat = asyncio.create_task(_record_grant(scheduler, order, "chat", PRIORITY_INTERACTIVE, "chat"))
+    await asyncio.sleep(0.01)
+
+    # Bulk cannot use the reserved slot, interactive gets it immediately.
+    assert order == ["chat"]
+    for _ in range(4):
+        scheduler.release()
+        await asyncio.sleep(0.01)
+    await asyncio.gather(chat, *bulk)
+    assert order == ["chat", "bulk-0", "bulk-1", "bulk-2"]
+
+    classes = scheduler.snapshot()["classes"]
+    assert classes["interactive"]["admitted"] == 1
+    assert classes["interactive"]["max_wait_seconds"] < 0.01
+    assert classes["bulk"]["admitted"] == 4
+    assert classes["bulk"]["max_wait_seconds"] > 0
+
+
+@pytest.mark.asyncio
+async def test_weighted_fair_queueing_between_tenants():
+    scheduler = LLMScheduler(
+        rate_per_second=0,
+        max_concurrency=1,
+        interactive_reserved=0,
+        tenant_weights={"nightly": 1, "pipeline": 3},
+    )
+    await scheduler.acquire(PRIORITY_BULK, "holder")
+    order = []
+    tasks = [
+        asyncio.create_task(_record_grant(scheduler, order, tenant, PRIORITY_BULK, tenant))
+        for tenant in ["nightly"] * 6 + ["pipeline"] * 6
+    ]
+    await asyncio.sleep(0)
+    for _ in range(8):
+        scheduler.release()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+    assert order[:8].count("pipeline") == 6
+    assert order[:8].count("nightly") == 2
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_bulk_is_deferred_then_shed_during_cooldown():
+    scheduler = LLMScheduler(rate_per_second=0, max_concurrency=4, bulk_max_deferred=1)
+    scheduler.note_cooldown(0.05)
+
+    deferred = asyncio.create_task(scheduler.acquire(PRIORITY_BULK, "batch"))
+    await asyncio.sleep(0)
+    with pytest.raises(LLMAdmissionRejected):
+        await scheduler.acquire(PRIORITY_BULK, "batch")
+    await asyncio.wait_for(scheduler.acquire(PRIORITY_INTERACTIVE, "chat"), timeout=0.01)
+    assert not deferred.done()
+
+    await asyncio.wait_for(deferred, timeout=1.0)
+    bulk = scheduler.snapshot()["classes"]["bulk"]
+    assert bulk["deferred"] == 1
+    assert bulk["shed"] == 1
+    assert bulk["max_wait_seconds"] >= 0.04
+
+
+def test_token_bucket_models_rate_and_burst():
+    clock = {"now": 0.0}
+    bucket = TokenBucket(rate_per_second=2.0, capacity=2, clock=lambda: clock["now"])
+    bucket.take()
+    bucket.take()
+    assert bucket.seconds_until_available() == pytest.approx(0.5)
+    clock["now"] = 0.5
+    assert bucket.seconds_until_available() == 0.0
+
+
+@pytest.mark.asyncio
+async def test_priority_tag_follows_context_and_decorator():
+    @llm_priority(PRIORITY_BULK, tenant="exploration")
+    async def tagged():
+        return current_llm_priority()
+
+    assert await tagged() == ("bulk", "exploration")
+    assert current_llm_priority() == ("standard", "default")
+
+    async def read_in_task():
+        return current_llm_priority()
+
+    with llm_priority(PRIORITY_INTERACTIVE, tenant="chat"):
+        assert await asyncio.create_task(read_in_task()) == ("interactive", "chat")
+
+
+def test_client_rate_limit_cooldown_reaches_shared_scheduler(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "chutes_openai")
+    monkeypatch.setenv("CHUTES_API_KEY", "test-chutes-key")
+    from claude_client import ClaudeClient
+
+    client = ClaudeClient()
+    client._llm_scheduler = LLMScheduler(rate_per_second=0)
+    cooldown = client._set_chutes_rate_limit_cooldown(attempt=0)
+
+    assert cooldown > 0
+    assert client._llm_scheduler.cooldown_remaining() > 0
+    assert "llm_scheduler" in client.get_runtime_diagnostics()
@@ -0,0 +1,153 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from backend.multi_pass_context import GraphContextCache, MultiPassContext, NetworkContext
+
+
+class _FakeFalkorDB:
+    def __init__(self, rows_by_entity):
+        self.rows_by_entity = rows_by_entity
+        self.queries = []
+
+    async def execute_query(self, query, params):
+        self.queries.append((query, params))
+        if "UNWIND" not in query:
+            return []
+        return [self.rows_by_entity[entity_id] for entity_id in params["entity_ids"] if entity_id in self.rows_by_entity]
+
+
+def _row(entity_id, partners=(), competitors=(), tech=()):
+    return {
+        "entity_id": entity_id,
+        "partners": list(partners) or [{"id": None, "name": None, "technology_stack": []}],
+        "competitors": list(competitors) or [{"id": None, "name": None}],
+        "technology_stack": list(tech),
+    }
+
+
+def _context_with(fake):
+    context = MultiPassContext()
+    context._falkordb_client = fake
+    return context
+
+
+@pytest.mark.asyncio
+async def test_cohort_loads_in_one_query_and_is_cached():
+    fake = _FakeFalkorDB({
+        "arsenal": _row(
+            "arsenal",
+            partners=[{"id": "emirates", "name": "Emirates", "technology_stack": ["React Native"]}],
+            competitors=[{"id": "chelsea", "name": "Chelsea"}],
+            tech=["Salesforce"],
+        ),
+        "chelsea": _row("chelsea"),
+    })
+    context = _context_with(fake)
+
+    contexts = await context.get_graph_contexts(["arsenal", "chelsea", "unknown"])
+
+    batch_queries = [q for q, _ in fake.queries if "UNWIND" in q]
+    assert len(batch_queries) == 1
+    assert "MATCH (e {id: entity_id})" in batch_queries[0]
+    assert contexts["arsenal"].competitors == [{"name": "Chelsea", "id": "chelsea"}]
+    assert contexts["arsenal"].technology_stack == ["Salesforce"]
+    # partner tech came back with the batch, so no per-partner follow-up query
+    assert contexts["arsenal"].network_hypotheses[0]["category"] == "React Development"
+    assert contexts["chelsea"].partners == []
+    assert contexts["unknown"].technology_stack == []
+
+    query_count = len(fake.queries)
+    again = await context.get_graph_context("arsenal")
+    assert again is contexts["arsenal"]
+    assert len(fake.queries) == query_count
+
+
+@pytest.mark.asyncio
+async def test_invalidation_drops_entity_and_linked_neighbours():
+    fake = _FakeFalkorDB({
+        "arsenal": _row("arsenal", competitors=[{"id": "chelsea", "name": "Chelsea"}]),
+        "chelsea": _row("chelsea"),
+        "spurs": _row("spurs"),
+    })
+    context = _context_with(fake)
+    await context.get_graph_contexts(["arsenal", "chelsea", "spurs"])
+
+    context.invalidate_graph_context("chelsea")
+
+    assert "chelsea" not in context.graph_context
+    assert "arsenal" not in context.graph_context
+    assert "spurs" in context.graph_context
+
+
+@pytest.mark.asyncio
+async def test_relationship_writes_invalidate_cached_graph_context():
+    from datetime import datetime, timezone
+
+    import multi_pass_context
+    from graphiti_service import GraphitiService
+    from schemas import Relationship, RelationshipType
+
+    class _Table:
+        def insert(self, _data):
+            return self
+
+        def execute(self):
+            return None
+
+    fake = _FakeFalkorDB({"arsenal": _row("arsenal"), "spurs": _row("spurs")})
+    context = multi_pass_context.MultiPassContext()
+    context._falkordb_client = fake
+    context._entity_index_ensured = True
+    await context.get_graph_contexts(["arsenal", "spurs"])
+
+    service = GraphitiService.__new__(GraphitiService)
+    service.use_supabase = True
+    service.supabase_client = type("_Supabase", (), {"table": lambda self, _name: _Table()})()
+    service.driver = None
+    await service.create_relationship(Relationship(
+        id="rel-1",
+        type=RelationshipType.PARTNER_OF,
+        from_entity="arsenal",
+        to_entity="emirates",
+        confidence=0.9,
+        valid_from=datetime.now(timezone.utc),
+    ))
+
+    assert "arsenal" not in context.graph_context
+    assert "spurs" in context.graph_context
+
+
+@pytest.mark.asyncio
+async def test_query_failure_is_not_cached():
+    class _Broken:
+        async def execute_query(self, query, params):
+            raise ConnectionError("falkordb down")
+
+    context = _context_with(_Broken())
+    result = await context.get_graph_context("arsenal")
+
+    assert result.partners == []
+    assert len(context.graph_context) == 0
+
+
+def test_cache_is_bounded_by_size_and_ttl(monkeypatch):
+    cache = GraphContextCache(max_entries=2, ttl_seconds=10)
+    clock = [100.0]
+    monkeypatch.setattr("backend.multi_pass_context.time.monotonic", lambda: clock[0])
+
+    cache.set("a", NetworkContext())
+    cache.set("b", NetworkContext())
+    assert cache.get("a") is not None
+    cache.set("c", NetworkContext())
+
+    assert cache.get("b") is None
+    assert cache.evictions == 1
+
+    clock[0] += 11
+    assert cache.get("a") is None
+    assert cache.get("c") is None
@@ -4,11 +4,16 @@ Unit Tests for Parameter Tuning
 Tests the grid search and Bayesian optimization for parameter tuning.
 """
 
+import math
+
 import pytest
 from backend.parameter_tuning import (
     ParameterConfig,
     ParameterTuner,
     TuningResult,
+    SampleArrays,
+    _simulate_trajectory,
+    score_config_vectorized,
     get_default_param_ranges,
     get_bayesian_param_ranges
 )
@@ -244,6 +249,79 @@ def test_bayesian_optimization_fallback(tuner, monkeypatch):
     assert result.best_config is not None
 
 
+def test_vectorized_score_matches_iterative_simulation(tuner):
+    """Vectorized scoring reproduces the per-sample simulation loop"""
+    samples = SampleArrays.from_samples(tuner.validation_data)
+
+    for accept_delta in (0.01, 0.06, 0.3):
+        for max_iterations in (1, 7, 30):
+            for max_cost in (0.09, 2.0):
+                config = ParameterConfig(
+                    accept_delta=accept_delta,
+                    max_iterations=max_iterations,
+                    max_cost_per_entity_usd=max_cost,
+                    actionable_min_categories=1
+                )
+
+                expected = 0.0
+                for sample in tuner.validation_data:
+                    simulated = tuner._simulate_discovery(sample, config)
+                    correct = simulated["actionable"] == sample["actual_actionable"]
+                    expected += (10 if sample["actual_actionable"] else 5) if correct else -5
+                    cost_diff = sample["actual_cost_usd"] - simulated["cost_usd"]
+                    expected += cost_diff * (500 if cost_diff > 0 else 1000)
+                expected /= len(tuner.validation_data)
+
+                assert score_config_vectorized(config, samples) == pytest.approx(expected)
+
+
+def test_fractional_max_iterations_matches_simulation_loop(tuner):
+    """A fractional iteration limit runs as many iterations as the loop does"""
+    sample = {"has_signal": True}
+    for max_iterations in (7.0, 7.2, 7.5, 7.9):
+        config = ParameterConfig(max_iterations=max_iterations, accept_delta=0.01)
+        simulated = tuner._simulate_discovery(sample, config)
+        actionable, cost, confidence, iterations = _simulate_trajectory(config, True)
+        assert iterations == simulated["iterations"] == math.ceil(max_iterations)
+        assert cost == pytest.approx(simulated["cost_usd"])
+        assert confidence == pytest.approx(simulated["confidence"])
+
+    with pytest.raises(ValueError):
+        _simulate_trajectory(ParameterConfig(max_iterations=float("nan")), True)
+
+
+def test_grid_search_process_pool_matches_serial(tuner):
+    """Process-pool grid search returns the same results in the same order"""
+    param_ranges = {
+        "accept_delta": (0.02, 0.3, 0.04),
+        "max_iterations": (10, 40, 10)
+    }
+
+    serial = tuner.grid_search(param_ranges, validation_split=0.5)
+    pooled = tuner.grid_search(param_ranges, validation_split=0.5, max_workers=2, chunk_size=3)
+
+    assert pooled.all_results == serial.all_results
+    assert pooled.best_config == serial.best_config
+
+
+def test_successive_halving_prunes_and_finds_grid_optimum(sample_validation_data):
+    """Successive halving evaluates fewer configs and keeps the grid winner"""
+    tuner = ParameterTuner(sample_validation_data * 5)
+    param_ranges = {
+        "accept_delta": (0.02, 0.3, 0.02),
+        "max_iterations": (5, 45, 5),
+        "actionable_min_categories": (1, 2, 1)
+    }
+
+    grid = tuner.grid_search(param_ranges, validation_split=0.0)
+    halving = tuner.successive_halving_search(param_ranges, eta=3, validation_split=0.0)
+
+    assert tuner.count_grid_combinations(param_ranges) == grid.iterations_completed
+    assert halving.iterations_completed < 2 * grid.iterations_completed
+    assert len(halving.all_results) < len(grid.all_results)
+    assert halving.best_score == pytest.approx(grid.best_score)
+
+
 def test_get_default_param_ranges():
     """Test default parameter ranges"""
     ranges = get_default_param_ranges()
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Tests for the streaming (pipelined) discovery -> Ralph -> persistence path.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from pipeline_orchestrator import PipelineOrchestrator
+
+
+@pytest.fixture(autouse=True)
+def streaming_env(monkeypatch):
+    monkeypatch.setenv("PIPELINE_QUESTION_FIRST_ENABLED", "false")
+    monkeypatch.setenv("PIPELINE_STREAMING_ENABLED", "true")
+    monkeypatch.setenv("PIPELINE_STREAMING_RALPH_BATCH_SIZE", "2")
+    monkeypatch.delenv("PIPELINE_PERSISTENCE_CONCURRENCY", raising=False)
+
+
+def _raw_signal(idx):
+    return {
+        "id": f"raw-{idx}",
+        "signal_type": "TECHNOLOGY_ADOPTED",
+        "statement": f"Raw discovery signal {idx}",
+        "confidence": 0.8,
+        "url": f"https://example.com/signal/{idx}",
+    }
+
+
+class _DiscoveryResult:
+    def __init__(self, signals):
+        self.final_confidence = 0.78
+        self.signals_discovered = signals
+        self.hypotheses = []
+
+
+class StreamingDiscovery:
+    """Reports one signal per lane through the progress callback, like DiscoveryRuntimeV2."""
+
+    def __init__(self, events, lanes=5):
+        self.events = events
+        self.lanes = lanes
+
+    async def run_discovery_with_dossier_context(self, **kwargs):
+        signals = []
+        for idx in range(self.lanes):
+            await asyncio.sleep(0.01)
+            signals.append(_raw_signal(idx))
+            await kwargs["progress_callback"](
+                {"status": "running", "lane": f"lane_{idx}", "signals_discovered": len(signals), "new_signals": [signals[-1]]}
+            )
+        self.events.append("discovery_done")
+        # The final result also carries a signal that was never streamed.
+        return _DiscoveryResult(signals + [_raw_signal(99)])
+
+
+class BatchingRalph:
+    def __init__(self, events, fail=False):
+        self.events = events
+        self.batches = []
+        self.fail = fail
+
+    async def validate_signals(self, raw_signals, entity_id):
+        self.events.append("ralph_batch")
+        self.batches.append([signal["id"] for signal in raw_signals])
+        if self.fail:
+            raise RuntimeError("ralph down")
+        return {
+            "validated_signals": [
+                {"id": f"valid-{signal['id']}", "type": "TECHNOLOGY_ADOPTED", "statement": signal["statement"], "confidence": 0.8}
+                for signal in raw_signals
+            ],
+            "capability_signals": [],
+            "hypothesis_states": {},
+            "aggregation_summary": {"accepted_count": len(raw_signals)},
+        }
+
+
+class DedupingRalph(BatchingRalph):
+    """Collapses signals whose statement prefix was already accepted, like Pass 3 does."""
+
+    def __init__(self, events):
+        super().__init__(events)
+        self.prior_counts = []
+        self.recalculated = []
+
+    async def validate_signals(self, raw_signals, entity_id, prior_signals=None):
+        result = await super().validate_signals(raw_signals, entity_id)
+        self.prior_counts.append(len(prior_signals or []))
+        seen = {signal["statement"][:12] for signal in prior_signals or []}
+        kept = []
+        for signal in result["validated_signals"]:
+            if signal["statement"][:12] not in seen:
+                seen.add(signal["statement"][:12])
+                kept.append(signal)
+        result["validated_signals"] = kept
+        result["hypothesis_states"] = {"TECHNOLOGY_ADOPTED": f"batch of {len(kept)}"}
+        return result
+
+    def recalculate_hypothesis_states(self, entity_id, validated_signals, capability_signals):
+        self.recalculated.append([signal["id"] for signal in validated_signals])
+        return {"TECHNOLOGY_ADOPTED": f"all {len(validated_signals)}"}
+
+
+class ConcurrentGraphiti:
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.episodes = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def add_discovery_episode(self, **kwargs):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        self.episodes.append(kwargs)
+        return {"episode_id": f"episode-{kwargs['metadata'].get('signal_type')}-{len(self.episodes)}"}
+
+    async def get_entity_timeline(self, entity_id, limit=50):
+        return [{"timeline": True, **episode} for episode in self.episodes[:limit]]
+
+
+class RecordingScorer:
+    def __init__(self):
+        self.calls = []
+
+    async def calculate_entity_scores(self, **kwargs):
+        self.calls.append(kwargs)
+        return {"procurement_maturity": 60.0, "active_probability": 0.7, "sales_readiness": "MONITOR"}
+
+
+class FakePersistenceCoordinator:
+    async def persist_run_artifacts(self, **kwargs):
+        return {
+            "dual_write_ok": True,
+            "supabase": {"ok": True, "attempts": 1},
+            "falkordb": {"ok": True, "attempts": 1},
+            "reconcile_required": False,
+            "reconciliation_payload": None,
+        }
+
+    async def persist_step_artifacts(self, **kwargs):
+        artifacts = kwargs.get("artifacts") or []
+        return {
+            "total_count": len(artifacts),
+            "persisted_count": len(artifacts),
+            "failed_count": 0,
+            "dual_write_ok": True,
+            "status_matrix": [],
+            "reconcile_required": False,
+            "reconciliation_payloads": [],
+            "failure_taxonomy": {"supabase_write_failure": 0, "falkordb_write_failure": 0, "dual_write_incomplete": 0},
+        }
+
+
+def _orchestrator(events, ralph=None, graphiti=None, scorer=None):
+    return PipelineOrchestrator(
+        dossier_generator=None,
+        discovery=StreamingDiscovery(events),
+        ralph_validator=ralph or BatchingRalph(events),
+        graphiti_service=graphiti or ConcurrentGraphiti(),
+        dashboard_scorer=scorer or RecordingScorer(),
+        persistence_coordinator=FakePersistenceCoordinator(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_streaming_validates_while_discovery_runs_and_keeps_phase_contract():
+    events = []
+    ralph = BatchingRalph(events)
+    graphiti = ConcurrentGraphiti()
+    scorer = RecordingScorer()
+    orchestrator = _orchestrator(events, ralph=ralph, graphiti=graphiti, scorer=scorer)
+    updates = []
+
+    async def phase_callback(phase, payload):
+        updates.append((phase, payload))
+
+    result = await orchestrator.run_entity_pipeline(
+        entity_id="arsenal-fc",
+        entity_name="Arsenal FC",
+        initial_dossier={"metadata": {"entity_id": "arsenal-fc"}, "questions": []},
+        phase_callback=phase_callback,
+    )
+
+    # Ralph started on streamed signals before discovery finished.
+    assert events.index("ralph_batch") < events.index("discovery_done")
+    validated_raw_ids = sorted(raw_id for batch in ralph.batches for raw_id in batch)
+    assert validated_raw_ids == sorted([f"raw-{idx}" for idx in range(5)] + ["raw-99"])
+    assert all(len(batch) <= 2 for batch in ralph.batches)
+
+    # Every validated signal is written exactly once, with writes overlapping.
+    assert len(graphiti.episodes) == 6
+    assert graphiti.peak > 1
+    assert result["validated_signal_count"] == 6
+    assert result["phase_details_by_phase"]["discovery"]["signals_streamed"] == 5
+    assert result["phase_details_by_phase"]["ralph_validation"]["micro_batch_count"] == len(ralph.batches)
+
+    # Scoring ran on the written episodes; the artifacts carry the re-read timeline.
+    assert len(scorer.calls[0]["episodes"]) == 6
+    assert all(episode.get("timeline") for episode in result["artifacts"]["episodes"])
+
+    completed = [phase for phase, payload in updates if payload.get("status") == "completed"]
+    assert completed == ["discovery", "ralph_validation", "temporal_persistence", "dashboard_scoring"]
+    assert all("new_signals" not in payload for _, payload in updates)
+    assert "passed" in result["acceptance_gate"]
+
+
+@pytest.mark.asyncio
+async def test_streaming_ralph_failure_skips_persistence_like_sequential_path():
+    events = []
+    orchestrator = _orchestrator(events, ralph=BatchingRalph(events, fail=True))
+
+    result = await orchestrator.run_entity_pipeline(
+        entity_id="arsenal-fc",
+        entity_name="Arsenal FC",
+        initial_dossier={"metadata": {"entity_id": "arsenal-fc"}, "questions": []},
+    )
+
+    phases = result["phase_details_by_phase"]
+    assert phases["discovery"]["status"] == "completed"
+    assert phases["ralph_validation"]["status"] == "failed"
+    assert phases["temporal_persistence"]["status"] == "skipped"
+    assert phases["dashboard_scoring"]["status"] == "completed"
+    assert result["validated_signal_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_persistence_keeps_signal_order(monkeypatch):
+    monkeypatch.setenv("PIPELINE_STREAMING_ENABLED", "false")
+    monkeypatch.setenv("PIPELINE_PERSISTENCE_CONCURRENCY", "3")
+    graphiti = ConcurrentGraphiti()
+    orchestrator = _orchestrator([], graphiti=graphiti)
+    signals = [
+        {"id": f"s-{idx}", "type": f"TYPE_{idx}", "statement": f"signal {idx}", "confidence": 0.7}
+        for idx in range(7)
+    ]
+
+    episodes = await orchestrator._persist_validated_signals(
+        entity_id="arsenal-fc",
+        entity_name="Arsenal FC",
+        validated_signals=signals,
+    )
+
+    assert graphiti.peak == 3
+    assert [episode["episode_id"].split("-")[1] for episode in episodes] == [f"TYPE_{idx}" for idx in range(7)]
+
+
+def test_signal_identity_is_shared_by_stream_and_persistence():
+    raw = {"signal_type": "RFP", "url": "https://arsenal.com/tenders", "evidence_found": "CRM tender " * 20}
+    same_type_key = {"type": "RFP", "url": "https://arsenal.com/tenders", "statement": "CRM tender " * 20}
+    other_url = dict(raw, url="https://arsenal.com/news")
+
+    key = PipelineOrchestrator._signal_identity(raw)
+    assert key == PipelineOrchestrator._signal_identity(same_type_key)
+    assert key != PipelineOrchestrator._signal_identity(other_url)
+    assert PipelineOrchestrator._signal_identity({"id": " s-1 ", "type": "RFP"}) == "s-1"
+
+
+def test_merge_signal_lists_keeps_its_own_key():
+    first = {"entity_id": "arsenal", "type": "RFP", "url": "https://arsenal.com/a", "statement": "x" * 80 + "first"}
+    same_prefix_other_url = dict(first, url="https://arsenal.com/b", statement="x" * 80 + "second")
+    other_type = dict(first, type="HIRE")
+
+    assert PipelineOrchestrator._merge_signal_lists([first], [same_prefix_other_url, other_type]) == [first, other_type]
+
+
+@pytest.mark.asyncio
+async def test_streaming_dedupes_across_batches_and_recomputes_hypothesis_states():
+    events = []
+    ralph = DedupingRalph(events)
+    graphiti = ConcurrentGraphiti()
+    orchestrator = _orchestrator(events, ralph=ralph, graphiti=graphiti)
+
+    result = await orchestrator.run_entity_pipeline(
+        entity_id="arsenal-fc",
+        entity_name="Arsenal FC",
+        initial_dossier={"metadata": {"entity_id": "arsenal-fc"}, "questions": []},
+    )
+
+    # Every statement shares the same prefix: only the first batch's first signal survives
+    assert len(ralph.batches) > 1
+    assert ralph.prior_counts[0] == 0 and all(count == 1 for count in ralph.prior_counts[1:])
+    assert result["validated_signal_count"] == 1
+    assert len(graphiti.episodes) == 1
+    assert ralph.recalculated == [["valid-raw-0"]]
+    assert result["artifacts"]["hypothesis_states"] == {"TECHNOLOGY_ADOPTED": "all 1"}
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests for the idle worker wakeup channel.
+"""
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import entity_pipeline_worker as worker_module
+import pipeline_wakeup
+from entity_pipeline_worker import EntityPipelineWorker
+from pipeline_wakeup import PipelineWakeup, notify_pipeline_wakeup
+
+
+def test_in_process_notify_wakes_waiter_before_timeout():
+    wakeup = PipelineWakeup().start()
+    try:
+        assert wakeup.wait(0.01) is None
+        threading.Timer(0.05, lambda: notify_pipeline_wakeup("batch_queued:b1", touch_file=False)).start()
+        started = time.monotonic()
+        assert wakeup.wait(5.0) == "batch_queued:b1"
+        assert time.monotonic() - started < 1.0
+        assert (wakeup.wakeups, wakeup.timeouts) == (1, 1)
+    finally:
+        wakeup.close()
+
+
+def test_file_stand_in_ignores_cursor_writes_but_wakes_on_resume(tmp_path):
+    control_path = tmp_path / "pipeline-control-state.json"
+    wakeup_path = tmp_path / "pipeline-wakeup"
+    control_path.write_text(json.dumps({"requested_state": "paused", "current_batch_id": "a"}), encoding="utf-8")
+    wakeup = PipelineWakeup(watch_paths=(wakeup_path,), control_state_path=control_path, file_poll_seconds=0.01).start()
+    try:
+        time.sleep(0.02)
+        control_path.write_text(json.dumps({"requested_state": "paused", "current_batch_id": "b"}), encoding="utf-8")
+        assert wakeup.wait(0.1) is None
+
+        time.sleep(0.02)
+        control_path.write_text(json.dumps({"requested_state": "running", "current_batch_id": "b"}), encoding="utf-8")
+        assert wakeup.wait(1.0) == "file:pipeline-control-state.json"
+
+        wakeup_path.write_text("batch_queued:b2\n", encoding="utf-8")
+        assert wakeup.wait(1.0) == "file:pipeline-wakeup"
+    finally:
+        wakeup.close()
+
+
+def test_idle_worker_waits_on_wakeup_with_safety_net_poll(tmp_path, monkeypatch):
+    monkeypatch.setenv("ENTITY_PIPELINE_WAKEUP_ENABLED", "true")
+    monkeypatch.setenv("ENTITY_PIPELINE_WORKER_IDLE_POLL_SECONDS", "300")
+    monkeypatch.setattr(worker_module, "should_use_local_pg", lambda: False)
+    monkeypatch.setattr(worker_module, "PIPELINE_WAKEUP_PATH", tmp_path / "pipeline-wakeup")
+    monkeypatch.setattr(pipeline_wakeup, "PIPELINE_WAKEUP_PATH", tmp_path / "pipeline-wakeup")
+    monkeypatch.setattr(worker_module, "PIPELINE_CONTROL_STATE_PATH", tmp_path / "pipeline-control-state.json")
+    monkeypatch.setattr(worker_module, "_heartbeat_supervisor_state", lambda: None)
+    monkeypatch.setattr(time, "sleep", lambda _seconds: (_ for _ in ()).throw(AssertionError("polled")))
+
+    worker = EntityPipelineWorker.__new__(EntityPipelineWorker)
+    waits = []
+    claims = []
+
+    def fake_claim_next_batch():
+        claims.append(1)
+        if len(claims) == 1:
+            return None
+        raise KeyboardInterrupt()
+
+    worker.claim_next_batch = fake_claim_next_batch
+    original_wait = PipelineWakeup.wait
+
+    def recording_wait(self, timeout):
+        waits.append(timeout)
+        return original_wait(self, 0.01)
+
+    monkeypatch.setattr(PipelineWakeup, "wait", recording_wait)
+    try:
+        worker.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        worker._wakeup.close()
+
+    assert waits == [300]
+    assert len(claims) == 2
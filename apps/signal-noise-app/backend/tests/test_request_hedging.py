@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Tests for latency-percentile request hedging.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from request_hedging import LatencyHistogram, RequestHedger
+
+
+def _warm(hedger, endpoint, seconds=0.05, samples=20):
+    for _ in range(samples):
+        hedger.record_latency(endpoint, seconds)
+
+
+def test_histogram_percentile_tracks_sliding_window():
+    histogram = LatencyHistogram(window=10)
+    for _ in range(9):
+        histogram.record(0.1)
+    histogram.record(5.0)
+
+    assert histogram.percentile(0.5) == pytest.approx(0.1, rel=0.25)
+    assert histogram.percentile(0.99) >= 5.0
+
+    for _ in range(10):
+        histogram.record(0.1)
+    assert histogram.percentile(0.99) < 1.0
+    assert len(histogram) == 10
+
+
+@pytest.mark.asyncio
+async def test_no_hedge_until_endpoint_has_enough_samples():
+    hedger = RequestHedger("t", min_samples=5, budget_ratio=1.0, min_delay_seconds=0.0)
+    calls = []
+
+    async def slow():
+        calls.append("call")
+        await asyncio.sleep(0.02)
+        return "ok"
+
+    assert await hedger.run("e", slow) == "ok"
+    assert calls == ["call"]
+    assert hedger.stats.hedges == 0
+    assert len(hedger.histogram("e")) == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_loser_cancelled():
+    hedger = RequestHedger("t", min_samples=5, budget_ratio=1.0, min_delay_seconds=0.0)
+    _warm(hedger, "e", seconds=0.01)
+    cancelled = []
+
+    async def stuck():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append("primary")
+            raise
+        return "primary"
+
+    async def fast():
+        return "hedge"
+
+    assert await asyncio.wait_for(hedger.run("e", stuck, fast), timeout=1.0) == "hedge"
+    await asyncio.sleep(0)
+    assert cancelled == ["primary"]
+    assert hedger.stats.hedges == 1
+    assert hedger.stats.hedge_wins == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_hedge_waits_for_primary_and_budget_caps_hedges():
+    hedger = RequestHedger("t", min_samples=5, budget_ratio=0.5, min_delay_seconds=0.0)
+    _warm(hedger, "e", seconds=0.01)
+
+    async def slowish():
+        await asyncio.sleep(0.1)
+        return {"answer_text": "primary"}
+
+    async def empty():
+        return {"answer_text": ""}
+
+    def answered(data):
+        return bool(data["answer_text"])
+
+    # Half a hedge is earned per primary: the first request may not hedge, the second may.
+    assert await hedger.run("e", slowish, empty, is_success=answered) == {"answer_text": "primary"}
+    assert (hedger.stats.hedges, hedger.stats.budget_denied) == (0, 1)
+    assert await hedger.run("e", slowish, empty, is_success=answered) == {"answer_text": "primary"}
+    assert (hedger.stats.hedges, hedger.stats.hedge_wins) == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_primary_error_surfaces_when_both_attempts_fail():
+    hedger = RequestHedger("t", min_samples=5, budget_ratio=1.0, min_delay_seconds=0.0)
+    _warm(hedger, "e", seconds=0.01)
+
+    async def fail_late():
+        await asyncio.sleep(0.05)
+        raise TimeoutError("primary")
+
+    async def fail_fast():
+        raise RuntimeError("hedge")
+
+    with pytest.raises(TimeoutError):
+        await hedger.run("e", fail_late, fail_fast)
+
+
+@pytest.mark.asyncio
+async def test_chutes_hedge_to_alternate_model(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "chutes_openai")
+    monkeypatch.setenv("CHUTES_API_KEY", "test-chutes-key")
+    from claude_client import ClaudeClient
+
+    client = ClaudeClient()
+    client._request_hedger = RequestHedger("chutes", min_samples=1, budget_ratio=1.0, min_delay_seconds=0.0)
+    client.chutes_hedge_model = "alt-model"
+    _warm(client._request_hedger, "chutes:primary-model:non_stream", seconds=0.01, samples=1)
+    seen = []
+
+    async def fake_non_stream(*, payload, headers, timeout):
+        seen.append(payload["model"])
+        if payload["model"] == "primary-model":
+            await asyncio.sleep(10)
+        return {"answer_text": "done"}
+
+    client._query_chutes_non_stream = fake_non_stream
+    data = await asyncio.wait_for(
+        client._send_chutes_request(payload={"model": "primary-model"}, headers={}, timeout=None, stream=False),
+        timeout=1.0,
+    )
+
+    assert seen == ["primary-model", "alt-model"]
+    assert data["served_model"] == "alt-model"
+    assert client.get_runtime_diagnostics()["request_hedging"]["hedge_wins"] == 1
+    assert len(client._request_hedger.histogram("chutes:alt-model:non_stream")) == 1
+    assert len(client._request_hedger.histogram("chutes:primary-model:non_stream")) == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelling_caller_before_hedge_cancels_primary():
+    hedger = RequestHedger("t", min_samples=5, budget_ratio=1.0, min_delay_seconds=5.0)
+    _warm(hedger, "e", seconds=0.01)
+    cancelled = []
+
+    async def stuck():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append("primary")
+            raise
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(hedger.run("e", stuck), timeout=0.05)
+    await asyncio.sleep(0)
+    assert cancelled == ["primary"]
+    assert hedger.stats.hedges == 0
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Tests for the SQLite task store used by the Celery dossier worker.
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+# db initialises its database on import; keep that away from the tracked tasks.db
+os.environ.setdefault("TASKS_DB_FILE", os.path.join(tempfile.mkdtemp(), "tasks.db"))
+
+import db
+
+
+@pytest.fixture
+def task_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(db, "DB_FILE", str(tmp_path / "tasks.db"))
+    db.init_db()
+    yield db
+    db.flush_task_progress()
+    db.close_db_connection()
+
+
+def test_connection_is_reused_per_thread_in_wal_mode(task_db):
+    conn = task_db.get_db_connection()
+
+    assert task_db.get_db_connection() is conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(task_db.get_db_connection()))
+    thread.start()
+    thread.join()
+    assert other[0] is not conn
+
+
+def test_progress_is_coalesced_and_final_update_wins(task_db, monkeypatch):
+    task_id = task_db.create_task("company", "Test FC")
+    writes = []
+    original_write = task_db._write_progress_batch
+
+    def recording_write(batch):
+        writes.append(dict(batch))
+        original_write(batch)
+
+    monkeypatch.setattr(task_db, "_write_progress_batch", recording_write)
+    monkeypatch.setattr(task_db._progress_coalescer, "interval_seconds", 60.0)
+    task_db._progress_coalescer._last_flush = time.monotonic()
+
+    started = time.monotonic()
+    for step in range(1, 5):
+        task_db.report_progress(task_id, {"status": "processing", "progress": f"{step * 25}%", "current_step": f"step {step}"})
+    assert time.monotonic() - started < 0.5
+    assert task_db.get_task(task_id)["status"] == "pending"
+
+    assert task_db.flush_task_progress()
+    assert len(writes) == 1
+    assert task_db.get_task(task_id)["current_step"] == "step 4"
+
+    # A queued progress write never lands after the final result
+    task_db.report_progress(task_id, {"status": "processing", "progress": "99%"})
+    assert task_db.update_task(task_id, {"status": "complete", "progress": "100%"})
+    task_db.flush_task_progress()
+    task_db._write_progress_batch({task_id: {"status": "processing", "progress": "10%"}})
+    task = task_db.get_task(task_id)
+    assert (task["status"], task["progress"]) == ("complete", "100%")
+
+
+def test_batched_status_queries(task_db):
+    ids = [task_db.create_task("company", f"Entity {index}") for index in range(6)]
+    task_db.update_task(ids[0], {"status": "complete"})
+    task_db.update_task(ids[1], {"status": "failed"})
+    task_db.update_task(ids[2], {"status": "processing"})
+
+    assert {task["id"] for task in task_db.get_tasks_by_status(["complete", "failed"])} == set(ids[:2])
+    assert [task["id"] for task in task_db.get_tasks_by_status("processing")] == [ids[2]]
+    assert {task["id"] for task in task_db.get_recent_tasks(statuses=["pending"])} == set(ids[3:])
+    assert len(task_db.get_recent_tasks(limit=4)) == 4
+
+    tasks = task_db.get_tasks(ids[:3] + ["missing"])
+    assert set(tasks) == set(ids[:3])
+    assert tasks[ids[0]]["result"] == {"status": "complete"}
+
+
+def test_readers_do_not_block_while_a_write_is_open(task_db):
+    task_id = task_db.create_task("company", "Test FC")
+    writer = sqlite3.connect(task_db.DB_FILE, timeout=0.1)
+    try:
+        writer.execute("BEGIN IMMEDIATE")
+        writer.execute("UPDATE tasks SET progress = '50%' WHERE id = ?", (task_id,))
+        assert task_db.get_task(task_id)["progress"] == "0%"
+    finally:
+        writer.rollback()
+        writer.close()
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental, concurrent temporal sweeps.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+backend_dir = Path(__file__).parent.parent
+app_dir = backend_dir.parent
+sys.path.insert(0, str(app_dir))
+sys.path.insert(0, str(backend_dir))
+
+import dossier_generator as generator_module
+import temporal_sweep_scheduler as scheduler_module
+from dossier_generator import EntityDossierGenerator
+from schemas import DossierQuestion, DossierQuestionType, DossierSection, EntityDossier, ProfileChangeType
+from temporal_sweep_scheduler import SweepBudget, TemporalSweepScheduler
+
+
+class _FakeClaude:
+    async def query(self, **_kwargs):
+        return {"content": "{}"}
+
+
+def _scheduler(monkeypatch):
+    monkeypatch.setattr(scheduler_module, "create_pipeline_brightdata_client", lambda: SimpleNamespace())
+    return TemporalSweepScheduler(_FakeClaude())
+
+
+@pytest.mark.asyncio
+async def test_generate_dossier_only_regenerates_sections_whose_inputs_changed(monkeypatch):
+    class _Collector:
+        async def collect_all(self, *_args, **_kwargs):
+            return SimpleNamespace(data_sources_used=["BrightData"], metadata=None)
+
+        async def close(self):
+            pass
+
+    monkeypatch.setenv("DOSSIER_RUN_POST_COLLECTION_ENRICHMENT", "false")
+    monkeypatch.setenv("DOSSIER_DISABLE_QUESTION_EXTRACTION", "true")
+    monkeypatch.setattr(generator_module, "DATA_COLLECTOR_AVAILABLE", True)
+    monkeypatch.setattr(generator_module, "DossierDataCollector", _Collector)
+
+    generator = EntityDossierGenerator(_FakeClaude())
+    entity_data = {"entity_name": "Test FC", "leadership_data": {"decision_makers": []}, "leadership_count": 1}
+    monkeypatch.setattr(generator, "_dossier_data_to_dict", lambda _obj: dict(entity_data))
+    generated = []
+
+    async def _sections(section_ids, _entity_data, model):
+        generated.append(list(section_ids))
+        return [DossierSection(id=section_id, title=section_id, content=[model]) for section_id in section_ids]
+
+    monkeypatch.setattr(generator, "_generate_sections_parallel", _sections)
+    section_ids = ["recent_news", "leadership", "current_performance"]
+
+    async def _generate(previous=None):
+        generated.clear()
+        return await generator.generate_dossier(
+            entity_id="test-fc",
+            entity_name="Test FC",
+            section_ids=section_ids,
+            previous_sections=previous.sections if previous else None,
+            previous_section_fingerprints=previous.metadata["section_fingerprints"] if previous else None,
+        )
+
+    first = await _generate()
+    assert sorted(sum(generated, [])) == sorted(section_ids)
+    assert set(first.metadata["section_fingerprints"]) == set(section_ids)
+
+    unchanged = await _generate(first)
+    assert generated == []
+    assert unchanged.metadata["reused_sections"] == section_ids
+    assert [section.id for section in unchanged.sections] == section_ids
+
+    entity_data["leadership_data"] = {"decision_makers": [{"name": "Alice Smith", "role": "CEO"}]}
+    changed = await _generate(unchanged)
+    assert sum(generated, []) == ["leadership"]
+    assert changed.metadata["reused_sections"] == ["recent_news", "current_performance"]
+    assert [section.id for section in changed.sections] == section_ids
+
+
+@pytest.mark.asyncio
+async def test_generate_dossier_regenerates_fallback_sections_with_unchanged_inputs(monkeypatch):
+    class _Collector:
+        async def collect_all(self, *_args, **_kwargs):
+            return SimpleNamespace(data_sources_used=["BrightData"], metadata=None)
+
+        async def close(self):
+            pass
+
+    monkeypatch.setenv("DOSSIER_RUN_POST_COLLECTION_ENRICHMENT", "false")
+    monkeypatch.setenv("DOSSIER_DISABLE_QUESTION_EXTRACTION", "true")
+    monkeypatch.setattr(generator_module, "DATA_COLLECTOR_AVAILABLE", True)
+    monkeypatch.setattr(generator_module, "DossierDataCollector", _Collector)
+
+    generator = EntityDossierGenerator(_FakeClaude())
+    entity_data = {"entity_name": "Test FC", "leadership_data": {"decision_makers": []}, "leadership_count": 1}
+    monkeypatch.setattr(generator, "_dossier_data_to_dict", lambda _obj: dict(entity_data))
+    generated = []
+    failing = {"leadership"}
+
+    async def _sections(section_ids, _entity_data, model):
+        generated.append(list(section_ids))
+        return [
+            generator._create_fallback_section(section_id, model, reason_code="section_timeout")
+            if section_id in failing
+            else DossierSection(id=section_id, title=section_id, content=[model])
+            for section_id in section_ids
+        ]
+
+    monkeypatch.setattr(generator, "_generate_sections_parallel", _sections)
+    section_ids = ["recent_news", "leadership"]
+
+    first = await generator.generate_dossier(
+        entity_id="test-fc",
+        entity_name="Test FC",
+        section_ids=section_ids,
+    )
+    assert set(first.metadata["section_fingerprints"]) == {"recent_news"}
+
+    generated.clear()
+    failing.clear()
+    # Even with the stale fingerprint supplied, the fallback section is regenerated.
+    second = await generator.generate_dossier(
+        entity_id="test-fc",
+        entity_name="Test FC",
+        section_ids=section_ids,
+        previous_sections=first.sections,
+        previous_section_fingerprints={
+            **first.metadata["section_fingerprints"],
+            "leadership": generator.section_input_fingerprint("leadership", entity_data),
+        },
+    )
+    assert sum(generated, []) == ["leadership"]
+    assert second.metadata["reused_sections"] == ["recent_news"]
+    assert next(section for section in second.sections if section.id == "leadership").fallback_used is False
+
+
+@pytest.mark.asyncio
+async def test_sweep_passes_fingerprints_forward_and_reports_section_changes(monkeypatch):
+    scheduler = _scheduler(monkeypatch)
+    fingerprints = [{"leadership": "a", "recent_news": "n"}, {"leadership": "b", "recent_news": "n"}]
+    calls = []
+
+    async def _generate_dossier(**kwargs):
+        calls.append(kwargs)
+        current = fingerprints[len(calls) - 1]
+        previous = kwargs["previous_section_fingerprints"] or {}
+        reused = [section_id for section_id in current if previous.get(section_id) == current[section_id]]
+        return EntityDossier(
+            entity_id="test-fc",
+            entity_name="Test FC",
+            entity_type="CLUB",
+            priority_score=50,
+            tier="STANDARD",
+            sections=[DossierSection(id=section_id, title=section_id, content=[]) for section_id in current],
+            metadata={"section_fingerprints": current, "reused_sections": reused},
+        )
+
+    extracted = []
+
+    async def _extract(sections, _entity_name, max_per_section=3):
+        extracted.append([section.id for section in sections])
+        return []
+
+    monkeypatch.setattr(scheduler.dossier_generator, "generate_dossier", _generate_dossier)
+    monkeypatch.setattr(scheduler.question_extractor, "extract_questions_from_dossier", _extract)
+
+    first = await scheduler.execute_sweep("test-fc", "Test FC", pass_number=2)
+    second = await scheduler.execute_sweep(
+        "test-fc", "Test FC", pass_number=2, previous_profile=first.entity_profile
+    )
+
+    assert calls[0]["previous_sections"] is None
+    assert calls[1]["previous_section_fingerprints"] == {"leadership": "a", "recent_news": "n"}
+    assert calls[1]["section_ids"] == scheduler.default_sweep_schedule[2].sections_to_generate
+    assert extracted == [["leadership", "recent_news"], ["leadership"]]
+    section_changes = [c for c in second.profile_changes if c.change_type == ProfileChangeType.SECTION_UPDATED]
+    assert [(c.previous_value, c.new_value) for c in section_changes] == [("a", "b")]
+
+
+@pytest.mark.asyncio
+async def test_question_discovery_runs_searches_concurrently(monkeypatch):
+    scheduler = _scheduler(monkeypatch)
+    scheduler.question_concurrency = 3
+    in_flight = {"now": 0, "max": 0}
+
+    async def _search_engine(query, engine="google", num_results=3):
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        return {"status": "success", "results": [{"title": query, "snippet": "found"}]}
+
+    scheduler.brightdata = SimpleNamespace(search_engine=_search_engine)
+    questions = [
+        DossierQuestion(
+            question_id=f"q{index}",
+            section_id="leadership",
+            question_type=DossierQuestionType.LEADERSHIP,
+            question_text=f"Question {index}?",
+            priority=5,
+            search_strategy={"search_queries": [f"query {index}"]},
+        )
+        for index in range(5)
+    ]
+
+    result = await scheduler._run_question_guided_discovery("test-fc", "Test FC", questions, None)
+
+    assert in_flight["max"] == 3
+    assert sorted(result["answers"]) == [f"q{index}" for index in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_execute_sweeps_shares_concurrency_and_cost_budget(monkeypatch):
+    scheduler = _scheduler(monkeypatch)
+    entities = [{"entity_id": f"e{index}", "entity_name": f"Entity {index}"} for index in range(5)]
+    in_flight = {"now": 0, "max": 0}
+
+    async def _execute_sweep(**kwargs):
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        if kwargs["entity_id"] == "e4":
+            raise RuntimeError("provider down")
+        return SimpleNamespace(cost_usd=0.001, entity_id=kwargs["entity_id"])
+
+    monkeypatch.setattr(scheduler, "execute_sweep", _execute_sweep)
+
+    # Pass 4 reserves 0.015 per sweep: only two fit while all run at once
+    budget = SweepBudget(max_cost_usd=0.035)
+    results = await scheduler.execute_sweeps(entities, pass_number=4, max_concurrency=5, budget=budget)
+    assert sorted(results) == ["e0", "e1"]
+    assert budget.skipped == ["e2", "e3", "e4"]
+    assert budget.reserved_usd == pytest.approx(0.0)
+    assert budget.spent_usd == pytest.approx(0.002)
+
+    # One at a time, each sweep settles its actual cost before the next reserves
+    in_flight["max"] = 0
+    results = await scheduler.execute_sweeps(entities, pass_number=4, max_concurrency=1, max_total_cost_usd=0.035)
+    assert sorted(results) == ["e0", "e1", "e2", "e3"]
+    assert in_flight["max"] == 1
@@ -0,0 +1,51 @@
+import sys
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from backend.url_features import BatchUrlScorer, DomainSuffixTrie, strip_www, url_features
+
+
+def test_features_parse_once_and_expose_ranking_fields():
+    features = url_features("https://WWW.Wolves.co.uk/News/Club-Statement.PDF?ref=home")
+
+    assert features.host == "wolves.co.uk"
+    assert features.registrable_domain == "wolves.co.uk"
+    assert features.domain_core == "wolves"
+    assert features.path_segments == ("news", "club-statement.pdf")
+    assert {"news", "club", "statement", "pdf"} <= features.path_tokens
+    assert features.file_type == "pdf"
+    assert not features.is_root
+    assert url_features("https://WWW.Wolves.co.uk/News/Club-Statement.PDF?ref=home") is features
+
+    # lstrip("www.") used to eat the leading "w" of hosts like wolves.co.uk.
+    assert strip_www("wolves.co.uk") == "wolves.co.uk"
+    assert url_features("not a url").host == ""
+    assert url_features("https://arsenal.com").is_root
+
+
+def test_suffix_trie_matches_on_label_boundaries():
+    trie = DomainSuffixTrie({"bbc.co.uk": "tier_2", "gov.uk": "tier_1", "uk": "cc"})
+
+    assert trie.lookup("www.bbc.co.uk") == "tier_2"
+    assert trie.lookup("sport.bbc.co.uk") == "tier_2"
+    assert trie.lookup("coventry.gov.uk") == "tier_1"
+    assert trie.lookup("notbbc.co.uk") == "cc"
+    assert trie.lookup("example.com") is None
+    assert not DomainSuffixTrie(["bbc.com"]).matches("notbbc.com")
+    assert len(trie) == 3
+
+
+def test_batch_scorer_ranks_with_prefix_and_keeps_ties_stable():
+    candidates = [
+        {"url": "https://a.example.com/news"},
+        {"url": "https://b.example.com/"},
+        {"url": "https://c.example.com/"},
+        {"url": "https://d.example.com/tender.pdf"},
+    ]
+    scorer = BatchUrlScorer(lambda candidate, features: 1.0 if features.is_root else 0.0)
+
+    assert [c["url"][8] for c in scorer.rank(candidates)] == ["b", "c", "a", "d"]
+    ranked = scorer.rank(candidates, key_prefix=lambda candidate: candidate["url"].endswith(".pdf"))
+    assert [c["url"][8] for c in ranked] == ["d", "b", "c", "a"]
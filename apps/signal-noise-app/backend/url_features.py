@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Shared URL feature extraction for discovery ranking.
+
+Hypothesis-driven discovery, DiscoveryRuntimeV2, the official-site resolver
+and the URL lane policy all need the same handful of facts about a candidate
+URL. ``url_features`` parses a URL once into an immutable ``UrlFeatures``
+record and memoizes it, so a SERP result ranked by several hops or rankers is
+only parsed once per process. ``DomainSuffixTrie`` replaces linear
+``any(domain in host ...)`` scans with a label-wise suffix lookup.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+URL_FEATURE_CACHE_SIZE = max(0, int(os.getenv("URL_FEATURE_CACHE_SIZE", "65536")))
+
+# Multi-label public suffixes seen in sports/procurement discovery; single-label
+# TLDs are handled implicitly.
+MULTI_LABEL_PUBLIC_SUFFIXES = (
+    "co.uk",
+    "org.uk",
+    "gov.uk",
+    "ac.uk",
+    "ltd.uk",
+    "plc.uk",
+    "net.uk",
+    "nhs.uk",
+    "sch.uk",
+    "police.uk",
+    "com.au",
+    "net.au",
+    "org.au",
+    "gov.au",
+    "edu.au",
+    "co.nz",
+    "org.nz",
+    "govt.nz",
+    "co.za",
+    "org.za",
+    "gov.za",
+    "com.br",
+    "com.mx",
+    "com.ar",
+    "co.jp",
+    "co.kr",
+    "co.in",
+    "gov.in",
+    "com.sg",
+    "com.hk",
+    "com.cn",
+    "com.tr",
+)
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_NON_ALNUM_PATTERN = re.compile(r"[^a-z0-9]+")
+_MISSING = object()
+
+
+def strip_www(host: str) -> str:
+    """Drop a leading ``www.`` label (unlike ``str.lstrip("www.")``, which eats any w/. prefix)."""
+    host = str(host or "")
+    return host[4:] if host.startswith("www.") else host
+
+
+def host_matches_domain(host: str, domain: str) -> bool:
+    """True when ``host`` is ``domain`` or one of its subdomains."""
+    if not host or not domain:
+        return False
+    return host == domain or host.endswith(f".{domain}")
+
+
+class DomainSuffixTrie:
+    """Label-wise suffix trie mapping registered domains to a value.
+
+    ``lookup`` walks the host's labels right to left and returns the value of
+    the longest registered domain the host equals or is a subdomain of, so the
+    cost depends on the host's label count rather than the number of domains.
+    """
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, entries: Union[Mapping[str, Any], Iterable[str]] = ()):
+        self._root: Dict[str, Any] = {}
+        self._size = 0
+        items = entries.items() if isinstance(entries, Mapping) else ((entry, True) for entry in entries)
+        for domain, value in items:
+            self.add(domain, value)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, domain: str, value: Any = True) -> None:
+        labels = [label for label in str(domain or "").strip().lower().strip(".").split(".") if label]
+        if not labels:
+            return
+        node = self._root
+        for label in reversed(labels):
+            node = node.setdefault(label, {})
+        if "" not in node:
+            self._size += 1
+        # Labels are never empty, so "" is a safe terminal key.
+        node[""] = value
+
+    def lookup(self, host: str, default: Any = None) -> Any:
+        node = self._root
+        found = default
+        for label in reversed(str(host or "").split(".")):
+            node = node.get(label)
+            if node is None:
+                break
+            if "" in node:
+                found = node[""]
+        return found
+
+    def matches(self, host: str) -> bool:
+        return self.lookup(host, _MISSING) is not _MISSING
+
+
+_PUBLIC_SUFFIX_TRIE = DomainSuffixTrie(MULTI_LABEL_PUBLIC_SUFFIXES)
+
+
+@dataclass(frozen=True)
+class UrlFeatures:
+    """Parsed, lowercased view of one URL."""
+
+    url: str
+    url_lower: str
+    scheme: str
+    netloc: str
+    hostname: str
+    host: str
+    labels: Tuple[str, ...]
+    registrable_domain: str
+    domain_core: str
+    path: str
+    path_segments: Tuple[str, ...]
+    path_tokens: FrozenSet[str]
+    file_type: str
+    compact: str
+
+    @property
+    def is_root(self) -> bool:
+        return not self.path_segments
+
+
+def _registrable_domain(labels: Tuple[str, ...]) -> str:
+    if len(labels) < 2:
+        return ".".join(labels)
+    suffix_labels = 1
+    if len(labels) >= 3 and _PUBLIC_SUFFIX_TRIE.matches(".".join(labels[-2:])):
+        suffix_labels = 2
+    return ".".join(labels[-(suffix_labels + 1):])
+
+
+def _parse_url_features(url: str) -> UrlFeatures:
+    raw = str(url or "").strip()
+    lowered = raw.lower()
+    try:
+        parts = urlsplit(lowered)
+        hostname = parts.hostname or ""
+    except ValueError:
+        parts = None
+        hostname = ""
+    host = strip_www(hostname)
+    labels = tuple(label for label in host.split(".") if label)
+    registrable = _registrable_domain(labels)
+    path = parts.path if parts is not None else ""
+    segments = tuple(segment for segment in path.split("/") if segment)
+    last_segment = segments[-1] if segments else ""
+    file_type = last_segment.rsplit(".", 1)[1] if "." in last_segment else ""
+    return UrlFeatures(
+        url=raw,
+        url_lower=lowered,
+        scheme=parts.scheme if parts is not None else "",
+        netloc=parts.netloc if parts is not None else "",
+        hostname=hostname,
+        host=host,
+        labels=labels,
+        registrable_domain=registrable,
+        domain_core=registrable.split(".", 1)[0] if registrable else "",
+        path=path,
+        path_segments=segments,
+        path_tokens=frozenset(_TOKEN_PATTERN.findall(path)),
+        file_type=file_type,
+        compact=_NON_ALNUM_PATTERN.sub("", lowered),
+    )
+
+
+if URL_FEATURE_CACHE_SIZE:
+    _cached_url_features = lru_cache(maxsize=URL_FEATURE_CACHE_SIZE)(_parse_url_features)
+else:
+    _cached_url_features = _parse_url_features
+
+
+def url_features(url: str) -> UrlFeatures:
+    """Return the (memoized) feature record for ``url``."""
+    return _cached_url_features(str(url or ""))
+
+
+def url_feature_cache_info() -> Dict[str, int]:
+    info = getattr(_cached_url_features, "cache_info", None)
+    if info is None:
+        return {"hits": 0, "misses": 0, "size": 0, "max_size": 0}
+    stats = info()
+    return {"hits": stats.hits, "misses": stats.misses, "size": stats.currsize, "max_size": stats.maxsize or 0}
+
+
+class BatchUrlScorer:
+    """Rank a whole result set against one set of per-batch invariants.
+
+    ``score`` receives the candidate and its ``UrlFeatures``; work that only
+    depends on the batch (entity aliases, lane keywords, official host) belongs
+    in the closure that builds ``score`` rather than in the per-URL path.
+    """
+
+    def __init__(self, score: Callable[[Mapping[str, Any], UrlFeatures], float]):
+        self._score = score
+
+    def score_all(self, candidates: Iterable[Mapping[str, Any]]) -> List[float]:
+        score = self._score
+        return [score(candidate, url_features(str(candidate.get("url") or ""))) for candidate in candidates]
+
+    def rank(
+        self,
+        candidates: Iterable[Mapping[str, Any]],
+        *,
+        key_prefix: Optional[Callable[[Mapping[str, Any]], Any]] = None,
+    ) -> List[Mapping[str, Any]]:
+        """Return candidates sorted best-first (stable for ties)."""
+        candidates = list(candidates)
+        scores = self.score_all(candidates)
+        if key_prefix is None:
+            order = sorted(range(len(candidates)), key=lambda index: scores[index], reverse=True)
+        else:
+            prefixes = [key_prefix(candidate) for candidate in candidates]
+            order = sorted(range(len(candidates)), key=lambda index: (prefixes[index], scores[index]), reverse=True)
+        return [candidates[index] for index in order]
@@ -1,5 +1,5 @@
 from .celery_app import celery
-from .db import update_task
+from .db import update_task, report_progress
 import logging
 from typing import Dict, Any
 import time
@@ -26,7 +26,7 @@ def enrich_dossier(self, task_id: str, entity_type: str, entity_name: str, prior
         # Step 1: Bright Data scraping
         current_step += 1
         progress = f"{int((current_step / total_steps) * 100)}%"
-        update_task(task_id, {"status": "processing", "progress": progress, "current_step": "Bright Data scraping"})
+        report_progress(task_id, {"status": "processing", "progress": progress, "current_step": "Bright Data scraping"})
         
         try:
             from .brightdata_client import fetch_company_data
@@ -39,7 +39,7 @@ def enrich_dossier(self, task_id: str, entity_type: str, entity_name: str, prior
         # Step 2: Perplexity enrichment
         current_step += 1
         progress = f"{int((current_step / total_steps) * 100)}%"
-        update_task(task_id, {"status": "processing", "progress": progress, "current_step": "Perplexity enrichment"})
+        report_progress(task_id, {"status": "processing", "progress": progress, "current_step": "Perplexity enrichment"})
         
         try:
             from .perplexity_client import fetch_perplexity_summary
@@ -52,7 +52,7 @@ def enrich_dossier(self, task_id: str, entity_type: str, entity_name: str, prior
         # Step 3: Claude Code reasoning and signal synthesis
         current_step += 1
         progress = f"{int((current_step / total_steps) * 100)}%"
-        update_task(task_id, {"status": "processing", "progress": progress, "current_step": "Claude Code reasoning"})
+        report_progress(task_id, {"status": "processing", "progress": progress, "current_step": "Claude Code reasoning"})
         
         try:
             from .claude_client import synthesize_signals
@@ -66,7 +66,7 @@ def enrich_dossier(self, task_id: str, entity_type: str, entity_name: str, prior
         # Step 4: Neo4j graph updates
         current_step += 1
         progress = f"{int((current_step / total_steps) * 100)}%"
-        update_task(task_id, {"status": "processing", "progress": progress, "current_step": "Neo4j graph updates"})
+        report_progress(task_id, {"status": "processing", "progress": progress, "current_step": "Neo4j graph updates"})
         
         try:
             from .neo4j_client import upsert_signals
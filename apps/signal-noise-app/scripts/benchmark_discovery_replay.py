@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""Record discovery provider traffic once, then benchmark discovery runtimes offline from the trace."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+BACKEND_ROOT = REPO_ROOT / "backend"
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from backend.discovery_trace import (  # noqa: E402
+    DiscoveryTrace,
+    RecordingBrightDataClient,
+    RecordingClaudeClient,
+    ReplayBrightDataClient,
+    ReplayClaudeClient,
+    TraceRecorder,
+    count_llm_tokens,
+)
+
+
+def _trace_path(trace_dir: Path, entity_id: str) -> Path:
+    return trace_dir / f"{entity_id}.jsonl.gz"
+
+
+def _parse_entities(values: List[str]) -> List[Dict[str, str]]:
+    entities: List[Dict[str, str]] = []
+    for value in values:
+        entity_id, _, entity_name = value.partition("=")
+        entity_id = entity_id.strip()
+        if not entity_id:
+            continue
+        entities.append({
+            "entity_id": entity_id,
+            "entity_name": entity_name.strip() or entity_id.replace("-", " ").title(),
+        })
+    return entities
+
+
+def _summarize_result(result: Any) -> Dict[str, Any]:
+    if isinstance(result, dict):
+        payload = result
+    elif hasattr(result, "to_dict"):
+        payload = result.to_dict()
+    else:
+        payload = getattr(result, "__dict__", {}) or {}
+    return {
+        "final_confidence": float(payload.get("final_confidence") or 0.0),
+        "iterations_completed": int(payload.get("iterations_completed") or 0),
+    }
+
+
+async def _run_entity(engine: Any, entity: Dict[str, str], args: argparse.Namespace) -> Dict[str, Any]:
+    wall_started = time.perf_counter()
+    cpu_started = time.process_time()
+    error = None
+    summary: Dict[str, Any] = {"final_confidence": 0.0, "iterations_completed": 0}
+    try:
+        result = await engine.run_discovery(
+            entity_id=entity["entity_id"],
+            entity_name=entity["entity_name"],
+            template_id=args.template_id,
+            max_iterations=args.max_iterations,
+        )
+        summary = _summarize_result(result)
+    except Exception as exc:  # noqa: BLE001 - reported per entity
+        error = f"{exc.__class__.__name__}: {exc}"
+    return {
+        "entity_id": entity["entity_id"],
+        "wall_seconds": round(time.perf_counter() - wall_started, 4),
+        "cpu_seconds": round(time.process_time() - cpu_started, 4),
+        **summary,
+        "error": error,
+    }
+
+
+async def _record_entity(entity: Dict[str, str], args: argparse.Namespace) -> Dict[str, Any]:
+    from backend.brightdata_sdk_client import BrightDataSDKClient
+    from backend.claude_client import ClaudeClient
+    from backend.discovery_engine_factory import create_discovery_engine
+
+    claude = ClaudeClient()
+    brightdata = BrightDataSDKClient()
+    path = _trace_path(Path(args.trace_dir), entity["entity_id"])
+    metadata = {
+        "entity_id": entity["entity_id"],
+        "entity_name": entity["entity_name"],
+        "engine": args.engine,
+        "template_id": args.template_id,
+        "max_iterations": args.max_iterations,
+        "llm_provider": getattr(claude, "provider", None),
+    }
+    with TraceRecorder(str(path), metadata=metadata) as recorder:
+        recording_claude = RecordingClaudeClient(claude, recorder)
+        engine, engine_name = create_discovery_engine(
+            claude_client=recording_claude,
+            brightdata_client=RecordingBrightDataClient(brightdata, recorder),
+            engine=args.engine,
+        )
+        report = await _run_entity(engine, entity, args)
+        report["records"] = recorder.record_count
+    close = getattr(brightdata, "close", None)
+    if close is not None:
+        await close()
+    report.update({"engine": engine_name, "trace": str(path)})
+    return report
+
+
+async def _replay_entity(entity: Dict[str, str], args: argparse.Namespace) -> Dict[str, Any]:
+    from backend.discovery_engine_factory import create_discovery_engine
+
+    path = _trace_path(Path(args.trace_dir), entity["entity_id"])
+    trace = DiscoveryTrace.load(str(path))
+    runs: List[Dict[str, Any]] = []
+    for run_index in range(1, args.runs + 1):
+        trace.reset()
+        engine, engine_name = create_discovery_engine(
+            claude_client=ReplayClaudeClient(trace, latency_scale=args.latency_scale, strict=args.strict),
+            brightdata_client=ReplayBrightDataClient(trace, latency_scale=args.latency_scale, strict=args.strict),
+            engine=args.engine,
+        )
+        report = await _run_entity(engine, entity, args)
+        report.update({"run": run_index, "engine": engine_name, "replay": trace.stats.to_dict()})
+        report["tokens"] = trace.stats.input_tokens + trace.stats.output_tokens
+        runs.append(report)
+
+    wall = sorted(run["wall_seconds"] for run in runs)
+    return {
+        "entity_id": entity["entity_id"],
+        "trace": str(path),
+        "trace_summary": trace.summary(),
+        "median_wall_seconds": wall[len(wall) // 2],
+        "median_cpu_seconds": sorted(run["cpu_seconds"] for run in runs)[len(runs) // 2],
+        "runs": runs,
+    }
+
+
+def _recorded_tokens(trace_path: Path) -> int:
+    trace = DiscoveryTrace.load(str(trace_path))
+    total = 0
+    for record in trace.records:
+        if record.kind == "llm" and record.error is None:
+            tokens = count_llm_tokens(record.response)
+            total += tokens["input_tokens"] + tokens["output_tokens"]
+    return total
+
+
+async def _run(args: argparse.Namespace) -> int:
+    entities = _parse_entities(args.entity)
+    if not entities:
+        raise SystemExit("at least one --entity is required")
+
+    reports: List[Dict[str, Any]] = []
+    for entity in entities:
+        if args.mode == "record":
+            report = await _record_entity(entity, args)
+            report["tokens"] = _recorded_tokens(Path(report["trace"]))
+        else:
+            report = await _replay_entity(entity, args)
+        reports.append(report)
+
+    aggregate = {
+        "mode": args.mode,
+        "engine": args.engine,
+        "latency_scale": args.latency_scale if args.mode == "replay" else None,
+        "entities": len(reports),
+        "reports": reports,
+    }
+    output = json.dumps(aggregate, indent=2)
+    print(output)
+
+    if args.output:
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(output + "\n")
+    return 0
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Record or replay discovery provider traces for offline benchmarking")
+    parser.add_argument("mode", choices=("record", "replay"))
+    parser.add_argument(
+        "--entity",
+        action="append",
+        default=[],
+        help="entity_id or entity_id=Entity Name (repeatable)",
+    )
+    parser.add_argument("--engine", default="v2")
+    parser.add_argument("--template-id", default="yellow_panther_agency")
+    parser.add_argument("--max-iterations", type=int, default=15)
+    parser.add_argument("--trace-dir", default=str(BACKEND_ROOT / "data" / "discovery_traces"))
+    parser.add_argument("--runs", type=int, default=3, help="replay repetitions per entity")
+    parser.add_argument(
+        "--latency-scale",
+        type=float,
+        default=1.0,
+        help="multiplier on recorded latency during replay (0 = CPU-only)",
+    )
+    parser.add_argument("--strict", action="store_true", help="fail on requests missing from the trace")
+    parser.add_argument("--output", default="")
+    return parser
+
+
+def main() -> None:
+    parser = _build_parser()
+    args = parser.parse_args()
+    if args.runs < 1:
+        raise SystemExit("--runs must be >= 1")
+    raise SystemExit(asyncio.run(_run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ optimization to maximize discovery effectiveness.
 Usage:
     python scripts/tune_parameters.py --method grid --iterations 50
     python scripts/tune_parameters.py --method bayesian --iterations 100
+    python scripts/tune_parameters.py --method halving --workers 8
     python scripts/tune_parameters.py --config-file data/best_config.json --validate
 """
 
@@ -76,9 +77,21 @@ async def main():
     parser = argparse.ArgumentParser(description="Tune discovery parameters")
     parser.add_argument(
         "--method",
-        choices=["grid", "bayesian"],
+        choices=["grid", "halving", "bayesian"],
         default="grid",
-        help="Optimization method"
+        help="Optimization method (halving = grid with successive-halving pruning)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for scoring configurations"
+    )
+    parser.add_argument(
+        "--eta",
+        type=int,
+        default=3,
+        help="Successive-halving pruning factor (keep top 1/eta per rung)"
     )
     parser.add_argument(
         "--iterations",
@@ -159,7 +172,17 @@ async def main():
         result = tuner.grid_search(
             param_ranges=param_ranges,
             n_samples=args.iterations,
-            validation_split=args.validation_split
+            validation_split=args.validation_split,
+            max_workers=args.workers
+        )
+    elif args.method == "halving":
+        logger.info("Using successive-halving grid search")
+        param_ranges = get_default_param_ranges()
+        result = tuner.successive_halving_search(
+            param_ranges=param_ranges,
+            eta=args.eta,
+            validation_split=args.validation_split,
+            max_workers=args.workers
         )
     else:  # bayesian
         logger.info("Using Bayesian optimization")
@@ -167,7 +190,8 @@ async def main():
         result = tuner.bayesian_optimization(
             param_ranges=param_ranges,
             n_iterations=args.iterations,
-            validation_split=args.validation_split
+            validation_split=args.validation_split,
+            n_jobs=args.workers
         )
 
     # Print results
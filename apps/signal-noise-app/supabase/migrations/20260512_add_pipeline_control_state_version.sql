@@ -0,0 +1,20 @@
+ALTER TABLE pipeline_control_state
+  ADD COLUMN IF NOT EXISTS version BIGINT NOT NULL DEFAULT 1;
+
+COMMENT ON COLUMN pipeline_control_state.version IS 'Monotonic record version; bumped on every update and used for compare-and-swap control writes';
+
+-- Every update bumps the version, including legacy unconditional upserts, so
+-- versioned readers notice writes from processes that do not use CAS yet.
+CREATE OR REPLACE FUNCTION bump_pipeline_control_state_version()
+RETURNS TRIGGER AS $$
+BEGIN
+  NEW.version := OLD.version + 1;
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_pipeline_control_state_version ON pipeline_control_state;
+CREATE TRIGGER trg_pipeline_control_state_version
+  BEFORE UPDATE ON pipeline_control_state
+  FOR EACH ROW
+  EXECUTE FUNCTION bump_pipeline_control_state_version();
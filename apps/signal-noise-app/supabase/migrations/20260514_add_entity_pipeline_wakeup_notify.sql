@@ -0,0 +1,47 @@
+-- Wake idle entity pipeline workers (LISTEN entity_pipeline_wakeup) as soon as
+-- there is something to claim, instead of waiting for the next poll.
+--
+-- Runs are inserted after their batch, so the run insert is the point at which
+-- a new batch becomes claimable. Batches re-entering 'queued' (stale lease
+-- requeue, operator retry) already have their runs.
+
+CREATE OR REPLACE FUNCTION notify_entity_pipeline_wakeup()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_TABLE_NAME = 'entity_pipeline_runs' THEN
+    PERFORM pg_notify('entity_pipeline_wakeup', 'runs_queued');
+  ELSIF TG_TABLE_NAME = 'entity_import_batches' THEN
+    IF NEW.status = 'queued' AND OLD.status IS DISTINCT FROM 'queued' THEN
+      PERFORM pg_notify('entity_pipeline_wakeup', 'batch_requeued:' || NEW.id::text);
+    END IF;
+  ELSIF TG_TABLE_NAME = 'pipeline_control_state' THEN
+    IF coalesce(NEW.state->>'requested_state', 'running') = 'running'
+      AND (
+        TG_OP = 'INSERT'
+        OR (OLD.state->>'requested_state') IS DISTINCT FROM (NEW.state->>'requested_state')
+        OR (OLD.state->>'provider_cooldown_until') IS DISTINCT FROM (NEW.state->>'provider_cooldown_until')
+      ) THEN
+      PERFORM pg_notify('entity_pipeline_wakeup', 'control_state_resumed');
+    END IF;
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_entity_pipeline_runs_wakeup ON entity_pipeline_runs;
+CREATE TRIGGER trg_entity_pipeline_runs_wakeup
+  AFTER INSERT ON entity_pipeline_runs
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION notify_entity_pipeline_wakeup();
+
+DROP TRIGGER IF EXISTS trg_entity_import_batches_wakeup ON entity_import_batches;
+CREATE TRIGGER trg_entity_import_batches_wakeup
+  AFTER UPDATE OF status ON entity_import_batches
+  FOR EACH ROW
+  EXECUTE FUNCTION notify_entity_pipeline_wakeup();
+
+DROP TRIGGER IF EXISTS trg_pipeline_control_state_wakeup ON pipeline_control_state;
+CREATE TRIGGER trg_pipeline_control_state_wakeup
+  AFTER INSERT OR UPDATE ON pipeline_control_state
+  FOR EACH ROW
+  EXECUTE FUNCTION notify_entity_pipeline_wakeup();
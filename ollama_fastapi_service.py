@@ -7,15 +7,17 @@ import asyncio
 import logging
 import json
 import os
-from typing import Dict, List, Any, Optional
+import re
+import time
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import httpx
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 import uvicorn
-from neo4j import GraphDatabase
+from neo4j import AsyncGraphDatabase
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -43,10 +45,95 @@ NEO4J_USER = os.getenv("NEO4J_USER", "neo4j")
 NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD", "pantherpassword")
 OLLAMA_HOST = os.getenv("OLLAMA_HOST", "http://localhost:11434")
 DEFAULT_OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "o3-mini")
+ORG_FULLTEXT_INDEX = os.getenv("NEO4J_ORG_FULLTEXT_INDEX", "sportingOrganizationText")
+CONTEXT_CACHE_TTL_SECONDS = float(os.getenv("KG_CONTEXT_CACHE_TTL_SECONDS", "30"))
+CONTEXT_CACHE_MAX_ENTRIES = int(os.getenv("KG_CONTEXT_CACHE_MAX_ENTRIES", "256"))
+CONTEXT_SEARCH_TERMS = 3
 
 # Global variables
 neo4j_driver = None
 ollama_client = None
+fulltext_index_available = False
+
+
+class _LoaderCancelled(Exception):
+    """Handed to coalesced waiters when the request running their loader is cancelled."""
+
+
+class TTLCache:
+    """Short-lived cache for knowledge graph lookups with in-flight request coalescing.
+
+    Concurrent requests for the same key share one Neo4j round trip instead of
+    each issuing the query. If the request running the query is cancelled
+    (e.g. its client disconnects), one of the waiters takes over the load.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._entries: Dict[Tuple, Tuple[float, Any]] = {}
+        self._inflight: Dict[Tuple, "asyncio.Future[Any]"] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def get_or_load(self, key: Tuple, loader: Callable[[], Awaitable[Any]]) -> Any:
+        while True:
+            now = time.monotonic()
+            entry = self._entries.get(key)
+            if entry and entry[0] > now:
+                self.hits += 1
+                return entry[1]
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+            try:
+                value = await asyncio.shield(inflight)
+            except _LoaderCancelled:
+                # The leading request went away: retry, electing a new loader.
+                continue
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            # Cancelling the shared future would raise CancelledError in
+            # unrelated waiters; tell them to reload instead.
+            future.set_exception(_LoaderCancelled())
+            future.exception()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Mark retrieved so an unawaited failure is not logged twice.
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        future.set_result(value)
+        if self.ttl_seconds > 0:
+            if len(self._entries) >= self.max_entries:
+                self._evict(now)
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        return value
+
+    def _evict(self, now: float) -> None:
+        for key in [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]:
+            del self._entries[key]
+        while len(self._entries) >= self.max_entries:
+            oldest = min(self._entries, key=lambda key: self._entries[key][0])
+            del self._entries[oldest]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+context_cache = TTLCache(CONTEXT_CACHE_TTL_SECONDS, CONTEXT_CACHE_MAX_ENTRIES)
 
 # Pydantic models
 class OllamaQueryRequest(BaseModel):
@@ -55,6 +142,7 @@ class OllamaQueryRequest(BaseModel):
     include_context: bool = Field(default=True, description="Include knowledge graph context")
     max_tokens: int = Field(default=1000, description="Maximum tokens for response")
     temperature: float = Field(default=0.1, description="Temperature for response generation")
+    stream: bool = Field(default=False, description="Stream tokens as NDJSON while Ollama generates them")
 
 class SportsIntelligenceQuery(BaseModel):
     organization: Optional[str] = Field(None, description="Filter by sports organization")
@@ -72,13 +160,14 @@ class SignalCreateRequest(BaseModel):
 # Startup and shutdown events
 @app.on_event("startup")
 async def startup_event():
-    global neo4j_driver, ollama_client
+    global neo4j_driver, ollama_client, fulltext_index_available
     
     # Initialize Neo4j driver
-    neo4j_driver = GraphDatabase.driver(
+    neo4j_driver = AsyncGraphDatabase.driver(
         NEO4J_URI,
         auth=(NEO4J_USER, NEO4J_PASSWORD)
     )
+    fulltext_index_available = await ensure_fulltext_index()
     
     # Initialize Ollama client
     ollama_client = httpx.AsyncClient(base_url=OLLAMA_HOST, timeout=60.0)
@@ -101,7 +190,7 @@ async def shutdown_event():
     global neo4j_driver, ollama_client
     
     if neo4j_driver:
-        neo4j_driver.close()
+        await neo4j_driver.close()
     
     if ollama_client:
         await ollama_client.aclose()
@@ -120,9 +209,9 @@ async def health_check():
     
     # Check Neo4j
     try:
-        with neo4j_driver.session() as session:
-            result = session.run("RETURN 1 as test")
-            record = result.single()
+        async with neo4j_driver.session() as session:
+            result = await session.run("RETURN 1 as test")
+            record = await result.single()
             if record:
                 health_status["components"]["neo4j"] = "healthy"
             else:
@@ -143,9 +232,122 @@ async def health_check():
     except Exception as e:
         health_status["components"]["ollama"] = f"error: {str(e)}"
     
+    health_status["components"]["context_cache"] = context_cache.stats()
     return JSONResponse(health_status)
 
 # Helper functions
+async def ensure_fulltext_index() -> bool:
+    """Create the organization full-text index if missing; False when the server cannot."""
+    try:
+        async with neo4j_driver.session() as session:
+            result = await session.run(
+                f"""
+                CREATE FULLTEXT INDEX {ORG_FULLTEXT_INDEX} IF NOT EXISTS
+                FOR (org:SportingOrganization) ON EACH [org.name, org.description]
+                """
+            )
+            await result.consume()
+        return True
+    except Exception as e:
+        logger.warning(f"Full-text index unavailable, falling back to CONTAINS scans: {e}")
+        return False
+
+def normalize_search_terms(query: str) -> Tuple[str, ...]:
+    """Lower-cased, de-duplicated leading terms used for both lookup and cache keys"""
+    terms: List[str] = []
+    for term in re.findall(r"\w+", query.lower()):
+        if term not in terms:
+            terms.append(term)
+        if len(terms) == CONTEXT_SEARCH_TERMS:
+            break
+    return tuple(terms)
+
+def _lucene_escape(term: str) -> str:
+    return re.sub(r'([+\-&|!(){}\[\]^"~*?:\\/])', r"\\\1", term)
+
+async def _run_query(query: str, **params) -> List[Any]:
+    # One session per sub-query: async sessions are not safe to share across tasks.
+    async with neo4j_driver.session() as session:
+        result = await session.run(query, **params)
+        return [record async for record in result]
+
+async def _search_organizations(terms: Tuple[str, ...], limit: int) -> List[Dict[str, Any]]:
+    if not terms:
+        return []
+    if fulltext_index_available:
+        try:
+            records = await _run_query(
+                """
+                CALL db.index.fulltext.queryNodes($index, $search)
+                YIELD node
+                RETURN node AS org
+                LIMIT $limit
+                """,
+                index=ORG_FULLTEXT_INDEX,
+                search=" OR ".join(_lucene_escape(term) for term in terms),
+                limit=limit,
+            )
+            return [dict(record["org"]) for record in records]
+        except Exception as e:
+            # e.g. the index is still populating or was dropped after startup
+            logger.warning(f"Full-text organization search failed, falling back to CONTAINS scan: {e}")
+    # One scan for all terms instead of one scan per term.
+    records = await _run_query(
+        """
+        MATCH (org:SportingOrganization)
+        WHERE any(term IN $search_terms WHERE org.name CONTAINS term OR org.description CONTAINS term)
+        RETURN org
+        LIMIT $limit
+        """,
+        search_terms=list(terms),
+        limit=limit,
+    )
+    return [dict(record["org"]) for record in records]
+
+async def _premier_league_data() -> Dict[str, Any]:
+    records = await _run_query(
+        """
+        MATCH (pl:SportingOrganization {name: 'Premier League'})
+        OPTIONAL MATCH (pl)-[:contains_club]->(club:PremierLeagueClub)
+        OPTIONAL MATCH (pl)-[:has_agency_relationship]->(agency:Agency)
+        OPTIONAL MATCH (pl)-[:emits]->(signal:Signal)
+        WHERE signal.date > date() - duration('P30D')
+        RETURN pl, collect(DISTINCT club) as clubs, 
+               collect(DISTINCT agency) as agencies,
+               collect(signal) as recent_signals
+        """
+    )
+    if not records:
+        return {}
+    record = records[0]
+    return {
+        "organization": dict(record["pl"]) if record["pl"] else {},
+        "clubs": [dict(club) for club in record["clubs"] if club],
+        "agencies": [dict(agency) for agency in record["agencies"] if agency],
+        "recent_signals": [dict(signal) for signal in record["recent_signals"] if signal]
+    }
+
+async def _recent_high_score_signals(limit: int) -> List[Dict[str, Any]]:
+    records = await _run_query(
+        """
+        MATCH (signal:Signal)
+        WHERE signal.score > 7.0
+          AND signal.date > date() - duration('P7D')
+        OPTIONAL MATCH (org:SportingOrganization)-[:emits]->(signal)
+        RETURN signal, org
+        ORDER BY signal.score DESC
+        LIMIT $limit
+        """,
+        limit=limit,
+    )
+    return [
+        {
+            "signal": dict(record["signal"]),
+            "organization": dict(record["org"]) if record["org"] else None
+        }
+        for record in records
+    ]
+
 async def get_knowledge_graph_context(query: str, limit: int = 10) -> Dict[str, Any]:
     """Get relevant context from the knowledge graph based on the query"""
     context = {
@@ -155,79 +357,41 @@ async def get_knowledge_graph_context(query: str, limit: int = 10) -> Dict[str,
         "agencies": []
     }
     
-    try:
-        with neo4j_driver.session() as session:
-            # Search for relevant organizations
-            org_query = """
-            MATCH (org:SportingOrganization)
-            WHERE org.name CONTAINS $search_term 
-               OR org.description CONTAINS $search_term
-            RETURN org
-            LIMIT $limit
-            """
-            search_terms = query.lower().split()
-            for term in search_terms[:3]:  # Search with first 3 terms
-                result = session.run(org_query, search_term=term, limit=limit)
-                context["organizations"].extend([dict(record["org"]) for record in result])
-            
-            # Get Premier League specific data if mentioned
-            if "premier league" in query.lower():
-                pl_query = """
-                MATCH (pl:SportingOrganization {name: 'Premier League'})
-                OPTIONAL MATCH (pl)-[:contains_club]->(club:PremierLeagueClub)
-                OPTIONAL MATCH (pl)-[:has_agency_relationship]->(agency:Agency)
-                OPTIONAL MATCH (pl)-[:emits]->(signal:Signal)
-                WHERE signal.date > date() - duration('P30D')
-                RETURN pl, collect(DISTINCT club) as clubs, 
-                       collect(DISTINCT agency) as agencies,
-                       collect(signal) as recent_signals
-                """
-                result = session.run(pl_query)
-                record = result.single()
-                if record:
-                    context["premier_league_data"] = {
-                        "organization": dict(record["pl"]) if record["pl"] else {},
-                        "clubs": [dict(club) for club in record["clubs"] if club],
-                        "agencies": [dict(agency) for agency in record["agencies"] if agency],
-                        "recent_signals": [dict(signal) for signal in record["recent_signals"] if signal]
-                    }
-            
-            # Get recent high-score signals
-            signals_query = """
-            MATCH (signal:Signal)
-            WHERE signal.score > 7.0
-              AND signal.date > date() - duration('P7D')
-            OPTIONAL MATCH (org:SportingOrganization)-[:emits]->(signal)
-            RETURN signal, org
-            ORDER BY signal.score DESC
-            LIMIT $limit
-            """
-            result = session.run(signals_query, limit=limit)
-            context["signals"] = [
-                {
-                    "signal": dict(record["signal"]),
-                    "organization": dict(record["org"]) if record["org"] else None
-                }
-                for record in result
-            ]
-    
-    except Exception as e:
-        logger.error(f"Error getting knowledge graph context: {e}")
+    terms = normalize_search_terms(query)
+    lookups = {
+        "organizations": context_cache.get_or_load(
+            ("organizations", terms, limit), lambda: _search_organizations(terms, limit)
+        ),
+        "signals": context_cache.get_or_load(("signals", limit), lambda: _recent_high_score_signals(limit)),
+    }
+    # Get Premier League specific data if mentioned
+    if "premier league" in query.lower():
+        lookups["premier_league_data"] = context_cache.get_or_load(("premier_league",), _premier_league_data)
+
+    results = await asyncio.gather(*lookups.values(), return_exceptions=True)
+    for key, value in zip(lookups, results):
+        if isinstance(value, Exception):
+            logger.error(f"Error getting knowledge graph context ({key}): {value}")
+            continue
+        context[key] = value
     
     return context
 
+def _ollama_payload(model: str, prompt: str, max_tokens: int, temperature: float, stream: bool) -> Dict[str, Any]:
+    return {
+        "model": model,
+        "prompt": prompt,
+        "options": {
+            "num_predict": max_tokens,
+            "temperature": temperature
+        },
+        "stream": stream
+    }
+
 async def query_ollama(model: str, prompt: str, max_tokens: int = 1000, temperature: float = 0.1) -> Dict[str, Any]:
     """Query Ollama with the given model and prompt"""
     try:
-        payload = {
-            "model": model,
-            "prompt": prompt,
-            "options": {
-                "num_predict": max_tokens,
-                "temperature": temperature
-            },
-            "stream": False
-        }
+        payload = _ollama_payload(model, prompt, max_tokens, temperature, stream=False)
         
         response = await ollama_client.post("/api/generate", json=payload)
         response.raise_for_status()
@@ -244,6 +408,19 @@ async def query_ollama(model: str, prompt: str, max_tokens: int = 1000, temperat
         logger.error(f"Error querying Ollama: {e}")
         raise HTTPException(status_code=500, detail=f"Ollama query failed: {str(e)}")
 
+async def stream_ollama(model: str, prompt: str, max_tokens: int = 1000, temperature: float = 0.1) -> AsyncIterator[Dict[str, Any]]:
+    """Yield Ollama generate chunks as they are produced"""
+    payload = _ollama_payload(model, prompt, max_tokens, temperature, stream=True)
+    async with ollama_client.stream("POST", "/api/generate", json=payload) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping malformed Ollama stream line: {line[:80]}")
+
 def create_enhanced_prompt(query: str, context: Dict[str, Any]) -> str:
     """Create an enhanced prompt with knowledge graph context"""
     
@@ -313,6 +490,12 @@ async def query_ollama_endpoint(request: OllamaQueryRequest):
         else:
             enhanced_prompt = request.query
         
+        if request.stream:
+            return StreamingResponse(
+                _stream_query_response(request, enhanced_prompt, context),
+                media_type="application/x-ndjson",
+            )
+        
         # Query Ollama
         ollama_response = await query_ollama(
             model=request.model,
@@ -338,12 +521,48 @@ async def query_ollama_endpoint(request: OllamaQueryRequest):
         logger.error(f"Error in query_ollama_endpoint: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+async def _stream_query_response(
+    request: OllamaQueryRequest,
+    prompt: str,
+    context: Dict[str, Any],
+) -> AsyncIterator[str]:
+    """NDJSON stream: a context header, one line per token chunk, then a done line with metadata"""
+    yield json.dumps({
+        "query": request.query,
+        "model": request.model,
+        "context_included": request.include_context,
+        "knowledge_graph_context": context if request.include_context else None,
+    }, default=str) + "\n"
+    try:
+        async for chunk in stream_ollama(
+            model=request.model,
+            prompt=prompt,
+            max_tokens=request.max_tokens,
+            temperature=request.temperature
+        ):
+            if chunk.get("response"):
+                yield json.dumps({"response": chunk["response"]}) + "\n"
+            if chunk.get("done"):
+                yield json.dumps({
+                    "done": True,
+                    "metadata": {
+                        "total_duration_ms": chunk.get("total_duration", 0) // 1000000,
+                        "eval_count": chunk.get("eval_count", 0),
+                        "timestamp": datetime.now().isoformat()
+                    }
+                }) + "\n"
+                return
+    except Exception as e:
+        # Headers are already sent, so report the failure in-band.
+        logger.error(f"Error streaming from Ollama: {e}")
+        yield json.dumps({"done": True, "error": f"Ollama query failed: {str(e)}"}) + "\n"
+
 @app.post("/sports-intelligence")
 async def query_sports_intelligence(request: SportsIntelligenceQuery):
     """Direct query to the sports intelligence knowledge graph"""
     
     try:
-        with neo4j_driver.session() as session:
+        async with neo4j_driver.session() as session:
             
             if request.query_type == "organization_overview":
                 query = """
@@ -356,8 +575,8 @@ async def query_sports_intelligence(request: SportsIntelligenceQuery):
                        collect(DISTINCT c) as clubs,
                        collect(s) as signals
                 """
-                result = session.run(query, org_name=request.organization)
-                records = [dict(record) for record in result]
+                result = await session.run(query, org_name=request.organization)
+                records = [dict(record) async for record in result]
                 return JSONResponse({"query_type": request.query_type, "results": records})
             
             elif request.query_type == "top_opportunities":
@@ -373,8 +592,8 @@ async def query_sports_intelligence(request: SportsIntelligenceQuery):
                 ORDER BY avg_score DESC, size(opportunity_signals) DESC
                 LIMIT 10
                 """
-                result = session.run(query)
-                records = [dict(record) for record in result]
+                result = await session.run(query)
+                records = [dict(record) async for record in result]
                 return JSONResponse({"query_type": request.query_type, "results": records})
             
             elif request.query_type == "premier_league_intelligence":
@@ -388,8 +607,8 @@ async def query_sports_intelligence(request: SportsIntelligenceQuery):
                        collect(s) as recent_signals,
                        collect(DISTINCT a) as agencies
                 """
-                result = session.run(query)
-                record = result.single()
+                result = await session.run(query)
+                record = await result.single()
                 return JSONResponse({"query_type": request.query_type, "results": dict(record) if record else {}})
             
             else:
@@ -404,7 +623,7 @@ async def create_signal(request: SignalCreateRequest):
     """Create a new business intelligence signal"""
     
     try:
-        with neo4j_driver.session() as session:
+        async with neo4j_driver.session() as session:
             # Create the signal
             signal_query = """
             CREATE (s:Signal {
@@ -421,7 +640,7 @@ async def create_signal(request: SignalCreateRequest):
             })
             RETURN s
             """
-            result = session.run(signal_query, {
+            result = await session.run(signal_query, {
                 "headline": request.headline,
                 "summary": request.summary,
                 "score": request.score,
@@ -430,7 +649,7 @@ async def create_signal(request: SignalCreateRequest):
                 "repository": request.repository
             })
             
-            signal = result.single()
+            signal = await result.single()
             
             # Link to organization
             link_query = """
@@ -438,10 +657,12 @@ async def create_signal(request: SignalCreateRequest):
             MATCH (org:SportingOrganization {name: $organization})
             MERGE (org)-[:emits]->(s)
             """
-            session.run(link_query, {
+            await session.run(link_query, {
                 "headline": request.headline,
                 "organization": request.organization
             })
+            # New signals must show up in the next context lookup.
+            context_cache.clear()
             
             return JSONResponse({
                 "status": "success",
@@ -486,14 +707,14 @@ async def get_knowledge_graph_stats():
     """Get statistics about the knowledge graph"""
     
     try:
-        with neo4j_driver.session() as session:
+        async with neo4j_driver.session() as session:
             stats_query = """
             MATCH (n)
             RETURN labels(n) as label, count(n) as count
             ORDER BY count DESC
             """
-            result = session.run(stats_query)
-            node_counts = [{"label": record["label"], "count": record["count"]} for record in result]
+            result = await session.run(stats_query)
+            node_counts = [{"label": record["label"], "count": record["count"]} async for record in result]
             
             # Get relationship counts
             rel_query = """
@@ -501,8 +722,8 @@ async def get_knowledge_graph_stats():
             RETURN type(r) as relationship_type, count(r) as count
             ORDER BY count DESC
             """
-            result = session.run(rel_query)
-            relationship_counts = [{"type": record["relationship_type"], "count": record["count"]} for record in result]
+            result = await session.run(rel_query)
+            relationship_counts = [{"type": record["relationship_type"], "count": record["count"]} async for record in result]
             
             # Get signal counts by type
             signal_query = """
@@ -510,8 +731,8 @@ async def get_knowledge_graph_stats():
             RETURN s.intelType as signal_type, count(s) as count
             ORDER BY count DESC
             """
-            result = session.run(signal_query)
-            signal_counts = [{"type": record["signal_type"], "count": record["count"]} for record in result]
+            result = await session.run(signal_query)
+            signal_counts = [{"type": record["signal_type"], "count": record["count"]} async for record in result]
             
             return JSONResponse({
                 "node_counts": node_counts,
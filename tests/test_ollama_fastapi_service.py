@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Tests for the knowledge graph context cache and NDJSON streaming in the Ollama service.
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import ollama_fastapi_service as service
+from ollama_fastapi_service import OllamaQueryRequest, TTLCache
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_load():
+    cache = TTLCache(ttl_seconds=30, max_entries=8)
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return ["arsenal"]
+
+    results = await asyncio.gather(*[cache.get_or_load(("orgs",), loader) for _ in range(5)])
+
+    assert results == [["arsenal"]] * 5
+    assert len(calls) == 1
+    assert cache.stats() == {"entries": 1, "hits": 4, "misses": 1}
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_after_ttl():
+    cache = TTLCache(ttl_seconds=0.05, max_entries=8)
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        return len(calls)
+
+    assert await cache.get_or_load(("signals",), loader) == 1
+    assert await cache.get_or_load(("signals",), loader) == 1
+    await asyncio.sleep(0.06)
+    assert await cache.get_or_load(("signals",), loader) == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_hands_the_load_to_a_waiter():
+    cache = TTLCache(ttl_seconds=30, max_entries=8)
+    started = asyncio.Event()
+    calls = []
+
+    async def slow_loader():
+        calls.append("slow")
+        started.set()
+        await asyncio.sleep(10)
+
+    async def loader():
+        calls.append("fast")
+        return "context"
+
+    leader = asyncio.create_task(cache.get_or_load(("orgs",), slow_loader))
+    await started.wait()
+    waiter = asyncio.create_task(cache.get_or_load(("orgs",), loader))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert await waiter == "context"
+    assert calls == ["slow", "fast"]
+
+
+@pytest.mark.asyncio
+async def test_failed_load_reaches_waiters_and_is_not_cached():
+    cache = TTLCache(ttl_seconds=30, max_entries=8)
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("neo4j down")
+
+    results = await asyncio.gather(
+        cache.get_or_load(("orgs",), failing),
+        cache.get_or_load(("orgs",), failing),
+        return_exceptions=True,
+    )
+
+    assert [str(result) for result in results] == ["neo4j down", "neo4j down"]
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_fulltext_failure_falls_back_to_contains_scan(monkeypatch):
+    queries = []
+
+    async def fake_run_query(query, **params):
+        queries.append(query)
+        if "queryNodes" in query:
+            raise RuntimeError("index not online")
+        return [{"org": {"name": "Arsenal FC"}}]
+
+    monkeypatch.setattr(service, "fulltext_index_available", True)
+    monkeypatch.setattr(service, "_run_query", fake_run_query)
+
+    assert await service._search_organizations(("arsenal",), limit=5) == [{"name": "Arsenal FC"}]
+    assert len(queries) == 2
+    assert "CONTAINS" in queries[1]
+
+
+async def _collect_stream(monkeypatch, chunks):
+    async def fake_stream(**_kwargs):
+        for chunk in chunks:
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+
+    monkeypatch.setattr(service, "stream_ollama", fake_stream)
+    request = OllamaQueryRequest(query="Arsenal partners", stream=True)
+    return [line async for line in service._stream_query_response(request, "prompt", {"organizations": []})]
+
+
+@pytest.mark.asyncio
+async def test_stream_frames_header_tokens_and_done_as_ndjson(monkeypatch):
+    lines = await _collect_stream(
+        monkeypatch,
+        [
+            {"response": "Arsenal "},
+            {"response": ""},
+            {"response": "works with Adidas"},
+            {"done": True, "total_duration": 2_000_000, "eval_count": 7},
+        ],
+    )
+
+    assert all(line.endswith("\n") and line.count("\n") == 1 for line in lines)
+    frames = [json.loads(line) for line in lines]
+    assert frames[0]["query"] == "Arsenal partners"
+    assert frames[0]["knowledge_graph_context"] == {"organizations": []}
+    assert frames[1:3] == [{"response": "Arsenal "}, {"response": "works with Adidas"}]
+    assert frames[3]["done"] is True
+    assert frames[3]["metadata"]["total_duration_ms"] == 2
+    assert frames[3]["metadata"]["eval_count"] == 7
+    assert len(frames) == 4
+
+
+@pytest.mark.asyncio
+async def test_stream_reports_failures_in_band(monkeypatch):
+    lines = await _collect_stream(monkeypatch, [{"response": "partial"}, RuntimeError("connection reset")])
+
+    frames = [json.loads(line) for line in lines]
+    assert frames[1] == {"response": "partial"}
+    assert frames[-1] == {"done": True, "error": "Ollama query failed: connection reset"}